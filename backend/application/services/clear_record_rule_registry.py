@@ -0,0 +1,61 @@
+"""
+クリア記録バリデーションルール表のレジストリ
+
+参照表はプロセス内で構築して共有し、機体カタログが変更された場合に破棄して再構築します。
+破棄は変更したプロセスにのみ反映されるため、複数ワーカー構成で他のワーカーでの変更を反映できるよう、
+一定時間（CLEAR_RECORD_RULES_TTL_SECONDS）ごとにも再構築します。
+"""
+import os
+import threading
+import time
+from typing import Optional
+
+from domain.repositories.game_character_repository import GameCharacterRepository
+from domain.value_objects.clear_record_rule_table import ClearRecordRuleTable
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ClearRecordRuleRegistry:
+    """クリア記録バリデーションルール表のキャッシュ"""
+
+    # 参照表をDBの機体カタログから作り直す間隔（秒）
+    ttl_seconds: float = float(os.getenv("CLEAR_RECORD_RULES_TTL_SECONDS", "300"))
+
+    _table: Optional[ClearRecordRuleTable] = None
+    _built_at: float = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def _is_fresh(cls) -> bool:
+        return cls._table is not None and time.monotonic() - cls._built_at <= cls.ttl_seconds
+
+    @classmethod
+    def get(cls, game_character_repository: GameCharacterRepository) -> ClearRecordRuleTable:
+        """
+        参照表を取得（未構築・期限切れの場合は機体カタログを1クエリで読み込んで構築）
+
+        Args:
+            game_character_repository: 機体カタログの読み込みに使用するリポジトリ
+
+        Returns:
+            ClearRecordRuleTable: 参照表
+        """
+        if cls._is_fresh():
+            return cls._table
+
+        with cls._lock:
+            if not cls._is_fresh():
+                characters_by_game = game_character_repository.find_all_character_names_by_game()
+                cls._table = ClearRecordRuleTable.build(characters_by_game)
+                cls._built_at = time.monotonic()
+                logger.info(f"Clear record rule table built: games_with_catalog={len(characters_by_game)}")
+            return cls._table
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """参照表を破棄（機体カタログ変更時に呼び出し、このプロセスにのみ反映）"""
+        with cls._lock:
+            cls._table = None
+        logger.debug("Clear record rule table invalidated")
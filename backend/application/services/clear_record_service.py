@@ -1,10 +1,13 @@
 """
 クリア記録サービス
 """
-from typing import List, Optional
-from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
 from domain.entities.clear_record import ClearRecord
 from domain.repositories.clear_record_repository import ClearRecordRepository
+from domain.value_objects.clear_record_rule_table import ClearRecordRuleTable
+from infrastructure.logging.exceptions import ValidationException
 from infrastructure.logging.logger import LoggerFactory
 
 logger = LoggerFactory.get_logger(__name__)
@@ -13,8 +16,29 @@ logger = LoggerFactory.get_logger(__name__)
 class ClearRecordService:
     """クリア記録サービス"""
 
-    def __init__(self, clear_record_repository: ClearRecordRepository):
+    def __init__(
+        self,
+        clear_record_repository: ClearRecordRepository,
+        rule_table: Optional[ClearRecordRuleTable] = None
+    ):
         self.clear_record_repository = clear_record_repository
+        self.rule_table = rule_table
+
+    def _validate_records(self, records_data: List[dict]) -> None:
+        """
+        ルール表でクリア記録を検証（ルール表未設定の場合は検証しない）
+
+        一括保存時もDBへ書き込む前に全件を検証します。
+        """
+        if self.rule_table is None:
+            return
+        for index, record_data in enumerate(records_data):
+            violation = self.rule_table.validate(record_data)
+            if violation is not None:
+                message, field_name, invalid_value = violation
+                if len(records_data) > 1:
+                    message = f"records[{index}]: {message}"
+                raise ValidationException(message, field_name=field_name, invalid_value=invalid_value)
     
     async def get_user_clear_records(self, user_id: int) -> List[ClearRecord]:
         """ユーザーのクリア記録を取得"""
@@ -24,6 +48,10 @@ class ClearRecordService:
         """ユーザーの特定ゲームのクリア記録を取得"""
         return await self.clear_record_repository.find_by_user_and_game(user_id, game_id)
     
+    async def get_user_clear_record_rows(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ユーザーのクリア記録を一覧表示用の辞書で取得（読み取り専用の高速パス）"""
+        return await self.clear_record_repository.find_rows_by_user(user_id, game_id)
+    
     async def get_clear_record_by_id(self, record_id: int) -> Optional[ClearRecord]:
         """IDでクリア記録を取得"""
         return await self.clear_record_repository.find_by_id(record_id)
@@ -31,6 +59,7 @@ class ClearRecordService:
     async def create_clear_record(self, user_id: int, clear_record_data: dict) -> ClearRecord:
         """クリア記録を作成"""
         logger.info(f"Creating clear record: user_id={user_id}, game_id={clear_record_data.get('game_id')}")
+        self._validate_records([clear_record_data])
 
         clear_record = ClearRecord(
             user_id=user_id,
@@ -74,6 +103,11 @@ class ClearRecordService:
         if 'cleared_at' in update_data:
             existing_record.cleared_at = update_data['cleared_at']
         
+        # 作成・一括保存と同じく、更新後のモード・条件の組み合わせを保存前に検証
+        self._validate_records([{
+            field_name: getattr(existing_record, field_name)
+            for field_name in ('game_id', 'character_name', 'difficulty', 'mode', *CLEAR_FLAG_FIELDS)
+        }])
         return await self.clear_record_repository.update(existing_record)
     
     async def delete_clear_record(self, record_id: int, user_id: int) -> bool:
@@ -111,10 +145,12 @@ class ClearRecordService:
     
     async def upsert_clear_record(self, user_id: int, clear_record_data: dict) -> ClearRecord:
         """クリア記録をUpsert（作成または更新）"""
+        self._validate_records([clear_record_data])
         return await self.create_or_update_clear_record(user_id, clear_record_data)
     
     async def batch_create_or_update_records(self, user_id: int, records_data: List[dict]) -> List[ClearRecord]:
         """複数のクリア記録を一括で作成または更新"""
+        self._validate_records(records_data)
         results = []
         for record_data in records_data:
             try:
@@ -126,4 +162,76 @@ class ClearRecordService:
     
     async def batch_upsert_clear_records(self, user_id: int, records_data: List[dict]) -> List[ClearRecord]:
         """複数のクリア記録を一括でUpsert"""
-        return await self.batch_create_or_update_records(user_id, records_data)
\ No newline at end of file
+        return await self.batch_create_or_update_records(user_id, records_data)
+    
+    async def get_clear_record_changes(self, user_id: int, since_seq: Optional[int], limit: int) -> Dict[str, Any]:
+        """
+        指定した連番より後のクリア記録の変更を取得（差分同期）
+
+        Args:
+            user_id: ユーザーID
+            since_seq: クライアントが取得済みの最後の連番（未指定の場合は基準の連番のみ返す）
+            limit: 最大件数
+
+        Returns:
+            changes: 変更のリスト（古い順）
+            latest_seq: 次回のsinceに指定する連番
+            has_more: 続きがあるか
+            resync_required: 変更ログが削除済みのため一覧の再取得が必要か
+        """
+        min_seq, max_seq = await self.clear_record_repository.get_change_seq_bounds()
+        latest_seq = max_seq or 0
+        # since以降の変更が圧縮で削除されている場合、差分では追いつけない
+        if since_seq is None or (min_seq is not None and since_seq < min_seq - 1):
+            return {"changes": [], "latest_seq": latest_seq, "has_more": False, "resync_required": True}
+
+        changes = await self.clear_record_repository.find_changes_since(user_id, since_seq, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        if has_more:
+            latest_seq = changes[-1]["seq"]
+        return {
+            "changes": changes,
+            "latest_seq": max(latest_seq, since_seq),
+            "has_more": has_more,
+            "resync_required": False,
+        }
+    
+    async def compact_changes(self, retention_days: int, batch_size: int) -> int:
+        """
+        保持期間を過ぎたクリア記録の変更ログを削除
+
+        Returns:
+            削除した件数
+        """
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        deleted = await self.clear_record_repository.delete_changes_before(cutoff, batch_size)
+        logger.info(f"Compacted clear record changes: deleted={deleted}, cutoff={cutoff.isoformat()}")
+        return deleted
+    
+    async def get_clear_record_achievements(self, record: ClearRecord) -> List[Dict[str, Any]]:
+        """記録の条件ごとの初回達成日時を達成順に取得"""
+        return await self.clear_record_repository.find_achievements(record)
+    
+    async def get_clear_progress(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        作品ごとの月別累計達成数を取得（進捗グラフ用）
+
+        月別集計（初回達成数）を作品・月の順に読み込み、条件ごとの累計に変換します。
+        達成のなかった月は含みません。
+
+        Returns:
+            [{"game_id": 作品ID, "months": [{"month": "YYYY-MM", "counts": {条件列名: 累計}}]}]
+        """
+        buckets = await self.clear_record_repository.find_monthly_progress(user_id, game_id)
+        progress: List[Dict[str, Any]] = []
+        for bucket in buckets:
+            if not progress or progress[-1]["game_id"] != bucket["game_id"]:
+                progress.append({"game_id": bucket["game_id"], "months": []})
+            months = progress[-1]["months"]
+            if not months or months[-1]["month"] != bucket["month"]:
+                previous = months[-1]["counts"] if months else dict.fromkeys(CLEAR_FLAG_FIELDS, 0)
+                months.append({"month": bucket["month"], "counts": dict(previous)})
+            counts = months[-1]["counts"]
+            counts[bucket["condition"]] = counts.get(bucket["condition"], 0) + bucket["count"]
+        return progress
@@ -0,0 +1,114 @@
+"""
+クリア条件達成率統計サービス
+"""
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
+from domain.repositories.clear_stats_repository import ClearStatsRepository, StatKey
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ClearStatsService:
+    """全ユーザーのクリア条件達成率を集計・提供するサービス"""
+
+    def __init__(self, clear_stats_repository: ClearStatsRepository):
+        self.clear_stats_repository = clear_stats_repository
+
+    def refresh(self, batch_size: int, force_full: bool = False) -> Dict[str, Any]:
+        """
+        達成率統計を更新
+
+        前回の集計以降の変更ログだけを反映します（増分集計）。
+        未集計の場合・強制指定の場合・変更ログの圧縮で続きを反映できない場合は
+        全クリア記録から集計し直します（全件集計）。
+
+        Args:
+            batch_size: 増分集計で1回に読み込む変更ログの件数
+            force_full: 全件集計を強制するか
+
+        Returns:
+            {"full_rebuild": 全件集計したか, "applied_changes": 反映した変更数,
+             "active_users": 分母のユーザー数, "last_change_seq": 反映済みの連番, "duration_ms": 所要時間}
+        """
+        started = time.perf_counter()
+        snapshot = self.clear_stats_repository.get_snapshot()
+        min_seq, _ = self.clear_stats_repository.get_change_seq_bounds()
+
+        full_rebuild = (
+            force_full
+            or snapshot is None
+            or (min_seq is not None and snapshot["last_change_seq"] < min_seq - 1)
+        )
+        applied_changes = 0
+        if full_rebuild:
+            last_change_seq = self.clear_stats_repository.rebuild_counts()
+        else:
+            last_change_seq = snapshot["last_change_seq"]
+            while True:
+                changes = self.clear_stats_repository.find_changes_after(last_change_seq, batch_size)
+                if not changes:
+                    break
+                self.clear_stats_repository.apply_count_deltas(self._count_deltas(changes))
+                applied_changes += len(changes)
+                last_change_seq = changes[-1]["seq"]
+                if len(changes) < batch_size:
+                    break
+
+        active_users = self.clear_stats_repository.count_active_players()
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.clear_stats_repository.save_snapshot(
+            active_users=active_users,
+            last_change_seq=last_change_seq,
+            full_rebuild=full_rebuild,
+            duration_ms=duration_ms,
+            built_at=datetime.now()
+        )
+        logger.info(
+            f"Refreshed clear stats: full_rebuild={full_rebuild}, applied_changes={applied_changes}, "
+            f"active_users={active_users}, duration_ms={duration_ms:.1f}"
+        )
+        return {
+            "full_rebuild": full_rebuild,
+            "applied_changes": applied_changes,
+            "active_users": active_users,
+            "last_change_seq": last_change_seq,
+            "duration_ms": duration_ms,
+        }
+
+    @staticmethod
+    def _count_deltas(changes: List[Dict[str, Any]]) -> Dict[StatKey, int]:
+        """変更ログの変更前後のビットマスクから、条件ごとの達成ユーザー数の増減を計算"""
+        deltas: Dict[StatKey, int] = {}
+        for change in changes:
+            old_flags = change["old_flags"] or 0
+            new_flags = change["new_flags"] or 0
+            changed = old_flags ^ new_flags
+            if not changed:
+                continue
+            for bit, condition in enumerate(CLEAR_FLAG_FIELDS):
+                if not changed & (1 << bit):
+                    continue
+                key = (change["game_id"], change["character_name"], change["difficulty"], change["mode"], condition)
+                deltas[key] = deltas.get(key, 0) + (1 if new_flags & (1 << bit) else -1)
+        return deltas
+
+    def get_rarity(self, game_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        条件ごとの達成率を取得
+
+        Returns:
+            {"active_users": 分母, "built_at": 集計日時, "stats": [集計行 + "rate": 達成率]}
+            （未集計の場合はactive_usersが0、built_atがNone）
+        """
+        snapshot = self.clear_stats_repository.get_snapshot()
+        if snapshot is None:
+            return {"active_users": 0, "built_at": None, "stats": []}
+
+        active_users = snapshot["active_users"]
+        stats = self.clear_stats_repository.find_stats(game_id)
+        for stat in stats:
+            stat["rate"] = round(stat["achieved_count"] / active_users, 6) if active_users else 0.0
+        return {"active_users": active_users, "built_at": snapshot["built_at"], "stats": stats}
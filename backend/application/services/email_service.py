@@ -1,6 +1,8 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from infrastructure.email.template_renderer import EmailTemplateRenderer, email_template_renderer
 
 
 class EmailSender(ABC):
@@ -11,55 +13,53 @@ class EmailSender(ABC):
         """メール送信の実装"""
         pass
 
+    def send_batch(self, messages: Sequence["EmailMessage"]) -> List[bool]:
+        """複数のメールを送信（接続を再利用できる実装は1つの接続でまとめて送信）"""
+        return [
+            self.send_email(message.to_email, message.subject, message.text_body, message.html_body)
+            for message in messages
+        ]
+
+    def close(self) -> None:
+        """接続などの資源を解放（必要な実装のみ）"""
+        pass
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    """送信するメール（宛先・件名・本文）"""
+    to_email: str
+    subject: str
+    text_body: str
+    html_body: str
+
 
 class EmailService:
     """メール送信のビジネスロジックを担当するサービス"""
     
-    def __init__(self, email_sender: EmailSender):
+    def __init__(self, email_sender: EmailSender, template_renderer: Optional[EmailTemplateRenderer] = None):
         self.email_sender = email_sender
+        self.template_renderer = template_renderer or email_template_renderer
         self.base_url = os.getenv("BASE_URL", "http://localhost:3000")
     
     def send_verification_email(self, to_email: str, username: str, verification_token: str) -> bool:
         """メールアドレス認証メールを送信"""
+        message = self.build_verification_email(to_email, username, verification_token)
+        return self.email_sender.send_email(message.to_email, message.subject, message.text_body, message.html_body)
+    
+    def build_email(self, template_name: str, to_email: str, locale: Optional[str] = None, **context) -> EmailMessage:
+        """テンプレート（infrastructure/email/templates）からメールを作成"""
+        subject, text_body, html_body = self.template_renderer.render(template_name, locale, **context)
+        return EmailMessage(to_email=to_email, subject=subject, text_body=text_body, html_body=html_body)
+    
+    def build_verification_email(
+        self, to_email: str, username: str, verification_token: str, locale: Optional[str] = None
+    ) -> EmailMessage:
+        """メールアドレス認証メールを作成（送信キューへの登録にも使用）"""
         verification_url = f"{self.base_url}/verify-email?token={verification_token}"
-        
-        subject = "東方プロジェクト クリアチェッカー - メールアドレス認証"
-        
-        html_body = f"""
-        <html>
-        <head></head>
-        <body>
-            <h2>メールアドレス認証</h2>
-            <p>{username} さん、</p>
-            <p>東方プロジェクト クリアチェッカーへのご登録ありがとうございます。</p>
-            <p>以下のリンクをクリックして、メールアドレスの認証を完了してください：</p>
-            <p><a href="{verification_url}" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">メールアドレスを認証</a></p>
-            <p>このリンクは24時間有効です。</p>
-            <p>もしこのメールに心当たりがない場合は、このメールを無視してください。</p>
-            <br>
-            <p>東方プロジェクト クリアチェッカー運営チーム</p>
-        </body>
-        </html>
-        """
-        
-        text_body = f"""
-メールアドレス認証
-
-{username} さん、
-
-東方プロジェクト クリアチェッカーへのご登録ありがとうございます。
-
-以下のURLにアクセスして、メールアドレスの認証を完了してください：
-{verification_url}
-
-このリンクは24時間有効です。
-
-もしこのメールに心当たりがない場合は、このメールを無視してください。
-
-東方プロジェクト クリアチェッカー運営チーム
-        """
-        
-        return self.email_sender.send_email(to_email, subject, text_body, html_body)
+        return self.build_email(
+            "verification", to_email, locale, username=username, verification_url=verification_url
+        )
 
 
 class MockEmailSender(EmailSender):
@@ -7,6 +7,7 @@ from ..dtos.game_character_dto import (
     UpdateGameCharacterDto,
     GameCharacterListDto
 )
+from .clear_record_rule_registry import ClearRecordRuleRegistry
 from infrastructure.logging.logger import LoggerFactory
 
 logger = LoggerFactory.get_logger(__name__)
@@ -65,6 +66,7 @@ class GameCharacterService:
             raise ValueError("Invalid game character data")
 
         saved_character = self.game_character_repository.save(character)
+        ClearRecordRuleRegistry.invalidate()
         logger.info(f"Game character created successfully: character_id={saved_character.id}, name={saved_character.character_name}")
         return self._to_dto(saved_character)
     
@@ -101,6 +103,7 @@ class GameCharacterService:
             raise ValueError("Invalid game character data")
 
         saved_character = self.game_character_repository.save(character)
+        ClearRecordRuleRegistry.invalidate()
         logger.info(f"Game character updated successfully: character_id={saved_character.id}, name={saved_character.character_name}")
         return self._to_dto(saved_character)
     
@@ -109,6 +112,7 @@ class GameCharacterService:
         logger.info(f"Deleting game character: character_id={character_id}")
         result = self.game_character_repository.delete(character_id)
         if result:
+            ClearRecordRuleRegistry.invalidate()
             logger.info(f"Game character deleted successfully: character_id={character_id}")
         else:
             logger.warning(f"Failed to delete game character: character_id={character_id}")
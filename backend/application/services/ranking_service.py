@@ -0,0 +1,83 @@
+"""
+ランキングサービス
+"""
+from typing import Any, Dict, Optional
+from domain.repositories.ranking_repository import RankingRepository
+from infrastructure.ranking.constants import RankingConstants
+from infrastructure.ranking.score_index import RankingIndex, ranking_index as global_ranking_index
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class RankingService:
+    """達成スコアによるリーダーボード・順位を提供するサービス"""
+
+    def __init__(self, ranking_repository: RankingRepository, ranking_index: Optional[RankingIndex] = None):
+        self.ranking_repository = ranking_repository
+        self.ranking_index = ranking_index or global_ranking_index
+
+    def _histogram_loader(self, game_id: int):
+        return lambda: self.ranking_repository.get_score_histogram(game_id)
+
+    def get_leaderboard(self, game_id: Optional[int], page: int, per_page: int) -> Dict[str, Any]:
+        """
+        リーダーボードの1ページを取得
+
+        順位インデックスでページ先頭のユーザーのスコアと、それより高いスコアの人数を求め、
+        (game_id, score) のインデックスをそのスコアから読み込みます。
+        ページ位置によらず、読み込むのは同点のユーザーとページ分の行だけです。
+
+        Args:
+            game_id: 作品ID（Noneの場合は全作品合計）
+            page: ページ番号（1始まり）
+            per_page: 1ページの件数
+
+        Returns:
+            {"game_id", "page", "per_page", "total", "entries": [{"rank", "user_id", "username", "score"}]}
+        """
+        index_game_id = RankingConstants.GLOBAL_GAME_ID if game_id is None else game_id
+        loader = self._histogram_loader(index_game_id)
+        start = (page - 1) * per_page + 1
+        boundary_score, above, total = self.ranking_index.locate(index_game_id, start, loader)
+
+        entries = []
+        if boundary_score is not None:
+            rows = self.ranking_repository.find_leaderboard(
+                index_game_id, boundary_score, start - 1 - above, per_page
+            )
+            for row in rows:
+                row["rank"], _ = self.ranking_index.rank(index_game_id, row["score"], loader)
+                entries.append(row)
+        logger.debug(f"Leaderboard: game_id={game_id}, page={page}, total={total}, entries={len(entries)}")
+        return {"game_id": game_id, "page": page, "per_page": per_page, "total": total, "entries": entries}
+
+    def get_user_rank(self, user_id: int, game_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        ユーザーの順位を取得（同点は同順位）
+
+        Returns:
+            {"game_id", "user_id", "score", "rank", "total"}（スコア0の場合、rankはNone）
+        """
+        index_game_id = RankingConstants.GLOBAL_GAME_ID if game_id is None else game_id
+        score = self.ranking_repository.find_score(user_id, index_game_id)
+        rank, total = self.ranking_index.rank(index_game_id, score, self._histogram_loader(index_game_id))
+        return {
+            "game_id": game_id,
+            "user_id": user_id,
+            "score": score,
+            "rank": rank if score > 0 else None,
+            "total": total,
+        }
+
+    def rebuild_scores(self) -> int:
+        """
+        全クリア記録から達成スコアを計算し直す（重み変更時・導入時）
+
+        Returns:
+            スコアを持つユーザー数
+        """
+        user_count = self.ranking_repository.rebuild_scores()
+        self.ranking_index.invalidate()
+        logger.info(f"Rebuilt user scores: users={user_count}")
+        return user_count
@@ -5,30 +5,35 @@ from application.dtos.user_dto import CreateUserDto, UpdateUserDto, UserResponse
 from infrastructure.security.password_hasher import PasswordHasher
 from infrastructure.security.jwt_handler import JWTHandler
 from infrastructure.security.token_generator import TokenGenerator
-from application.services.email_service import EmailService, EmailSender, MockEmailSender
-from infrastructure.email.smtp_email_sender import SMTPEmailSender
+from application.services.email_service import EmailService
+from domain.repositories.email_outbox_repository import EmailOutboxRepository
+from infrastructure.email.sender_factory import create_email_sender
 from infrastructure.logging.logger import LoggerFactory
-import os
 
 
 logger = LoggerFactory.get_logger(__name__)
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepository, email_service: Optional[EmailService] = None):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        email_service: Optional[EmailService] = None,
+        email_outbox: Optional[EmailOutboxRepository] = None
+    ):
         self.user_repository = user_repository
         self.password_hasher = PasswordHasher()
         self.jwt_handler = JWTHandler()
         
         # メールサービスの設定（開発環境では Mock を使用）
-        if email_service:
-            self.email_service = email_service
-        elif os.getenv("ENVIRONMENT") == "production":
-            smtp_sender = SMTPEmailSender()
-            self.email_service = EmailService(smtp_sender)
-        else:
-            mock_sender = MockEmailSender()
-            self.email_service = EmailService(mock_sender)
+        self.email_service = email_service or EmailService(create_email_sender())
+        # 送信キュー（指定時はユーザーの更新と同じトランザクションで登録し、送信ワーカーが送信する）
+        self.email_outbox = email_outbox
+    
+    def _queue_verification_email(self, to_email: str, username: str, verification_token: str) -> None:
+        """認証メールを送信キューに登録（呼び出し元のユーザー更新のコミットで書き込む）"""
+        message = self.email_service.build_verification_email(to_email, username, verification_token)
+        self.email_outbox.enqueue(message.to_email, message.subject, message.text_body, message.html_body)
 
     def create_user(self, create_dto: CreateUserDto) -> UserResponseDto:
         logger.debug(f"Creating user: username={create_dto.username}")
@@ -59,9 +64,16 @@ class UserService:
             verification_token_expires_at=expires_at
         )
 
+        if self.email_outbox is not None:
+            self._queue_verification_email(create_dto.email, create_dto.username, verification_token)
+
         created_user = self.user_repository.create(user)
         logger.info(f"User created: user_id={created_user.id}, username={created_user.username}")
 
+        if self.email_outbox is not None:
+            logger.info(f"Verification email queued for: {created_user.email}")
+            return self._to_response_dto(created_user)
+
         # 認証メール送信
         try:
             self.email_service.send_verification_email(
@@ -182,6 +194,12 @@ class UserService:
         user.verification_token = verification_token
         user.verification_token_expires_at = expires_at
         
+        if self.email_outbox is not None:
+            self._queue_verification_email(user.email, user.username, verification_token)
+            self.user_repository.update(user)
+            logger.info(f"Verification email queued for: {user.email}")
+            return True
+        
         self.user_repository.update(user)
         
         # 認証メール送信
@@ -0,0 +1,76 @@
+"""
+メール認証の定期クリーンアップサービス
+"""
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Dict, Optional
+from domain.repositories.user_cleanup_repository import UserCleanupRepository
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class VerificationSweepService:
+    """期限切れの認証トークンと、長期間メール未認証のユーザーを削除するサービス"""
+
+    def __init__(self, user_cleanup_repository: UserCleanupRepository):
+        self.user_cleanup_repository = user_cleanup_repository
+
+    @staticmethod
+    def _sweep_in_batches(sweep_batch: Callable[[], int], batch_size: int) -> Dict[str, int]:
+        """1トランザクションbatch_size件ずつ、対象がなくなるまで処理"""
+        rows = batches = 0
+        while True:
+            processed = sweep_batch()
+            if processed == 0:
+                break
+            rows += processed
+            batches += 1
+            if processed < batch_size:
+                break
+        return {"rows": rows, "batches": batches}
+
+    def sweep(
+        self,
+        batch_size: int,
+        purge_unverified_after: Optional[timedelta] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        期限切れの認証トークンを削除し、指定した場合は未認証のままのユーザーも削除
+
+        Args:
+            batch_size: 1トランザクションで処理する行数
+            purge_unverified_after: 登録からこの期間を過ぎた未認証ユーザーを削除（Noneの場合は削除しない）
+            now: 基準日時（DBの日時と同じくタイムゾーンなしのUTC、省略時は現在時刻）
+
+        Returns:
+            {"expired_tokens_cleared": 削除したトークン数, "unverified_users_purged": 削除したユーザー数,
+             "batches": トランザクション数, "duration_ms": 所要時間}
+        """
+        started = time.perf_counter()
+        now = now or datetime.now(UTC).replace(tzinfo=None)
+
+        purged = {"rows": 0, "batches": 0}
+        if purge_unverified_after is not None:
+            created_before = now - purge_unverified_after
+            purged = self._sweep_in_batches(
+                lambda: self.user_cleanup_repository.purge_unverified_users(created_before, batch_size),
+                batch_size
+            )
+        cleared = self._sweep_in_batches(
+            lambda: self.user_cleanup_repository.clear_expired_tokens(now, batch_size),
+            batch_size
+        )
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Swept email verification: expired_tokens_cleared={cleared['rows']}, "
+            f"unverified_users_purged={purged['rows']}, duration_ms={duration_ms:.1f}"
+        )
+        return {
+            "expired_tokens_cleared": cleared["rows"],
+            "unverified_users_purged": purged["rows"],
+            "batches": cleared["batches"] + purged["batches"],
+            "duration_ms": duration_ms,
+        }
@@ -0,0 +1,6 @@
+"""
+パフォーマンスベンチマークモジュール
+
+合成データを投入したデータベースに対して、ASGIアプリをプロセス内で実行し
+主要シナリオのレイテンシを計測します。
+"""
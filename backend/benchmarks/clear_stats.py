@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+クリア条件達成率統計の集計ジョブベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+合成データ（N人分のクリア記録グリッド）を投入し、全件集計と、
+M件の変更を反映する増分集計の所要時間を計測します。
+計測後に全件集計をやり直し、増分集計の結果と一致することも確認します。
+
+Usage:
+    python -m benchmarks.clear_stats [--users N] [--changes N] [--database-url URL]
+
+指定したデータベースのテーブルは削除・再作成されるため、専用のデータベースを使用してください。
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from application.services.clear_stats_service import ClearStatsService
+from benchmarks.data_generator import DEFAULT_SEED, SyntheticDataGenerator
+from domain.constants.clear_condition_constants import BASIC_CLEAR_FLAG_MASK, CLEAR_FLAG_FIELDS, clear_flags_to_mask
+from infrastructure.database.models.clear_record_change_model import ClearRecordChangeModel
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.jobs.constants import ClearStatsConstants
+
+
+def simulate_changes(engine, change_count: int, seed: int) -> int:
+    """
+    ランダムなクリア記録の基本条件を1つ反転し、変更ログと合わせて書き込む
+
+    Returns:
+        書き込んだ変更数
+    """
+    rng = random.Random(seed)
+    records = ClearRecordModel.__table__
+    changes = ClearRecordChangeModel.__table__
+    basic_bits = [bit for bit in range(len(CLEAR_FLAG_FIELDS)) if BASIC_CLEAR_FLAG_MASK & (1 << bit)]
+    now = datetime.now()
+
+    with engine.begin() as conn:
+        max_id = conn.execute(select(func.max(records.c.id))).scalar() or 0
+        ids = rng.sample(range(1, max_id + 1), min(change_count, max_id))
+        rows = conn.execute(select(records).where(records.c.id.in_(ids))).mappings().all()
+        change_rows = []
+        for row in rows:
+            old_flags = clear_flags_to_mask(row)
+            new_flags = old_flags ^ (1 << rng.choice(basic_bits))
+            conn.execute(
+                records.update().where(records.c.id == row["id"]).values(
+                    {field: bool(new_flags & (1 << bit)) for bit, field in enumerate(CLEAR_FLAG_FIELDS)}
+                )
+            )
+            change_rows.append({
+                "user_id": row["user_id"], "record_id": row["id"], "game_id": row["game_id"],
+                "character_name": row["character_name"], "difficulty": row["difficulty"],
+                "mode": row["mode"], "old_flags": old_flags, "new_flags": new_flags, "changed_at": now,
+            })
+        if change_rows:
+            conn.execute(changes.insert(), change_rows)
+    return len(change_rows)
+
+
+def run(database_url: str, user_count: int, change_count: int, seed: int) -> dict:
+    """合成データを投入して集計ジョブを計測"""
+    engine = create_engine(database_url, future=True)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    start = time.perf_counter()
+    dataset = SyntheticDataGenerator(seed).populate(engine, user_count)
+    populate_seconds = time.perf_counter() - start
+    print(f"📦 {dataset.user_count}人・{dataset.clear_record_count}件を投入しました（{populate_seconds:.1f}s）")
+
+    def refresh(force_full: bool) -> dict:
+        with Session() as session:
+            return ClearStatsService(ClearStatsRepositoryImpl(session)).refresh(
+                ClearStatsConstants.CHANGE_BATCH_SIZE, force_full=force_full
+            )
+
+    def stats() -> List[dict]:
+        with Session() as session:
+            return ClearStatsRepositoryImpl(session).find_stats()
+
+    full = refresh(force_full=True)
+    print(f"🧮 全件集計: {full['duration_ms']:.0f}ms（分母: {full['active_users']}人）")
+
+    applied = simulate_changes(engine, change_count, seed)
+    incremental = refresh(force_full=False)
+    print(f"➕ 増分集計: {incremental['duration_ms']:.0f}ms（{incremental['applied_changes']}件の変更）")
+
+    incremental_stats = stats()
+    refresh(force_full=True)
+    consistent = incremental_stats == stats()
+    print(f"{'✅' if consistent else '❌'} 増分集計と全件集計の結果が{'一致' if consistent else '不一致'}")
+
+    engine.dispose()
+    return {
+        "dataset": dataset.to_dict(),
+        "populate_seconds": round(populate_seconds, 1),
+        "full_rebuild_ms": round(full["duration_ms"], 1),
+        "incremental": {
+            "changes": applied,
+            "duration_ms": round(incremental["duration_ms"], 1),
+        },
+        "stat_rows": len(incremental_stats),
+        "consistent": consistent,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="クリア条件達成率統計の集計ジョブベンチマーク")
+    parser.add_argument("--users", type=int, default=100000, help="生成する一般ユーザー数（デフォルト: 100000）")
+    parser.add_argument("--changes", type=int, default=10000, help="増分集計で反映する変更数（デフォルト: 10000）")
+    parser.add_argument("--database-url", help="接続URL（省略時は一時ファイルのSQLite）")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="合成データの乱数シード")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        database_url = args.database_url or f"sqlite:///{Path(work_dir) / 'clear_stats.db'}"
+        result = run(database_url, args.users, args.changes, args.seed)
+    print(json.dumps(result, indent=2))
+    return 0 if result["consistent"] else 1
+
+
+if __name__ == "__main__":
+    exit(main())
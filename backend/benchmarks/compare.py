@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+ベンチマーク結果比較スクリプト
+
+2つの結果JSON（benchmarks/run.py の出力）をシナリオごとに比較し、
+指定した割合以上に悪化したシナリオがあれば終了コード1を返します。
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CURRENT.json [--metric p50_ms] [--threshold 10]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+
+def compare(baseline: dict, current: dict, metric: str, threshold_pct: float) -> Tuple[List[str], List[str]]:
+    """
+    シナリオごとの指標を比較
+
+    Args:
+        baseline: 基準となる結果
+        current: 比較対象の結果
+        metric: 比較する指標（例: p50_ms）
+        threshold_pct: 悪化と判定する変化率（%）
+
+    Returns:
+        (出力行のリスト, 悪化したシナリオ名のリスト)
+    """
+    lines, regressions = [], []
+    for name, current_stats in current["scenarios"].items():
+        baseline_stats = baseline["scenarios"].get(name)
+        if baseline_stats is None or not baseline_stats.get(metric):
+            lines.append(f"{name:<16} {'-':>10} {current_stats[metric]:>10.2f}  (new)")
+            continue
+        change_pct = (current_stats[metric] - baseline_stats[metric]) / baseline_stats[metric] * 100
+        marker = ""
+        if change_pct >= threshold_pct:
+            marker = "  ⚠️ regression"
+            regressions.append(name)
+        lines.append(
+            f"{name:<16} {baseline_stats[metric]:>10.2f} {current_stats[metric]:>10.2f} {change_pct:>+8.1f}%{marker}"
+        )
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ベンチマーク結果比較')
+    parser.add_argument('baseline', help='基準となる結果JSON')
+    parser.add_argument('current', help='比較対象の結果JSON')
+    parser.add_argument('--metric', default='p50_ms', help='比較する指標')
+    parser.add_argument('--threshold', type=float, default=10.0, help='悪化と判定する変化率（%%）')
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+
+    print(f"baseline={baseline['metadata'].get('commit')} current={current['metadata'].get('commit')} "
+          f"metric={args.metric}")
+    lines, regressions = compare(baseline, current, args.metric, args.threshold)
+    print("\n".join(lines))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
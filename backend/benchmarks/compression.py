@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+レスポンス圧縮ベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+代表的なレスポンス（クリア記録グリッド〈通常JSON・コンパクト形式〉・作品一覧・機体一覧）について、
+圧縮方式ごとの転送バイト数と、リクエストごとの圧縮CPU時間を計測します。
+事前圧縮済みのカタログは圧縮コストが生成時の1回のみになるため、その生成コストも出力します。
+
+Usage:
+    python -m benchmarks.compression [--records N] [--iterations N]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.data_generator import SyntheticDataGenerator
+from benchmarks.run import summarize
+from infrastructure.http.compression import available_encodings, compress
+from infrastructure.http.precompressed import PrecompressedPayload
+from presentation.api.compact_format import encode_compact_clear_records
+from presentation.api.responses import TrustedJSONResponse
+
+NOW = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def build_payloads(record_count: int) -> Dict[str, bytes]:
+    """計測対象のレスポンスボディを作成"""
+    generator = SyntheticDataGenerator()
+    records = []
+    user_id = 1
+    while len(records) < record_count:
+        records.extend(generator.generate_clear_records(user_id, skill=0.9))
+        user_id += 1
+    rows = [
+        {"id": index, **{key: value for key, value in record.items() if key != "user_id"},
+         "created_at": NOW, "last_updated_at": NOW}
+        for index, record in enumerate(records[:record_count], start=1)
+    ]
+    games = [
+        {"title": f"東方作品{index}", "series_number": str(index + 5), "release_year": 2000 + index,
+         "game_type": "main_series", "id": index}
+        for index in range(1, 31)
+    ]
+    characters = {
+        "game_characters": [
+            {"character_name": name, "description": None, "sort_order": index, "id": index,
+             "game_id": game_id, "created_at": NOW}
+            for game_id, names in generator.characters_by_game.items()
+            for index, name in enumerate(names, start=1)
+        ][:24],
+        "total_count": 24,
+    }
+    return {
+        "clear_records": TrustedJSONResponse(content=rows).body,
+        "clear_records_compact": TrustedJSONResponse(content=encode_compact_clear_records(rows)).body,
+        "games": TrustedJSONResponse(content=games).body,
+        "game_characters": TrustedJSONResponse(content=characters).body,
+    }
+
+
+def time_ms(func: Callable[[], object], iterations: int) -> dict:
+    """処理時間を計測"""
+    durations_ms: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations_ms.append((time.perf_counter() - start) * 1000)
+    return summarize(durations_ms, [], 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="レスポンス圧縮ベンチマーク")
+    parser.add_argument("--records", type=int, default=2000, help="クリア記録件数（デフォルト: 2000）")
+    parser.add_argument("--iterations", type=int, default=50, help="計測回数（デフォルト: 50）")
+    args = parser.parse_args()
+
+    results = {"encodings": list(available_encodings()), "payloads": {}}
+    for name, body in build_payloads(args.records).items():
+        entry = {"identity_bytes": len(body)}
+        for encoding in available_encodings():
+            compressed = compress(body, encoding)
+            entry[encoding] = {
+                "bytes": len(compressed),
+                "ratio": round(len(compressed) / len(body), 3),
+                "per_request_cpu": time_ms(lambda: compress(body, encoding), args.iterations),
+            }
+        payload = PrecompressedPayload.build(body)
+        entry["precompressed"] = {
+            "bytes": {encoding: len(variant) for encoding, variant in payload.variants.items()},
+            "build_cpu": time_ms(lambda: PrecompressedPayload.build(body), max(1, args.iterations // 10)),
+        }
+        results["payloads"][name] = entry
+
+        line = f"{name:>21}: identity={len(body)}B"
+        for encoding in available_encodings():
+            line += (f" {encoding}={entry[encoding]['bytes']}B"
+                     f" ({entry[encoding]['per_request_cpu']['p50_ms']:.3f}ms/req)")
+        print(line)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
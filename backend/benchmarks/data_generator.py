@@ -0,0 +1,240 @@
+"""
+ベンチマーク用合成データ生成
+
+domain/constants のゲーム・難易度・モード・特殊条件ルールと
+scripts/initialize_database.py のゲーム・機体マスタを用いて、
+N人分の現実的なクリア記録グリッドを生成・投入します。
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from domain.constants.clear_condition_constants import is_special_condition_available
+from domain.constants.game_constants import (
+    get_available_difficulties_for_game_and_mode,
+    get_available_modes_for_game,
+)
+from infrastructure.database.connection import Base
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.game_character_model import GameCharacterModel
+from infrastructure.database.models.game_memo_model import GameMemoModel
+from infrastructure.database.models.game_model import GameModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.security.password_hasher import PasswordHasher
+from scripts.initialize_database import GAMES_DATA, DatabaseInitializer
+
+
+# 乱数シード（同一シードで同一データセットを再現）
+DEFAULT_SEED = 20020811
+
+# 生成ユーザー共通のパスワード
+BENCHMARK_PASSWORD = "benchmark-password"
+BENCHMARK_ADMIN_USERNAME = "benchmark_admin"
+
+# 一括INSERTのチャンクサイズ
+INSERT_CHUNK_SIZE = 1000
+
+# 難易度別の記録存在確率（上手いユーザーほど高難易度の記録を持つ）
+DIFFICULTY_BASE_RATE = {
+    "Easy": 0.55,
+    "Normal": 0.75,
+    "Hard": 0.45,
+    "Lunatic": 0.2,
+    "Extra": 0.35,
+    "Phantasm": 0.15,
+}
+
+# 条件別の達成確率（記録が存在する前提）
+CONDITION_RATE = {
+    "is_cleared": 0.95,
+    "is_no_continue_clear": 0.7,
+    "is_no_bomb_clear": 0.2,
+    "is_no_miss_clear": 0.1,
+    "is_full_spell_card": 0.03,
+}
+SPECIAL_CONDITION_RATE = 0.15
+SPECIAL_CONDITION_KEYS = ("special_1", "special_2", "special_3")
+
+# メモを持つユーザーの割合
+MEMO_RATE = 0.3
+
+
+@dataclass
+class GeneratedDataset:
+    """投入したデータセットの概要"""
+    seed: int
+    user_count: int
+    usernames: List[str] = field(default_factory=list)
+    admin_username: str = BENCHMARK_ADMIN_USERNAME
+    password: str = BENCHMARK_PASSWORD
+    clear_record_count: int = 0
+    memo_count: int = 0
+
+    def to_dict(self) -> dict:
+        """結果出力用の辞書に変換（ユーザー名一覧は除外）"""
+        return {
+            "seed": self.seed,
+            "user_count": self.user_count,
+            "clear_record_count": self.clear_record_count,
+            "memo_count": self.memo_count,
+        }
+
+
+class SyntheticDataGenerator:
+    """合成データ生成クラス"""
+
+    def __init__(self, seed: int = DEFAULT_SEED):
+        """
+        Args:
+            seed: 乱数シード
+        """
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.characters_by_game = self._load_characters()
+
+    @staticmethod
+    def _load_characters() -> Dict[int, List[str]]:
+        """初期化スクリプトの機体マスタをゲームID別に整理"""
+        characters: Dict[int, List[str]] = {}
+        for game_id, name, _description, sort_order in sorted(
+            DatabaseInitializer()._get_all_characters_data(), key=lambda c: (c[0], c[3])
+        ):
+            characters.setdefault(game_id, []).append(name)
+        return characters
+
+    def generate_clear_records(self, user_id: int, skill: Optional[float] = None) -> List[dict]:
+        """
+        1ユーザー分のクリア記録グリッドを生成
+
+        Args:
+            user_id: ユーザーID
+            skill: 腕前（0.0〜1.0、省略時はランダム）
+
+        Returns:
+            clear_recordsテーブルへのINSERT用辞書のリスト
+        """
+        if skill is None:
+            skill = self.random.random()
+
+        records = []
+        now = datetime.utcnow()
+        for game_id, characters in self.characters_by_game.items():
+            # 腕前が高いユーザーほど多くの作品を遊んでいる
+            if self.random.random() > 0.3 + 0.6 * skill:
+                continue
+            for mode in get_available_modes_for_game(game_id):
+                for difficulty in get_available_difficulties_for_game_and_mode(game_id, mode):
+                    rate = DIFFICULTY_BASE_RATE.get(difficulty, 0.3) * (0.5 + skill)
+                    for character_name in characters:
+                        if self.random.random() > rate:
+                            continue
+                        records.append(
+                            self._build_record(user_id, game_id, character_name, difficulty, mode, skill, now)
+                        )
+        return records
+
+    def _build_record(
+        self,
+        user_id: int,
+        game_id: int,
+        character_name: str,
+        difficulty: str,
+        mode: str,
+        skill: float,
+        now: datetime
+    ) -> dict:
+        """1セル分のクリア記録を生成"""
+        record = {
+            "user_id": user_id,
+            "game_id": game_id,
+            "character_name": character_name,
+            "difficulty": difficulty,
+            "mode": mode,
+        }
+        for column, rate in CONDITION_RATE.items():
+            record[column] = self.random.random() < rate * (0.5 + skill)
+
+        for index, special_key in enumerate(SPECIAL_CONDITION_KEYS, start=1):
+            record[f"is_special_clear_{index}"] = (
+                is_special_condition_available(game_id, special_key)
+                and self.random.random() < SPECIAL_CONDITION_RATE * (0.5 + skill)
+            )
+
+        updated_at = now - timedelta(days=self.random.randint(0, 3650))
+        record["cleared_at"] = updated_at.date() if record["is_cleared"] else None
+        record["last_updated_at"] = updated_at
+        record["created_at"] = updated_at
+        return record
+
+    def populate(self, engine: Engine, user_count: int) -> GeneratedDataset:
+        """
+        テーブルを作り直して合成データを投入
+
+        Args:
+            engine: 投入先のEngine（既存データは削除されます）
+            user_count: 生成する一般ユーザー数
+
+        Returns:
+            投入したデータセットの概要
+        """
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+        dataset = GeneratedDataset(seed=self.seed, user_count=user_count)
+        hashed_password = PasswordHasher().hash_password(BENCHMARK_PASSWORD)
+        now = datetime.utcnow()
+
+        with engine.begin() as conn:
+            conn.execute(GameModel.__table__.insert(), [
+                {"id": game_id, "title": title, "series_number": series_number,
+                 "release_year": release_year, "game_type": game_type}
+                for game_id, (title, series_number, release_year, game_type) in enumerate(GAMES_DATA, start=1)
+            ])
+            conn.execute(GameCharacterModel.__table__.insert(), [
+                {"game_id": game_id, "character_name": name, "description": description,
+                 "sort_order": sort_order, "created_at": now}
+                for game_id, name, description, sort_order in DatabaseInitializer()._get_all_characters_data()
+            ])
+
+            users = [{
+                "id": 1, "username": BENCHMARK_ADMIN_USERNAME, "email": "admin@benchmark.example.com",
+                "hashed_password": hashed_password, "is_active": True, "is_admin": True,
+                "email_verified": True, "created_at": now, "updated_at": now,
+            }]
+            for user_id in range(2, user_count + 2):
+                username = f"bench_user_{user_id:06d}"
+                dataset.usernames.append(username)
+                users.append({
+                    "id": user_id, "username": username, "email": f"{username}@benchmark.example.com",
+                    "hashed_password": hashed_password, "is_active": True, "is_admin": False,
+                    "email_verified": True, "created_at": now, "updated_at": now,
+                })
+            for chunk in self._chunks(users):
+                conn.execute(UserModel.__table__.insert(), chunk)
+
+            for user_id in range(2, user_count + 2):
+                records = self.generate_clear_records(user_id)
+                for chunk in self._chunks(records):
+                    conn.execute(ClearRecordModel.__table__.insert(), chunk)
+                dataset.clear_record_count += len(records)
+
+            memos = [
+                {"user_id": user_id, "game_id": game_id, "memo": f"ベンチマーク用メモ {user_id}-{game_id}",
+                 "created_at": now, "updated_at": now}
+                for user_id in range(2, user_count + 2) if self.random.random() < MEMO_RATE
+                for game_id in self.random.sample(sorted(self.characters_by_game), 3)
+            ]
+            for chunk in self._chunks(memos):
+                conn.execute(GameMemoModel.__table__.insert(), chunk)
+            dataset.memo_count = len(memos)
+
+        return dataset
+
+    @staticmethod
+    def _chunks(rows: List[dict]) -> Iterator[List[dict]]:
+        """一括INSERT用にチャンク分割"""
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            yield rows[start:start + INSERT_CHUNK_SIZE]
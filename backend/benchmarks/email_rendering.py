@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+メール作成ベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+認証メールN通分について、本文の作成と送信用バイト列への組み立てにかかる1通あたりの時間を計測します。
+- email_mime: 本文をそのつど置換し、email.mimeのオブジェクトを作成・シリアライズ（従来の組み立て方）
+- template: コンパイル済みテンプレートとキャッシュした固定部分から組み立て
+
+Usage:
+    python -m benchmarks.email_rendering [--messages N]
+"""
+import argparse
+import json
+import sys
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+from string import Template
+from typing import Callable
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from application.services.email_service import EmailService, MockEmailSender
+from infrastructure.email.mime import encode_email_message
+from infrastructure.email.template_renderer import TEMPLATE_DIR
+
+FROM_EMAIL = "noreply@example.com"
+BASE_URL = "http://localhost:3000"
+
+
+SOURCES = {
+    suffix: (TEMPLATE_DIR / "ja" / f"verification{suffix}").read_text(encoding="utf-8")
+    for suffix in (".subject.txt", ".txt", ".html")
+}
+
+
+def build_with_email_mime(index: int) -> bytes:
+    """本文をそのつど置換してemail.mimeで組み立て"""
+    context = {
+        "username": f"user{index}",
+        "verification_url": f"{BASE_URL}/verify-email?token=token{index}",
+    }
+    subject = Template(SOURCES[".subject.txt"]).substitute(context)
+    text_body = Template(SOURCES[".txt"]).substitute(context)
+    html_body = Template(SOURCES[".html"]).substitute(context)
+
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject.strip()
+    msg["From"] = FROM_EMAIL
+    msg["To"] = f"user{index}@example.com"
+    msg.attach(MIMEText(text_body, "plain", "utf-8"))
+    msg.attach(MIMEText(html_body, "html", "utf-8"))
+    return msg.as_bytes()
+
+
+def make_template_builder() -> Callable[[int], bytes]:
+    service = EmailService(MockEmailSender())
+    service.base_url = BASE_URL
+
+    def build(index: int) -> bytes:
+        message = service.build_verification_email(f"user{index}@example.com", f"user{index}", f"token{index}")
+        return encode_email_message(FROM_EMAIL, message).data
+
+    return build
+
+
+def measure(build: Callable[[int], bytes], message_count: int) -> dict:
+    """1通あたりの作成時間（マイクロ秒）を計測"""
+    build(0)
+    start = time.perf_counter()
+    for index in range(message_count):
+        build(index)
+    seconds = time.perf_counter() - start
+    return {
+        "per_message_us": round(seconds / message_count * 1_000_000, 1),
+        "messages_per_second": round(message_count / seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="メール作成ベンチマーク")
+    parser.add_argument("--messages", type=int, default=10000, help="作成するメール数（デフォルト: 10000）")
+    args = parser.parse_args()
+
+    results = {
+        "messages": args.messages,
+        "email_mime": measure(build_with_email_mime, args.messages),
+        "template": measure(make_template_builder(), args.messages),
+    }
+    for name in ("email_mime", "template"):
+        print(f"{name:>10}: {results[name]['per_message_us']:>7.1f}µs/通")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+インポート時間計測スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+`python -X importtime` でアプリケーション（main）のインポート時間を計測し、
+自己時間の大きいモジュールを表示します。ワーカーの起動時間（オートスケール時のコールドスタート）の確認に使用します。
+インポート時間が予算を超えた場合は終了コード1を返します。
+
+Usage:
+    python -m benchmarks.import_time [--module main] [--repeat 3] [--top 15] [--budget-ms 2000]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# mainのインポート時間の予算（ミリ秒、計測環境に合わせて環境変数で変更可能）
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """
+    -X importtime の出力を解析
+
+    Args:
+        output: 標準エラー出力
+
+    Returns:
+        (モジュール名, 自己時間µs, 累積時間µs, ネストの深さ) のリスト（出力順）
+    """
+    timings = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def measure_import_time(module: str = "main", env: Optional[Dict[str, str]] = None) -> List[Tuple[str, int, int, int]]:
+    """
+    新しいPythonプロセスでモジュールをインポートし、インポート時間を計測
+
+    Raises:
+        RuntimeError: インポートに失敗した場合
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}: {result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def total_ms(timings: List[Tuple[str, int, int, int]], module: str) -> float:
+    """モジュールのインポート全体（依存モジュールを含む累積時間）をミリ秒で取得"""
+    for name, _, cumulative_us, depth in timings:
+        if name == module and depth == 0:
+            return cumulative_us / 1000
+    raise ValueError(f"Module not found in importtime output: {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='インポート時間計測')
+    parser.add_argument('--module', default='main', help='計測するモジュール（デフォルト: main）')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値を採用、デフォルト: 3）')
+    parser.add_argument('--top', type=int, default=15, help='表示するモジュール数（デフォルト: 15）')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'インポート時間の予算（ミリ秒、デフォルト: {DEFAULT_BUDGET_MS:g}）')
+    args = parser.parse_args()
+
+    runs = [measure_import_time(args.module) for _ in range(args.repeat)]
+    fastest = min(runs, key=lambda timings: total_ms(timings, args.module))
+    elapsed_ms = total_ms(fastest, args.module)
+
+    print(f"{'self_ms':>9} {'cumulative_ms':>14}  module")
+    for name, self_us, cumulative_us, _ in sorted(fastest, key=lambda timing: timing[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}  {name}")
+    print(json.dumps({
+        "module": args.module,
+        "import_ms": round(elapsed_ms, 1),
+        "budget_ms": args.budget_ms,
+        "modules": len(fastest),
+    }, indent=2))
+
+    if elapsed_ms > args.budget_ms:
+        print(f"❌ インポート時間が予算を超えています: {elapsed_ms:.1f}ms > {args.budget_ms:g}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
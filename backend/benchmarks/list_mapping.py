@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+クリア記録一覧の行→レスポンス変換ベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+大量の記録を持つユーザー（デフォルト5,000件）について、次の2経路のレイテンシと
+ピークメモリ（tracemalloc）を比較します。
+
+- orm:  ORMモデル → エンティティ → ClearRecordResponse → JSON（従来の経路）
+- rows: Core select の列の値 → JSON（一覧APIの高速パス）
+
+Usage:
+    python -m benchmarks.list_mapping [--rows N] [--iterations N]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.run import summarize
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from presentation.api.responses import TrustedJSONResponse
+from presentation.api.v1.clear_records import _to_response
+from presentation.schemas.clear_record_schema import ClearRecordResponse
+
+BENCHMARK_USER_ID = 1
+DIFFICULTIES = ("Easy", "Normal", "Hard", "Lunatic", "Extra")
+
+
+def populate(session, row_count: int) -> None:
+    """1ユーザー分のクリア記録を投入"""
+    rng = random.Random(0)
+    session.bulk_insert_mappings(ClearRecordModel, [
+        {
+            "user_id": BENCHMARK_USER_ID,
+            "game_id": index % 16 + 1,
+            "character_name": f"機体{index // 80:03d}",
+            "difficulty": DIFFICULTIES[index % len(DIFFICULTIES)],
+            "mode": "normal",
+            "is_cleared": True,
+            "is_no_continue_clear": rng.random() < 0.5,
+            "is_no_bomb_clear": rng.random() < 0.2,
+            "is_no_miss_clear": rng.random() < 0.1,
+            "cleared_at": date(2024, 1, 1) + timedelta(days=index % 365),
+        }
+        for index in range(row_count)
+    ])
+    session.commit()
+
+
+def measure(label: str, func: Callable[[], bytes], iterations: int) -> dict:
+    """レイテンシとピークメモリを計測"""
+    durations_ms: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations_ms.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    body = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = summarize(durations_ms, [], 0)
+    result["peak_memory_kib"] = round(peak / 1024, 1)
+    result["response_bytes"] = len(body)
+    print(f"{label:>5}: p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+          f"peak={result['peak_memory_kib']:.0f}KiB")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="クリア記録一覧の変換経路ベンチマーク")
+    parser.add_argument("--rows", type=int, default=5000, help="ユーザーの記録件数（デフォルト: 5000）")
+    parser.add_argument("--iterations", type=int, default=20, help="計測回数（デフォルト: 20）")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:")
+    ClearRecordModel.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    populate(session, args.rows)
+    repository = ClearRecordRepositoryImpl(session)
+
+    def orm_path() -> bytes:
+        records = asyncio.run(repository.find_by_user_id(BENCHMARK_USER_ID))
+        body = json.dumps(
+            [_to_response(record).model_dump(mode="json") for record in records],
+            ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        session.expunge_all()
+        return body
+
+    def rows_path() -> bytes:
+        rows = asyncio.run(repository.find_rows_by_user(BENCHMARK_USER_ID))
+        return TrustedJSONResponse(content=rows).body
+
+    # 両経路の出力が一致することを確認してから計測する
+    if json.loads(orm_path()) != [ClearRecordResponse(**row).model_dump(mode="json") for row in json.loads(rows_path())]:
+        raise RuntimeError("Fast path output differs from schema output")
+
+    results = {
+        "rows": args.rows,
+        "orm": measure("orm", orm_path, args.iterations),
+        "fast": measure("rows", rows_path, args.iterations),
+    }
+    print(json.dumps(results, indent=2))
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
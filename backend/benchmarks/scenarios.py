@@ -0,0 +1,123 @@
+"""
+ベンチマークシナリオ定義
+
+各シナリオは準備済みのBenchmarkContextを受け取り、1回分のHTTPリクエストを実行します。
+"""
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from domain.constants.game_constants import GameIds, get_available_difficulties_for_game_and_mode
+from infrastructure.security.jwt_handler import JWTHandler
+from benchmarks.data_generator import GeneratedDataset
+
+
+# シナリオで使用するユーザー数の上限（トークン発行コストを抑える）
+MAX_ACTIVE_USERS = 20
+
+# バッチ保存・トグル対象のゲーム
+TARGET_GAME_ID = GameIds.TOUHOU_06_EOSD
+
+
+@dataclass
+class BenchmarkContext:
+    """シナリオ実行コンテキスト"""
+    client: object
+    dataset: GeneratedDataset
+    characters_by_game: Dict[int, List[str]]
+    user_headers: List[dict] = field(default_factory=list)
+    admin_headers: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        jwt_handler = JWTHandler()
+        self.user_headers = [
+            {"Authorization": f"Bearer {jwt_handler.create_access_token({'sub': username})}"}
+            for username in self.dataset.usernames[:MAX_ACTIVE_USERS]
+        ]
+        self.admin_headers = {
+            "Authorization": f"Bearer {jwt_handler.create_access_token({'sub': self.dataset.admin_username})}"
+        }
+        self._user_cycle = itertools.cycle(range(len(self.user_headers)))
+        self._toggle = itertools.cycle([True, False])
+
+    def next_user_index(self) -> int:
+        """ラウンドロビンで次のユーザーを選択"""
+        return next(self._user_cycle)
+
+    def next_toggle(self) -> bool:
+        """トグル値を交互に返す"""
+        return next(self._toggle)
+
+
+def login(ctx: BenchmarkContext):
+    """ログイン（パスワード検証・トークン発行）"""
+    username = ctx.dataset.usernames[ctx.next_user_index()]
+    return ctx.client.post(
+        "/api/v1/users/login",
+        data={"username": username, "password": ctx.dataset.password}
+    )
+
+
+def grid_load(ctx: BenchmarkContext):
+    """全作品のクリア記録グリッド読み込み"""
+    return ctx.client.get("/api/v1/clear-records", headers=ctx.user_headers[ctx.next_user_index()])
+
+
+def batch_save(ctx: BenchmarkContext):
+    """1作品分のクリア記録グリッド一括保存"""
+    cleared = ctx.next_toggle()
+    records = [
+        {
+            "game_id": TARGET_GAME_ID,
+            "character_name": character_name,
+            "difficulty": difficulty,
+            "is_cleared": cleared,
+            "is_no_continue_clear": cleared,
+        }
+        for difficulty in get_available_difficulties_for_game_and_mode(TARGET_GAME_ID, "normal")
+        for character_name in ctx.characters_by_game[TARGET_GAME_ID]
+    ]
+    return ctx.client.post(
+        "/api/v1/clear-records/batch",
+        json={"records": records},
+        headers=ctx.user_headers[ctx.next_user_index()]
+    )
+
+
+def single_toggle(ctx: BenchmarkContext):
+    """単一セルのチェック切り替え"""
+    return ctx.client.post(
+        "/api/v1/clear-records/upsert",
+        json={
+            "game_id": TARGET_GAME_ID,
+            "character_name": ctx.characters_by_game[TARGET_GAME_ID][0],
+            "difficulty": "Lunatic",
+            "is_cleared": ctx.next_toggle(),
+        },
+        headers=ctx.user_headers[ctx.next_user_index()]
+    )
+
+
+def admin_user_list(ctx: BenchmarkContext):
+    """管理者による全ユーザー一覧取得"""
+    return ctx.client.get("/api/v1/admin/users", headers=ctx.admin_headers)
+
+
+def memo_save(ctx: BenchmarkContext):
+    """ゲームメモ保存"""
+    return ctx.client.post(
+        f"/api/v1/game-memos/{TARGET_GAME_ID}/upsert",
+        json={"memo": "ベンチマーク" * 50},
+        headers=ctx.user_headers[ctx.next_user_index()]
+    )
+
+
+# シナリオ名と実行関数の対応（実行順）
+SCENARIOS: Dict[str, Callable[[BenchmarkContext], object]] = {
+    "login": login,
+    "grid_load": grid_load,
+    "batch_save": batch_save,
+    "single_toggle": single_toggle,
+    "admin_user_list": admin_user_list,
+    "memo_save": memo_save,
+}
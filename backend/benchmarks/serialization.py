@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+一覧APIのレスポンスシリアライズベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+一覧エンドポイントごとに、次の2経路のシリアライズ時間を比較します（DBアクセスは含みません）。
+
+- schema:  レスポンスモデル生成 → response_modelでの再検証 → JSONResponse（標準json）
+- trusted: 辞書の組み立て → TrustedJSONResponse（orjson、再検証なし）
+
+Usage:
+    python -m benchmarks.serialization [--records N] [--iterations N]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from application.dtos.game_character_dto import GameCharacterDto, GameCharacterListDto
+from application.dtos.game_dto import GameDto
+from application.dtos.user_dto import UserResponseDto
+from benchmarks.run import summarize
+from domain.entities.clear_record import ClearRecord
+from domain.entities.game_memo import GameMemo
+from domain.value_objects.game_type import GameType
+from presentation.api.responses import TrustedJSONResponse
+from presentation.api.v1 import admin, game_characters, games
+from presentation.api.v1.clear_records import _to_response
+from presentation.api.v1.game_memos import GameMemoResponse
+from presentation.schemas.clear_record_schema import ClearRecordResponse
+from presentation.schemas.game_character_schema import GameCharacterListResponse, GameCharacterResponse
+from presentation.schemas.game_schema import GameResponse
+from presentation.schemas.user_schema import UserResponse
+
+NOW = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def schema_path(response_model, build_models: Callable[[], object]) -> Callable[[], bytes]:
+    """FastAPI標準の経路（モデル生成＋response_model再検証＋標準json）"""
+    adapter = TypeAdapter(response_model)
+
+    def run() -> bytes:
+        validated = adapter.validate_python(build_models(), from_attributes=True)
+        return JSONResponse(content=adapter.dump_python(validated, mode="json")).body
+    return run
+
+
+def trusted_path(build_payload: Callable[[], object]) -> Callable[[], bytes]:
+    """信頼済みデータをそのままorjsonで出力する経路"""
+    def run() -> bytes:
+        return TrustedJSONResponse(content=build_payload()).body
+    return run
+
+
+def build_endpoints(record_count: int) -> Dict[str, Dict[str, Callable[[], bytes]]]:
+    """エンドポイントごとの計測対象を作成"""
+    records = [
+        ClearRecord(
+            id=index, user_id=1, game_id=index % 16 + 1, character_name=f"霊夢{index % 12}",
+            difficulty="Normal", is_cleared=True, is_no_continue_clear=index % 2 == 0,
+            cleared_at=date(2024, 1, 1), last_updated_at=NOW, created_at=NOW
+        ) for index in range(record_count)
+    ]
+    rows = [_to_response(record).model_dump() for record in records]
+    game_dtos = [
+        GameDto(id=index, title=f"東方作品{index}", series_number=Decimal(index + 5),
+                release_year=2000 + index, game_type=GameType.MAIN_SERIES)
+        for index in range(1, 31)
+    ]
+    character_list = GameCharacterListDto(
+        game_characters=[
+            GameCharacterDto(id=index, game_id=1, character_name=f"博麗霊夢（夢符）{index}",
+                             description="霊撃タイプ", sort_order=index, created_at=NOW)
+            for index in range(16)
+        ],
+        total_count=16
+    )
+    memos = [
+        GameMemo(id=index, user_id=1, game_id=index, memo="Extraの道中が難しい" * 10,
+                 created_at=NOW, updated_at=NOW)
+        for index in range(1, 17)
+    ]
+    users = [
+        UserResponseDto(id=index, username=f"user{index:05d}", email=f"user{index:05d}@example.com",
+                        is_active=True, is_admin=False, email_verified=True,
+                        created_at=NOW, updated_at=NOW)
+        for index in range(record_count // 10)
+    ]
+
+    return {
+        "clear_records": {
+            "schema": schema_path(List[ClearRecordResponse], lambda: [_to_response(r) for r in records]),
+            "trusted": trusted_path(lambda: rows),
+        },
+        "games": {
+            "schema": schema_path(List[GameResponse], lambda: [
+                GameResponse(id=d.id, title=d.title, series_number=d.series_number,
+                             release_year=d.release_year, game_type=d.game_type.value)
+                for d in game_dtos
+            ]),
+            "trusted": trusted_path(lambda: [games._to_payload(d) for d in game_dtos]),
+        },
+        "game_characters": {
+            "schema": schema_path(GameCharacterListResponse, lambda: GameCharacterListResponse(
+                game_characters=[
+                    GameCharacterResponse(id=d.id, game_id=d.game_id, character_name=d.character_name,
+                                          description=d.description, sort_order=d.sort_order,
+                                          created_at=d.created_at)
+                    for d in character_list.game_characters
+                ],
+                total_count=character_list.total_count
+            )),
+            "trusted": trusted_path(lambda: {
+                "game_characters": [game_characters._to_payload(d) for d in character_list.game_characters],
+                "total_count": character_list.total_count,
+            }),
+        },
+        "game_memos": {
+            "schema": schema_path(List[GameMemoResponse], lambda: [
+                GameMemoResponse(id=m.id, user_id=m.user_id, game_id=m.game_id, memo=m.memo,
+                                 created_at=m.created_at.isoformat(), updated_at=m.updated_at.isoformat())
+                for m in memos
+            ]),
+            "trusted": trusted_path(lambda: [m.to_dict() for m in memos]),
+        },
+        "admin_users": {
+            "schema": schema_path(List[UserResponse], lambda: users),
+            "trusted": trusted_path(lambda: [admin._user_payload(u) for u in users]),
+        },
+    }
+
+
+def measure(func: Callable[[], bytes], iterations: int) -> dict:
+    """シリアライズ時間を計測"""
+    durations_ms: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations_ms.append((time.perf_counter() - start) * 1000)
+    return summarize(durations_ms, [], 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="一覧APIのレスポンスシリアライズベンチマーク")
+    parser.add_argument("--records", type=int, default=2000, help="クリア記録件数（デフォルト: 2000）")
+    parser.add_argument("--iterations", type=int, default=50, help="計測回数（デフォルト: 50）")
+    args = parser.parse_args()
+
+    results = {}
+    for endpoint, paths in build_endpoints(args.records).items():
+        # 両経路の出力が一致することを確認してから計測する
+        if json.loads(paths["schema"]()) != json.loads(paths["trusted"]()):
+            raise RuntimeError(f"Trusted output differs from schema output: {endpoint}")
+        results[endpoint] = {name: measure(func, args.iterations) for name, func in paths.items()}
+        schema_p50 = results[endpoint]["schema"]["p50_ms"]
+        trusted_p50 = results[endpoint]["trusted"]["p50_ms"]
+        print(f"{endpoint:>16}: schema p50={schema_p50:.3f}ms trusted p50={trusted_p50:.3f}ms "
+              f"({schema_p50 / trusted_p50 if trusted_p50 else 0:.1f}x)")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
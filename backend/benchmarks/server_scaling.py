@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+ワーカー数スケーリングベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+合成データを投入した一時SQLiteデータベースに対して本番用の起動スクリプト（server.py）でサーバーを起動し、
+ワーカー数ごとに同時接続数を固定したクローズドループの負荷をかけて毎秒リクエスト数とレイテンシーを計測します。
+- login: ログイン（Argon2によるパスワード検証でCPUを使用）
+- games: ゲーム一覧の取得
+
+1ワーカーに対する倍率（speedup）がCPUコア数に近いほど、ワーカーを増やす効果があります。
+
+Usage:
+    python -m benchmarks.server_scaling [--workers 1,2,4] [--concurrency 32] [--duration 10] [--users 200]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import httpx
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.data_generator import BENCHMARK_PASSWORD
+from benchmarks.run import percentile
+from loadtest.server import ServerProcess
+from server import available_cpu_count
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8002
+
+
+def default_worker_counts(cpu_count: int) -> List[int]:
+    """2の累乗でCPUコア数までのワーカー数（CPUコア数が2の累乗でない場合は末尾に追加）"""
+    counts = [1]
+    while counts[-1] * 2 <= cpu_count:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpu_count:
+        counts.append(cpu_count)
+    return counts
+
+
+def login_request(usernames: List[str]) -> Callable[[httpx.AsyncClient], asyncio.Future]:
+    """ログインリクエスト（ユーザーはランダムに選択）"""
+    def send(client: httpx.AsyncClient):
+        return client.post(
+            "/api/v1/users/login",
+            data={"username": random.choice(usernames), "password": BENCHMARK_PASSWORD},
+        )
+    return send
+
+
+def games_request(client: httpx.AsyncClient):
+    """ゲーム一覧の取得リクエスト"""
+    return client.get("/api/v1/games")
+
+
+async def run_closed_loop(base_url: str, send, concurrency: int, duration: float) -> Dict:
+    """
+    同時接続数を固定し、各クライアントが応答を受け取るたびに次のリクエストを送信する
+
+    Returns:
+        リクエスト数・エラー数・毎秒リクエスト数・レイテンシー（ミリ秒）
+    """
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client_loop(client: httpx.AsyncClient):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await send(client)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ワーカー数スケーリングベンチマーク')
+    parser.add_argument('--workers', help='計測するワーカー数（カンマ区切り、デフォルト: CPUコア数までの2の累乗）')
+    parser.add_argument('--concurrency', type=int, default=32, help='同時接続数（デフォルト: 32）')
+    parser.add_argument('--duration', type=float, default=10.0, help='シナリオごとの計測時間（秒、デフォルト: 10）')
+    parser.add_argument('--users', type=int, default=200, help='投入する既存ユーザー数（デフォルト: 200）')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='起動するサーバーのポート')
+    args = parser.parse_args()
+
+    # リクエストごとのhttpxログを抑制
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    cpu_count = available_cpu_count()
+    worker_counts = ([int(count) for count in args.workers.split(",")] if args.workers
+                     else default_worker_counts(cpu_count))
+    results: Dict[str, List[Dict]] = {"login": [], "games": []}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        database_url = f"sqlite:///{Path(work_dir) / 'server_scaling.db'}"
+        print(f"🧪 合成データを投入中... (users={args.users})")
+        dataset = ServerProcess(database_url, HOST, args.port).seed(args.users)
+        scenarios = {"login": login_request(dataset.usernames), "games": games_request}
+
+        for workers in worker_counts:
+            server = ServerProcess(database_url, HOST, args.port, workers=workers, production=True)
+            print(f"🚀 workers={workers} で起動中...")
+            server.start()
+            try:
+                for name, send in scenarios.items():
+                    result = asyncio.run(run_closed_loop(server.base_url, send, args.concurrency, args.duration))
+                    results[name].append({"workers": workers, **result})
+            finally:
+                server.stop()
+
+    for name, rows in results.items():
+        baseline = rows[0]["rps"] or 1.0
+        print(f"\n📈 {name}")
+        for row in rows:
+            row["speedup"] = round(row["rps"] / baseline, 2)
+            print(f"  workers={row['workers']:>3} rps={row['rps']:>8.1f} p50={row['p50_ms']:>8.1f}ms "
+                  f"p99={row['p99_ms']:>8.1f}ms x{row['speedup']:.2f} err={row['errors']}")
+
+    print(json.dumps({
+        "cpu_count": cpu_count,
+        "concurrency": args.concurrency,
+        "duration_sec": args.duration,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
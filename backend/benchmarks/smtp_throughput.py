@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+SMTP送信スループットベンチマーク
+東方プロジェクトクリア状況チェッカー用
+
+ローカルのSMTPサーバー（aiosmtpd）を起動し、送信方式ごとの毎秒送信数を計測します。
+- per_message: メールごとに接続・切断（接続プール導入前の送信方式）
+- pooled: 接続プールで1通ずつ送信（接続を再利用）
+- batched: 送信キューのワーカーと同じく、スレッド数に分割して1接続でまとめて送信
+- async: aiosmtplibの接続プールで同じ分割数をまとめて送信（aiosmtplibインストール時のみ）
+
+ローカルのサーバーは接続のコストがほぼないため、`--handshake-ms` でEHLO応答を遅らせて
+本番のSMTPサーバーでのSTARTTLS・認証の往復時間を模擬します。
+
+Usage:
+    python -m benchmarks.smtp_throughput [--messages N] [--connections N] [--handshake-ms N]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import smtplib
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+from application.services.email_service import EmailMessage
+from infrastructure.email.mime import EncodedEmail, encode_email_message
+from infrastructure.email.smtp_pool import AsyncSMTPConnectionPool, SMTPConnectionPool, aiosmtplib
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:  # pragma: no cover - 任意依存
+    Controller = None
+
+HOST = "127.0.0.1"
+
+
+class CountingHandler:
+    """受信したメール数を数え、EHLOの応答を遅らせるSMTPハンドラー"""
+
+    def __init__(self, handshake_seconds: float):
+        self.handshake_seconds = handshake_seconds
+        self.received = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        await asyncio.sleep(self.handshake_seconds)
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+def build_messages(count: int) -> List[EncodedEmail]:
+    """計測用のメールを作成"""
+    return [
+        encode_email_message("noreply@example.com", EmailMessage(
+            f"user{index}@example.com", f"ベンチマーク {index}",
+            f"ベンチマーク用のメール本文 {index}\n" * 20, f"<p>ベンチマーク用のメール本文 {index}</p>" * 20
+        ))
+        for index in range(count)
+    ]
+
+
+def split(messages: List[EncodedEmail], count: int) -> List[List[EncodedEmail]]:
+    return [messages[index::count] for index in range(count)]
+
+
+def send_per_message(port: int, messages: List[EncodedEmail], connections: int) -> int:
+    def send(message: EncodedEmail) -> None:
+        with smtplib.SMTP(HOST, port) as server:
+            server.sendmail(message.from_email, [message.to_email], message.data)
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        list(executor.map(send, messages))
+    return len(messages)
+
+
+def send_pooled(port: int, messages: List[EncodedEmail], connections: int) -> int:
+    pool = SMTPConnectionPool(HOST, port, use_tls=False, max_connections=connections)
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        list(executor.map(lambda message: pool.send_messages([message]), messages))
+    pool.close()
+    return pool.created_count
+
+
+def send_batched(port: int, messages: List[EncodedEmail], connections: int) -> int:
+    pool = SMTPConnectionPool(HOST, port, use_tls=False, max_connections=connections)
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        list(executor.map(pool.send_messages, split(messages, connections)))
+    pool.close()
+    return pool.created_count
+
+
+def send_async(port: int, messages: List[EncodedEmail], connections: int) -> int:
+    async def send() -> int:
+        pool = AsyncSMTPConnectionPool(HOST, port, use_tls=False, max_connections=connections)
+        await asyncio.gather(*(pool.send_messages(group) for group in split(messages, connections)))
+        await pool.close()
+        return pool.created_count
+
+    return asyncio.run(send())
+
+
+def measure(handler: CountingHandler, send: Callable[[], int], message_count: int) -> Dict[str, float]:
+    """送信にかかった時間と毎秒送信数を計測"""
+    handler.received = 0
+    start = time.perf_counter()
+    connections = send()
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": round(seconds, 3),
+        "messages_per_second": round(message_count / seconds, 1),
+        "connections": connections,
+        "received": handler.received,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SMTP送信スループットベンチマーク")
+    parser.add_argument("--messages", type=int, default=500, help="送信するメール数（デフォルト: 500）")
+    parser.add_argument("--connections", type=int, default=4, help="同時接続数（デフォルト: 4）")
+    parser.add_argument("--handshake-ms", type=float, default=50,
+                        help="接続ごとのハンドシェイク遅延（ミリ秒、デフォルト: 50）")
+    args = parser.parse_args()
+
+    if Controller is None:
+        print("❌ aiosmtpd がインストールされていません（pip install -r requirements-dev.txt）")
+        return 1
+
+    # aiosmtpdのコマンドごとのログを抑止
+    logging.getLogger("mail.log").setLevel(logging.WARNING)
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        port = sock.getsockname()[1]
+    handler = CountingHandler(args.handshake_ms / 1000)
+    controller = Controller(handler, hostname=HOST, port=port)
+    controller.start()
+
+    messages = build_messages(args.messages)
+    modes = {
+        "per_message": send_per_message,
+        "pooled": send_pooled,
+        "batched": send_batched,
+    }
+    if aiosmtplib is not None:
+        modes["async"] = send_async
+
+    results = {"messages": args.messages, "connections": args.connections, "handshake_ms": args.handshake_ms}
+    try:
+        for name, send in modes.items():
+            result = measure(handler, lambda: send(port, messages, args.connections), args.messages)
+            results[name] = result
+            print(f"{name:>11}: {result['messages_per_second']:>8.1f} msg/s "
+                  f"({result['seconds']:.2f}s, {result['connections']} connections)")
+    finally:
+        controller.stop()
+
+    print(json.dumps(results, indent=2))
+    return 0 if all(results[name]["received"] == args.messages for name in modes) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -215,4 +215,72 @@ def is_special_condition_available(game_id: int, special_key: str) -> bool:
         bool: 利用可能かどうか
     """
     special_conditions = get_special_conditions_for_game(game_id)
-    return special_key in special_conditions
\ No newline at end of file
+    return special_key in special_conditions
+
+# クリア条件フラグのビット順序（ビットマスク表現に使用、並び順は変更禁止）
+CLEAR_FLAG_FIELDS = (
+    "is_cleared",
+    "is_no_continue_clear",
+    "is_no_bomb_clear",
+    "is_no_miss_clear",
+    "is_full_spell_card",
+    "is_special_clear_1",
+    "is_special_clear_2",
+    "is_special_clear_3",
+)
+
+# 特殊条件キーと対応するフラグ列
+SPECIAL_CONDITION_FLAG_FIELDS = {
+    "special_1": "is_special_clear_1",
+    "special_2": "is_special_clear_2",
+    "special_3": "is_special_clear_3",
+}
+
+# 全作品共通で利用可能な基本条件のビットマスク
+BASIC_CLEAR_FLAG_MASK = 0b00011111
+
+
+def get_clear_flag_bit(field_name: str) -> int:
+    """
+    クリア条件フラグ列に対応するビットを取得
+    
+    Args:
+        field_name: フラグ列名（例: is_no_miss_clear）
+    
+    Returns:
+        int: ビット値
+    """
+    return 1 << CLEAR_FLAG_FIELDS.index(field_name)
+
+
+def clear_flags_to_mask(record_data: dict) -> int:
+    """
+    クリア記録のフラグをビットマスクに変換
+    
+    Args:
+        record_data: フラグ列を含む辞書
+    
+    Returns:
+        int: 達成済み条件のビットマスク
+    """
+    mask = 0
+    for bit, field_name in enumerate(CLEAR_FLAG_FIELDS):
+        if record_data.get(field_name):
+            mask |= 1 << bit
+    return mask
+
+
+def get_allowed_clear_flag_mask_for_game(game_id: int) -> int:
+    """
+    ゲームで記録可能なクリア条件のビットマスクを取得（基本条件＋利用可能な特殊条件）
+    
+    Args:
+        game_id: ゲームID
+    
+    Returns:
+        int: 記録可能な条件のビットマスク
+    """
+    mask = BASIC_CLEAR_FLAG_MASK
+    for special_key in get_special_conditions_for_game(game_id):
+        mask |= get_clear_flag_bit(SPECIAL_CONDITION_FLAG_FIELDS[special_key])
+    return mask
@@ -0,0 +1,87 @@
+"""
+ランキング（達成スコア）関連の定数定義
+"""
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from domain.constants.clear_condition_constants import (
+    CLEAR_FLAG_FIELDS,
+    SPECIAL_CONDITION_FLAG_FIELDS,
+    SpecialClearConditions,
+    get_special_conditions_for_game,
+)
+
+
+# 難易度ごとのスコア倍率
+DIFFICULTY_SCORE_WEIGHTS = {
+    "Easy": 1,
+    "Normal": 2,
+    "Hard": 3,
+    "Lunatic": 5,
+    "Extra": 4,
+    "Phantasm": 5,
+}
+DEFAULT_DIFFICULTY_SCORE_WEIGHT = 1
+
+# 基本クリア条件ごとのスコア
+CONDITION_SCORE_WEIGHTS = {
+    "is_cleared": 10,
+    "is_no_continue_clear": 5,
+    "is_no_bomb_clear": 10,
+    "is_no_miss_clear": 15,
+    "is_full_spell_card": 20,
+}
+
+# 特殊クリア条件のスコア（GAME_SPECIAL_CONDITIONSの条件キー単位で上書き）
+DEFAULT_SPECIAL_CONDITION_SCORE = 8
+SPECIAL_CONDITION_SCORE_WEIGHTS = {
+    SpecialClearConditions.BASIC_SETUP_ONLY: 12,
+    SpecialClearConditions.STARTER_DECK_ONLY: 12,
+}
+
+
+@lru_cache(maxsize=None)
+def get_condition_scores_for_game(game_id: int) -> Tuple[int, ...]:
+    """
+    ゲームのクリア条件ビットごとのスコアを取得（利用できない特殊条件は0）
+
+    Args:
+        game_id: ゲームID
+
+    Returns:
+        Tuple[int, ...]: CLEAR_FLAG_FIELDSの順のスコア
+    """
+    special_conditions = get_special_conditions_for_game(game_id)
+    special_keys: Dict[str, str] = {field: key for key, field in SPECIAL_CONDITION_FLAG_FIELDS.items()}
+    scores = []
+    for field_name in CLEAR_FLAG_FIELDS:
+        if field_name in CONDITION_SCORE_WEIGHTS:
+            scores.append(CONDITION_SCORE_WEIGHTS[field_name])
+            continue
+        condition = special_conditions.get(special_keys[field_name])
+        scores.append(
+            SPECIAL_CONDITION_SCORE_WEIGHTS.get(condition["key"], DEFAULT_SPECIAL_CONDITION_SCORE) if condition else 0
+        )
+    return tuple(scores)
+
+
+def calculate_record_score(game_id: int, difficulty: str, flags: int) -> int:
+    """
+    クリア記録1件の達成スコアを計算
+
+    Args:
+        game_id: ゲームID
+        difficulty: 難易度
+        flags: 達成済み条件のビットマスク
+
+    Returns:
+        int: (達成済み条件のスコアの合計) × 難易度倍率
+    """
+    if not flags:
+        return 0
+    score = sum(
+        condition_score
+        for bit, condition_score in enumerate(get_condition_scores_for_game(game_id))
+        if flags & (1 << bit)
+    )
+    return score * DIFFICULTY_SCORE_WEIGHTS.get(difficulty, DEFAULT_DIFFICULTY_SCORE_WEIGHT)
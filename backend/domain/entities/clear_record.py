@@ -8,6 +8,14 @@ from typing import Optional
 class ClearRecord:
     """機体別個別条件記録エンティティ"""
     
+    # 一覧取得時に大量生成されるため、インスタンス辞書を持たない
+    __slots__ = (
+        "id", "user_id", "game_id", "character_name", "difficulty", "mode",
+        "is_cleared", "is_no_continue_clear", "is_no_bomb_clear", "is_no_miss_clear",
+        "is_full_spell_card", "is_special_clear_1", "is_special_clear_2", "is_special_clear_3",
+        "cleared_at", "last_updated_at", "created_at",
+    )
+    
     def __init__(
         self,
         id: Optional[int] = None,
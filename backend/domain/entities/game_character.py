@@ -8,6 +8,8 @@ from typing import Optional
 class GameCharacter:
     """統合ゲーム機体エンティティ"""
     
+    __slots__ = ("id", "game_id", "character_name", "description", "sort_order", "created_at")
+    
     def __init__(
         self,
         id: Optional[int] = None,
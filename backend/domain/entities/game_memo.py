@@ -8,6 +8,8 @@ from typing import Optional
 class GameMemo:
     """作品ごとメモエンティティ"""
     
+    __slots__ = ("id", "user_id", "game_id", "memo", "created_at", "updated_at")
+    
     def __init__(
         self,
         id: Optional[int] = None,
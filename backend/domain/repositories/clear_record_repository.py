@@ -2,7 +2,8 @@
 クリア記録リポジトリインターフェース
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from domain.entities.clear_record import ClearRecord
 
 
@@ -80,4 +81,50 @@ class ClearRecordRepository(ABC):
     @abstractmethod
     async def create_or_update(self, clear_record: ClearRecord) -> ClearRecord:
         """クリア記録を作成または更新（UPSERT）"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def find_rows_by_user(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        ユーザーのクリア記録を一覧表示用の列のみの辞書で取得（読み取り専用）
+
+        エンティティを生成しないため、大量の記録を返す一覧APIで使用します。
+        """
+        pass
+    
+    @abstractmethod
+    async def find_changes_since(self, user_id: int, since_seq: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        ユーザーの変更ログのうち、指定した連番より後のものを古い順に取得（読み取り専用）
+
+        Args:
+            user_id: ユーザーID
+            since_seq: クライアントが取得済みの最後の連番
+            limit: 最大件数
+        """
+        pass
+    
+    @abstractmethod
+    async def get_change_seq_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        """変更ログに残っている最小・最大の連番を取得（空の場合は (None, None)）"""
+        pass
+    
+    @abstractmethod
+    async def delete_changes_before(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        指定日時より古い変更ログを削除（最新の1件は連番の基準として残す）
+
+        Returns:
+            削除した件数
+        """
+        pass
+    
+    @abstractmethod
+    async def find_achievements(self, clear_record: ClearRecord) -> List[Dict[str, Any]]:
+        """記録の条件ごとの初回達成日時（condition, achieved_at）を達成順に取得"""
+        pass
+    
+    @abstractmethod
+    async def find_monthly_progress(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ユーザーの月別・作品別・条件別の初回達成数（game_id, month, condition, count）を作品・月の順に取得"""
+        pass
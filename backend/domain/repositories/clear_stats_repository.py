@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 達成率統計の集計単位（作品ID・機体名・難易度・モード・条件列名）
+StatKey = Tuple[int, str, str, str, str]
+
+
+class ClearStatsRepository(ABC):
+    @abstractmethod
+    def get_snapshot(self) -> Optional[Dict[str, Any]]:
+        """集計状態（未集計の場合はNone）"""
+        pass
+
+    @abstractmethod
+    def get_change_seq_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        """変更ログに残っている最小・最大の連番"""
+        pass
+
+    @abstractmethod
+    def rebuild_counts(self) -> int:
+        """全クリア記録から達成ユーザー数を集計し直し、集計時点の変更ログの最大連番を返す"""
+        pass
+
+    @abstractmethod
+    def find_changes_after(self, since_seq: int, limit: int) -> List[Dict[str, Any]]:
+        """全ユーザーの変更ログのうち、指定した連番より後のものを古い順に取得"""
+        pass
+
+    @abstractmethod
+    def apply_count_deltas(self, deltas: Dict[StatKey, int]) -> None:
+        """達成ユーザー数に増減を加算"""
+        pass
+
+    @abstractmethod
+    def count_active_players(self) -> int:
+        """クリア記録を1件以上持つユーザー数（達成ユーザー数と同じく無効化されたユーザーを含む）"""
+        pass
+
+    @abstractmethod
+    def save_snapshot(
+        self,
+        active_users: int,
+        last_change_seq: int,
+        full_rebuild: bool,
+        duration_ms: float,
+        built_at: datetime
+    ) -> None:
+        """集計状態を保存してコミット"""
+        pass
+
+    @abstractmethod
+    def find_stats(self, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """達成ユーザー数が1以上の集計行を取得"""
+        pass
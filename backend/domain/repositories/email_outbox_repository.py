@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class EmailOutboxRepository(ABC):
+    @abstractmethod
+    def enqueue(self, to_email: str, subject: str, text_body: str, html_body: str) -> None:
+        """送信待ちのメールを追加（呼び出し元のコミットで書き込む）"""
+        pass
+
+    @abstractmethod
+    def claim_due(self, limit: int, lease_seconds: int) -> List[Dict[str, Any]]:
+        """送信時刻を過ぎたメールを送信中として確保して取得（確保はコミットする）"""
+        pass
+
+    @abstractmethod
+    def mark_sent(self, message_id: int) -> None:
+        """送信済みにする"""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, message_id: int, error: str, retry_at: Optional[datetime]) -> None:
+        """送信失敗を記録（retry_atがNoneの場合はデッドレターにする）"""
+        pass
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, int]:
+        """状態ごとの件数"""
+        pass
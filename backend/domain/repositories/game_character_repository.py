@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..entities.game_character import GameCharacter
 
 
@@ -26,4 +26,8 @@ class GameCharacterRepository(ABC):
     
     @abstractmethod
     def get_character_count_by_game(self, game_id: int) -> int:
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def find_all_character_names_by_game(self) -> Dict[int, List[str]]:
+        pass
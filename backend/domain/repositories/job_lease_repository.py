@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+class JobLeaseRepository(ABC):
+    @abstractmethod
+    def try_acquire(self, job_name: str, owner: str, now: datetime, expires_at: datetime) -> bool:
+        """リースが未取得・期限切れ・自分が保持中の場合にexpires_atまで取得してコミットし、取得できたかを返す"""
+        pass
+
+    @abstractmethod
+    def release(self, job_name: str, owner: str, now: datetime) -> None:
+        """自分が保持しているリースを手放してコミット"""
+        pass
+
+    @abstractmethod
+    def find_all(self) -> List[Dict[str, Any]]:
+        """全ジョブのリース（job_name, owner, acquired_at, expires_at）を取得"""
+        pass
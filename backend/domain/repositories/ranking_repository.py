@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class RankingRepository(ABC):
+    @abstractmethod
+    def get_score_histogram(self, game_id: int) -> Dict[int, int]:
+        """スコア→人数の分布（スコア0のユーザーは含まない）"""
+        pass
+
+    @abstractmethod
+    def find_score(self, user_id: int, game_id: int) -> int:
+        """ユーザーの達成スコア（記録がない場合は0）"""
+        pass
+
+    @abstractmethod
+    def find_leaderboard(self, game_id: int, max_score: int, skip: int, limit: int) -> List[Dict[str, Any]]:
+        """max_score以下のユーザーをスコアの高い順（同点はユーザーID順）にskip件読み飛ばして取得"""
+        pass
+
+    @abstractmethod
+    def rebuild_scores(self) -> int:
+        """全クリア記録から達成スコアを計算し直し、スコアを持つユーザー数を返す"""
+        pass
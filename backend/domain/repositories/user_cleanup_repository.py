@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class UserCleanupRepository(ABC):
+    @abstractmethod
+    def clear_expired_tokens(self, now: datetime, limit: int) -> int:
+        """有効期限切れのメール認証トークンを最大limit件削除してコミットし、件数を返す"""
+        pass
+
+    @abstractmethod
+    def purge_unverified_users(self, created_before: datetime, limit: int) -> int:
+        """指定日時より前に登録されたメール未認証のユーザー（クリア記録などのデータがないもの）を最大limit件削除してコミットし、件数を返す"""
+        pass
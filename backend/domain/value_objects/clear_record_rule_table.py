@@ -0,0 +1,139 @@
+"""
+クリア記録バリデーションルール表
+
+domain/constants のゲーム・モード・難易度・特殊条件ルールと機体カタログを
+起動時に一度だけ不変の参照表へコンパイルし、1行あたりO(1)で検証します。
+"""
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from domain.constants.clear_condition_constants import (
+    clear_flags_to_mask,
+    get_allowed_clear_flag_mask_for_game,
+)
+from domain.constants.game_constants import (
+    GameIds,
+    GameModes,
+    get_available_difficulties_for_game_and_mode,
+    get_available_modes_for_game,
+)
+
+
+def _all_game_ids() -> List[int]:
+    """GameIdsに定義された全ゲームIDを取得"""
+    return sorted(
+        value for name, value in vars(GameIds).items()
+        if not name.startswith("_") and isinstance(value, int)
+    )
+
+
+class ClearRecordRuleTable:
+    """クリア記録の検証用参照表（不変）"""
+
+    __slots__ = ("_modes", "_difficulties", "_characters", "_flag_masks")
+
+    def __init__(
+        self,
+        modes: Mapping[int, FrozenSet[str]],
+        difficulties: Mapping[Tuple[int, str], FrozenSet[str]],
+        characters: Mapping[int, FrozenSet[str]],
+        flag_masks: Mapping[int, int]
+    ):
+        """
+        Args:
+            modes: ゲームIDごとの利用可能モード
+            difficulties: (ゲームID, モード)ごとの利用可能難易度
+            characters: ゲームIDごとの機体名（カタログ未登録のゲームは含まない）
+            flag_masks: ゲームIDごとの記録可能なクリア条件ビットマスク
+        """
+        self._modes = MappingProxyType(dict(modes))
+        self._difficulties = MappingProxyType(dict(difficulties))
+        self._characters = MappingProxyType(dict(characters))
+        self._flag_masks = MappingProxyType(dict(flag_masks))
+
+    @classmethod
+    def build(
+        cls,
+        characters_by_game: Mapping[int, Iterable[str]],
+        game_ids: Optional[Iterable[int]] = None
+    ) -> "ClearRecordRuleTable":
+        """
+        ドメイン定数と機体カタログから参照表を構築
+
+        Args:
+            characters_by_game: ゲームIDごとの機体名
+            game_ids: 対象ゲームID（省略時はGameIdsの全ゲーム）
+
+        Returns:
+            ClearRecordRuleTable: 構築した参照表
+        """
+        modes: Dict[int, FrozenSet[str]] = {}
+        difficulties: Dict[Tuple[int, str], FrozenSet[str]] = {}
+        flag_masks: Dict[int, int] = {}
+        for game_id in (game_ids if game_ids is not None else _all_game_ids()):
+            game_modes = get_available_modes_for_game(game_id)
+            modes[game_id] = frozenset(game_modes)
+            for mode in game_modes:
+                difficulties[(game_id, mode)] = frozenset(
+                    get_available_difficulties_for_game_and_mode(game_id, mode)
+                )
+            flag_masks[game_id] = get_allowed_clear_flag_mask_for_game(game_id)
+
+        characters = {
+            game_id: frozenset(names)
+            for game_id, names in characters_by_game.items()
+            if game_id in modes and names
+        }
+        return cls(modes, difficulties, characters, flag_masks)
+
+    def has_game(self, game_id: int) -> bool:
+        """ゲームIDが参照表に含まれるか"""
+        return game_id in self._modes
+
+    def validate(self, record_data: dict) -> Optional[Tuple[str, str, object]]:
+        """
+        クリア記録1件を検証
+
+        機体名はカタログに登録済みのゲームのみ検証します。
+
+        Args:
+            record_data: game_id / character_name / difficulty / mode / 各フラグを含む辞書
+
+        Returns:
+            違反がある場合は (メッセージ, フィールド名, 不正な値)、問題ない場合はNone
+        """
+        game_id = record_data.get("game_id")
+        modes = self._modes.get(game_id)
+        if modes is None:
+            return (f"Unknown game_id: {game_id}", "game_id", game_id)
+
+        mode = record_data.get("mode") or GameModes.NORMAL
+        if mode not in modes:
+            return (f"Invalid mode for game_id={game_id}: {mode}", "mode", mode)
+
+        difficulty = record_data.get("difficulty")
+        if difficulty not in self._difficulties[(game_id, mode)]:
+            return (
+                f"Invalid difficulty for game_id={game_id}, mode={mode}: {difficulty}",
+                "difficulty",
+                difficulty
+            )
+
+        characters = self._characters.get(game_id)
+        character_name = record_data.get("character_name")
+        if characters is not None and character_name not in characters:
+            return (
+                f"Unknown character for game_id={game_id}: {character_name}",
+                "character_name",
+                character_name
+            )
+
+        invalid_flags = clear_flags_to_mask(record_data) & ~self._flag_masks[game_id]
+        if invalid_flags:
+            return (
+                f"Special condition not available for game_id={game_id}",
+                "special_conditions",
+                invalid_flags
+            )
+
+        return None
@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
+from infrastructure.database.query_instrumentation import QueryInstrumentation
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -15,9 +16,21 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# リクエスト単位のクエリ数・DB時間の計測を有効化
+QueryInstrumentation.install()
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_session_factory():
+    """
+    リクエストのセッションとは別に開くセッションの作成関数
+
+    同時リクエストで共有するキャッシュの読み込みなど、リクエストの終了後も使用するセッションに使います。
+    get_dbと同じくdependency_overridesで差し替えられます。
+    """
+    return SessionLocal
\ No newline at end of file
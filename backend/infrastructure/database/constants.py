@@ -0,0 +1,15 @@
+"""
+データベース関連の定数定義
+
+マジックナンバー禁止原則に従い、スキーマ管理などの設定を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class DatabaseConstants:
+    """データベース設定定数"""
+
+    # 起動時（lifespan）に未作成のテーブルを作成するか
+    # 本番環境ではfalseにしてデプロイ時に scripts/create_schema.py を実行し、各ワーカーの起動を速くする
+    AUTO_CREATE_SCHEMA: Final[bool] = os.getenv("DB_AUTO_CREATE_SCHEMA", "true").lower() == "true"
@@ -2,12 +2,26 @@ from .user_model import UserModel
 from .game_model import GameModel
 from .game_character_model import GameCharacterModel
 from .clear_record_model import ClearRecordModel
+from .clear_record_change_model import ClearRecordChangeModel
+from .clear_achievement_model import ClearAchievementModel, ClearProgressMonthlyModel
+from .clear_stats_model import ClearConditionStatModel, ClearStatsSnapshotModel
+from .user_score_model import UserScoreModel
 from .game_memo_model import GameMemoModel
+from .email_outbox_model import EmailOutboxModel
+from .job_lease_model import JobLeaseModel
 
 __all__ = [
     'UserModel', 
     'GameModel', 
     'GameCharacterModel',
     'ClearRecordModel',
-    'GameMemoModel'
+    'ClearRecordChangeModel',
+    'ClearAchievementModel',
+    'ClearProgressMonthlyModel',
+    'ClearConditionStatModel',
+    'ClearStatsSnapshotModel',
+    'UserScoreModel',
+    'GameMemoModel',
+    'EmailOutboxModel',
+    'JobLeaseModel'
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+クリア条件達成履歴SQLAlchemyモデル
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+from infrastructure.database.connection import Base
+
+
+class ClearAchievementModel(Base):
+    """
+    クリア条件ごとの初回達成日時
+
+    クリア記録の条件フラグが初めてONになった時点で記録し、その後OFFに戻しても保持します。
+    記録のキー（ユーザー・作品・機体・難易度・モード）と条件列名で一意です。
+    """
+    __tablename__ = "clear_achievements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    game_id = Column(Integer, nullable=False)
+    character_name = Column(String(100), nullable=False)
+    difficulty = Column(String(20), nullable=False)
+    mode = Column(String(20), nullable=False, default="normal")
+    condition = Column(String(30), nullable=False)
+    achieved_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "game_id", "character_name", "difficulty", "mode", "condition",
+            name="uq_clear_achievements_record_condition"
+        ),
+    )
+
+
+class ClearProgressMonthlyModel(Base):
+    """
+    月別・作品別・条件別の初回達成数（進捗グラフ用の集計済みテーブル）
+
+    初回達成の記録と同じトランザクションで加算するため、履歴が長くても
+    進捗グラフは（月数 × 作品数 × 条件数）行の読み込みだけで作成できます。
+    """
+    __tablename__ = "clear_progress_monthly"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    game_id = Column(Integer, nullable=False)
+    month = Column(String(7), nullable=False)  # YYYY-MM
+    condition = Column(String(30), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "game_id", "month", "condition", name="uq_clear_progress_monthly_bucket"),
+        Index("idx_clear_progress_monthly_user_game", "user_id", "game_id", "month"),
+    )
@@ -0,0 +1,34 @@
+"""
+クリア記録変更ログSQLAlchemyモデル
+"""
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.sql import func
+from infrastructure.database.connection import Base
+
+
+class ClearRecordChangeModel(Base):
+    """
+    クリア記録の変更ログ（追記専用）
+
+    クリア記録の作成・更新・削除と同じトランザクションで書き込み、
+    seq（単調増加の連番）より後の変更だけを返す差分同期に使用します。
+    old_flagsがNULLの場合は作成、new_flagsがNULLの場合は削除を表します。
+    """
+    __tablename__ = "clear_record_changes"
+
+    # SQLiteではINTEGER PRIMARY KEYのみ自動採番されるため型を切り替える
+    seq = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    game_id = Column(Integer, nullable=False)
+    character_name = Column(String(100), nullable=False)
+    difficulty = Column(String(20), nullable=False)
+    mode = Column(String(20), nullable=False, default="normal")
+    old_flags = Column(Integer, nullable=True)
+    new_flags = Column(Integer, nullable=True)
+    changed_at = Column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("idx_clear_record_changes_user_seq", "user_id", "seq"),
+        Index("idx_clear_record_changes_changed_at", "changed_at"),
+    )
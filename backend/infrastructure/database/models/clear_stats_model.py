@@ -0,0 +1,47 @@
+"""
+クリア条件達成率統計SQLAlchemyモデル
+"""
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, Index, Integer, String, UniqueConstraint
+from infrastructure.database.connection import Base
+
+
+class ClearConditionStatModel(Base):
+    """
+    作品・機体・難易度・モード・条件ごとの達成ユーザー数（集計済みテーブル）
+
+    全ユーザーのクリア記録を集計ジョブが定期的に書き込み、
+    公開の達成率APIはこのテーブルだけを読み込みます。
+    """
+    __tablename__ = "clear_condition_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    game_id = Column(Integer, nullable=False)
+    character_name = Column(String(100), nullable=False)
+    difficulty = Column(String(20), nullable=False)
+    mode = Column(String(20), nullable=False, default="normal")
+    condition = Column(String(30), nullable=False)
+    achieved_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "game_id", "character_name", "difficulty", "mode", "condition",
+            name="uq_clear_condition_stats_bucket"
+        ),
+        Index("idx_clear_condition_stats_game", "game_id"),
+    )
+
+
+class ClearStatsSnapshotModel(Base):
+    """
+    達成率統計の集計状態（1行のみ）
+
+    分母となるアクティブユーザー数と、集計に反映済みの変更ログの連番を保持します。
+    """
+    __tablename__ = "clear_stats_snapshots"
+
+    id = Column(Integer, primary_key=True)
+    active_users = Column(Integer, nullable=False, default=0)
+    last_change_seq = Column(BigInteger, nullable=False, default=0)
+    full_rebuild = Column(Boolean, nullable=False, default=True)
+    duration_ms = Column(Float, nullable=False, default=0.0)
+    built_at = Column(DateTime, nullable=False)
@@ -0,0 +1,33 @@
+"""
+メール送信キューSQLAlchemyモデル
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.sql import func
+from infrastructure.database.connection import Base
+
+
+class EmailOutboxModel(Base):
+    """
+    送信待ちのメール（トランザクショナルアウトボックス）
+
+    ユーザー登録などと同じトランザクションで書き込み、送信ワーカーが非同期に送信します。
+    status は pending（送信待ち）→ sending（送信中）→ sent（送信済み）/ dead（再試行上限）と遷移します。
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    text_body = Column(Text, nullable=False)
+    html_body = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=func.now())
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,20 @@
+"""
+ジョブリースSQLAlchemyモデル
+"""
+from sqlalchemy import Column, DateTime, String
+from infrastructure.database.connection import Base
+
+
+class JobLeaseModel(Base):
+    """
+    定期ジョブの実行権（リース）
+
+    複数ワーカーで起動した場合に、リースを取得できたワーカーだけがジョブを実行します。
+    保持者が停止してもexpires_atを過ぎれば他のワーカーが取得できます。
+    """
+    __tablename__ = "job_leases"
+
+    job_name = Column(String(100), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from infrastructure.database.connection import Base
 from domain.constants.validation_constants import ValidationConstants
@@ -15,6 +15,11 @@ class UserModel(Base):
     is_admin = Column(Boolean, default=False, nullable=False)
     email_verified = Column(Boolean, default=False, nullable=False)
     verification_token = Column(String(ValidationConstants.VERIFICATION_TOKEN_MAX_LENGTH), nullable=True, index=True)
-    verification_token_expires_at = Column(DateTime(timezone=True), nullable=True)
+    verification_token_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 未認証ユーザーの定期削除で登録日時順に選ぶためのインデックス
+        Index("idx_users_unverified_created", "email_verified", "created_at"),
+    )
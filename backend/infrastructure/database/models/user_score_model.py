@@ -0,0 +1,28 @@
+"""
+達成スコアSQLAlchemyモデル
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, UniqueConstraint
+from sqlalchemy.sql import func
+from infrastructure.database.connection import Base
+
+
+class UserScoreModel(Base):
+    """
+    ユーザーの作品別・全作品合計の達成スコア
+
+    クリア記録の作成・更新・削除と同じトランザクションで増減し、
+    リーダーボードは (game_id, score) のインデックスを上位から読み込みます。
+    game_idが0の行は全作品合計を表します。
+    """
+    __tablename__ = "user_scores"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    game_id = Column(Integer, nullable=False)
+    score = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "game_id", name="uq_user_scores_user_game"),
+        Index("idx_user_scores_game_score", "game_id", "score", "user_id"),
+    )
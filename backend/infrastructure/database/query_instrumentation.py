@@ -0,0 +1,82 @@
+"""
+SQLクエリ計測
+
+SQLAlchemyのカーソル実行イベントをフックし、リクエスト単位のクエリ数と
+DB処理時間をRequestContextに記録します。閾値を超えたクエリはスロークエリログに出力します。
+"""
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from infrastructure.logging.context import RequestContext
+from infrastructure.logging.slow_query_logger import slow_query_logger
+
+
+# Connection.info に保持するクエリ開始時刻スタックのキー
+QUERY_START_TIMES_KEY = "query_start_times"
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """クエリ実行前に開始時刻を記録"""
+    conn.info.setdefault(QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """クエリ実行後に経過時間を計算して記録"""
+    start_times = conn.info.get(QUERY_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    RequestContext.record_db_query(elapsed_ms)
+    slow_query_logger.log_if_slow(conn, statement, parameters, elapsed_ms, executemany)
+
+
+def _handle_error(exception_context: Any) -> None:
+    """クエリ失敗時も開始時刻スタックを巻き戻し、実行されたクエリとして記録"""
+    conn = exception_context.connection
+    if conn is None:
+        return
+    start_times = conn.info.get(QUERY_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    RequestContext.record_db_query(elapsed_ms)
+
+
+class QueryInstrumentation:
+    """クエリ計測イベントの登録を管理するクラス"""
+
+    _installed = False
+
+    @classmethod
+    def install(cls) -> None:
+        """
+        全Engineに対してクエリ計測イベントを登録
+
+        Engineクラス単位で登録するため、テスト用Engineも含めて計測対象になります。
+        複数回呼び出しても一度だけ登録されます。
+        """
+        if cls._installed:
+            return
+
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        cls._installed = True
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """クエリ計測イベントの登録を解除"""
+        if not cls._installed:
+            return
+
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.remove(Engine, "handle_error", _handle_error)
+        cls._installed = False
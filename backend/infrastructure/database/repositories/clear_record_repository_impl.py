@@ -1,19 +1,197 @@
 """
 クリア記録リポジトリ実装
 """
-from typing import List, Optional
-from datetime import datetime, date
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, date, time
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
 from domain.repositories.clear_record_repository import ClearRecordRepository
 from domain.entities.clear_record import ClearRecord
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS, clear_flags_to_mask
+from domain.constants.ranking_constants import calculate_record_score
 from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.clear_record_change_model import ClearRecordChangeModel
+from infrastructure.database.models.clear_achievement_model import ClearAchievementModel, ClearProgressMonthlyModel
+from infrastructure.database.models.user_score_model import UserScoreModel
+from infrastructure.realtime.change_feed import ClearRecordChangeFeed, clear_record_change_feed
+from infrastructure.realtime.constants import ChangeFeedConstants
+from infrastructure.ranking.constants import RankingConstants
+from infrastructure.ranking.score_index import RankingIndex, ranking_index as global_ranking_index
+
+
+# 一覧表示用に取得する列（ClearRecordResponseのフィールドと一致させる）
+LIST_COLUMN_NAMES = (
+    "id", "game_id", "character_name", "difficulty", "mode",
+    "is_cleared", "is_no_continue_clear", "is_no_bomb_clear", "is_no_miss_clear",
+    "is_full_spell_card", "is_special_clear_1", "is_special_clear_2", "is_special_clear_3",
+    "cleared_at", "created_at", "last_updated_at",
+)
+
+# 差分同期で返す変更ログの列
+CHANGE_COLUMN_NAMES = (
+    "seq", "record_id", "game_id", "character_name", "difficulty", "mode",
+    "old_flags", "new_flags", "changed_at",
+)
+
+
+# 進捗グラフで返す月別集計の列
+PROGRESS_COLUMN_NAMES = ("game_id", "month", "condition", "count")
+
+
+def _flags_of(source: Any) -> int:
+    """モデル・エンティティのクリア条件をビットマスクに変換"""
+    return clear_flags_to_mask({field: getattr(source, field) for field in CLEAR_FLAG_FIELDS})
 
 
 class ClearRecordRepositoryImpl(ClearRecordRepository):
     """クリア記録リポジトリの実装クラス"""
     
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        change_feed: Optional[ClearRecordChangeFeed] = None,
+        ranking_index: Optional[RankingIndex] = None
+    ):
         self.session = session
+        # コミットした変更の配信先（SSEによるタブ間同期）
+        self.change_feed = change_feed or clear_record_change_feed
+        # コミットしたスコア変更の反映先（リーダーボードの順位）
+        self.ranking_index = ranking_index or global_ranking_index
+    
+    def _publish_change(self, event_type: str, clear_record: ClearRecord) -> None:
+        """コミットした変更を変更フィードへ発行"""
+        flags = None if event_type == ChangeFeedConstants.EVENT_DELETE else _flags_of(clear_record)
+        self.change_feed.publish(
+            event_type=event_type,
+            user_id=clear_record.user_id,
+            record_id=clear_record.id,
+            game_id=clear_record.game_id,
+            character_name=clear_record.character_name,
+            difficulty=clear_record.difficulty,
+            mode=clear_record.mode,
+            flags=flags,
+        )
+    
+    def _add_change_log(self, model: ClearRecordModel, old_flags: Optional[int], new_flags: Optional[int]) -> None:
+        """変更ログを追加（呼び出し元のコミットで記録の変更と同時に書き込む）"""
+        if old_flags == new_flags:
+            return
+        self.session.add(ClearRecordChangeModel(
+            user_id=model.user_id,
+            record_id=model.id,
+            game_id=model.game_id,
+            character_name=model.character_name,
+            difficulty=model.difficulty,
+            mode=model.mode or "normal",
+            old_flags=old_flags,
+            new_flags=new_flags,
+            changed_at=datetime.now()
+        ))
+    
+    def _add_score(
+        self, model: ClearRecordModel, old_flags: Optional[int], new_flags: Optional[int]
+    ) -> List[Tuple[int, int, int]]:
+        """
+        作品別・全作品合計の達成スコアを増減（呼び出し元のコミットで書き込む）
+
+        Returns:
+            コミット後に順位インデックスへ反映する (作品ID, 変更前スコア, 変更後スコア) のリスト
+        """
+        delta = (
+            calculate_record_score(model.game_id, model.difficulty, new_flags or 0)
+            - calculate_record_score(model.game_id, model.difficulty, old_flags or 0)
+        )
+        if not delta:
+            return []
+        changes = []
+        table = UserScoreModel.__table__
+        now = datetime.now()
+        for game_id in (model.game_id, RankingConstants.GLOBAL_GAME_ID):
+            key = (table.c.user_id == model.user_id) & (table.c.game_id == game_id)
+            # 同じユーザーの同時保存で加算が失われないよう、DB側で加算する（行ロックはコミットまで保持）
+            incremented = self.session.execute(
+                update(table).where(key).values(score=table.c.score + delta, updated_at=now)
+            )
+            if incremented.rowcount == 0:
+                self.session.execute(
+                    insert(table).values(user_id=model.user_id, game_id=game_id, score=delta, updated_at=now)
+                )
+            new_score = self.session.execute(select(table.c.score).where(key)).scalar_one()
+            changes.append((game_id, new_score - delta, new_score))
+        return changes
+    
+    def _apply_scores(self, changes: List[Tuple[int, int, int]]) -> None:
+        """コミットしたスコア変更を順位インデックスへ反映"""
+        for game_id, old_score, new_score in changes:
+            self.ranking_index.apply(game_id, old_score, new_score)
+    
+    def _achievement_key(self, source: Any) -> tuple:
+        """記録のキー（ユーザー・作品・機体・難易度・モード）で達成履歴を絞り込む条件"""
+        return (
+            ClearAchievementModel.user_id == source.user_id,
+            ClearAchievementModel.game_id == source.game_id,
+            ClearAchievementModel.character_name == source.character_name,
+            ClearAchievementModel.difficulty == source.difficulty,
+            ClearAchievementModel.mode == (source.mode or "normal"),
+        )
+    
+    def _add_progress(self, user_id: int, game_id: int, month: str, condition: str, delta: int) -> None:
+        """月別集計に加算（呼び出し元のコミットで書き込む）"""
+        table = ClearProgressMonthlyModel.__table__
+        # 同じユーザーの同時保存で加算が失われないよう、DB側で加算する
+        incremented = self.session.execute(
+            update(table).where(
+                table.c.user_id == user_id,
+                table.c.game_id == game_id,
+                table.c.month == month,
+                table.c.condition == condition
+            ).values(count=table.c.count + delta)
+        )
+        if incremented.rowcount == 0 and delta > 0:
+            self.session.execute(
+                insert(table).values(user_id=user_id, game_id=game_id, month=month, condition=condition, count=delta)
+            )
+    
+    def _record_achievements(self, model: ClearRecordModel, old_flags: Optional[int], new_flags: int) -> None:
+        """新たにONになったクリア条件の初回達成日時を記録（2回目以降の達成は記録しない）"""
+        achieved_mask = new_flags & ~(old_flags or 0)
+        if not achieved_mask:
+            return
+        conditions = [field for bit, field in enumerate(CLEAR_FLAG_FIELDS) if achieved_mask & (1 << bit)]
+        recorded = set(self.session.execute(
+            select(ClearAchievementModel.condition).where(
+                *self._achievement_key(model),
+                ClearAchievementModel.condition.in_(conditions)
+            )
+        ).scalars().all())
+        now = datetime.now()
+        for condition in conditions:
+            if condition in recorded:
+                continue
+            achieved_at = now
+            # 過去のクリア日が指定されている場合は、その日を通常クリアの達成日とする
+            if condition == "is_cleared" and model.cleared_at and model.cleared_at < now.date():
+                achieved_at = datetime.combine(model.cleared_at, time())
+            self.session.add(ClearAchievementModel(
+                user_id=model.user_id,
+                game_id=model.game_id,
+                character_name=model.character_name,
+                difficulty=model.difficulty,
+                mode=model.mode or "normal",
+                condition=condition,
+                achieved_at=achieved_at
+            ))
+            self._add_progress(model.user_id, model.game_id, achieved_at.strftime("%Y-%m"), condition, 1)
+    
+    def _remove_achievements(self, model: ClearRecordModel) -> None:
+        """削除する記録の達成履歴と月別集計を取り消す"""
+        achievements = self.session.query(ClearAchievementModel).filter(*self._achievement_key(model)).all()
+        for achievement in achievements:
+            self._add_progress(
+                achievement.user_id, achievement.game_id, achievement.achieved_at.strftime("%Y-%m"),
+                achievement.condition, -1
+            )
+            self.session.delete(achievement)
     
     async def find_all(self) -> List[ClearRecord]:
         """全クリア記録を取得"""
@@ -36,6 +214,27 @@ class ClearRecordRepositoryImpl(ClearRecordRepository):
         ).all()
         return [model.to_entity() for model in models]
     
+    async def find_rows_by_user(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        ユーザーのクリア記録を一覧表示用の列のみの辞書で取得
+
+        ORMのIdentity Mapを経由せず、Core の select で列の値だけを読み込みます。
+        """
+        table = ClearRecordModel.__table__
+        query = select(*(table.c[name] for name in LIST_COLUMN_NAMES)).where(table.c.user_id == user_id)
+        if game_id is not None:
+            query = query.where(table.c.game_id == game_id).order_by(
+                table.c.character_name,
+                table.c.difficulty
+            )
+        else:
+            query = query.order_by(
+                table.c.game_id,
+                table.c.character_name,
+                table.c.difficulty
+            )
+        return [dict(row) for row in self.session.execute(query).mappings()]
+    
     async def find_by_game_id(self, game_id: int) -> List[ClearRecord]:
         """ゲームIDでクリア記録を取得"""
         models = self.session.query(ClearRecordModel).filter(
@@ -110,9 +309,16 @@ class ClearRecordRepositoryImpl(ClearRecordRepository):
             
             print(f"Creating model: {model}")
             self.session.add(model)
+            # 変更ログに記録IDを残すため、コミット前に採番する
+            self.session.flush()
+            self._add_change_log(model, None, _flags_of(model))
+            self._record_achievements(model, None, _flags_of(model))
+            score_changes = self._add_score(model, None, _flags_of(model))
             self.session.commit()
             self.session.refresh(model)
             result = model.to_entity()
+            self._publish_change(ChangeFeedConstants.EVENT_UPSERT, result)
+            self._apply_scores(score_changes)
             print(f"Created entity: {result}")
             return result
         except Exception as e:
@@ -136,6 +342,7 @@ class ClearRecordRepositoryImpl(ClearRecordRepository):
             # クリア状態でない場合はcleared_atをクリア
             cleared_at = None
         
+        old_flags = _flags_of(model)
         model.is_cleared = clear_record.is_cleared
         model.is_no_continue_clear = clear_record.is_no_continue_clear
         model.is_no_bomb_clear = clear_record.is_no_bomb_clear
@@ -147,15 +354,28 @@ class ClearRecordRepositoryImpl(ClearRecordRepository):
         model.cleared_at = cleared_at
         model.last_updated_at = now
         
+        new_flags = _flags_of(model)
+        self._add_change_log(model, old_flags, new_flags)
+        self._record_achievements(model, old_flags, new_flags)
+        score_changes = self._add_score(model, old_flags, new_flags)
         self.session.commit()
-        return model.to_entity()
+        result = model.to_entity()
+        self._publish_change(ChangeFeedConstants.EVENT_UPSERT, result)
+        self._apply_scores(score_changes)
+        return result
     
     async def delete(self, id: int) -> bool:
         """クリア記録を削除"""
         model = self.session.query(ClearRecordModel).filter(ClearRecordModel.id == id).first()
         if model:
+            deleted = model.to_entity()
+            self._add_change_log(model, _flags_of(model), None)
+            self._remove_achievements(model)
+            score_changes = self._add_score(model, _flags_of(model), None)
             self.session.delete(model)
             self.session.commit()
+            self._publish_change(ChangeFeedConstants.EVENT_DELETE, deleted)
+            self._apply_scores(score_changes)
             return True
         return False
     
@@ -181,4 +401,63 @@ class ClearRecordRepositoryImpl(ClearRecordRepository):
             return await self.update(clear_record)
         else:
             # 新規作成
-            return await self.create(clear_record)
\ No newline at end of file
+            return await self.create(clear_record)
+    
+    async def find_changes_since(self, user_id: int, since_seq: int, limit: int) -> List[Dict[str, Any]]:
+        """ユーザーの変更ログのうち、指定した連番より後のものを古い順に取得"""
+        table = ClearRecordChangeModel.__table__
+        query = select(*(table.c[name] for name in CHANGE_COLUMN_NAMES)).where(
+            table.c.user_id == user_id,
+            table.c.seq > since_seq
+        ).order_by(table.c.seq).limit(limit)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+    
+    async def get_change_seq_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        """変更ログに残っている最小・最大の連番を取得"""
+        table = ClearRecordChangeModel.__table__
+        min_seq, max_seq = self.session.execute(select(func.min(table.c.seq), func.max(table.c.seq))).one()
+        return min_seq, max_seq
+    
+    async def delete_changes_before(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        指定日時より古い変更ログを削除
+
+        ロックを短く保つため、batch_size件ずつ別トランザクションで削除します。
+        最新の1件は削除済み範囲を判定する基準として残します。
+        """
+        table = ClearRecordChangeModel.__table__
+        _, max_seq = await self.get_change_seq_bounds()
+        if max_seq is None:
+            return 0
+        deleted = 0
+        while True:
+            seqs = self.session.execute(
+                select(table.c.seq).where(
+                    table.c.changed_at < cutoff,
+                    table.c.seq < max_seq
+                ).order_by(table.c.seq).limit(batch_size)
+            ).scalars().all()
+            if not seqs:
+                return deleted
+            self.session.execute(delete(table).where(table.c.seq.in_(seqs)))
+            self.session.commit()
+            deleted += len(seqs)
+    
+    async def find_achievements(self, clear_record: ClearRecord) -> List[Dict[str, Any]]:
+        """記録の条件ごとの初回達成日時を達成順に取得"""
+        query = select(ClearAchievementModel.condition, ClearAchievementModel.achieved_at).where(
+            *self._achievement_key(clear_record)
+        ).order_by(ClearAchievementModel.achieved_at, ClearAchievementModel.id)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+    
+    async def find_monthly_progress(self, user_id: int, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ユーザーの月別・作品別・条件別の初回達成数を作品・月の順に取得"""
+        table = ClearProgressMonthlyModel.__table__
+        query = select(*(table.c[name] for name in PROGRESS_COLUMN_NAMES)).where(
+            table.c.user_id == user_id,
+            table.c.count > 0
+        )
+        if game_id is not None:
+            query = query.where(table.c.game_id == game_id)
+        query = query.order_by(table.c.game_id, table.c.month)
+        return [dict(row) for row in self.session.execute(query).mappings()]
@@ -0,0 +1,147 @@
+"""
+クリア条件達成率統計リポジトリ実装
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.orm import Session
+from domain.repositories.clear_stats_repository import ClearStatsRepository, StatKey
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.clear_record_change_model import ClearRecordChangeModel
+from infrastructure.database.models.clear_stats_model import ClearConditionStatModel, ClearStatsSnapshotModel
+
+
+# 集計状態の行ID（1行のみ保持）
+SNAPSHOT_ID = 1
+
+# 達成率APIで返す集計行の列
+STAT_COLUMN_NAMES = ("game_id", "character_name", "difficulty", "mode", "condition", "achieved_count")
+
+# 増分集計で読み込む変更ログの列
+CHANGE_COLUMN_NAMES = ("seq", "game_id", "character_name", "difficulty", "mode", "old_flags", "new_flags")
+
+# 一括INSERTのチャンクサイズ
+INSERT_CHUNK_SIZE = 1000
+
+
+class ClearStatsRepositoryImpl(ClearStatsRepository):
+    """クリア条件達成率統計リポジトリの実装クラス"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_snapshot(self) -> Optional[Dict[str, Any]]:
+        table = ClearStatsSnapshotModel.__table__
+        row = self.session.execute(select(table).where(table.c.id == SNAPSHOT_ID)).mappings().first()
+        return dict(row) if row else None
+
+    def get_change_seq_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        table = ClearRecordChangeModel.__table__
+        min_seq, max_seq = self.session.execute(select(func.min(table.c.seq), func.max(table.c.seq))).one()
+        return min_seq, max_seq
+
+    def rebuild_counts(self) -> int:
+        """
+        全クリア記録から達成ユーザー数を集計し直す
+
+        変更ログの最大連番と集計を同じトランザクションで読み込むため、
+        以降の増分集計はこの連番より後の変更だけを反映すれば整合します。
+        （同じキーのクリア記録はユーザーごとに1件のため、記録数をユーザー数として扱います）
+        """
+        _, max_seq = self.get_change_seq_bounds()
+
+        table = ClearRecordModel.__table__
+        mode = func.coalesce(table.c.mode, "normal")
+        keys = (table.c.game_id, table.c.character_name, table.c.difficulty, mode)
+        sums = [func.sum(case((table.c[field], 1), else_=0)) for field in CLEAR_FLAG_FIELDS]
+        rows = self.session.execute(select(*keys, *sums).group_by(*keys)).all()
+
+        stats = []
+        for game_id, character_name, difficulty, row_mode, *counts in rows:
+            for condition, count in zip(CLEAR_FLAG_FIELDS, counts):
+                if count:
+                    stats.append({
+                        "game_id": game_id,
+                        "character_name": character_name,
+                        "difficulty": difficulty,
+                        "mode": row_mode,
+                        "condition": condition,
+                        "achieved_count": int(count),
+                    })
+
+        self.session.execute(delete(ClearConditionStatModel.__table__))
+        for start in range(0, len(stats), INSERT_CHUNK_SIZE):
+            self.session.execute(ClearConditionStatModel.__table__.insert(), stats[start:start + INSERT_CHUNK_SIZE])
+        return max_seq or 0
+
+    def find_changes_after(self, since_seq: int, limit: int) -> List[Dict[str, Any]]:
+        table = ClearRecordChangeModel.__table__
+        query = select(*(table.c[name] for name in CHANGE_COLUMN_NAMES)).where(
+            table.c.seq > since_seq
+        ).order_by(table.c.seq).limit(limit)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
+    def apply_count_deltas(self, deltas: Dict[StatKey, int]) -> None:
+        table = ClearConditionStatModel.__table__
+        for (game_id, character_name, difficulty, mode, condition), delta in deltas.items():
+            if delta == 0:
+                continue
+            key_filter = (
+                table.c.game_id == game_id,
+                table.c.character_name == character_name,
+                table.c.difficulty == difficulty,
+                table.c.mode == mode,
+                table.c.condition == condition,
+            )
+            result = self.session.execute(
+                table.update().where(*key_filter).values(achieved_count=table.c.achieved_count + delta)
+            )
+            if result.rowcount == 0 and delta > 0:
+                self.session.execute(table.insert().values(
+                    game_id=game_id,
+                    character_name=character_name,
+                    difficulty=difficulty,
+                    mode=mode,
+                    condition=condition,
+                    achieved_count=delta,
+                ))
+
+    def count_active_players(self) -> int:
+        # 分子（全ユーザーの記録数）と同じ母集団にするため、ユーザーの有効/無効では絞り込まない
+        records = ClearRecordModel.__table__
+        query = select(func.count(func.distinct(records.c.user_id)))
+        return self.session.execute(query).scalar() or 0
+
+    def save_snapshot(
+        self,
+        active_users: int,
+        last_change_seq: int,
+        full_rebuild: bool,
+        duration_ms: float,
+        built_at: datetime
+    ) -> None:
+        try:
+            snapshot = self.session.get(ClearStatsSnapshotModel, SNAPSHOT_ID)
+            if snapshot is None:
+                snapshot = ClearStatsSnapshotModel(id=SNAPSHOT_ID)
+                self.session.add(snapshot)
+            snapshot.active_users = active_users
+            snapshot.last_change_seq = last_change_seq
+            snapshot.full_rebuild = full_rebuild
+            snapshot.duration_ms = duration_ms
+            snapshot.built_at = built_at
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def find_stats(self, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        table = ClearConditionStatModel.__table__
+        query = select(*(table.c[name] for name in STAT_COLUMN_NAMES)).where(table.c.achieved_count > 0)
+        if game_id is not None:
+            query = query.where(table.c.game_id == game_id)
+        query = query.order_by(
+            table.c.game_id, table.c.character_name, table.c.difficulty, table.c.mode, table.c.condition
+        )
+        return [dict(row) for row in self.session.execute(query).mappings()]
@@ -0,0 +1,102 @@
+"""
+メール送信キューリポジトリ実装
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+from domain.repositories.email_outbox_repository import EmailOutboxRepository
+from infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from infrastructure.email.constants import EmailOutboxConstants
+
+
+# 送信ワーカーに渡す列
+MESSAGE_COLUMN_NAMES = ("id", "to_email", "subject", "text_body", "html_body", "attempts")
+
+
+class EmailOutboxRepositoryImpl(EmailOutboxRepository):
+    """メール送信キューリポジトリの実装クラス"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue(self, to_email: str, subject: str, text_body: str, html_body: str) -> None:
+        now = datetime.now()
+        self.session.add(EmailOutboxModel(
+            to_email=to_email,
+            subject=subject,
+            text_body=text_body,
+            html_body=html_body,
+            status=EmailOutboxConstants.STATUS_PENDING,
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now
+        ))
+
+    def _due_condition(self, now: datetime):
+        """送信待ちで送信時刻を過ぎたもの、または確保期限が切れた送信中のもの"""
+        table = EmailOutboxModel.__table__
+        return or_(
+            and_(table.c.status == EmailOutboxConstants.STATUS_PENDING, table.c.next_attempt_at <= now),
+            and_(table.c.status == EmailOutboxConstants.STATUS_SENDING, table.c.locked_until < now),
+        )
+
+    def claim_due(self, limit: int, lease_seconds: int) -> List[Dict[str, Any]]:
+        """
+        送信時刻を過ぎたメールを送信中として確保
+
+        複数のワーカー・プロセスが同時に取り出しても二重送信しないよう、
+        状態を条件にした更新で1件ずつ確保し、更新できたものだけを返します。
+        """
+        table = EmailOutboxModel.__table__
+        now = datetime.now()
+        try:
+            candidate_ids = self.session.execute(
+                select(table.c.id).where(self._due_condition(now)).order_by(table.c.next_attempt_at).limit(limit)
+            ).scalars().all()
+            claimed_ids = []
+            for message_id in candidate_ids:
+                result = self.session.execute(
+                    update(table).where(table.c.id == message_id, self._due_condition(now)).values(
+                        status=EmailOutboxConstants.STATUS_SENDING,
+                        locked_until=now + timedelta(seconds=lease_seconds),
+                        attempts=table.c.attempts + 1
+                    )
+                )
+                if result.rowcount == 1:
+                    claimed_ids.append(message_id)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        if not claimed_ids:
+            return []
+        query = select(*(table.c[name] for name in MESSAGE_COLUMN_NAMES)).where(
+            table.c.id.in_(claimed_ids)
+        ).order_by(table.c.next_attempt_at)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
+    def mark_sent(self, message_id: int) -> None:
+        table = EmailOutboxModel.__table__
+        self.session.execute(update(table).where(table.c.id == message_id).values(
+            status=EmailOutboxConstants.STATUS_SENT,
+            locked_until=None,
+            sent_at=datetime.now()
+        ))
+        self.session.commit()
+
+    def mark_failed(self, message_id: int, error: str, retry_at: Optional[datetime]) -> None:
+        table = EmailOutboxModel.__table__
+        values = {"locked_until": None, "last_error": error}
+        if retry_at is None:
+            values["status"] = EmailOutboxConstants.STATUS_DEAD
+        else:
+            values["status"] = EmailOutboxConstants.STATUS_PENDING
+            values["next_attempt_at"] = retry_at
+        self.session.execute(update(table).where(table.c.id == message_id).values(**values))
+        self.session.commit()
+
+    def count_by_status(self) -> Dict[str, int]:
+        table = EmailOutboxModel.__table__
+        query = select(table.c.status, func.count()).group_by(table.c.status)
+        return {status: count for status, count in self.session.execute(query)}
@@ -1,7 +1,7 @@
 """
 ゲーム機体リポジトリ実装
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from domain.entities.game_character import GameCharacter
@@ -167,4 +167,20 @@ class GameCharacterRepositoryImpl(GameCharacterRepository):
         result = self.session.execute(query, {"game_id": game_id})
         row = result.first()
         
-        return row.count if row else 0
\ No newline at end of file
+        return row.count if row else 0
+    
+    def find_all_character_names_by_game(self) -> Dict[int, List[str]]:
+        """全ゲームの機体名をゲームID別に取得（1クエリ）"""
+        query = text("""
+            SELECT game_id, character_name
+            FROM game_characters
+            ORDER BY game_id ASC, sort_order ASC, id ASC
+        """)
+        
+        result = self.session.execute(query)
+        characters_by_game: Dict[int, List[str]] = {}
+        
+        for row in result:
+            characters_by_game.setdefault(row.game_id, []).append(row.character_name)
+        
+        return characters_by_game
@@ -0,0 +1,61 @@
+"""
+ジョブリースリポジトリ実装
+"""
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from domain.repositories.job_lease_repository import JobLeaseRepository
+from infrastructure.database.models.job_lease_model import JobLeaseModel
+
+
+class JobLeaseRepositoryImpl(JobLeaseRepository):
+    """
+    ジョブリースリポジトリの実装クラス
+
+    条件付きUPDATE（保持者が自分か期限切れの場合のみ）で取得し、行がなければINSERTします。
+    同時に取得しようとしたワーカーのうち、UPDATEの行ロックまたは主キー制約で1つだけが成功します。
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def try_acquire(self, job_name: str, owner: str, now: datetime, expires_at: datetime) -> bool:
+        table = JobLeaseModel.__table__
+        try:
+            result = self.session.execute(
+                update(table).where(
+                    table.c.job_name == job_name,
+                    (table.c.owner == owner) | (table.c.expires_at < now)
+                ).values(owner=owner, acquired_at=now, expires_at=expires_at)
+            )
+            if result.rowcount == 0:
+                self.session.execute(
+                    insert(table).values(job_name=job_name, owner=owner, acquired_at=now, expires_at=expires_at)
+                )
+            self.session.commit()
+        except IntegrityError:
+            # 他のワーカーが保持中（または同時に作成した）
+            self.session.rollback()
+            return False
+        except Exception:
+            self.session.rollback()
+            raise
+        return True
+
+    def release(self, job_name: str, owner: str, now: datetime) -> None:
+        table = JobLeaseModel.__table__
+        try:
+            self.session.execute(
+                update(table).where(table.c.job_name == job_name, table.c.owner == owner).values(expires_at=now)
+            )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def find_all(self) -> List[Dict[str, Any]]:
+        table = JobLeaseModel.__table__
+        rows = self.session.execute(select(table).order_by(table.c.job_name)).mappings().all()
+        return [dict(row) for row in rows]
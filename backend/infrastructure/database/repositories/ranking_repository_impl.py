@@ -0,0 +1,95 @@
+"""
+ランキング（達成スコア）リポジトリ実装
+"""
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from domain.repositories.ranking_repository import RankingRepository
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
+from domain.constants.ranking_constants import calculate_record_score
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.models.user_score_model import UserScoreModel
+from infrastructure.ranking.constants import RankingConstants
+
+
+# 全件再計算で一度に読み込むクリア記録の件数
+REBUILD_FETCH_SIZE = 10000
+
+# 一括INSERTのチャンクサイズ
+INSERT_CHUNK_SIZE = 1000
+
+
+class RankingRepositoryImpl(RankingRepository):
+    """ランキングリポジトリの実装クラス"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_score_histogram(self, game_id: int) -> Dict[int, int]:
+        table = UserScoreModel.__table__
+        query = select(table.c.score, func.count()).where(
+            table.c.game_id == game_id,
+            table.c.score > 0
+        ).group_by(table.c.score)
+        return {score: count for score, count in self.session.execute(query)}
+
+    def find_score(self, user_id: int, game_id: int) -> int:
+        table = UserScoreModel.__table__
+        score = self.session.execute(
+            select(table.c.score).where(table.c.user_id == user_id, table.c.game_id == game_id)
+        ).scalar()
+        return score or 0
+
+    def find_leaderboard(self, game_id: int, max_score: int, skip: int, limit: int) -> List[Dict[str, Any]]:
+        scores = UserScoreModel.__table__
+        users = UserModel.__table__
+        query = select(scores.c.user_id, users.c.username, scores.c.score).select_from(
+            scores.join(users, users.c.id == scores.c.user_id)
+        ).where(
+            scores.c.game_id == game_id,
+            scores.c.score > 0,
+            scores.c.score <= max_score
+        ).order_by(scores.c.score.desc(), scores.c.user_id).offset(skip).limit(limit)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
+    def rebuild_scores(self) -> int:
+        """
+        全クリア記録から達成スコアを計算し直す
+
+        記録はユーザーID順にまとめて読み込み、スコアの計算はcalculate_record_scoreで行います
+        （クリア記録の更新時の増減と同じ計算式）。
+        """
+        records = ClearRecordModel.__table__
+        flag_columns = [records.c[field] for field in CLEAR_FLAG_FIELDS]
+        query = select(records.c.user_id, records.c.game_id, records.c.difficulty, *flag_columns).order_by(
+            records.c.user_id
+        ).execution_options(yield_per=REBUILD_FETCH_SIZE)
+
+        totals: Dict[tuple, int] = {}
+        for user_id, game_id, difficulty, *flags in self.session.execute(query):
+            mask = 0
+            for bit, flag in enumerate(flags):
+                if flag:
+                    mask |= 1 << bit
+            score = calculate_record_score(game_id, difficulty, mask)
+            if not score:
+                continue
+            for key in ((user_id, game_id), (user_id, RankingConstants.GLOBAL_GAME_ID)):
+                totals[key] = totals.get(key, 0) + score
+
+        try:
+            now = datetime.now()
+            rows = [
+                {"user_id": user_id, "game_id": game_id, "score": score, "updated_at": now}
+                for (user_id, game_id), score in totals.items()
+            ]
+            self.session.execute(delete(UserScoreModel.__table__))
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                self.session.execute(UserScoreModel.__table__.insert(), rows[start:start + INSERT_CHUNK_SIZE])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return sum(1 for _, game_id in totals if game_id == RankingConstants.GLOBAL_GAME_ID)
@@ -0,0 +1,77 @@
+"""
+ユーザーの定期クリーンアップリポジトリ実装
+"""
+from datetime import datetime
+from typing import List
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import Session
+from domain.repositories.user_cleanup_repository import UserCleanupRepository
+from infrastructure.database.models.clear_achievement_model import ClearAchievementModel, ClearProgressMonthlyModel
+from infrastructure.database.models.clear_record_change_model import ClearRecordChangeModel
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.game_memo_model import GameMemoModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.models.user_score_model import UserScoreModel
+
+# ユーザーのデータを持つテーブル。行が残っているユーザーは削除しない
+# （スコア・統計・変更履歴と整合しなくなり、外部キーのあるDBでは削除自体が失敗するため）
+_USER_DATA_TABLES = (
+    ClearRecordModel.__table__,
+    GameMemoModel.__table__,
+    UserScoreModel.__table__,
+    ClearRecordChangeModel.__table__,
+    ClearAchievementModel.__table__,
+    ClearProgressMonthlyModel.__table__,
+)
+
+
+class UserCleanupRepositoryImpl(UserCleanupRepository):
+    """
+    ユーザーの定期クリーンアップリポジトリの実装クラス
+
+    対象の行をインデックスで最大limit件選んでから主キー指定で更新・削除し、
+    1回のトランザクションでロックする行数を抑えます。
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _commit_ids(self, statement, ids: List[int]) -> int:
+        if not ids:
+            return 0
+        try:
+            result = self.session.execute(statement)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return result.rowcount
+
+    def clear_expired_tokens(self, now: datetime, limit: int) -> int:
+        table = UserModel.__table__
+        expired = table.c.verification_token_expires_at < now
+        ids = self.session.execute(
+            select(table.c.id).where(expired).order_by(table.c.verification_token_expires_at).limit(limit)
+        ).scalars().all()
+        return self._commit_ids(
+            update(table).where(table.c.id.in_(ids), expired).values(
+                verification_token=None,
+                verification_token_expires_at=None,
+                updated_at=now
+            ),
+            ids
+        )
+
+    def purge_unverified_users(self, created_before: datetime, limit: int) -> int:
+        table = UserModel.__table__
+        stale = (
+            table.c.email_verified.is_(False)
+            & table.c.is_admin.is_(False)
+            & (table.c.created_at < created_before)
+        )
+        for data_table in _USER_DATA_TABLES:
+            stale &= ~exists().where(data_table.c.user_id == table.c.id)
+        ids = self.session.execute(
+            select(table.c.id).where(stale).order_by(table.c.email_verified, table.c.created_at).limit(limit)
+        ).scalars().all()
+        return self._commit_ids(delete(table).where(table.c.id.in_(ids), stale), ids)
@@ -0,0 +1,38 @@
+"""
+データベーススキーマの作成
+
+モジュールのインポート時ではなく、起動処理（lifespan）やデプロイ時のスクリプトから明示的に呼び出します。
+"""
+import time
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from infrastructure.database.connection import Base, engine
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def create_schema(bind: Engine = engine) -> None:
+    """
+    全モデルのテーブル・インデックスのうち未作成のものを作成
+
+    複数ワーカーが同時に起動して他のワーカーが先に作成した場合（already exists）は、作成済みの確認からやり直します。
+    DDLはテーブル単位で確定するため、競合するたびに少なくとも1つのテーブルが作成済みになり、
+    試行回数はテーブル・インデックス数で上限を設けます。
+    """
+    # 全モデルをメタデータに登録する
+    import infrastructure.database.models  # noqa: F401
+
+    start = time.perf_counter()
+    max_attempts = sum(1 + len(table.indexes) for table in Base.metadata.sorted_tables) + 1
+    for attempt in range(1, max_attempts + 1):
+        try:
+            Base.metadata.create_all(bind=bind)
+            break
+        except (OperationalError, ProgrammingError) as e:
+            if attempt == max_attempts or "already exists" not in str(e):
+                raise
+            logger.info(f"Schema was created concurrently by another worker, retrying: {e.orig}")
+    logger.info(f"Database schema ensured in {(time.perf_counter() - start) * 1000:.1f}ms")
@@ -0,0 +1,68 @@
+"""
+メール送信関連の定数定義
+
+マジックナンバー禁止原則に従い、送信キュー（アウトボックス）・SMTP接続プール・テンプレートの設定値を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class EmailOutboxConstants:
+    """メール送信キュー（アウトボックス）設定定数"""
+
+    # 送信ワーカーを起動するか
+    WORKER_ENABLED: Final[bool] = os.getenv("EMAIL_OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+
+    # 同時に送信するスレッド数
+    WORKER_COUNT: Final[int] = int(os.getenv("EMAIL_OUTBOX_WORKER_COUNT", "4"))
+
+    # 送信待ちを確認する間隔（秒）
+    POLL_INTERVAL_SECONDS: Final[float] = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL_SECONDS", "1"))
+
+    # 1回に取り出す件数
+    BATCH_SIZE: Final[int] = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "20"))
+
+    # 送信中として確保する期間（秒、ワーカーが停止した場合はこの後に再送）
+    LEASE_SECONDS: Final[int] = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "120"))
+
+    # 送信試行の上限（超えた場合はデッドレター）
+    MAX_ATTEMPTS: Final[int] = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+
+    # 再試行間隔（秒、試行ごとに倍増して上限で頭打ち）
+    RETRY_BASE_SECONDS: Final[float] = float(os.getenv("EMAIL_OUTBOX_RETRY_BASE_SECONDS", "30"))
+    RETRY_MAX_SECONDS: Final[float] = float(os.getenv("EMAIL_OUTBOX_RETRY_MAX_SECONDS", "3600"))
+
+    # 状態
+    STATUS_PENDING: Final[str] = "pending"
+    STATUS_SENDING: Final[str] = "sending"
+    STATUS_SENT: Final[str] = "sent"
+    STATUS_DEAD: Final[str] = "dead"
+
+
+class SMTPConstants:
+    """SMTP接続プール設定定数"""
+
+    # 同時に使用する接続数の上限
+    POOL_MAX_CONNECTIONS: Final[int] = int(os.getenv("SMTP_POOL_MAX_CONNECTIONS", "4"))
+
+    # 未使用の接続を保持する期間（秒、超えた接続は閉じて作り直す）
+    POOL_MAX_IDLE_SECONDS: Final[float] = float(os.getenv("SMTP_POOL_MAX_IDLE_SECONDS", "60"))
+
+    # この期間（秒）以上使用していない接続はNOOPで生存を確認してから使用
+    NOOP_AFTER_IDLE_SECONDS: Final[float] = float(os.getenv("SMTP_NOOP_AFTER_IDLE_SECONDS", "1"))
+
+    # 1接続で送信するメール数の上限（サーバー側の制限を避けるため超えたら接続し直す）
+    MAX_MESSAGES_PER_CONNECTION: Final[int] = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100"))
+
+    # 接続・応答のタイムアウト（秒）
+    TIMEOUT_SECONDS: Final[float] = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+
+    # NOOPの正常応答コード
+    NOOP_OK_CODE: Final[int] = 250
+
+
+class EmailTemplateConstants:
+    """メールテンプレート設定定数"""
+
+    # テンプレートのロケール（指定がない場合・指定したロケールのテンプレートがない場合に使用）
+    DEFAULT_LOCALE: Final[str] = os.getenv("EMAIL_DEFAULT_LOCALE", "ja")
@@ -0,0 +1,87 @@
+"""
+送信用メール（MIME）の組み立て
+
+テキスト・HTMLの2パートからなるmultipart/alternativeのメールを、キャッシュした固定部分
+（境界・各パートのヘッダー・エンコード済みの件名と差出人）と、メールごとの宛先・本文から
+直接バイト列に組み立てます。email.mimeのオブジェクトをメールごとに作成・シリアライズしません。
+"""
+import base64
+from dataclasses import dataclass
+from email.header import Header
+from functools import lru_cache
+from typing import Optional
+
+from application.services.email_service import EmailMessage
+
+CRLF = b"\r\n"
+
+# パートの境界（本文はBase64のため境界の文字列が本文に現れることはない）
+BOUNDARY = "===============touhou-clear-checker=="
+
+_MESSAGE_HEADERS = (
+    f'Content-Type: multipart/alternative; boundary="{BOUNDARY}"\r\n'
+    "MIME-Version: 1.0\r\n"
+).encode("ascii")
+_PART_SEPARATOR = f"\r\n--{BOUNDARY}\r\n".encode("ascii")
+_CLOSING_BOUNDARY = f"\r\n--{BOUNDARY}--\r\n".encode("ascii")
+_TEXT_PART_HEADERS = (
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    "MIME-Version: 1.0\r\n"
+    "Content-Transfer-Encoding: base64\r\n\r\n"
+).encode("ascii")
+_HTML_PART_HEADERS = (
+    'Content-Type: text/html; charset="utf-8"\r\n'
+    "MIME-Version: 1.0\r\n"
+    "Content-Transfer-Encoding: base64\r\n\r\n"
+).encode("ascii")
+
+# エンコード済みヘッダーのキャッシュ件数（件名・差出人は種類が限られる）
+HEADER_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class EncodedEmail:
+    """送信用にエンコード済みのメール（エンベロープの差出人・宛先とメール本体）"""
+    from_email: str
+    to_email: str
+    data: bytes
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def encode_header(value: str) -> bytes:
+    """ヘッダーの値をエンコード（ASCII以外を含む場合はMIMEエンコード）"""
+    if value.isascii():
+        return value.encode("ascii")
+    return Header(value, "utf-8").encode(linesep="\r\n").encode("ascii")
+
+
+def encode_body(body: str) -> bytes:
+    """本文をBase64でエンコード（76文字ごとに改行）"""
+    return base64.encodebytes(body.encode("utf-8")).replace(b"\n", CRLF).rstrip(CRLF)
+
+
+def encode_email_message(from_email: Optional[str], message: EmailMessage) -> EncodedEmail:
+    """
+    テキスト・HTMLの両方を含むメールをバイト列に組み立て
+
+    Args:
+        from_email: 差出人
+        message: 送信するメール
+
+    Returns:
+        EncodedEmail: エンコード済みのメール
+    """
+    from_email = from_email or ""
+    data = b"".join((
+        _MESSAGE_HEADERS,
+        b"Subject: ", encode_header(message.subject), CRLF,
+        b"From: ", encode_header(from_email), CRLF,
+        b"To: ", encode_header(message.to_email), CRLF,
+        CRLF,
+        _PART_SEPARATOR[2:],
+        _TEXT_PART_HEADERS, encode_body(message.text_body),
+        _PART_SEPARATOR,
+        _HTML_PART_HEADERS, encode_body(message.html_body),
+        _CLOSING_BOUNDARY,
+    ))
+    return EncodedEmail(from_email=from_email, to_email=message.to_email, data=data)
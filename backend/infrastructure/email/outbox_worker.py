@@ -0,0 +1,126 @@
+"""
+メール送信キューの送信ワーカー
+
+送信キュー（email_outbox）から送信時刻を過ぎたメールを取り出し、スレッド数に分割して並行して送信します。
+分割した各グループは送信実装のsend_batchで1つのSMTP接続を使ってまとめて送信します。
+失敗したメールは指数バックオフで再試行し、試行回数の上限に達したものはデッドレターにします。
+登録処理はキューへの書き込みだけで応答するため、SMTPサーバーの応答時間や障害の影響を受けません。
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from application.services.email_service import EmailMessage, EmailSender
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from infrastructure.email.constants import EmailOutboxConstants
+from infrastructure.email.sender_factory import create_email_sender
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class EmailOutboxWorker:
+    """送信キューを処理するワーカー"""
+
+    def __init__(
+        self,
+        email_sender: Optional[EmailSender] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        worker_count: int = EmailOutboxConstants.WORKER_COUNT,
+        batch_size: int = EmailOutboxConstants.BATCH_SIZE,
+        max_attempts: int = EmailOutboxConstants.MAX_ATTEMPTS,
+        retry_base_seconds: float = EmailOutboxConstants.RETRY_BASE_SECONDS,
+        retry_max_seconds: float = EmailOutboxConstants.RETRY_MAX_SECONDS,
+        lease_seconds: int = EmailOutboxConstants.LEASE_SECONDS,
+    ):
+        """
+        Args:
+            email_sender: メール送信実装（省略時は環境に応じて選択）
+            session_factory: DBセッションの作成関数
+            worker_count: 同時に送信するスレッド数
+            batch_size: 1回に取り出す件数
+            max_attempts: 送信試行の上限
+            retry_base_seconds: 1回目の再試行までの間隔（秒）
+            retry_max_seconds: 再試行間隔の上限（秒）
+            lease_seconds: 送信中として確保する期間（秒）
+        """
+        self.email_sender = email_sender or create_email_sender()
+        self.session_factory = session_factory
+        self.worker_count = worker_count
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.lease_seconds = lease_seconds
+        self._executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="email-outbox")
+
+    def retry_delay(self, attempts: int) -> float:
+        """試行回数に応じた再試行までの間隔（秒）"""
+        return min(self.retry_base_seconds * (2 ** (attempts - 1)), self.retry_max_seconds)
+
+    def _send_group(self, messages: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        メールのグループを1つの接続で送信
+
+        Returns:
+            メールごとの失敗理由（成功した場合はNone）
+        """
+        try:
+            results = self.email_sender.send_batch([
+                EmailMessage(message["to_email"], message["subject"], message["text_body"], message["html_body"])
+                for message in messages
+            ])
+        except Exception as e:
+            return [f"{type(e).__name__}: {e}"] * len(messages)
+        return [None if sent else "Email sender reported failure" for sent in results]
+
+    def drain_once(self) -> Dict[str, int]:
+        """
+        送信時刻を過ぎたメールを1バッチ分送信
+
+        Returns:
+            {"sent": 送信数, "retried": 再試行予定数, "dead": デッドレター数}
+        """
+        result = {"sent": 0, "retried": 0, "dead": 0}
+        session = self.session_factory()
+        try:
+            repository = EmailOutboxRepositoryImpl(session)
+            messages = repository.claim_due(self.batch_size, self.lease_seconds)
+            if not messages:
+                return result
+            groups = [messages[index::self.worker_count] for index in range(min(self.worker_count, len(messages)))]
+            errors: Dict[int, Optional[str]] = {}
+            for group, group_errors in zip(groups, self._executor.map(self._send_group, groups)):
+                errors.update((message["id"], error) for message, error in zip(group, group_errors))
+            now = datetime.now()
+            for message in messages:
+                error = errors[message["id"]]
+                if error is None:
+                    repository.mark_sent(message["id"])
+                    result["sent"] += 1
+                elif message["attempts"] >= self.max_attempts:
+                    repository.mark_failed(message["id"], error, None)
+                    result["dead"] += 1
+                    logger.error(
+                        f"Email moved to dead letter: id={message['id']}, attempts={message['attempts']}, error={error}"
+                    )
+                else:
+                    retry_at = now + timedelta(seconds=self.retry_delay(message["attempts"]))
+                    repository.mark_failed(message["id"], error, retry_at)
+                    result["retried"] += 1
+                    logger.warning(
+                        f"Email delivery failed: id={message['id']}, attempts={message['attempts']}, "
+                        f"retry_at={retry_at.isoformat()}, error={error}"
+                    )
+        finally:
+            session.close()
+        logger.info(f"Email outbox drained: {result}")
+        return result
+
+    def shutdown(self) -> None:
+        """スレッドプールを停止し、送信実装の接続を閉じる"""
+        self._executor.shutdown(wait=True)
+        self.email_sender.close()
@@ -0,0 +1,21 @@
+"""
+メール送信実装の選択
+"""
+import os
+from functools import lru_cache
+
+from application.services.email_service import EmailSender, MockEmailSender
+from infrastructure.email.smtp_email_sender import SMTPEmailSender
+
+
+@lru_cache(maxsize=None)
+def get_smtp_email_sender() -> SMTPEmailSender:
+    """プロセス内で共有するSMTP送信（接続プールを共有するため1つだけ作成）"""
+    return SMTPEmailSender()
+
+
+def create_email_sender() -> EmailSender:
+    """環境に応じたメール送信実装を作成（本番環境のみSMTP、それ以外は開発用モック）"""
+    if os.getenv("ENVIRONMENT") == "production":
+        return get_smtp_email_sender()
+    return MockEmailSender()
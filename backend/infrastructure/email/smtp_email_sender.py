@@ -1,46 +1,105 @@
-import smtplib
 import os
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from application.services.email_service import EmailSender
+from typing import List, Optional, Sequence
+from application.services.email_service import EmailMessage, EmailSender
+from infrastructure.email.mime import encode_email_message
+from infrastructure.email.smtp_pool import AsyncSMTPConnectionPool, SMTPConnectionPool
 from infrastructure.security.constants import SecurityConstants
+from infrastructure.logging.logger import LoggerFactory
 
+logger = LoggerFactory.get_logger(__name__)
+
+
+class SMTPSettings:
+    """環境変数から読み込むSMTPサーバーの設定"""
 
-class SMTPEmailSender(EmailSender):
-    """SMTP経由でのメール送信を担当するクラス"""
-    
     def __init__(self):
         self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
         self.smtp_port = int(os.getenv("SMTP_PORT", str(SecurityConstants.SMTP_DEFAULT_PORT)))
         self.smtp_username = os.getenv("SMTP_USERNAME")
         self.smtp_password = os.getenv("SMTP_PASSWORD")
         self.from_email = os.getenv("FROM_EMAIL", self.smtp_username)
+        # false の場合はSTARTTLS・認証なしで送信（ローカルのリレー・テスト用SMTPサーバー向け）
+        self.use_tls = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+
+    @property
+    def credentials_missing(self) -> bool:
+        return self.use_tls and (not self.smtp_username or not self.smtp_password)
+
+    def pool_arguments(self) -> dict:
+        return {
+            "host": self.smtp_server,
+            "port": self.smtp_port,
+            "username": self.smtp_username,
+            "password": self.smtp_password,
+            "use_tls": self.use_tls,
+        }
+
+
+class SMTPEmailSender(EmailSender):
+    """SMTP経由でのメール送信を担当するクラス（認証済みの接続をプールして再利用）"""
+    
+    def __init__(self, pool: Optional[SMTPConnectionPool] = None):
+        self.settings = SMTPSettings()
+        self.pool = pool or SMTPConnectionPool(**self.settings.pool_arguments())
 
     def send_email(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
         """SMTPサーバーを使用してメールを送信"""
+        return self.send_batch([EmailMessage(to_email, subject, text_body, html_body)])[0]
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> List[bool]:
+        """1つの接続で複数のメールを送信"""
+        if self.settings.credentials_missing:
+            logger.warning("SMTP credentials not configured. Email not sent.")
+            return [False] * len(messages)
         try:
-            if not self.smtp_username or not self.smtp_password:
-                print("Warning: SMTP credentials not configured. Email not sent.")
-                return False
+            errors = self.pool.send_messages(
+                [encode_email_message(self.settings.from_email, message) for message in messages]
+            )
+        except Exception as e:
+            logger.error(f"Failed to send email via SMTP: {str(e)}")
+            return [False] * len(messages)
+        for error in errors:
+            if error is not None:
+                logger.error(f"Failed to send email via SMTP: {error}")
+        return [error is None for error in errors]
 
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.from_email
-            msg["To"] = to_email
+    def close(self) -> None:
+        """プール内の接続を閉じる"""
+        self.pool.close()
 
-            part1 = MIMEText(text_body, "plain", "utf-8")
-            part2 = MIMEText(html_body, "html", "utf-8")
 
-            msg.attach(part1)
-            msg.attach(part2)
+class AsyncSMTPEmailSender:
+    """イベントループからのSMTP送信（aiosmtplibが必要）"""
 
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+    def __init__(self, pool: Optional[AsyncSMTPConnectionPool] = None):
+        """
+        Raises:
+            RuntimeError: aiosmtplibがインストールされていない場合
+        """
+        self.settings = SMTPSettings()
+        self.pool = pool or AsyncSMTPConnectionPool(**self.settings.pool_arguments())
 
-            return True
+    async def send_email(self, to_email: str, subject: str, text_body: str, html_body: str) -> bool:
+        """SMTPサーバーを使用してメールを送信"""
+        return (await self.send_batch([EmailMessage(to_email, subject, text_body, html_body)]))[0]
 
+    async def send_batch(self, messages: Sequence[EmailMessage]) -> List[bool]:
+        """1つの接続で複数のメールを送信"""
+        if self.settings.credentials_missing:
+            logger.warning("SMTP credentials not configured. Email not sent.")
+            return [False] * len(messages)
+        try:
+            errors = await self.pool.send_messages(
+                [encode_email_message(self.settings.from_email, message) for message in messages]
+            )
         except Exception as e:
-            print(f"Failed to send email via SMTP: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error(f"Failed to send email via SMTP: {str(e)}")
+            return [False] * len(messages)
+        for error in errors:
+            if error is not None:
+                logger.error(f"Failed to send email via SMTP: {error}")
+        return [error is None for error in errors]
+
+    async def close(self) -> None:
+        """プール内の接続を閉じる"""
+        await self.pool.close()
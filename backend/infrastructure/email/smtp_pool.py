@@ -0,0 +1,335 @@
+"""
+SMTP接続プール
+
+メールごとに接続・STARTTLS・認証をやり直さないよう、認証済みの接続を保持して再利用します。
+一定期間使用していない接続はNOOPで生存を確認してから使用し、同時に使用する接続数には上限を設けます。
+aiosmtplibがインストールされている場合のみ、イベントループから使用する非同期版を利用できます。
+"""
+import asyncio
+import smtplib
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from infrastructure.email.constants import SMTPConstants
+from infrastructure.email.mime import EncodedEmail
+from infrastructure.logging.logger import LoggerFactory
+
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - 任意依存
+    aiosmtplib = None
+
+logger = LoggerFactory.get_logger(__name__)
+
+# 送信中に接続が切れた場合に1通あたり試行する回数（接続し直して再送）
+SEND_ATTEMPTS = 2
+
+
+def describe_error(error: Exception) -> str:
+    """送信失敗の理由を文字列に変換"""
+    return f"{type(error).__name__}: {error}"
+
+
+class PooledConnection:
+    """プール内の接続（送信数と最終使用時刻を保持）"""
+
+    __slots__ = ("client", "sent_count", "last_used")
+
+    def __init__(self, client):
+        self.client = client
+        self.sent_count = 0
+        self.last_used = time.monotonic()
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.last_used
+
+
+class BaseSMTPConnectionPool:
+    """SMTP接続プールの設定と未使用接続の管理"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        max_connections: int = SMTPConstants.POOL_MAX_CONNECTIONS,
+        max_idle_seconds: float = SMTPConstants.POOL_MAX_IDLE_SECONDS,
+        noop_after_idle_seconds: float = SMTPConstants.NOOP_AFTER_IDLE_SECONDS,
+        max_messages_per_connection: int = SMTPConstants.MAX_MESSAGES_PER_CONNECTION,
+        timeout_seconds: float = SMTPConstants.TIMEOUT_SECONDS,
+    ):
+        """
+        Args:
+            host: SMTPサーバーのホスト名
+            port: SMTPサーバーのポート番号
+            username: 認証ユーザー名
+            password: 認証パスワード
+            use_tls: STARTTLS・認証を行うか（falseはローカルのリレー向け）
+            max_connections: 同時に使用する接続数の上限
+            max_idle_seconds: 未使用の接続を保持する期間（秒）
+            noop_after_idle_seconds: NOOPで生存を確認する未使用期間（秒）
+            max_messages_per_connection: 1接続で送信するメール数の上限
+            timeout_seconds: 接続・応答のタイムアウト（秒）
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_connections = max_connections
+        self.max_idle_seconds = max_idle_seconds
+        self.noop_after_idle_seconds = noop_after_idle_seconds
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout_seconds = timeout_seconds
+        # 作成した接続数（再利用の効果の確認用）
+        self.created_count = 0
+        self._idle: List[PooledConnection] = []
+        self._closed = False
+
+    def _pop_idle(self) -> Optional[PooledConnection]:
+        """最後に使用した未使用接続を取り出す"""
+        return self._idle.pop() if self._idle else None
+
+    def _should_reuse(self, connection: PooledConnection) -> bool:
+        return not self._closed and connection.sent_count < self.max_messages_per_connection
+
+
+class SMTPConnectionPool(BaseSMTPConnectionPool):
+    """スレッドから使用するSMTP接続プール（smtplib）"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+
+    def _connect(self) -> PooledConnection:
+        client = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if self.use_tls:
+                client.starttls()
+                client.login(self.username, self.password)
+        except Exception:
+            client.close()
+            raise
+        with self._lock:
+            self.created_count += 1
+        return PooledConnection(client)
+
+    @staticmethod
+    def _quit(connection: PooledConnection) -> None:
+        try:
+            connection.client.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.client.close()
+
+    @staticmethod
+    def _is_alive(connection: PooledConnection) -> bool:
+        try:
+            code, _ = connection.client.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == SMTPConstants.NOOP_OK_CODE
+
+    def _checkout(self) -> PooledConnection:
+        """未使用の接続を取り出す（期限切れ・切断済みの接続は閉じて、なければ新しく接続）"""
+        while True:
+            with self._lock:
+                connection = self._pop_idle()
+            if connection is None:
+                return self._connect()
+            idle_seconds = connection.idle_seconds()
+            if idle_seconds > self.max_idle_seconds:
+                self._quit(connection)
+            elif idle_seconds >= self.noop_after_idle_seconds and not self._is_alive(connection):
+                connection.client.close()
+            else:
+                return connection
+
+    def _checkin(self, connection: PooledConnection) -> None:
+        connection.last_used = time.monotonic()
+        with self._lock:
+            if self._should_reuse(connection):
+                self._idle.append(connection)
+                return
+        self._quit(connection)
+
+    def send_messages(self, messages: Sequence[EncodedEmail]) -> List[Optional[str]]:
+        """
+        1つの接続で複数のメールを送信
+
+        送信中に接続が切れた場合は接続し直して続きを送信します。
+        接続できない場合は残りのメールを送信せずに失敗とします。
+
+        Args:
+            messages: エンコード済みのメール
+
+        Returns:
+            メールごとの失敗理由（成功した場合はNone）
+        """
+        results: List[Optional[str]] = []
+        with self._slots:
+            connection: Optional[PooledConnection] = None
+            try:
+                for index, message in enumerate(messages):
+                    error = None
+                    for _ in range(SEND_ATTEMPTS):
+                        if connection is None:
+                            try:
+                                connection = self._checkout()
+                            except (smtplib.SMTPException, OSError) as e:
+                                logger.error(f"Failed to connect to SMTP server: {e}")
+                                results.extend([describe_error(e)] * (len(messages) - index))
+                                return results
+                        try:
+                            connection.client.sendmail(message.from_email, [message.to_email], message.data)
+                        except smtplib.SMTPServerDisconnected as e:
+                            error = describe_error(e)
+                        except smtplib.SMTPException as e:
+                            # 宛先の拒否など、接続は引き続き使用できる
+                            error = describe_error(e)
+                            break
+                        except OSError as e:
+                            error = describe_error(e)
+                        else:
+                            connection.sent_count += 1
+                            error = None
+                            break
+                        # 接続が切れた場合は接続し直して再送
+                        connection.client.close()
+                        connection = None
+                    results.append(error)
+                    if connection is not None and connection.sent_count >= self.max_messages_per_connection:
+                        self._quit(connection)
+                        connection = None
+            finally:
+                if connection is not None:
+                    self._checkin(connection)
+        return results
+
+    def close(self) -> None:
+        """未使用の接続を閉じる（使用中の接続は返却時に閉じる）"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._quit(connection)
+
+
+class AsyncSMTPConnectionPool(BaseSMTPConnectionPool):
+    """イベントループから使用するSMTP接続プール（aiosmtplib）"""
+
+    def __init__(self, *args, **kwargs):
+        """
+        Raises:
+            RuntimeError: aiosmtplibがインストールされていない場合
+        """
+        if aiosmtplib is None:
+            raise RuntimeError("aiosmtplib package is required for asynchronous SMTP sending")
+        super().__init__(*args, **kwargs)
+        self._slots = asyncio.Semaphore(self.max_connections)
+
+    async def _connect(self) -> PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            username=self.username if self.use_tls else None,
+            password=self.password if self.use_tls else None,
+            start_tls=self.use_tls,
+            timeout=self.timeout_seconds,
+        )
+        await client.connect()
+        self.created_count += 1
+        return PooledConnection(client)
+
+    @staticmethod
+    async def _quit(connection: PooledConnection) -> None:
+        try:
+            await connection.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.client.close()
+
+    @staticmethod
+    async def _is_alive(connection: PooledConnection) -> bool:
+        try:
+            response = await connection.client.noop()
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+        return response.code == SMTPConstants.NOOP_OK_CODE
+
+    async def _checkout(self) -> PooledConnection:
+        """未使用の接続を取り出す（期限切れ・切断済みの接続は閉じて、なければ新しく接続）"""
+        while True:
+            connection = self._pop_idle()
+            if connection is None:
+                return await self._connect()
+            idle_seconds = connection.idle_seconds()
+            if idle_seconds > self.max_idle_seconds:
+                await self._quit(connection)
+            elif idle_seconds >= self.noop_after_idle_seconds and not await self._is_alive(connection):
+                connection.client.close()
+            else:
+                return connection
+
+    async def _checkin(self, connection: PooledConnection) -> None:
+        connection.last_used = time.monotonic()
+        if self._should_reuse(connection):
+            self._idle.append(connection)
+            return
+        await self._quit(connection)
+
+    async def send_messages(self, messages: Sequence[EncodedEmail]) -> List[Optional[str]]:
+        """
+        1つの接続で複数のメールを送信（SMTPConnectionPool.send_messagesの非同期版）
+
+        Returns:
+            メールごとの失敗理由（成功した場合はNone）
+        """
+        results: List[Optional[str]] = []
+        async with self._slots:
+            connection: Optional[PooledConnection] = None
+            try:
+                for index, message in enumerate(messages):
+                    error = None
+                    for _ in range(SEND_ATTEMPTS):
+                        if connection is None:
+                            try:
+                                connection = await self._checkout()
+                            except (aiosmtplib.SMTPException, OSError) as e:
+                                logger.error(f"Failed to connect to SMTP server: {e}")
+                                results.extend([describe_error(e)] * (len(messages) - index))
+                                return results
+                        try:
+                            await connection.client.sendmail(message.from_email, [message.to_email], message.data)
+                        except aiosmtplib.SMTPServerDisconnected as e:
+                            error = describe_error(e)
+                        except aiosmtplib.SMTPException as e:
+                            # 宛先の拒否など、接続は引き続き使用できる
+                            error = describe_error(e)
+                            break
+                        except OSError as e:
+                            error = describe_error(e)
+                        else:
+                            connection.sent_count += 1
+                            error = None
+                            break
+                        # 接続が切れた場合は接続し直して再送
+                        connection.client.close()
+                        connection = None
+                    results.append(error)
+                    if connection is not None and connection.sent_count >= self.max_messages_per_connection:
+                        await self._quit(connection)
+                        connection = None
+            finally:
+                if connection is not None:
+                    await self._checkin(connection)
+        return results
+
+    async def close(self) -> None:
+        """未使用の接続を閉じる（使用中の接続は返却時に閉じる）"""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._quit(connection)
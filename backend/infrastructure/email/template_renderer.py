@@ -0,0 +1,175 @@
+"""
+メールテンプレート
+
+templates/<ロケール>/<テンプレート名>.subject.txt / .txt / .html を初回使用時に読み込み、
+固定部分と変数名の並びに分解（コンパイル）してロケールごとにキャッシュします。
+メールごとの処理は固定部分と変数の値を連結するだけになります。
+
+書式はstring.Template（$name / ${name}、$$ は $ そのもの）で、HTMLに埋め込む値はエスケープします。
+メールの種類を増やす場合は、同じ名前の3ファイルを追加します。
+"""
+import html
+import threading
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+
+from infrastructure.email.constants import EmailTemplateConstants
+
+# テンプレートのディレクトリ
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# テンプレートの種類とファイルの拡張子
+SUBJECT_SUFFIX = ".subject.txt"
+TEXT_SUFFIX = ".txt"
+HTML_SUFFIX = ".html"
+
+
+class CompiledTemplate:
+    """固定部分と変数名に分解したテンプレート"""
+
+    __slots__ = ("fragments", "fields")
+
+    def __init__(self, source: str):
+        """
+        Args:
+            source: string.Template形式のテンプレート
+
+        Raises:
+            ValueError: 不正なプレースホルダーを含む場合
+        """
+        fragments: List[str] = []
+        fields: List[str] = []
+        literal: List[str] = []
+        position = 0
+        for match in Template.pattern.finditer(source):
+            literal.append(source[position:match.start()])
+            position = match.end()
+            if match.group("escaped") is not None:
+                literal.append(Template.delimiter)
+                continue
+            field = match.group("named") or match.group("braced")
+            if field is None:
+                raise ValueError(f"Invalid placeholder in email template: {source[match.start():match.end() + 1]!r}")
+            fragments.append("".join(literal))
+            fields.append(field)
+            literal = []
+        literal.append(source[position:])
+        fragments.append("".join(literal))
+        self.fragments: Tuple[str, ...] = tuple(fragments)
+        self.fields: Tuple[str, ...] = tuple(fields)
+
+    def render(self, context: Dict[str, str]) -> str:
+        """
+        変数を置換
+
+        Raises:
+            ValueError: テンプレートの変数がcontextにない場合
+        """
+        parts = [self.fragments[0]]
+        for field, fragment in zip(self.fields, self.fragments[1:]):
+            try:
+                parts.append(context[field])
+            except KeyError:
+                raise ValueError(f"Missing email template variable: {field}") from None
+            parts.append(fragment)
+        return "".join(parts)
+
+
+class EmailTemplate:
+    """1種類のメールの件名・テキスト本文・HTML本文のテンプレート"""
+
+    def __init__(self, subject: str, text: str, html_source: str):
+        self.subject = CompiledTemplate(subject.strip())
+        self.text = CompiledTemplate(text)
+        self.html = CompiledTemplate(html_source)
+
+    def render(self, context: Dict[str, Any]) -> Tuple[str, str, str]:
+        """
+        メールを作成
+
+        Returns:
+            (件名, テキスト本文, HTML本文)
+        """
+        values = {name: str(value) for name, value in context.items()}
+        escaped = {name: html.escape(value) for name, value in values.items()}
+        return self.subject.render(values), self.text.render(values), self.html.render(escaped)
+
+
+class EmailTemplateRenderer:
+    """ロケールごとにコンパイル済みテンプレートをキャッシュするレンダラー"""
+
+    def __init__(
+        self,
+        template_dir: Path = TEMPLATE_DIR,
+        default_locale: str = EmailTemplateConstants.DEFAULT_LOCALE
+    ):
+        """
+        Args:
+            template_dir: テンプレートのディレクトリ
+            default_locale: 既定のロケール
+        """
+        self.template_dir = template_dir
+        self.default_locale = default_locale
+        self._lock = threading.Lock()
+        self._templates: Dict[Tuple[str, str], EmailTemplate] = {}
+
+    def _load(self, name: str, locale: str) -> Optional[EmailTemplate]:
+        directory = self.template_dir / locale
+        paths = [directory / f"{name}{suffix}" for suffix in (SUBJECT_SUFFIX, TEXT_SUFFIX, HTML_SUFFIX)]
+        if not all(path.is_file() for path in paths):
+            return None
+        return EmailTemplate(*(path.read_text(encoding="utf-8") for path in paths))
+
+    def get(self, name: str, locale: Optional[str] = None) -> EmailTemplate:
+        """
+        コンパイル済みテンプレートを取得（指定したロケールにない場合は既定のロケール）
+
+        Raises:
+            ValueError: テンプレートが存在しない場合
+        """
+        key = (name, locale or self.default_locale)
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                template = self._load(name, key[1]) or self._load(name, self.default_locale)
+                if template is None:
+                    raise ValueError(f"Email template not found: {name}")
+                self._templates[key] = template
+        return template
+
+    def render(self, name: str, locale: Optional[str] = None, **context: Any) -> Tuple[str, str, str]:
+        """
+        テンプレートからメールを作成
+
+        Returns:
+            (件名, テキスト本文, HTML本文)
+        """
+        return self.get(name, locale).render(context)
+
+    def preload(self) -> int:
+        """
+        既定のロケールの全テンプレートをコンパイルしてキャッシュ（ワーカーの起動時用）
+
+        Returns:
+            コンパイルしたテンプレート数
+        """
+        names = [
+            path.name[:-len(SUBJECT_SUFFIX)]
+            for path in (self.template_dir / self.default_locale).glob(f"*{SUBJECT_SUFFIX}")
+        ]
+        for name in names:
+            self.get(name)
+        return len(names)
+
+    def clear(self) -> None:
+        """キャッシュを破棄（テンプレートの変更を反映する場合・テスト用）"""
+        with self._lock:
+            self._templates.clear()
+
+
+# グローバルなメールテンプレートレンダラー
+email_template_renderer = EmailTemplateRenderer()
@@ -0,0 +1,6 @@
+"""
+HTTP基盤モジュール
+
+このモジュールは、レスポンス圧縮（gzip / brotli）と
+事前圧縮済みレスポンスのキャッシュ（同一キーの読み込みの集約を含む）を提供します。
+"""
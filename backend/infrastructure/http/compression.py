@@ -0,0 +1,261 @@
+"""
+レスポンス圧縮
+
+Accept-Encodingに応じてgzip / brotliでレスポンスを圧縮するASGIミドルウェアを提供します。
+brotliがインストールされている場合はbrotliを優先し、未インストールの場合はgzipのみを使用します。
+"""
+import gzip
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.http.constants import CompressionConstants
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 任意依存
+    brotli = None
+
+# ストリーミング配信のため圧縮しないContent-Type
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """サーバーが対応する圧縮方式（優先順）"""
+    if brotli is not None:
+        return (CompressionConstants.ENCODING_BROTLI, CompressionConstants.ENCODING_GZIP)
+    return (CompressionConstants.ENCODING_GZIP,)
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encodingヘッダーをエンコーディング名→q値の辞書に変換"""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    クライアントが受け入れる圧縮方式を決定
+
+    Args:
+        accept_encoding: Accept-Encodingヘッダーの値
+
+    Returns:
+        使用するエンコーディング名（圧縮しない場合はNone）
+    """
+    if not accept_encoding:
+        return None
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    candidates: List[Tuple[float, int, str]] = []
+    for priority, encoding in enumerate(available_encodings()):
+        weight = weights.get(encoding, wildcard)
+        if weight > 0:
+            # q値が同じ場合はサーバーの優先順を採用
+            candidates.append((weight, -priority, encoding))
+    if not candidates:
+        return None
+    return max(candidates)[2]
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    """
+    指定方式で圧縮
+
+    Args:
+        body: 圧縮前のバイト列
+        encoding: エンコーディング名（br / gzip）
+        precompress: 事前圧縮用の最大圧縮レベルを使用するか
+
+    Returns:
+        圧縮後のバイト列
+    """
+    if encoding == CompressionConstants.ENCODING_BROTLI:
+        quality = (
+            CompressionConstants.PRECOMPRESS_BROTLI_QUALITY if precompress
+            else CompressionConstants.BROTLI_QUALITY
+        )
+        return brotli.compress(body, quality=quality)
+    if encoding == CompressionConstants.ENCODING_GZIP:
+        level = (
+            CompressionConstants.PRECOMPRESS_GZIP_LEVEL if precompress
+            else CompressionConstants.GZIP_LEVEL
+        )
+        # mtime=0 で同じ入力から常に同じ出力を得る
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class StreamingCompressor:
+    """
+    チャンク単位でボディを圧縮するコンプレッサー
+
+    ストリーミングレスポンスのように全体を一括で受け取れないボディを、
+    受け取ったチャンクから順に圧縮して送り出すために使用します。
+    """
+
+    def __init__(self, encoding: str):
+        """
+        Args:
+            encoding: エンコーディング名（br / gzip）
+        """
+        if encoding == CompressionConstants.ENCODING_BROTLI:
+            self._brotli = brotli.Compressor(quality=CompressionConstants.BROTLI_QUALITY)
+            self._zlib = None
+        elif encoding == CompressionConstants.ENCODING_GZIP:
+            # wbits=31 でgzipヘッダー付き（mtime=0）のストリームを生成
+            self._brotli = None
+            self._zlib = zlib.compressobj(CompressionConstants.GZIP_LEVEL, zlib.DEFLATED, 31)
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        """チャンクを圧縮（内部バッファに留まった分は空のバイト列になる）"""
+        if self._zlib is not None:
+            return self._zlib.compress(chunk)
+        return self._brotli.process(chunk)
+
+    def finish(self) -> bytes:
+        """残りのデータをすべて出力してストリームを終了"""
+        if self._zlib is not None:
+            return self._zlib.flush()
+        return self._brotli.finish()
+
+
+def is_compressible_content_type(content_type: str) -> bool:
+    """圧縮対象のContent-Typeかどうか（+json 構造化構文サフィックスを含む）"""
+    content_type = content_type.lower()
+    if content_type.startswith(EXCLUDED_CONTENT_TYPES):
+        return False
+    media_type = content_type.split(";", 1)[0].strip()
+    return content_type.startswith(CompressionConstants.COMPRESSIBLE_CONTENT_TYPES) or media_type.endswith("+json")
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    """Vary: Accept-Encoding を付与（既存のVaryは保持）"""
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """
+    レスポンス圧縮ミドルウェア
+
+    圧縮対象のContent-Typeで最小サイズ以上のレスポンスをAccept-Encodingに応じて
+    圧縮します。複数チャンクに分かれたボディは最小サイズに達するまでバッファし、
+    ボディ全体が揃っていれば一括で、続きがあればチャンク単位で圧縮します。
+    Server-Sent Eventsと、事前圧縮済み（Content-Encoding設定済み）のレスポンスは
+    そのまま返します。
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = CompressionConstants.MINIMUM_SIZE):
+        """
+        Args:
+            app: ASGIアプリケーション
+            minimum_size: 圧縮対象とする最小サイズ（バイト）
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+        buffer: List[bytes] = []
+        buffered_size = 0
+        compressor: Optional[StreamingCompressor] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough, buffered_size, compressor
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not is_compressible_content_type(
+                    headers.get("content-type", "")
+                ):
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is None:  # pragma: no cover - ASGI仕様上発生しない
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is not None:
+                # 圧縮ストリームの途中
+                chunk = compressor.compress(body)
+                if not more_body:
+                    chunk += compressor.finish()
+                if chunk or not more_body:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            buffer.append(body)
+            buffered_size += len(body)
+            if more_body and buffered_size < self.minimum_size:
+                # 最小サイズに達するか最後のチャンクが届くまで判断を保留
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            add_vary_accept_encoding(headers)
+            data = b"".join(buffer)
+            buffer.clear()
+
+            if not more_body and buffered_size < self.minimum_size:
+                # 小さいレスポンスは圧縮しない
+                passthrough = True
+                headers["Content-Length"] = str(len(data))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": data, "more_body": False})
+                return
+
+            headers["Content-Encoding"] = encoding
+            if not more_body:
+                # ボディ全体が揃っていれば一括で圧縮してContent-Lengthを設定
+                compressed = compress(data, encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressed, "more_body": False})
+                return
+
+            # 残りのボディは届いた順に圧縮して送り出す（長さは未確定）
+            del headers["Content-Length"]
+            compressor = StreamingCompressor(encoding)
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressor.compress(data), "more_body": True})
+
+        await self.app(scope, receive, send_wrapper)
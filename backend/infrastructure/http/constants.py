@@ -0,0 +1,44 @@
+"""
+HTTP関連の定数定義
+
+マジックナンバー禁止原則に従い、レスポンス圧縮の設定値を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class CompressionConstants:
+    """レスポンス圧縮設定定数"""
+
+    # 圧縮を有効化するか
+    ENABLED: Final[bool] = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+
+    # 圧縮対象とする最小レスポンスサイズ（バイト、これ未満は圧縮しない）
+    MINIMUM_SIZE: Final[int] = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+    # 圧縮レベル（リクエストごとの圧縮はCPUコストとのバランスを取る）
+    GZIP_LEVEL: Final[int] = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    BROTLI_QUALITY: Final[int] = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+    # 事前圧縮時の圧縮レベル（一度だけ圧縮するため最大レベルを使用）
+    PRECOMPRESS_GZIP_LEVEL: Final[int] = 9
+    PRECOMPRESS_BROTLI_QUALITY: Final[int] = 11
+
+    # 事前圧縮済みカタログレスポンスの有効期間（秒、他プロセスでの更新を反映するため）
+    CATALOG_CACHE_TTL_SECONDS: Final[float] = float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300"))
+
+    # 有効期間の経過後、バックグラウンドで更新している間に古いカタログレスポンスを返す期間（秒）
+    CATALOG_CACHE_STALE_SECONDS: Final[float] = float(os.getenv("CATALOG_CACHE_STALE_SECONDS", "300"))
+
+    # 圧縮対象のContent-Type（前方一致）
+    COMPRESSIBLE_CONTENT_TYPES: Final[tuple] = (
+        "application/json",
+        "text/",
+        "application/javascript",
+        "application/x-msgpack",
+    )
+
+    # エンコーディング名
+    ENCODING_BROTLI: Final[str] = "br"
+    ENCODING_GZIP: Final[str] = "gzip"
+    ENCODING_IDENTITY: Final[str] = "identity"
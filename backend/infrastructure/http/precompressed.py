@@ -0,0 +1,177 @@
+"""
+事前圧縮済みレスポンス
+
+ほとんど変更されないカタログ（作品一覧・機体一覧）のレスポンスを、
+生成時に一度だけ各方式で圧縮してキャッシュし、リクエストごとの再圧縮を避けます。
+期限切れ直後の同時リクエストは読み込みを1回にまとめ（single-flight）、
+期限切れから一定期間は古いレスポンスを返しながらバックグラウンドで1回だけ更新します（stale-while-revalidate）。
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from infrastructure.http.compression import (
+    add_vary_accept_encoding,
+    available_encodings,
+    compress,
+    negotiate_encoding,
+)
+from infrastructure.http.constants import CompressionConstants
+from infrastructure.http.single_flight import SingleFlight
+
+
+@dataclass(frozen=True)
+class PrecompressedPayload:
+    """圧縮前のボディと、方式ごとの圧縮済みボディ"""
+
+    body: bytes
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    media_type: str = "application/json"
+    created_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str = "application/json") -> "PrecompressedPayload":
+        """
+        対応する全方式で事前圧縮したペイロードを作成
+
+        Args:
+            body: 圧縮前のバイト列
+            media_type: Content-Type
+
+        Returns:
+            PrecompressedPayload: 作成したペイロード（最小サイズ未満の場合は圧縮なし）
+        """
+        variants: Dict[str, bytes] = {}
+        if len(body) >= CompressionConstants.MINIMUM_SIZE:
+            variants = {
+                encoding: compress(body, encoding, precompress=True)
+                for encoding in available_encodings()
+            }
+        return cls(body=body, variants=variants, media_type=media_type)
+
+
+class PrecompressedResponse(Response):
+    """
+    事前圧縮済みペイロードを返すレスポンス
+
+    送信時にリクエストのAccept-Encodingを参照し、対応する圧縮済みボディを選択します。
+    Content-Encodingを設定するため、CompressionMiddlewareでは再圧縮されません。
+    """
+
+    def __init__(self, payload: PrecompressedPayload, status_code: int = 200):
+        super().__init__(content=payload.body, status_code=status_code, media_type=payload.media_type)
+        self.payload = payload
+        add_vary_accept_encoding(self.headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        variant = self.payload.variants.get(encoding) if encoding else None
+        if variant is not None:
+            self.body = variant
+            self.headers["Content-Encoding"] = encoding
+            self.headers["Content-Length"] = str(len(variant))
+        await super().__call__(scope, receive, send)
+
+
+class PrecompressedResponseCache:
+    """事前圧縮済みペイロードのキャッシュ（TTL付き・期限切れ後は一定期間古い値を返しながら更新）"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = CompressionConstants.CATALOG_CACHE_TTL_SECONDS,
+        stale_seconds: float = CompressionConstants.CATALOG_CACHE_STALE_SECONDS,
+    ):
+        """
+        Args:
+            ttl_seconds: 有効期間（秒）
+            stale_seconds: 有効期間の経過後、更新中に古い値を返す期間（秒）
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.single_flight = SingleFlight()
+        self._entries: Dict[str, PrecompressedPayload] = {}
+        # 破棄のたびに増やし、破棄前に開始した読み込みの結果を保存しないようにする
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[PrecompressedPayload]:
+        """有効期間内のペイロードを取得（存在しない・期限切れの場合はNone）"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            age = time.monotonic() - payload.created_at
+            if age > self.ttl_seconds + self.stale_seconds:
+                del self._entries[key]
+            if age > self.ttl_seconds:
+                return None
+            return payload
+
+    def set(self, key: str, payload: PrecompressedPayload) -> None:
+        """ペイロードを保存"""
+        with self._lock:
+            self._entries[key] = payload
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], PrecompressedPayload],
+        refresher: Optional[Callable[[], PrecompressedPayload]] = None,
+    ) -> PrecompressedPayload:
+        """
+        ペイロードを取得し、なければ読み込んで保存
+
+        同じキーの読み込みが実行中の場合は、新たに読み込まずにその結果を待ちます。
+        有効期間を過ぎても古い値を返す期間内であれば、古い値を返してrefresherでバックグラウンドに更新します。
+
+        Args:
+            key: キャッシュキー
+            loader: ペイロードを作成する関数（呼び出し元のリクエストが結果を待つ場合に使用）
+            refresher: バックグラウンドでの更新に使用する関数（リクエストのDBセッションに依存しないもの）。
+                省略時は古い値を返さず、期限切れを未保存と同じに扱う
+
+        Returns:
+            PrecompressedPayload: キャッシュ済みまたは読み込んだペイロード
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            generation = self._generation
+        if payload is not None:
+            age = time.monotonic() - payload.created_at
+            if age <= self.ttl_seconds:
+                return payload
+            if refresher is not None and age <= self.ttl_seconds + self.stale_seconds:
+                self.single_flight.start(key, lambda: self._load(key, refresher, generation))
+                return payload
+        return await self.single_flight.do(key, lambda: self._load(key, loader, generation))
+
+    def _load(self, key: str, loader: Callable[[], PrecompressedPayload], generation: int) -> PrecompressedPayload:
+        payload = loader()
+        with self._lock:
+            if self._generation == generation:
+                self._entries[key] = payload
+        return payload
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        キャッシュを破棄
+
+        実行中の読み込みは破棄前のデータを読んでいる可能性があるため、結果を保存せず以降の呼び出しでも待ちません。
+
+        Args:
+            prefix: 破棄するキーの接頭辞（省略時は全件）
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+        self.single_flight.forget(prefix)
+
+
+# グローバルなカタログレスポンスキャッシュ
+catalog_response_cache = PrecompressedResponseCache()
@@ -0,0 +1,72 @@
+"""
+同一キーの読み込みの集約（single-flight）
+
+キャッシュの期限切れ直後に同じキーへのリクエストが同時に届いた場合、
+読み込み（DBアクセス・JSON生成・事前圧縮）を1回だけ実行し、他のリクエストはその結果を待ちます。
+同期関数の読み込みはイベントループを塞がないよう別スレッドで実行します。
+"""
+import asyncio
+from typing import Any, Callable, Dict
+
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class SingleFlight:
+    """キーごとに実行中の読み込みを1つにまとめる"""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    def _in_flight(self, key: str):
+        task = self._calls.get(key)
+        # 別のイベントループ（終了済みのループなど）で開始した読み込みは待てないため使用しない
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def in_flight(self, key: str) -> bool:
+        """キーの読み込みが実行中か（イベントループ上で呼び出す）"""
+        return self._in_flight(key) is not None
+
+    def start(self, key: str, func: Callable[[], Any]) -> asyncio.Task:
+        """
+        読み込みを開始（同じキーの読み込みが実行中の場合はそのタスクを返す）
+
+        結果を待たないバックグラウンドでの更新に使用します。失敗した場合はログに記録します。
+        """
+        task = self._in_flight(key)
+        if task is not None:
+            return task
+        task = asyncio.create_task(asyncio.to_thread(func), name=f"single-flight:{key}")
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    async def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        読み込みを実行して結果を返す（同じキーの読み込みが実行中の場合はその結果を待つ）
+
+        待っているリクエストの1つがキャンセルされても、読み込みは他のリクエストのために継続します。
+
+        Raises:
+            Exception: 読み込みで発生した例外（待っている全員に伝わる）
+        """
+        return await asyncio.shield(self.start(key, func))
+
+    def forget(self, prefix: str = "") -> None:
+        """
+        実行中の読み込みを以降の呼び出しで再利用しない（キャッシュの破棄時）
+
+        Args:
+            prefix: 対象のキーの接頭辞（省略時は全件）
+        """
+        for key in [key for key in self._calls if key.startswith(prefix)]:
+            del self._calls[key]
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Single-flight load failed: key={key}, error={task.exception()}")
@@ -0,0 +1,6 @@
+"""
+バックグラウンドジョブモジュール
+
+このモジュールは、アプリケーションの起動中に定期実行する
+集計ジョブ（クリア条件達成率統計など）を提供します。
+"""
@@ -0,0 +1,33 @@
+"""
+クリア記録変更ログの定期圧縮ジョブ
+
+アプリケーションの起動中、ジョブスケジューラーから定期的に保持期間を過ぎた変更ログを削除します。
+"""
+import asyncio
+from typing import Dict
+
+from application.services.clear_record_service import ClearRecordService
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from infrastructure.realtime.constants import ChangeLogConstants
+
+# スケジューラー・メトリクスに登録するジョブ名
+JOB_NAME = "change_log_compaction"
+
+
+def compact_clear_record_changes() -> Dict[str, int]:
+    """
+    保持期間を過ぎた変更ログを1回削除（スケジューラーのワーカースレッドで実行）
+
+    Returns:
+        処理行数（削除した変更ログの件数）
+    """
+    db = SessionLocal()
+    try:
+        service = ClearRecordService(ClearRecordRepositoryImpl(db))
+        deleted = asyncio.run(
+            service.compact_changes(ChangeLogConstants.RETENTION_DAYS, ChangeLogConstants.COMPACTION_BATCH_SIZE)
+        )
+    finally:
+        db.close()
+    return {"deleted_changes": deleted}
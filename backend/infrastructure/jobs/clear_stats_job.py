@@ -0,0 +1,35 @@
+"""
+クリア条件達成率統計の定期集計ジョブ
+
+アプリケーションの起動中、ジョブスケジューラーから一定間隔で達成率統計を増分集計します。
+"""
+from typing import Dict
+
+from application.services.clear_stats_service import ClearStatsService
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.http.precompressed import catalog_response_cache
+from infrastructure.jobs.constants import ClearStatsConstants
+
+# スケジューラー・メトリクスに登録するジョブ名
+JOB_NAME = "clear_stats_refresh"
+
+
+def refresh_clear_stats(force_full: bool = False) -> Dict[str, int]:
+    """
+    達成率統計を1回集計し、達成率APIのキャッシュを破棄
+
+    Args:
+        force_full: 全件集計を強制するか
+
+    Returns:
+        処理行数（反映した変更数）
+    """
+    db = SessionLocal()
+    try:
+        service = ClearStatsService(ClearStatsRepositoryImpl(db))
+        result = service.refresh(ClearStatsConstants.CHANGE_BATCH_SIZE, force_full=force_full)
+    finally:
+        db.close()
+    catalog_response_cache.invalidate(ClearStatsConstants.CACHE_KEY_PREFIX)
+    return {"applied_changes": result["applied_changes"]}
@@ -0,0 +1,74 @@
+"""
+バックグラウンドジョブ関連の定数定義
+
+マジックナンバー禁止原則に従い、ジョブの実行間隔などを定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class ClearStatsConstants:
+    """クリア条件達成率統計ジョブ設定定数"""
+
+    # 定期集計を有効にするか（複数ワーカー構成ではリースを取得した1プロセスのみが集計する）
+    REFRESH_ENABLED: Final[bool] = os.getenv("CLEAR_STATS_REFRESH_ENABLED", "true").lower() == "true"
+
+    # 集計間隔（秒）
+    REFRESH_INTERVAL_SECONDS: Final[float] = float(os.getenv("CLEAR_STATS_REFRESH_INTERVAL_SECONDS", "600"))
+
+    # 増分集計で1回に読み込む変更ログの件数
+    CHANGE_BATCH_SIZE: Final[int] = int(os.getenv("CLEAR_STATS_CHANGE_BATCH_SIZE", "5000"))
+
+    # 達成率APIのレスポンスキャッシュのキー接頭辞
+    CACHE_KEY_PREFIX: Final[str] = "clear_stats:"
+
+    # 達成率APIのブラウザ・CDN向けキャッシュ期間（秒）
+    CACHE_MAX_AGE_SECONDS: Final[int] = int(os.getenv("CLEAR_STATS_CACHE_MAX_AGE_SECONDS", "300"))
+
+
+class VerificationSweepConstants:
+    """メール認証の定期クリーンアップジョブ設定定数"""
+
+    # 定期クリーンアップを有効にするか
+    SWEEP_ENABLED: Final[bool] = os.getenv("VERIFICATION_SWEEP_ENABLED", "true").lower() == "true"
+
+    # 実行間隔（秒）
+    SWEEP_INTERVAL_SECONDS: Final[float] = float(os.getenv("VERIFICATION_SWEEP_INTERVAL_SECONDS", "3600"))
+
+    # 1トランザクションで更新・削除する行数（テーブルを長時間ロックしないよう小さく保つ）
+    BATCH_SIZE: Final[int] = int(os.getenv("VERIFICATION_SWEEP_BATCH_SIZE", "500"))
+
+    # 登録から一定期間メール未認証のユーザーを削除するか
+    PURGE_UNVERIFIED_ENABLED: Final[bool] = os.getenv("VERIFICATION_SWEEP_PURGE_UNVERIFIED", "false").lower() == "true"
+
+    # 未認証ユーザーを削除するまでの期間（日）
+    PURGE_UNVERIFIED_AFTER_DAYS: Final[int] = int(os.getenv("VERIFICATION_SWEEP_PURGE_AFTER_DAYS", "30"))
+
+
+class SchedulerConstants:
+    """定期ジョブスケジューラー設定定数"""
+
+    # スケジューラーを起動するか（無効の場合は定期ジョブを一切実行しない）
+    ENABLED: Final[bool] = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+
+    # 全ジョブ合計の同時実行数の上限（DB接続やスレッドを使い切らないため）
+    MAX_CONCURRENCY: Final[int] = int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "2"))
+
+    # 実行時刻に加える揺らぎの上限（秒、複数ワーカーのリース取得の衝突を避ける）
+    JITTER_SECONDS: Final[float] = float(os.getenv("SCHEDULER_JITTER_SECONDS", "5"))
+
+    # リースの最短保持期間（秒、次回の実行時刻がこれより近い場合もこの期間は保持する）
+    LEASE_MIN_SECONDS: Final[float] = float(os.getenv("SCHEDULER_LEASE_MIN_SECONDS", "60"))
+
+    # ジョブごとに保持する実行履歴の件数
+    HISTORY_SIZE: Final[int] = int(os.getenv("SCHEDULER_HISTORY_SIZE", "20"))
+
+
+class ChangeLogCompactionConstants:
+    """クリア記録変更ログの定期圧縮ジョブ設定定数"""
+
+    # 定期圧縮を有効にするか
+    ENABLED: Final[bool] = os.getenv("CHANGE_LOG_COMPACTION_ENABLED", "true").lower() == "true"
+
+    # 実行スケジュール（cron形式、デフォルトは毎日4:30）
+    SCHEDULE: Final[str] = os.getenv("CHANGE_LOG_COMPACTION_SCHEDULE", "30 4 * * *")
@@ -0,0 +1,52 @@
+"""
+メール送信キューの送信ジョブ
+
+アプリケーションの起動中、送信キューを一定間隔で確認して送信します。
+送信待ちが1バッチ以上ある場合は間隔を空けずに続けて処理します。
+"""
+import asyncio
+from typing import Optional, Tuple
+
+from infrastructure.email.constants import EmailOutboxConstants
+from infrastructure.email.outbox_worker import EmailOutboxWorker
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+async def run_email_outbox_loop(
+    worker: EmailOutboxWorker,
+    poll_interval_seconds: float = EmailOutboxConstants.POLL_INTERVAL_SECONDS
+) -> None:
+    """送信キューを繰り返し処理（処理の失敗はログに記録して次回に再試行）"""
+    while True:
+        processed = 0
+        try:
+            result = await asyncio.to_thread(worker.drain_once)
+            processed = sum(result.values())
+        except Exception as e:
+            logger.error(f"Failed to drain email outbox: {e}")
+        if processed < worker.batch_size:
+            await asyncio.sleep(poll_interval_seconds)
+
+
+def start_email_outbox_worker() -> Optional[Tuple[EmailOutboxWorker, asyncio.Task]]:
+    """設定で有効な場合に送信ワーカーを開始"""
+    if not EmailOutboxConstants.WORKER_ENABLED:
+        return None
+    worker = EmailOutboxWorker()
+    logger.info(f"Email outbox worker started: workers={EmailOutboxConstants.WORKER_COUNT}")
+    return worker, asyncio.create_task(run_email_outbox_loop(worker))
+
+
+async def stop_email_outbox_worker(started: Optional[Tuple[EmailOutboxWorker, asyncio.Task]]) -> None:
+    """送信ワーカーを停止（送信中のメールは完了を待つ）"""
+    if started is None:
+        return
+    worker, task = started
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    await asyncio.to_thread(worker.shutdown)
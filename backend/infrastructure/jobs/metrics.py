@@ -0,0 +1,81 @@
+"""
+バックグラウンドジョブの実行メトリクス
+
+ジョブごとの実行回数・失敗回数・処理行数の累計と、直近の実行結果・所要時間をプロセス内に記録します。
+"""
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class JobMetrics:
+    """ジョブの実行メトリクス（スレッドセーフ）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, job_name: str) -> Dict[str, Any]:
+        entry = self._jobs.get(job_name)
+        if entry is None:
+            entry = self._jobs[job_name] = {
+                "runs": 0,
+                "failures": 0,
+                "rows_total": {},
+                "last_rows": {},
+                "last_duration_ms": None,
+                "max_duration_ms": None,
+                "last_run_at": None,
+                "last_error": None,
+            }
+        return entry
+
+    def record(self, job_name: str, duration_ms: float, rows: Dict[str, int]) -> None:
+        """
+        成功した実行を記録
+
+        Args:
+            job_name: ジョブ名
+            duration_ms: 所要時間（ミリ秒）
+            rows: 種類ごとの処理行数
+        """
+        with self._lock:
+            entry = self._entry(job_name)
+            entry["runs"] += 1
+            for name, count in rows.items():
+                entry["rows_total"][name] = entry["rows_total"].get(name, 0) + count
+            entry["last_rows"] = dict(rows)
+            entry["last_duration_ms"] = round(duration_ms, 1)
+            entry["max_duration_ms"] = max(entry["max_duration_ms"] or 0.0, round(duration_ms, 1))
+            entry["last_run_at"] = datetime.now()
+            entry["last_error"] = None
+
+    def record_failure(self, job_name: str, error: str) -> None:
+        """失敗した実行を記録"""
+        with self._lock:
+            entry = self._entry(job_name)
+            entry["runs"] += 1
+            entry["failures"] += 1
+            entry["last_run_at"] = datetime.now()
+            entry["last_error"] = error
+
+    def snapshot(self, job_name: Optional[str] = None) -> Dict[str, Any]:
+        """記録したメトリクスのコピー（job_name指定時はそのジョブのみ）"""
+        with self._lock:
+            if job_name is not None:
+                entry = self._jobs.get(job_name)
+                return _copy(entry) if entry is not None else {}
+            return {name: _copy(entry) for name, entry in self._jobs.items()}
+
+    def clear(self) -> None:
+        """記録を破棄（テスト用）"""
+        with self._lock:
+            self._jobs.clear()
+
+
+def _copy(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {**entry, "rows_total": dict(entry["rows_total"]), "last_rows": dict(entry["last_rows"])}
+
+
+# グローバルなジョブ実行メトリクス
+job_metrics = JobMetrics()
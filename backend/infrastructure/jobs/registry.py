@@ -0,0 +1,56 @@
+"""
+定期ジョブの登録
+
+アプリケーションの定期処理はすべてここでジョブスケジューラーに登録し、lifespanから起動・停止します。
+送信キューのワーカー（email_outbox_job）は送信待ちを常時処理する常駐ワーカーで、
+複数ワーカーで並行して処理できるため、スケジューラーの対象外です。
+"""
+from typing import Optional
+
+from infrastructure.jobs import change_log_compaction_job, clear_stats_job, verification_sweep_job
+from infrastructure.jobs.constants import (
+    ChangeLogCompactionConstants,
+    ClearStatsConstants,
+    SchedulerConstants,
+    VerificationSweepConstants,
+)
+from infrastructure.jobs.scheduler import JobScheduler, ScheduledJob, job_scheduler
+from infrastructure.jobs.schedules import CronSchedule, IntervalSchedule
+
+
+def register_default_jobs(scheduler: JobScheduler) -> None:
+    """設定で有効な定期ジョブをスケジューラーに登録"""
+    if ClearStatsConstants.REFRESH_ENABLED:
+        scheduler.register(ScheduledJob(
+            name=clear_stats_job.JOB_NAME,
+            func=clear_stats_job.refresh_clear_stats,
+            schedule=IntervalSchedule(ClearStatsConstants.REFRESH_INTERVAL_SECONDS),
+        ))
+    if VerificationSweepConstants.SWEEP_ENABLED:
+        scheduler.register(ScheduledJob(
+            name=verification_sweep_job.JOB_NAME,
+            func=verification_sweep_job.sweep_verification,
+            schedule=IntervalSchedule(VerificationSweepConstants.SWEEP_INTERVAL_SECONDS),
+        ))
+    if ChangeLogCompactionConstants.ENABLED:
+        scheduler.register(ScheduledJob(
+            name=change_log_compaction_job.JOB_NAME,
+            func=change_log_compaction_job.compact_clear_record_changes,
+            schedule=CronSchedule(ChangeLogCompactionConstants.SCHEDULE),
+        ))
+
+
+def start_job_scheduler() -> Optional[JobScheduler]:
+    """設定で有効な場合に定期ジョブを登録してスケジューラーを開始"""
+    if not SchedulerConstants.ENABLED:
+        return None
+    register_default_jobs(job_scheduler)
+    job_scheduler.start()
+    return job_scheduler
+
+
+async def stop_job_scheduler(scheduler: Optional[JobScheduler]) -> None:
+    """スケジューラーを停止"""
+    if scheduler is None:
+        return
+    await scheduler.stop()
@@ -0,0 +1,257 @@
+"""
+定期ジョブスケジューラー
+
+登録したジョブをスケジュール（一定間隔・cron形式）に従ってアプリケーションのイベントループ上で起動します。
+同期関数のジョブはイベントループを塞がないよう別スレッドで実行します。
+
+- 複数ワーカーで起動した場合、leader_onlyのジョブはDBのリース行（job_leases）を取得できたワーカーだけが実行します。
+  リースは次回の実行時刻まで保持し、保持者が停止した場合は期限切れ後に他のワーカーが引き継ぎます。
+- ジョブごとの同時実行数と、全ジョブ合計の同時実行数を制限します。
+- 実行時刻に揺らぎ（jitter）を加え、複数ワーカーが同時にリースを取り合うのを避けます。
+- 実行結果・所要時間はジョブごとの実行履歴とジョブの実行メトリクス（job_metrics）に記録します。
+"""
+import asyncio
+import os
+import random
+import socket
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Union
+
+from sqlalchemy.orm import Session
+
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.job_lease_repository_impl import JobLeaseRepositoryImpl
+from infrastructure.jobs.constants import SchedulerConstants
+from infrastructure.jobs.metrics import job_metrics
+from infrastructure.jobs.schedules import CronSchedule, IntervalSchedule
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+Schedule = Union[IntervalSchedule, CronSchedule]
+
+# 実行結果
+RUN_SUCCEEDED = "succeeded"
+RUN_FAILED = "failed"
+RUN_SKIPPED = "skipped"
+
+
+@dataclass
+class ScheduledJob:
+    """
+    スケジューラーに登録するジョブ
+
+    funcは処理行数の辞書（種類→件数、なければNone）を返す同期関数またはコルーチン関数です。
+    """
+
+    name: str
+    func: Callable[[], Any]
+    schedule: Schedule
+    leader_only: bool = True
+    max_concurrency: int = 1
+    jitter_seconds: float = SchedulerConstants.JITTER_SECONDS
+
+
+@dataclass
+class JobRun:
+    """ジョブの1回分の実行結果"""
+
+    started_at: datetime
+    status: str
+    duration_ms: Optional[float] = None
+    rows: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class _JobState:
+    """ジョブごとの実行状態"""
+
+    history: Deque[JobRun]
+    running: int = 0
+    next_run_at: Optional[datetime] = None
+    is_leader: Optional[bool] = None
+
+
+def _default_owner() -> str:
+    """このワーカーの識別子（ホスト名:PID:乱数）"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobScheduler:
+    """定期ジョブスケジューラー"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        owner: Optional[str] = None,
+        max_concurrency: int = SchedulerConstants.MAX_CONCURRENCY,
+        history_size: int = SchedulerConstants.HISTORY_SIZE,
+        lease_min_seconds: float = SchedulerConstants.LEASE_MIN_SECONDS,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Args:
+            session_factory: DBセッションの作成関数（リースの取得に使用）
+            owner: リースの保持者として記録するワーカーの識別子
+            max_concurrency: 全ジョブ合計の同時実行数の上限
+            history_size: ジョブごとに保持する実行履歴の件数
+            lease_min_seconds: リースの最短保持期間（秒）
+            clock: 現在時刻の取得関数
+        """
+        self.session_factory = session_factory
+        self.owner = owner or _default_owner()
+        self.history_size = history_size
+        self.lease_min_seconds = lease_min_seconds
+        self.clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._states: Dict[str, _JobState] = {}
+        self._loops: List[asyncio.Task] = []
+        self._runs: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._loops)
+
+    @property
+    def jobs(self) -> List[ScheduledJob]:
+        return list(self._jobs.values())
+
+    def register(self, job: ScheduledJob) -> None:
+        """
+        ジョブを登録（同名のジョブは置き換える）
+
+        Raises:
+            RuntimeError: スケジューラーの起動中に登録した場合
+        """
+        if self.is_running:
+            raise RuntimeError("Cannot register jobs while the scheduler is running")
+        self._jobs[job.name] = job
+        self._states[job.name] = _JobState(history=deque(maxlen=self.history_size))
+
+    def start(self) -> None:
+        """登録済みのジョブのスケジュールを開始（イベントループ上で呼び出す）"""
+        if self.is_running:
+            return
+        for job in self._jobs.values():
+            self._loops.append(asyncio.create_task(self._schedule_loop(job), name=f"job-scheduler:{job.name}"))
+        logger.info(f"Job scheduler started: owner={self.owner}, jobs={list(self._jobs)}")
+
+    async def stop(self) -> None:
+        """スケジュールと実行中のジョブを停止し、保持しているリースを手放す"""
+        tasks = self._loops + list(self._runs)
+        self._loops = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for name, state in self._states.items():
+            if state.is_leader:
+                try:
+                    await asyncio.to_thread(self._release_lease, name)
+                except Exception as e:
+                    logger.warning(f"Failed to release job lease: job={name}, error={e}")
+                state.is_leader = None
+        logger.info("Job scheduler stopped")
+
+    async def _schedule_loop(self, job: ScheduledJob) -> None:
+        state = self._states[job.name]
+        state.next_run_at = job.schedule.first_run(self.clock())
+        while True:
+            delay = (state.next_run_at - self.clock()).total_seconds() + random.uniform(0, job.jitter_seconds)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            state.next_run_at = job.schedule.next_run(self.clock())
+            task = asyncio.create_task(self.run_job(job.name))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def run_job(self, name: str) -> JobRun:
+        """
+        ジョブを1回実行し、結果を実行履歴に記録
+
+        同時実行数の上限に達している場合や、他のワーカーがリースを保持している場合は実行せずにskippedを返します。
+
+        Raises:
+            KeyError: 未登録のジョブ名の場合
+        """
+        job = self._jobs[name]
+        state = self._states[name]
+        started_at = self.clock()
+        if state.running >= job.max_concurrency:
+            logger.warning(f"Skipped job run (max concurrency reached): job={name}")
+            return self._record(state, JobRun(started_at, RUN_SKIPPED, error="max concurrency reached"))
+
+        state.running += 1
+        try:
+            async with self._semaphore:
+                start = time.perf_counter()
+                try:
+                    if job.leader_only:
+                        state.is_leader = await asyncio.to_thread(self._acquire_lease, job.name, state.next_run_at)
+                        if not state.is_leader:
+                            return self._record(state, JobRun(started_at, RUN_SKIPPED, error="lease held by another worker"))
+                        start = time.perf_counter()
+                    if asyncio.iscoroutinefunction(job.func):
+                        result = await job.func()
+                    else:
+                        result = await asyncio.to_thread(job.func)
+                except Exception as e:
+                    duration_ms = (time.perf_counter() - start) * 1000
+                    logger.error(f"Job failed: job={name}, error={e}")
+                    job_metrics.record_failure(name, str(e))
+                    return self._record(state, JobRun(started_at, RUN_FAILED, round(duration_ms, 1), error=str(e)))
+                duration_ms = (time.perf_counter() - start) * 1000
+                rows = dict(result) if result else {}
+                job_metrics.record(name, duration_ms, rows)
+                return self._record(state, JobRun(started_at, RUN_SUCCEEDED, round(duration_ms, 1), rows))
+        finally:
+            state.running -= 1
+
+    def _record(self, state: _JobState, run: JobRun) -> JobRun:
+        state.history.append(run)
+        return run
+
+    def _acquire_lease(self, job_name: str, next_run_at: Optional[datetime]) -> bool:
+        """次回の実行時刻（最短lease_min_seconds秒後）までのリースを取得"""
+        now = self.clock()
+        expires_at = now + timedelta(seconds=self.lease_min_seconds)
+        if next_run_at is not None and next_run_at > expires_at:
+            expires_at = next_run_at
+        db = self.session_factory()
+        try:
+            return JobLeaseRepositoryImpl(db).try_acquire(job_name, self.owner, now, expires_at)
+        finally:
+            db.close()
+
+    def _release_lease(self, job_name: str) -> None:
+        db = self.session_factory()
+        try:
+            JobLeaseRepositoryImpl(db).release(job_name, self.owner, self.clock())
+        finally:
+            db.close()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """ジョブごとの設定・実行状態・実行履歴（新しい順）・実行メトリクス"""
+        return [
+            {
+                "name": job.name,
+                "schedule": str(job.schedule),
+                "leader_only": job.leader_only,
+                "max_concurrency": job.max_concurrency,
+                "running": self._states[job.name].running,
+                "next_run_at": self._states[job.name].next_run_at,
+                "is_leader": self._states[job.name].is_leader,
+                "history": [asdict(run) for run in reversed(self._states[job.name].history)],
+                "metrics": job_metrics.snapshot(job.name) or None,
+            }
+            for job in self._jobs.values()
+        ]
+
+
+# グローバルな定期ジョブスケジューラー
+job_scheduler = JobScheduler()
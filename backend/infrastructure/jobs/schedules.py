@@ -0,0 +1,144 @@
+"""
+定期ジョブの実行スケジュール
+
+一定間隔で実行するIntervalScheduleと、cron形式（分 時 日 月 曜日）で実行時刻を指定するCronScheduleを提供します。
+時刻はサーバーのローカル時刻（タイムゾーンなし）で扱います。
+"""
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+
+class IntervalSchedule:
+    """一定間隔のスケジュール"""
+
+    def __init__(self, seconds: float, run_at_start: bool = True):
+        """
+        Args:
+            seconds: 実行間隔（秒）
+            run_at_start: 起動直後に1回実行するか
+
+        Raises:
+            ValueError: 実行間隔が0以下の場合
+        """
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive: {seconds}")
+        self.seconds = seconds
+        self.run_at_start = run_at_start
+
+    def first_run(self, now: datetime) -> datetime:
+        """起動後の最初の実行時刻"""
+        return now if self.run_at_start else self.next_run(now)
+
+    def next_run(self, after: datetime) -> datetime:
+        """指定時刻の次の実行時刻"""
+        return after + timedelta(seconds=self.seconds)
+
+    def __str__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+# cronの各フィールドの範囲（最小値, 最大値）
+CRON_FIELD_RANGES: Tuple[Tuple[int, int], ...] = (
+    (0, 59),  # 分
+    (0, 23),  # 時
+    (1, 31),  # 日
+    (1, 12),  # 月
+    (0, 7),   # 曜日（0と7は日曜日）
+)
+
+# 次の実行時刻を探す上限（指定できない日付の組み合わせで無限ループしないため）
+CRON_SEARCH_LIMIT_DAYS = 366 * 5
+
+
+def _parse_cron_field(field: str, minimum: int, maximum: int) -> FrozenSet[int]:
+    """cronの1フィールド（* / a-b / */n / a-b/n / カンマ区切り）を値の集合に変換"""
+    values = set()
+    for part in field.split(","):
+        expression, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if expression == "*":
+            start, end = minimum, maximum
+        elif "-" in expression:
+            start_text, _, end_text = expression.partition("-")
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(expression)
+            end = maximum if step_text else start
+        if step <= 0 or start < minimum or end > maximum or start > end:
+            raise ValueError(f"Invalid cron field: {field}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """cron形式（分 時 日 月 曜日）のスケジュール"""
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron式（例: "30 4 * * *" は毎日4:30）
+
+        Raises:
+            ValueError: cron式が不正な場合
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+        try:
+            minutes, hours, days, months, weekdays = (
+                _parse_cron_field(field, minimum, maximum)
+                for field, (minimum, maximum) in zip(fields, CRON_FIELD_RANGES)
+            )
+        except ValueError:
+            raise ValueError(f"Invalid cron expression: {expression}")
+        self.expression = expression
+        self.minutes = minutes
+        self.hours = hours
+        self.days = days
+        self.months = months
+        # cronの曜日（日曜日=0）をdatetime.weekday()（月曜日=0）に合わせる
+        self.weekdays = frozenset((weekday - 1) % 7 for weekday in weekdays)
+        # 日と曜日の両方を指定した場合はどちらかに一致すれば実行する（cronと同じ）
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+
+    def _matches_day(self, value: datetime) -> bool:
+        day_match = value.day in self.days
+        weekday_match = value.weekday() in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def first_run(self, now: datetime) -> datetime:
+        """起動後の最初の実行時刻"""
+        return self.next_run(now)
+
+    def next_run(self, after: datetime) -> datetime:
+        """
+        指定時刻より後で最初に条件を満たす時刻（分単位）
+
+        Raises:
+            ValueError: 条件を満たす日付が存在しない場合（例: "0 0 31 2 *"）
+        """
+        candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + timedelta(days=CRON_SEARCH_LIMIT_DAYS)
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                # 翌月の1日 0:00へ
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+                continue
+            if not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+    def __str__(self) -> str:
+        return f"cron {self.expression}"
@@ -0,0 +1,43 @@
+"""
+メール認証の定期クリーンアップジョブ
+
+アプリケーションの起動中、ジョブスケジューラーから一定間隔で期限切れの認証トークンを削除し、
+設定で有効な場合は長期間メール未認証のユーザーも削除します。
+"""
+from datetime import timedelta
+from typing import Dict
+
+from application.services.verification_sweep_service import VerificationSweepService
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.user_cleanup_repository_impl import UserCleanupRepositoryImpl
+from infrastructure.jobs.constants import VerificationSweepConstants
+
+# スケジューラー・メトリクスに登録するジョブ名
+JOB_NAME = "verification_sweep"
+
+
+def sweep_verification(
+    purge_unverified: bool = VerificationSweepConstants.PURGE_UNVERIFIED_ENABLED
+) -> Dict[str, int]:
+    """
+    メール認証のクリーンアップを1回実行
+
+    Args:
+        purge_unverified: 未認証のままのユーザーも削除するか
+
+    Returns:
+        種類ごとの処理行数
+    """
+    purge_after = (
+        timedelta(days=VerificationSweepConstants.PURGE_UNVERIFIED_AFTER_DAYS) if purge_unverified else None
+    )
+    db = SessionLocal()
+    try:
+        service = VerificationSweepService(UserCleanupRepositoryImpl(db))
+        result = service.sweep(VerificationSweepConstants.BATCH_SIZE, purge_unverified_after=purge_after)
+    finally:
+        db.close()
+    return {
+        "expired_tokens_cleared": result["expired_tokens_cleared"],
+        "unverified_users_purged": result["unverified_users_purged"],
+    }
@@ -25,6 +25,7 @@ class LoggingConstants:
     LOG_FILE_APP: Final[str] = "app.log"
     LOG_FILE_ERROR: Final[str] = "error.log"
     LOG_FILE_SECURITY: Final[str] = "security.log"
+    LOG_FILE_SLOW_QUERY: Final[str] = "slow_query.log"
 
     # ログローテーション設定
     LOG_MAX_BYTES: Final[int] = 10 * 1024 * 1024  # 10MB
@@ -58,6 +59,29 @@ class LoggingConstants:
     JSON_KEY_REQUEST_PATH: Final[str] = "request_path"
     JSON_KEY_REQUEST_METHOD: Final[str] = "request_method"
     JSON_KEY_RESPONSE_TIME: Final[str] = "response_time_ms"
+    JSON_KEY_DB_QUERY_COUNT: Final[str] = "db_query_count"
+    JSON_KEY_DB_TIME: Final[str] = "db_time_ms"
+
+    # DBクエリ数デバッグヘッダー（本番環境以外ではデフォルト有効）
+    DB_QUERY_HEADER_NAME: Final[str] = "X-DB-Queries"
+    DB_QUERY_HEADER_ENABLED: Final[bool] = os.getenv(
+        "DB_QUERY_HEADER_ENABLED",
+        "false" if os.getenv("ENVIRONMENT") == "production" else "true"
+    ).lower() == "true"
+
+    # スロークエリログ設定（環境変数で上書き可能）
+    SLOW_QUERY_THRESHOLD_MS: Final[float] = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_EXPLAIN_ENABLED: Final[bool] = os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() == "true"
+    SLOW_QUERY_MAX_PARAM_LENGTH: Final[int] = 200
+
+    # スロークエリログ用キー
+    JSON_KEY_STATEMENT: Final[str] = "statement"
+    JSON_KEY_PARAMETERS: Final[str] = "parameters"
+    JSON_KEY_DURATION: Final[str] = "duration_ms"
+    JSON_KEY_THRESHOLD: Final[str] = "threshold_ms"
+    JSON_KEY_CALLER: Final[str] = "caller"
+    JSON_KEY_DIALECT: Final[str] = "dialect"
+    JSON_KEY_EXPLAIN_PLAN: Final[str] = "explain_plan"
 
     # セキュリティログ用キー
     JSON_KEY_EVENT_TYPE: Final[str] = "event_type"
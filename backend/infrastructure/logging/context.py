@@ -9,10 +9,36 @@ from contextvars import ContextVar
 from typing import Optional
 
 
+class DBQueryStats:
+    """
+    リクエスト単位のDBクエリ統計
+
+    同期エンドポイントはスレッドプールでコピーされたコンテキスト上で実行されるため、
+    値そのものではなく可変オブジェクトをコンテキスト変数に保持して集計します。
+    """
+
+    __slots__ = ("query_count", "total_time_ms")
+
+    def __init__(self) -> None:
+        self.query_count = 0
+        self.total_time_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """
+        クエリ1件分の実行時間を加算
+
+        Args:
+            elapsed_ms: クエリ実行時間（ミリ秒）
+        """
+        self.query_count += 1
+        self.total_time_ms += elapsed_ms
+
+
 # リクエストごとのコンテキスト変数
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 user_id_var: ContextVar[Optional[int]] = ContextVar("user_id", default=None)
 username_var: ContextVar[Optional[str]] = ContextVar("username", default=None)
+db_query_stats_var: ContextVar[Optional[DBQueryStats]] = ContextVar("db_query_stats", default=None)
 
 
 class RequestContext:
@@ -82,9 +108,44 @@ class RequestContext:
         """
         return username_var.get()
 
+    @staticmethod
+    def start_db_query_stats() -> DBQueryStats:
+        """
+        DBクエリ統計の集計を開始
+
+        Returns:
+            現在のリクエストに紐づくDBクエリ統計
+        """
+        stats = DBQueryStats()
+        db_query_stats_var.set(stats)
+        return stats
+
+    @staticmethod
+    def get_db_query_stats() -> Optional[DBQueryStats]:
+        """
+        現在のDBクエリ統計を取得
+
+        Returns:
+            DBクエリ統計（集計していない場合はNone）
+        """
+        return db_query_stats_var.get()
+
+    @staticmethod
+    def record_db_query(elapsed_ms: float) -> None:
+        """
+        DBクエリの実行を記録（集計中でない場合は何もしない）
+
+        Args:
+            elapsed_ms: クエリ実行時間（ミリ秒）
+        """
+        stats = db_query_stats_var.get()
+        if stats is not None:
+            stats.record(elapsed_ms)
+
     @staticmethod
     def clear() -> None:
         """コンテキスト情報をクリア（リクエスト終了時に呼び出し）"""
         request_id_var.set(None)
         user_id_var.set(None)
         username_var.set(None)
+        db_query_stats_var.set(None)
@@ -7,6 +7,7 @@ import json
 import logging
 import logging.handlers
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -196,6 +197,25 @@ class LoggerFactory:
 
         return logging.getLogger(name)
 
+    _security_logger: Optional["SecurityLogger"] = None
+    _security_logger_lock = threading.Lock()
+
+    @classmethod
+    def get_security_logger(cls) -> "SecurityLogger":
+        """
+        セキュリティロガーを取得
+
+        ログファイルの作成はインポート時ではなく初回の呼び出し時に行います。
+
+        Returns:
+            SecurityLoggerインスタンス
+        """
+        if cls._security_logger is None:
+            with cls._security_logger_lock:
+                if cls._security_logger is None:
+                    cls._security_logger = SecurityLogger()
+        return cls._security_logger
+
 
 class SecurityLogger:
     """セキュリティイベント専用のロガー"""
@@ -264,7 +284,3 @@ class SecurityLogger:
             log_message,
             extra={LoggingConstants.JSON_KEY_EXTRA: event_data}
         )
-
-
-# グローバルなセキュリティロガーインスタンス
-security_logger = SecurityLogger()
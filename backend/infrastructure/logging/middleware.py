@@ -5,13 +5,17 @@
 パフォーマンス測定とログ記録を行います。
 """
 import time
-from typing import Callable
+from datetime import datetime, UTC
+from typing import Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from infrastructure.logging.context import RequestContext
 from infrastructure.logging.logger import LoggerFactory
 from infrastructure.logging.constants import LoggingConstants
+from infrastructure.profiling.constants import ProfilingConstants
+from infrastructure.profiling.report_store import ProfileReport, profile_report_store
+from infrastructure.profiling.request_profiler import RequestProfiler
 
 
 logger = LoggerFactory.get_logger(__name__)
@@ -24,9 +28,12 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
     各HTTPリクエストに対して以下の処理を行います:
     1. リクエストIDの生成・設定
     2. リクエスト開始ログの記録
-    3. パフォーマンス測定（レスポンスタイム）
+    3. パフォーマンス測定（レスポンスタイム、DBクエリ数・DB時間）
     4. リクエスト完了ログの記録
     5. コンテキストのクリーンアップ
+
+    プロファイリング用シークレットをヘッダーで指定したリクエストは
+    プロファイリングされ、レポートはリクエストIDをキーとして保存されます。
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -64,16 +71,34 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
 
         # パフォーマンス測定開始
         start_time = time.time()
+        db_stats = RequestContext.start_db_query_stats()
+
+        # シークレットが一致する場合のみプロファイリング
+        profiler = None
+        if RequestProfiler.is_authorized(
+            request.headers.get(ProfilingConstants.PROFILE_REQUEST_HEADER_NAME)
+        ):
+            profiler = self._start_profile(method, path)
 
         try:
             # 次のミドルウェア/ハンドラーを実行
-            response = await call_next(request)
+            try:
+                response = await call_next(request)
+            finally:
+                if profiler is not None:
+                    self._save_profile(profiler, request_id, method, path, start_time)
 
             # レスポンスタイム計算（ミリ秒）
             response_time_ms = round((time.time() - start_time) * 1000, 2)
 
             # レスポンスヘッダーにリクエストIDを追加
             response.headers["X-Request-ID"] = request_id
+            if profiler is not None:
+                response.headers[ProfilingConstants.PROFILE_ID_HEADER_NAME] = request_id
+
+            # デバッグ用にDBクエリ数をヘッダーで返す
+            if LoggingConstants.DB_QUERY_HEADER_ENABLED:
+                response.headers[LoggingConstants.DB_QUERY_HEADER_NAME] = str(db_stats.query_count)
 
             # リクエスト完了ログ
             logger.info(
@@ -85,6 +110,8 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
                         LoggingConstants.JSON_KEY_REQUEST_PATH: path,
                         LoggingConstants.JSON_KEY_STATUS_CODE: response.status_code,
                         LoggingConstants.JSON_KEY_RESPONSE_TIME: response_time_ms,
+                        LoggingConstants.JSON_KEY_DB_QUERY_COUNT: db_stats.query_count,
+                        LoggingConstants.JSON_KEY_DB_TIME: round(db_stats.total_time_ms, 2),
                         LoggingConstants.JSON_KEY_IP_ADDRESS: client_host,
                     }
                 }
@@ -105,6 +132,8 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
                         LoggingConstants.JSON_KEY_REQUEST_METHOD: method,
                         LoggingConstants.JSON_KEY_REQUEST_PATH: path,
                         LoggingConstants.JSON_KEY_RESPONSE_TIME: response_time_ms,
+                        LoggingConstants.JSON_KEY_DB_QUERY_COUNT: db_stats.query_count,
+                        LoggingConstants.JSON_KEY_DB_TIME: round(db_stats.total_time_ms, 2),
                         LoggingConstants.JSON_KEY_IP_ADDRESS: client_host,
                         "exception_type": type(e).__name__,
                         "exception_message": str(e),
@@ -119,3 +148,64 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
         finally:
             # コンテキストクリーンアップ
             RequestContext.clear()
+
+    @staticmethod
+    def _start_profile(method: str, path: str) -> Optional[RequestProfiler]:
+        """
+        プロファイリングを開始（開始できない場合もリクエストは通常どおり処理する）
+
+        Args:
+            method: HTTPメソッド
+            path: リクエストパス
+
+        Returns:
+            実行中のプロファイラー（他のリクエストをプロファイリング中・開始に失敗した場合はNone）
+        """
+        profiler = RequestProfiler()
+        try:
+            started = profiler.start()
+        except Exception as e:
+            logger.warning(f"Request profiling failed to start: {method} {path} - {type(e).__name__}: {str(e)}")
+            return None
+        if not started:
+            logger.warning(f"Request profiling skipped (another request is being profiled): {method} {path}")
+            return None
+        return profiler
+
+    @staticmethod
+    def _save_profile(
+        profiler: RequestProfiler,
+        request_id: str,
+        method: str,
+        path: str,
+        start_time: float
+    ) -> None:
+        """
+        プロファイリングを終了してレポートを保存
+
+        Args:
+            profiler: 実行中のプロファイラー
+            request_id: リクエストID
+            method: HTTPメソッド
+            path: リクエストパス
+            start_time: リクエスト開始時刻
+        """
+        report = profiler.stop()
+        profile_report_store.save(ProfileReport(
+            request_id=request_id,
+            method=method,
+            path=path,
+            profiler=profiler.profiler_name,
+            duration_ms=round((time.time() - start_time) * 1000, 2),
+            created_at=datetime.now(UTC),
+            report=report
+        ))
+        logger.info(
+            f"Request profiled: {method} {path}",
+            extra={
+                LoggingConstants.JSON_KEY_EXTRA: {
+                    LoggingConstants.JSON_KEY_REQUEST_ID: request_id,
+                    "profiler": profiler.profiler_name,
+                }
+            }
+        )
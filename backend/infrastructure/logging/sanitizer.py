@@ -50,6 +50,8 @@ class SensitiveDataSanitizer:
         re.compile(r"\b[A-Za-z0-9]{32,}\b"),
         # メールアドレス形式
         re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+        # パスワードハッシュ形式（Argon2 / bcrypt）
+        re.compile(r"\$(argon2(id|i|d)|2[aby])\$\S+"),
     ]
 
     @classmethod
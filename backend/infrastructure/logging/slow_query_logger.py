@@ -0,0 +1,279 @@
+"""
+スロークエリロガー
+
+閾値を超えたSQLを、マスキング済みパラメータ・実行時間・呼び出し元リポジトリメソッドと共に
+専用のローテーションログ（slow_query.log）へ記録します。
+設定により、SQLite / MySQL では実行計画（EXPLAIN）も取得します。
+"""
+import logging
+import logging.handlers
+import re
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+from infrastructure.logging.constants import LoggingConstants
+from infrastructure.logging.logger import JSONFormatter, LoggerFactory
+from infrastructure.logging.sanitizer import SensitiveDataSanitizer
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+# 呼び出し元として扱うモジュールの接頭辞
+REPOSITORY_MODULE_PREFIX = "infrastructure.database.repositories."
+
+# 方言ごとの実行計画取得用プレフィックス
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "mysql": "EXPLAIN ",
+}
+
+# 位置指定パラメータのプレースホルダー（SQLite: ?、MySQL: %s）
+PLACEHOLDER_PATTERN = re.compile(r"\?|%s")
+
+# INSERT文の列リスト（VALUES内のプレースホルダーを列名に対応付ける）
+INSERT_COLUMNS_PATTERN = re.compile(r"\bINSERT\s+INTO\s+\S+\s*\(([^)]*)\)\s*VALUES\b", re.IGNORECASE)
+
+# プレースホルダー直前の比較・代入の対象列（"列 = ?"、"列 IN (?"）
+COLUMN_BEFORE_PLACEHOLDER_PATTERN = re.compile(
+    r"([\w.`\"]+)\s*(=|!=|<>|<=|>=|<|>|\bLIKE|\bIN\s*\()\s*$", re.IGNORECASE
+)
+
+# 対象列を探す範囲（プレースホルダー直前の文字数）
+COLUMN_SEARCH_WINDOW = 100
+
+
+class SlowQueryLogger:
+    """スロークエリ専用のロガー"""
+
+    def __init__(
+        self,
+        threshold_ms: float = LoggingConstants.SLOW_QUERY_THRESHOLD_MS,
+        explain_enabled: bool = LoggingConstants.SLOW_QUERY_EXPLAIN_ENABLED
+    ):
+        """
+        Args:
+            threshold_ms: スロークエリと判定する閾値（ミリ秒）
+            explain_enabled: 実行計画を取得するかどうか
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_enabled = explain_enabled
+        self._logger: Optional[logging.Logger] = None
+
+    def _get_logger(self) -> logging.Logger:
+        """専用ロガーを取得（初回のスロークエリ発生時にファイルハンドラーを作成）"""
+        if self._logger is not None:
+            return self._logger
+
+        log_dir = Path(LoggingConstants.LOG_DIR)
+        log_dir.mkdir(exist_ok=True)
+
+        slow_logger = logging.getLogger("slow_query")
+        slow_logger.setLevel(LoggingConstants.LOG_LEVEL_INFO)
+        slow_logger.propagate = False  # ルートロガーへの伝播を無効化
+
+        if not slow_logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                log_dir / LoggingConstants.LOG_FILE_SLOW_QUERY,
+                maxBytes=LoggingConstants.LOG_MAX_BYTES,
+                backupCount=LoggingConstants.LOG_BACKUP_COUNT,
+                encoding="utf-8"
+            )
+            handler.setFormatter(JSONFormatter())
+            slow_logger.addHandler(handler)
+
+        self._logger = slow_logger
+        return slow_logger
+
+    def is_slow(self, elapsed_ms: float) -> bool:
+        """
+        スロークエリかどうかを判定
+
+        Args:
+            elapsed_ms: クエリ実行時間（ミリ秒）
+
+        Returns:
+            閾値以上の場合True
+        """
+        return elapsed_ms >= self.threshold_ms
+
+    def log_if_slow(
+        self,
+        conn: Any,
+        statement: str,
+        parameters: Any,
+        elapsed_ms: float,
+        executemany: bool = False
+    ) -> bool:
+        """
+        閾値を超えた場合にスロークエリとして記録
+
+        Args:
+            conn: SQLAlchemyのConnection
+            statement: SQL文
+            parameters: バインドパラメータ
+            elapsed_ms: クエリ実行時間（ミリ秒）
+            executemany: executemanyによる実行かどうか
+
+        Returns:
+            記録した場合True
+        """
+        if not self.is_slow(elapsed_ms):
+            return False
+
+        dialect_name = conn.dialect.name
+        event_data = {
+            LoggingConstants.JSON_KEY_STATEMENT: statement,
+            LoggingConstants.JSON_KEY_PARAMETERS: self.sanitize_parameters(parameters, statement),
+            LoggingConstants.JSON_KEY_DURATION: round(elapsed_ms, 2),
+            LoggingConstants.JSON_KEY_THRESHOLD: self.threshold_ms,
+            LoggingConstants.JSON_KEY_CALLER: self.find_caller(),
+            LoggingConstants.JSON_KEY_DIALECT: dialect_name,
+        }
+
+        if self.explain_enabled and not executemany:
+            plan = self.explain(conn, statement, parameters)
+            if plan is not None:
+                event_data[LoggingConstants.JSON_KEY_EXPLAIN_PLAN] = plan
+
+        self._get_logger().warning(
+            f"Slow query: {round(elapsed_ms, 2)}ms",
+            extra={LoggingConstants.JSON_KEY_EXTRA: event_data}
+        )
+        return True
+
+    @classmethod
+    def sanitize_parameters(cls, parameters: Any, statement: Optional[str] = None) -> Any:
+        """
+        バインドパラメータの機密情報をマスキングし、長い値を切り詰める
+
+        位置指定パラメータ（tuple / list）は、SQL文から対応する列名を特定できた場合は
+        名前指定パラメータと同じく列名でも判定します（値のパターンに一致しないトークン等）。
+
+        Args:
+            parameters: バインドパラメータ（dict / tuple / list）
+            statement: SQL文（位置指定パラメータの列名の特定に使用）
+
+        Returns:
+            ログ出力用のパラメータ
+        """
+        if isinstance(parameters, dict):
+            return {
+                key: cls._truncate(value)
+                for key, value in SensitiveDataSanitizer.sanitize_dict(parameters).items()
+            }
+        if isinstance(parameters, (list, tuple)):
+            columns = cls.placeholder_columns(statement) if statement else []
+            sanitized = []
+            for index, value in enumerate(parameters):
+                column = columns[index] if index < len(columns) else None
+                if isinstance(value, (list, tuple, dict)):
+                    # executemanyの各行
+                    sanitized.append(cls.sanitize_parameters(value, statement))
+                elif column is not None:
+                    sanitized.append(cls._truncate(SensitiveDataSanitizer.sanitize_dict({column: value})[column]))
+                else:
+                    sanitized.append(cls.sanitize_parameters(value))
+            return sanitized
+        return cls._truncate(SensitiveDataSanitizer.sanitize_value(parameters))
+
+    @staticmethod
+    def placeholder_columns(statement: str) -> List[Optional[str]]:
+        """
+        位置指定パラメータのプレースホルダーごとに対応する列名を特定
+
+        Args:
+            statement: SQL文
+
+        Returns:
+            プレースホルダー順の列名のリスト（特定できない場合はNone）
+        """
+        insert = INSERT_COLUMNS_PATTERN.search(statement)
+        insert_columns = insert.group(1).split(",") if insert else []
+        columns: List[Optional[str]] = []
+        values_index = 0
+        in_list_column = None
+        previous_end = 0
+        for match in PLACEHOLDER_PATTERN.finditer(statement):
+            preceding = statement[previous_end:match.start()]
+            previous_end = match.end()
+            if insert_columns and match.start() >= insert.end():
+                column = insert_columns[values_index % len(insert_columns)]
+                values_index += 1
+            elif in_list_column is not None and preceding.strip() == ",":
+                # IN (?, ?, ...) の2つ目以降
+                column = in_list_column
+            else:
+                found = COLUMN_BEFORE_PLACEHOLDER_PATTERN.search(
+                    statement, max(0, match.start() - COLUMN_SEARCH_WINDOW), match.start()
+                )
+                column = found.group(1) if found else None
+                in_list_column = column if found and found.group(2).upper().startswith("IN") else None
+            columns.append(column.split(".")[-1].strip(' `"') if column else None)
+        return columns
+
+    @staticmethod
+    def _truncate(value: Any) -> Any:
+        """ログ肥大化を防ぐため長い値を切り詰める"""
+        if not isinstance(value, (str, bytes)):
+            return value if isinstance(value, (int, float, bool, type(None))) else str(value)
+        if isinstance(value, bytes):
+            return f"<{len(value)} bytes>"
+        if len(value) > LoggingConstants.SLOW_QUERY_MAX_PARAM_LENGTH:
+            return value[:LoggingConstants.SLOW_QUERY_MAX_PARAM_LENGTH] + "..."
+        return value
+
+    @staticmethod
+    def find_caller() -> Optional[str]:
+        """
+        呼び出し元のリポジトリメソッドを特定
+
+        Returns:
+            "クラス名.メソッド名" 形式の文字列（見つからない場合はNone）
+        """
+        frame = sys._getframe(1)
+        while frame is not None:
+            module_name = frame.f_globals.get("__name__", "")
+            if module_name.startswith(REPOSITORY_MODULE_PREFIX):
+                owner = frame.f_locals.get("self")
+                method_name = frame.f_code.co_name
+                if owner is not None:
+                    return f"{type(owner).__name__}.{method_name}"
+                return f"{module_name}.{method_name}"
+            frame = frame.f_back
+        return None
+
+    @staticmethod
+    def explain(conn: Any, statement: str, parameters: Any) -> Optional[List[str]]:
+        """
+        実行計画を取得
+
+        計測イベントを発火させないよう、DBAPIカーソルを直接使用します。
+
+        Args:
+            conn: SQLAlchemyのConnection
+            statement: SQL文
+            parameters: バインドパラメータ
+
+        Returns:
+            実行計画の各行（未対応の方言・取得失敗時はNone）
+        """
+        prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None or not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        cursor = None
+        try:
+            cursor = conn.connection.cursor()
+            cursor.execute(prefix + statement, parameters or ())
+            return [" | ".join(str(column) for column in row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.debug(f"Failed to capture query plan: {type(e).__name__}: {str(e)}")
+            return None
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+
+# グローバルなスロークエリロガーインスタンス
+slow_query_logger = SlowQueryLogger()
@@ -0,0 +1,6 @@
+"""
+プロファイリング基盤モジュール
+
+このモジュールは、管理者向けのリクエスト単位プロファイリングと
+サンプリングプロファイラーを提供します。
+"""
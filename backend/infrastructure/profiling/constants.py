@@ -0,0 +1,35 @@
+"""
+プロファイリング関連の定数定義
+
+マジックナンバー禁止原則に従い、プロファイリング設定値を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class ProfilingConstants:
+    """プロファイリング設定定数"""
+
+    # リクエストプロファイリングを有効化するシークレット（未設定の場合は無効）
+    PROFILING_SECRET: Final[str] = os.getenv("PROFILING_SECRET", "")
+
+    # リクエストヘッダー名
+    PROFILE_REQUEST_HEADER_NAME: Final[str] = "X-Profile-Token"
+    PROFILE_ID_HEADER_NAME: Final[str] = "X-Profile-ID"
+
+    # プロファイラー種別
+    PROFILER_PYINSTRUMENT: Final[str] = "pyinstrument"
+    PROFILER_CPROFILE: Final[str] = "cprofile"
+
+    # cProfileレポートに出力する関数の上限数
+    CPROFILE_REPORT_LIMIT: Final[int] = 50
+
+    # 保持するプロファイルレポートの上限数（古いものから破棄）
+    REPORT_STORE_MAX_SIZE: Final[int] = int(os.getenv("PROFILING_REPORT_MAX_SIZE", "50"))
+
+    # サンプリングプロファイラー設定
+    SAMPLING_DEFAULT_INTERVAL_MS: Final[float] = 10.0
+    SAMPLING_MIN_INTERVAL_MS: Final[float] = 1.0
+    SAMPLING_MAX_INTERVAL_MS: Final[float] = 1000.0
+    SAMPLING_MAX_STACK_DEPTH: Final[int] = 128
+    SAMPLING_MAX_UNIQUE_STACKS: Final[int] = 10000
@@ -0,0 +1,83 @@
+"""
+プロファイルレポートストア
+
+リクエスト単位のプロファイル結果をリクエストIDをキーとしてメモリ上に保持します。
+上限を超えた場合は古いレポートから破棄します。
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from infrastructure.profiling.constants import ProfilingConstants
+
+
+@dataclass
+class ProfileReport:
+    """プロファイルレポート"""
+    request_id: str
+    method: str
+    path: str
+    profiler: str
+    duration_ms: float
+    created_at: datetime
+    report: str
+
+
+class ProfileReportStore:
+    """スレッドセーフな上限付きプロファイルレポートストア"""
+
+    def __init__(self, max_size: int = ProfilingConstants.REPORT_STORE_MAX_SIZE):
+        """
+        Args:
+            max_size: 保持するレポートの上限数
+        """
+        self.max_size = max_size
+        self._reports: "OrderedDict[str, ProfileReport]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, report: ProfileReport) -> None:
+        """
+        レポートを保存
+
+        Args:
+            report: プロファイルレポート
+        """
+        with self._lock:
+            self._reports[report.request_id] = report
+            self._reports.move_to_end(report.request_id)
+            while len(self._reports) > self.max_size:
+                self._reports.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[ProfileReport]:
+        """
+        リクエストIDでレポートを取得
+
+        Args:
+            request_id: リクエストID
+
+        Returns:
+            プロファイルレポート（存在しない場合はNone）
+        """
+        with self._lock:
+            return self._reports.get(request_id)
+
+    def list(self) -> List[ProfileReport]:
+        """
+        保持しているレポートを新しい順に取得
+
+        Returns:
+            プロファイルレポートのリスト
+        """
+        with self._lock:
+            return list(reversed(self._reports.values()))
+
+    def clear(self) -> None:
+        """全レポートを破棄"""
+        with self._lock:
+            self._reports.clear()
+
+
+# グローバルなプロファイルレポートストアインスタンス
+profile_report_store = ProfileReportStore()
@@ -0,0 +1,116 @@
+"""
+リクエストプロファイラー
+
+単一リクエストの処理をプロファイリングし、テキスト形式のレポートを生成します。
+pyinstrumentがインストールされている場合はそれを使用し、
+未インストールの場合は標準ライブラリのcProfileにフォールバックします。
+"""
+import cProfile
+import hmac
+import io
+import pstats
+import threading
+from typing import Optional
+
+from infrastructure.profiling.constants import ProfilingConstants
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:  # pragma: no cover - 任意依存
+    PyinstrumentProfiler = None
+
+# プロファイリング中のリクエストはプロセスで1つまで
+# （cProfileのフックはプロセスで1つしか設定できず、Python 3.12以降は2つ目の開始がValueErrorになるため）
+_active_lock = threading.Lock()
+
+
+class RequestProfiler:
+    """
+    単一リクエスト用のプロファイラー
+
+    cProfileは実行スレッドのみを計測するため、スレッドプールで実行される
+    同期エンドポイントの内部はpyinstrumentの方が正確に計測できます。
+    また、cProfileのレポートには計測中に同じイベントループで実行された他のリクエストの処理も含まれます。
+    """
+
+    def __init__(self, use_pyinstrument: Optional[bool] = None):
+        """
+        Args:
+            use_pyinstrument: pyinstrumentを使用するかどうか（Noneの場合はインストール状況で判定）
+        """
+        if use_pyinstrument is None:
+            use_pyinstrument = PyinstrumentProfiler is not None
+        self.profiler_name = (
+            ProfilingConstants.PROFILER_PYINSTRUMENT
+            if use_pyinstrument
+            else ProfilingConstants.PROFILER_CPROFILE
+        )
+        self._profiler = None
+
+    @staticmethod
+    def is_authorized(token: Optional[str], secret: Optional[str] = None) -> bool:
+        """
+        プロファイリング要求ヘッダーの値がシークレットと一致するか判定
+
+        シークレットが未設定の場合は常に無効です。
+
+        Args:
+            token: リクエストヘッダーの値
+            secret: 比較するシークレット（省略時は環境変数の値）
+
+        Returns:
+            一致する場合True
+        """
+        if secret is None:
+            secret = ProfilingConstants.PROFILING_SECRET
+        if not secret or not token:
+            return False
+        return hmac.compare_digest(token.encode("utf-8"), secret.encode("utf-8"))
+
+    def start(self) -> bool:
+        """
+        プロファイリングを開始
+
+        Returns:
+            開始した場合True（他のリクエストをプロファイリング中の場合False）
+        """
+        if not _active_lock.acquire(blocking=False):
+            return False
+        try:
+            if self.profiler_name == ProfilingConstants.PROFILER_PYINSTRUMENT:
+                self._profiler = PyinstrumentProfiler(async_mode="enabled")
+                self._profiler.start()
+            else:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+        except Exception:
+            self._profiler = None
+            _active_lock.release()
+            raise
+        return True
+
+    def stop(self) -> str:
+        """
+        プロファイリングを終了してレポートを生成
+
+        Returns:
+            テキスト形式のプロファイルレポート
+        """
+        if self._profiler is None:
+            return ""
+
+        try:
+            if self.profiler_name == ProfilingConstants.PROFILER_PYINSTRUMENT:
+                self._profiler.stop()
+                report = self._profiler.output_text(unicode=True, color=False)
+            else:
+                self._profiler.disable()
+                stream = io.StringIO()
+                stats = pstats.Stats(self._profiler, stream=stream)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE)
+                stats.print_stats(ProfilingConstants.CPROFILE_REPORT_LIMIT)
+                report = stream.getvalue()
+        finally:
+            self._profiler = None
+            _active_lock.release()
+        return report
@@ -0,0 +1,152 @@
+"""
+サンプリングプロファイラー
+
+バックグラウンドスレッドから一定間隔で全スレッドのスタックを採取し、
+フレームグラフ（flamegraph.pl / speedscope）互換のcollapsed形式で集計します。
+計測対象のコードにフックを挿入しないため、本番環境でも低オーバーヘッドで動作します。
+"""
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+from infrastructure.logging.logger import LoggerFactory
+from infrastructure.profiling.constants import ProfilingConstants
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+# 集計上限を超えたスタックをまとめるキー
+TRUNCATED_STACK_KEY = "[truncated]"
+
+
+class SamplingProfiler:
+    """スタックサンプリングによるプロファイラー"""
+
+    def __init__(
+        self,
+        max_unique_stacks: int = ProfilingConstants.SAMPLING_MAX_UNIQUE_STACKS
+    ):
+        """
+        Args:
+            max_unique_stacks: 集計するユニークなスタックの上限数
+        """
+        self.max_unique_stacks = max_unique_stacks
+        self.interval_ms = ProfilingConstants.SAMPLING_DEFAULT_INTERVAL_MS
+        self.sample_count = 0
+        self.started_at: Optional[float] = None
+        self._stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """サンプリング中かどうか"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_ms: float = ProfilingConstants.SAMPLING_DEFAULT_INTERVAL_MS) -> bool:
+        """
+        サンプリングを開始（既に実行中の場合は何もしない）
+
+        Args:
+            interval_ms: サンプリング間隔（ミリ秒）
+
+        Returns:
+            新たに開始した場合True
+        """
+        if self.is_running:
+            return False
+
+        self.interval_ms = min(
+            max(interval_ms, ProfilingConstants.SAMPLING_MIN_INTERVAL_MS),
+            ProfilingConstants.SAMPLING_MAX_INTERVAL_MS
+        )
+        self.reset()
+        self.started_at = time.time()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Sampling profiler started: interval_ms={self.interval_ms}")
+        return True
+
+    def stop(self) -> bool:
+        """
+        サンプリングを停止（集計結果は保持）
+
+        Returns:
+            停止した場合True
+        """
+        if not self.is_running:
+            return False
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        logger.info(f"Sampling profiler stopped: samples={self.sample_count}")
+        return True
+
+    def reset(self) -> None:
+        """集計結果を破棄"""
+        with self._lock:
+            self._stacks.clear()
+            self.sample_count = 0
+
+    def _run(self) -> None:
+        """サンプリングループ"""
+        interval_sec = self.interval_ms / 1000
+        while not self._stop_event.wait(interval_sec):
+            self.sample()
+
+    def sample(self) -> None:
+        """全スレッドのスタックを1回採取（サンプリングスレッド自身は除外）"""
+        own_thread_id = threading.get_ident()
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id == own_thread_id:
+                    continue
+                stack = self._format_stack(frame)
+                if stack in self._stacks or len(self._stacks) < self.max_unique_stacks:
+                    self._stacks[stack] += 1
+                else:
+                    self._stacks[TRUNCATED_STACK_KEY] += 1
+            self.sample_count += 1
+
+    @staticmethod
+    def _format_stack(frame: Optional[FrameType]) -> str:
+        """
+        フレームをcollapsed形式のスタック文字列に変換
+
+        Args:
+            frame: 最も内側のフレーム
+
+        Returns:
+            ルート側から";"で連結したスタック文字列
+        """
+        names = []
+        while frame is not None and len(names) < ProfilingConstants.SAMPLING_MAX_STACK_DEPTH:
+            module_name = frame.f_globals.get("__name__", "?")
+            names.append(f"{module_name}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def collapsed(self) -> str:
+        """
+        集計結果をcollapsed形式で出力
+
+        Returns:
+            "スタック 回数" を1行とするテキスト（回数の多い順）
+        """
+        with self._lock:
+            lines = [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+        return "\n".join(lines)
+
+
+# グローバルなサンプリングプロファイラーインスタンス
+sampling_profiler = SamplingProfiler()
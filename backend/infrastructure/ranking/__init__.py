@@ -0,0 +1,6 @@
+"""
+ランキングモジュール
+
+このモジュールは、ユーザーの達成スコアの順位を対数時間で求めるための
+スコア別人数のFenwick木（Binary Indexed Tree）による順位インデックスを提供します。
+"""
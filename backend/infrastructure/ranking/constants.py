@@ -0,0 +1,24 @@
+"""
+ランキング関連の定数定義
+
+マジックナンバー禁止原則に従い、順位インデックスの設定値を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class RankingConstants:
+    """ランキング設定定数"""
+
+    # 全作品合計スコアを表す作品ID（user_scoresテーブルのgame_id）
+    GLOBAL_GAME_ID: Final[int] = 0
+
+    # 順位インデックスをDBから作り直す間隔（秒、他プロセスでの更新を反映するため）
+    INDEX_TTL_SECONDS: Final[float] = float(os.getenv("RANKING_INDEX_TTL_SECONDS", "300"))
+
+    # 順位インデックスの初期容量（スコアの上限、超えた場合は倍に拡張）
+    INDEX_INITIAL_CAPACITY: Final[int] = 1024
+
+    # リーダーボードのページサイズ
+    DEFAULT_PAGE_SIZE: Final[int] = 50
+    MAX_PAGE_SIZE: Final[int] = 100
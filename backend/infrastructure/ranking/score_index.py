@@ -0,0 +1,184 @@
+"""
+達成スコアの順位インデックス
+
+作品（全作品合計を含む）ごとに、スコア値をインデックスとする人数のFenwick木を保持します。
+順位（自分より高いスコアの人数 + 1）と、上からN番目のユーザーのスコアを
+O(log スコア上限) で求められるため、リクエストごとに全ユーザーを並べ替える必要がありません。
+
+同じスコアのユーザーは同順位です。このプロセスでの変更は即座に反映し、
+他プロセスでの変更はTTL経過後にDBのスコア分布から作り直して反映します。
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from infrastructure.ranking.constants import RankingConstants
+
+
+class FenwickTree:
+    """スコア値ごとの人数を保持するFenwick木（スコアは0以上の整数）"""
+
+    def __init__(self, capacity: int = RankingConstants.INDEX_INITIAL_CAPACITY):
+        """
+        Args:
+            capacity: 保持できるスコアの上限 + 1
+        """
+        self._counts: List[int] = [0] * capacity
+        self._tree: List[int] = [0] * (capacity + 1)
+        self._total = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._counts)
+
+    @property
+    def total(self) -> int:
+        """登録されている人数"""
+        return self._total
+
+    def _grow(self, score: int) -> None:
+        """容量を倍に拡張（O(容量)で作り直す）"""
+        capacity = self.capacity
+        while capacity <= score:
+            capacity *= 2
+        self._counts.extend([0] * (capacity - self.capacity))
+        tree = [0] + self._counts[:]
+        for index in range(1, capacity + 1):
+            parent = index + (index & -index)
+            if parent <= capacity:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def add(self, score: int, delta: int) -> None:
+        """スコアの人数を増減"""
+        if score >= self.capacity:
+            self._grow(score)
+        self._counts[score] += delta
+        self._total += delta
+        index = score + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def count_at_most(self, score: int) -> int:
+        """スコアがscore以下の人数"""
+        index = min(score, self.capacity - 1) + 1
+        count = 0
+        while index > 0:
+            count += self._tree[index]
+            index -= index & -index
+        return count
+
+    def count_above(self, score: int) -> int:
+        """スコアがscoreより高い人数"""
+        return self._total - self.count_at_most(score)
+
+    def score_at(self, position: int) -> Optional[int]:
+        """
+        スコアの高い順でposition番目（1始まり）のユーザーのスコア
+
+        Returns:
+            スコア（positionが人数を超える場合はNone）
+        """
+        if position < 1 or position > self._total:
+            return None
+        # 低い順での順番に変換し、累積人数がその順番に達する最小のスコアを二分探索
+        remaining = self._total - position + 1
+        index = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            next_index = index + step
+            if next_index < len(self._tree) and self._tree[next_index] < remaining:
+                index = next_index
+                remaining -= self._tree[next_index]
+            step >>= 1
+        return index
+
+
+class RankingIndex:
+    """作品ごとの順位インデックス（プロセス内で共有）"""
+
+    def __init__(self, ttl_seconds: float = RankingConstants.INDEX_TTL_SECONDS):
+        """
+        Args:
+            ttl_seconds: DBのスコア分布から作り直す間隔（秒）
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._trees: Dict[int, Tuple[FenwickTree, float]] = {}
+
+    def _build(self, histogram: Dict[int, int]) -> FenwickTree:
+        tree = FenwickTree(max(RankingConstants.INDEX_INITIAL_CAPACITY, max(histogram, default=0) + 1))
+        for score, count in histogram.items():
+            tree.add(score, count)
+        return tree
+
+    def _tree(self, game_id: int, load_histogram: Callable[[], Dict[int, int]]) -> FenwickTree:
+        """順位インデックスを取得（未作成・期限切れの場合はスコア分布から作成）"""
+        with self._lock:
+            entry = self._trees.get(game_id)
+            if entry is not None and time.monotonic() - entry[1] <= self.ttl_seconds:
+                return entry[0]
+        tree = self._build(load_histogram())
+        with self._lock:
+            self._trees[game_id] = (tree, time.monotonic())
+        return tree
+
+    def rank(self, game_id: int, score: int, load_histogram: Callable[[], Dict[int, int]]) -> Tuple[int, int]:
+        """
+        スコアの順位を取得
+
+        Args:
+            game_id: 作品ID（全作品合計はRankingConstants.GLOBAL_GAME_ID）
+            score: スコア
+            load_histogram: スコア→人数の分布を読み込む関数（インデックス作成時に使用）
+
+        Returns:
+            (順位, ランキング対象の人数)
+        """
+        tree = self._tree(game_id, load_histogram)
+        with self._lock:
+            return tree.count_above(score) + 1, tree.total
+
+    def locate(
+        self,
+        game_id: int,
+        position: int,
+        load_histogram: Callable[[], Dict[int, int]]
+    ) -> Tuple[Optional[int], int, int]:
+        """
+        スコアの高い順でposition番目（1始まり）のユーザーの位置を取得
+
+        Returns:
+            (そのユーザーのスコア, そのスコアより高い人数, ランキング対象の人数)
+            （positionが人数を超える場合、スコアはNone）
+        """
+        tree = self._tree(game_id, load_histogram)
+        with self._lock:
+            score = tree.score_at(position)
+            above = tree.count_above(score) if score is not None else tree.total
+            return score, above, tree.total
+
+    def apply(self, game_id: int, old_score: int, new_score: int) -> None:
+        """このプロセスでのスコア変更を反映（スコア0はランキング対象外）"""
+        with self._lock:
+            entry = self._trees.get(game_id)
+            if entry is None:
+                return
+            tree = entry[0]
+            if old_score > 0:
+                tree.add(old_score, -1)
+            if new_score > 0:
+                tree.add(new_score, 1)
+
+    def invalidate(self, game_id: Optional[int] = None) -> None:
+        """インデックスを破棄（次回の参照時に作り直す）"""
+        with self._lock:
+            if game_id is None:
+                self._trees.clear()
+            else:
+                self._trees.pop(game_id, None)
+
+
+# グローバルな順位インデックス
+ranking_index = RankingIndex()
@@ -0,0 +1,7 @@
+"""
+レート制限モジュール
+
+このモジュールは、ユーザー（JWTのsubject）またはクライアントIPごとの
+トークンバケットによるルート別のレート制限と、同時処理数を超えたリクエストを
+503で拒否する負荷制限（ロードシェディング）のミドルウェアを提供します。
+"""
@@ -0,0 +1,52 @@
+"""
+レート制限関連の定数定義
+
+マジックナンバー禁止原則に従い、ルートごとのリクエスト上限と同時処理数の上限を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class RateLimitConstants:
+    """レート制限設定定数"""
+
+    # レート制限を有効化するか
+    ENABLED: Final[bool] = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+
+    # トークンバケットの保存先（memory: ワーカーごと / redis: 複数ワーカーで共有）
+    STORE: Final[str] = os.getenv("RATE_LIMIT_STORE", "memory").lower()
+    STORE_URL: Final[str] = os.getenv("RATE_LIMIT_STORE_URL", "redis://localhost:6379/0")
+    STORE_KEY_PREFIX: Final[str] = "touhou_clear_checker:rate_limit:"
+
+    # プロセス内ストアのシャード数（ロックの競合を分散）と、シャードごとに保持するバケット数の上限
+    MEMORY_SHARDS: Final[int] = int(os.getenv("RATE_LIMIT_MEMORY_SHARDS", "16"))
+    MEMORY_MAX_KEYS_PER_SHARD: Final[int] = int(os.getenv("RATE_LIMIT_MEMORY_MAX_KEYS_PER_SHARD", "10000"))
+
+    # X-Forwarded-Forの末尾（直前のプロキシが記録したアドレス）をクライアントIPとして使用するか
+    # リバースプロキシの背後で起動する場合のみtrueにする（クライアントが自由に設定できるため）
+    TRUST_FORWARDED_FOR: Final[bool] = os.getenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+    # ログイン（Argon2によるパスワード検証）: クライアントIPごとに連続5回、以降は1分あたり5回
+    LOGIN_CAPACITY: Final[int] = int(os.getenv("RATE_LIMIT_LOGIN_CAPACITY", "5"))
+    LOGIN_PER_MINUTE: Final[float] = float(os.getenv("RATE_LIMIT_LOGIN_PER_MINUTE", "5"))
+
+    # ユーザー登録（パスワードのハッシュ化・認証メール送信）: クライアントIPごと
+    REGISTER_CAPACITY: Final[int] = int(os.getenv("RATE_LIMIT_REGISTER_CAPACITY", "3"))
+    REGISTER_PER_MINUTE: Final[float] = float(os.getenv("RATE_LIMIT_REGISTER_PER_MINUTE", "1"))
+
+    # クリア記録の一括更新: ユーザーごと
+    BATCH_CAPACITY: Final[int] = int(os.getenv("RATE_LIMIT_BATCH_CAPACITY", "10"))
+    BATCH_PER_MINUTE: Final[float] = float(os.getenv("RATE_LIMIT_BATCH_PER_MINUTE", "30"))
+
+
+class ConcurrencyLimitConstants:
+    """同時処理数の上限（ロードシェディング）設定定数"""
+
+    # ワーカーごとの処理中リクエスト数の上限（0の場合は制限しない）
+    MAX_IN_FLIGHT: Final[int] = int(os.getenv("CONCURRENCY_LIMIT_MAX_IN_FLIGHT", "200"))
+
+    # 上限を超えて拒否したリクエストに返す再試行までの秒数（Retry-After）
+    RETRY_AFTER_SECONDS: Final[int] = int(os.getenv("CONCURRENCY_LIMIT_RETRY_AFTER_SECONDS", "1"))
+
+    # 上限の対象外とするパス（ヘルスチェックと、接続を保持し続ける変更通知ストリーム）
+    EXEMPT_PATHS: Final[tuple] = ("/healthz", "/readyz", "/api/v1/clear-records/stream")
@@ -0,0 +1,216 @@
+"""
+レート制限・負荷制限ミドルウェア
+
+- RateLimitMiddleware: ルートごとのトークンバケットで、ユーザー（JWTのsubject）またはクライアントIPごとのリクエスト数を制限します。
+  上限を超えたリクエストには429とRetry-Afterを返し、ハンドラー（Argon2によるパスワード検証など）を実行しません。
+- ConcurrencyLimitMiddleware: ワーカーの処理中リクエスト数が上限に達している場合、新しいリクエストを503とRetry-Afterで拒否します。
+  過負荷時に全リクエストの応答が遅くなるのを避け、ロードバランサーに他のワーカーへ振り分けさせます。
+"""
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+from jose import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.logging.logger import LoggerFactory
+from infrastructure.ratelimit.constants import ConcurrencyLimitConstants, RateLimitConstants
+from infrastructure.ratelimit.stores import TokenBucketStore, create_token_bucket_store
+from infrastructure.security.jwt_handler import JWTHandler
+
+logger = LoggerFactory.get_logger(__name__)
+
+# レート制限のキーの種類
+KEY_BY_USER = "user"  # JWTのsubject（トークンがない・無効な場合はクライアントIP）
+KEY_BY_IP = "ip"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """ルートごとのリクエスト上限（トークンバケット）"""
+
+    name: str
+    method: str
+    path: str
+    capacity: int
+    refill_per_second: float
+    key_by: str = KEY_BY_USER
+
+    def matches(self, method: str, path: str) -> bool:
+        return method == self.method and path.rstrip("/") == self.path
+
+
+DEFAULT_RATE_LIMIT_RULES: Tuple[RateLimitRule, ...] = (
+    RateLimitRule(
+        "login", "POST", "/api/v1/users/login",
+        RateLimitConstants.LOGIN_CAPACITY, RateLimitConstants.LOGIN_PER_MINUTE / 60, KEY_BY_IP,
+    ),
+    RateLimitRule(
+        "register", "POST", "/api/v1/users/register",
+        RateLimitConstants.REGISTER_CAPACITY, RateLimitConstants.REGISTER_PER_MINUTE / 60, KEY_BY_IP,
+    ),
+    RateLimitRule(
+        "clear_records_batch", "POST", "/api/v1/clear-records/batch",
+        RateLimitConstants.BATCH_CAPACITY, RateLimitConstants.BATCH_PER_MINUTE / 60, KEY_BY_USER,
+    ),
+)
+
+
+def client_ip(scope: Scope, trust_forwarded_for: bool = RateLimitConstants.TRUST_FORWARDED_FOR) -> str:
+    """クライアントIP（プロキシを信頼する場合はX-Forwarded-Forの末尾）"""
+    if trust_forwarded_for:
+        forwarded_for = Headers(scope=scope).get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[-1].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def token_subject(scope: Scope) -> Optional[str]:
+    """BearerトークンのJWT subject（トークンがない・無効な場合はNone）"""
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return JWTHandler().verify_token(token).username
+    except JWTError:
+        return None
+
+
+def rate_limit_key(rule: RateLimitRule, scope: Scope) -> str:
+    """ルール名とユーザー・クライアントIPからバケットのキーを作成"""
+    if rule.key_by == KEY_BY_USER:
+        subject = token_subject(scope)
+        if subject is not None:
+            return f"{rule.name}:user:{subject}"
+    return f"{rule.name}:ip:{client_ip(scope)}"
+
+
+def _retry_after(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+class RateLimitMiddleware:
+    """ルート別のレート制限ミドルウェア"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Sequence[RateLimitRule] = DEFAULT_RATE_LIMIT_RULES,
+        store: Optional[TokenBucketStore] = None,
+    ):
+        """
+        Args:
+            app: ASGIアプリケーション
+            rules: ルートごとのリクエスト上限
+            store: トークンバケットの保存先（省略時は設定に応じて作成）
+        """
+        self.app = app
+        self.rules = tuple(rules)
+        self.store = store if store is not None else create_token_bucket_store()
+
+    def _match(self, scope: Scope) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(scope["method"], scope["path"]):
+                return rule
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rule = self._match(scope)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = rate_limit_key(rule, scope)
+        try:
+            decision = await self.store.consume(key, rule.capacity, rule.refill_per_second)
+        except Exception as e:
+            # 保存先の障害時は制限せずに処理する（レート制限のためにサービスを止めない）
+            logger.warning(f"Rate limit store failed, allowing request: key={key}, error={e}")
+            await self.app(scope, receive, send)
+            return
+
+        if not decision.allowed:
+            logger.info(f"Rate limited: {key}")
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "error": "Too Many Requests",
+                    "message": "リクエストが多すぎます。しばらく待ってから再試行してください",
+                    "error_code": "RATE_LIMITED",
+                },
+                headers={
+                    "Retry-After": _retry_after(decision.retry_after_seconds),
+                    "X-RateLimit-Limit": str(rule.capacity),
+                    "X-RateLimit-Remaining": "0",
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(rule.capacity)
+                headers["X-RateLimit-Remaining"] = str(decision.remaining)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ConcurrencyLimitMiddleware:
+    """処理中リクエスト数の上限を超えたリクエストを拒否するミドルウェア（ワーカーごと）"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_in_flight: int = ConcurrencyLimitConstants.MAX_IN_FLIGHT,
+        retry_after_seconds: int = ConcurrencyLimitConstants.RETRY_AFTER_SECONDS,
+        exempt_paths: Sequence[str] = ConcurrencyLimitConstants.EXEMPT_PATHS,
+    ):
+        """
+        Args:
+            app: ASGIアプリケーション
+            max_in_flight: 処理中リクエスト数の上限
+            retry_after_seconds: 拒否したリクエストに返す再試行までの秒数
+            exempt_paths: 上限の対象外とするパス
+        """
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.retry_after_seconds = retry_after_seconds
+        self.exempt_paths = frozenset(exempt_paths)
+        # イベントループのスレッドからのみ更新するためロックは不要
+        self.in_flight = 0
+        self.shed_count = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self.in_flight >= self.max_in_flight:
+            self.shed_count += 1
+            logger.warning(f"Request shed: in_flight={self.in_flight}, path={scope['path']}")
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "error": "Service Unavailable",
+                    "message": "サーバーが混雑しています。しばらく待ってから再試行してください",
+                    "error_code": "OVERLOADED",
+                },
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,181 @@
+"""
+トークンバケットの保存先
+
+バケットごとに残りトークン数と最終更新時刻を保持し、経過時間に応じてトークンを補充してから1つ消費します。
+- ShardedMemoryTokenBucketStore: プロセス内（ワーカーごと）。キーのハッシュでシャードに分け、シャードごとのロックで競合を分散します。
+- RedisTokenBucketStore: 複数ワーカーで共有。補充と消費をLuaスクリプトで原子的に実行します（redisインストール時のみ）。
+"""
+import math
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from infrastructure.ratelimit.constants import RateLimitConstants
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - 任意依存
+    redis_asyncio = None
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """トークンの消費結果"""
+
+    allowed: bool
+    remaining: int
+    retry_after_seconds: float = 0.0
+
+
+def refill_and_consume(
+    tokens: float, updated_at: float, now: float, capacity: int, refill_per_second: float
+) -> Tuple[float, RateLimitDecision]:
+    """
+    経過時間分のトークンを補充してから1つ消費
+
+    Returns:
+        (消費後のトークン数, 消費結果)
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_per_second)
+    if tokens >= 1:
+        tokens -= 1
+        return tokens, RateLimitDecision(True, int(tokens))
+    retry_after = (1 - tokens) / refill_per_second if refill_per_second > 0 else math.inf
+    return tokens, RateLimitDecision(False, 0, retry_after)
+
+
+class TokenBucketStore(ABC):
+    """トークンバケットの保存先"""
+
+    @abstractmethod
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> RateLimitDecision:
+        """
+        キーのバケットからトークンを1つ消費
+
+        Args:
+            key: バケットのキー（ルート名とユーザー・クライアントIP）
+            capacity: バケットの容量（連続して許可するリクエスト数）
+            refill_per_second: 1秒あたりに補充するトークン数
+        """
+        pass
+
+
+class _Shard:
+    def __init__(self):
+        # キー → (トークン数, 最終更新時刻)。最近使用したキーを末尾に移動し、上限を超えたら先頭から削除する
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+
+class ShardedMemoryTokenBucketStore(TokenBucketStore):
+    """プロセス内のトークンバケット（シャード分割）"""
+
+    def __init__(
+        self,
+        shards: int = RateLimitConstants.MEMORY_SHARDS,
+        max_keys_per_shard: int = RateLimitConstants.MEMORY_MAX_KEYS_PER_SHARD,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            shards: シャード数
+            max_keys_per_shard: シャードごとに保持するバケット数の上限（超えた場合は最も長く使用していないものを削除）
+            clock: 現在時刻（秒）の取得関数
+        """
+        self.max_keys_per_shard = max_keys_per_shard
+        self.clock = clock
+        self._shards: List[_Shard] = [_Shard() for _ in range(max(1, shards))]
+
+    def _shard(self, key: str) -> _Shard:
+        # hash()はプロセスごとに値が変わるため、安定したハッシュでシャードを決める
+        return self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+
+    def consume_sync(self, key: str, capacity: int, refill_per_second: float) -> RateLimitDecision:
+        """consumeの同期版（イベントループ外からの呼び出し・テスト用）"""
+        shard = self._shard(key)
+        now = self.clock()
+        with shard.lock:
+            tokens, updated_at = shard.buckets.pop(key, (float(capacity), now))
+            tokens, decision = refill_and_consume(tokens, updated_at, now, capacity, refill_per_second)
+            shard.buckets[key] = (tokens, now)
+            while len(shard.buckets) > self.max_keys_per_shard:
+                shard.buckets.popitem(last=False)
+        return decision
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> RateLimitDecision:
+        return self.consume_sync(key, capacity, refill_per_second)
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+# KEYS[1]: バケットのキー / ARGV: 容量, 1秒あたりの補充数, 現在時刻（秒）, キーの有効期間（秒）
+# 戻り値: {許可(1/0), 残りトークン数, 再試行までのミリ秒}
+_CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local allowed = 0
+local retry_after_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return {allowed, math.floor(tokens), retry_after_ms}
+"""
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Redisによる複数ワーカー共有のトークンバケット"""
+
+    def __init__(self, url: str = RateLimitConstants.STORE_URL, key_prefix: str = RateLimitConstants.STORE_KEY_PREFIX):
+        """
+        Args:
+            url: RedisのURL
+            key_prefix: バケットのキーの接頭辞
+
+        Raises:
+            RuntimeError: redisがインストールされていない場合
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("redis package is required for RATE_LIMIT_STORE=redis")
+        self.key_prefix = key_prefix
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(_CONSUME_SCRIPT)
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> RateLimitDecision:
+        # 満杯まで補充される時間を過ぎたバケットは初期状態と同じため、その時点で削除されるようにする
+        ttl_seconds = max(1, math.ceil(capacity / refill_per_second)) if refill_per_second > 0 else 86400
+        allowed, remaining, retry_after_ms = await self._script(
+            keys=[self.key_prefix + key], args=[capacity, refill_per_second, time.time(), ttl_seconds]
+        )
+        return RateLimitDecision(bool(allowed), int(remaining), int(retry_after_ms) / 1000)
+
+
+def create_token_bucket_store(name: str = RateLimitConstants.STORE) -> TokenBucketStore:
+    """
+    設定に応じた保存先を作成
+
+    Args:
+        name: 保存先（memory / redis）
+
+    Raises:
+        ValueError: 未対応の保存先の場合
+    """
+    if name == "memory":
+        return ShardedMemoryTokenBucketStore()
+    if name == "redis":
+        return RedisTokenBucketStore()
+    raise ValueError(f"Unsupported rate limit store: {name}")
@@ -0,0 +1,7 @@
+"""
+リアルタイム同期モジュール
+
+このモジュールは、クリア記録の変更をタブ・端末間で同期するための
+プロセス内変更フィード（Pub/Sub・ユーザー別変更ログ）と、
+複数ワーカー構成向けのブローカーアダプターを提供します。
+"""
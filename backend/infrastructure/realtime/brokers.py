@@ -0,0 +1,140 @@
+"""
+変更フィードのブローカーアダプター
+
+複数ワーカー（uvicorn --workers / gunicorn）で起動した場合、あるワーカーで発生した変更を
+他のワーカーに接続しているストリームへ届けるため、ブローカー経由で中継します。
+redisがインストールされている場合のみRedis Pub/Subを使用できます。
+"""
+import asyncio
+import json
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from infrastructure.realtime.change_feed import ClearRecordChangeEvent, ClearRecordChangeFeed
+from infrastructure.realtime.constants import ChangeFeedConstants
+from infrastructure.logging.logger import LoggerFactory
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - 任意依存
+    redis_asyncio = None
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ChangeFeedBroker(ABC):
+    """変更フィードのブローカー（ワーカー間の中継）"""
+
+    @abstractmethod
+    async def start(self, feed: ClearRecordChangeFeed) -> None:
+        """中継を開始（他ワーカーからのイベントをfeed.deliverへ渡す）"""
+        pass
+
+    @abstractmethod
+    def publish(self, event: ClearRecordChangeEvent) -> None:
+        """このワーカーで発生したイベントを他ワーカーへ送信"""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """中継を停止"""
+        pass
+
+
+class RedisChangeFeedBroker(ChangeFeedBroker):
+    """Redis Pub/Subによるブローカー"""
+
+    def __init__(self, url: str = ChangeFeedConstants.BROKER_URL, channel: str = ChangeFeedConstants.BROKER_CHANNEL):
+        """
+        Args:
+            url: RedisのURL
+            channel: Pub/Subのチャンネル名
+
+        Raises:
+            RuntimeError: redisがインストールされていない場合
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("redis package is required for CHANGE_FEED_BROKER=redis")
+        self.url = url
+        self.channel = channel
+        # 自ワーカーが送信したイベントを受信時に除外するための識別子
+        self.origin = uuid.uuid4().hex
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, feed: ClearRecordChangeFeed) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._client = redis_asyncio.from_url(self.url)
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub, feed))
+        logger.info(f"Change feed broker started: channel={self.channel}")
+
+    async def _listen(self, pubsub, feed: ClearRecordChangeFeed) -> None:
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                data = json.loads(message["data"])
+                if data.get("origin") == self.origin:
+                    continue
+                feed.deliver(ClearRecordChangeEvent.from_dict(data["event"]))
+            except Exception as e:
+                logger.warning(f"Ignored malformed change feed message: {e}")
+
+    def publish(self, event: ClearRecordChangeEvent) -> None:
+        if self._client is None or self._loop is None:
+            return
+        message = json.dumps({"origin": self.origin, "event": event.to_dict()}, ensure_ascii=False)
+        asyncio.run_coroutine_threadsafe(self._client.publish(self.channel, message), self._loop)
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        logger.info("Change feed broker stopped")
+
+
+def create_change_feed_broker(name: str = ChangeFeedConstants.BROKER) -> Optional[ChangeFeedBroker]:
+    """
+    設定に応じたブローカーを作成
+
+    Args:
+        name: ブローカー名（memory / redis）
+
+    Returns:
+        ブローカー（プロセス内のみで配信する場合はNone）
+
+    Raises:
+        ValueError: 未対応のブローカー名の場合
+    """
+    if name == "memory":
+        return None
+    if name == "redis":
+        return RedisChangeFeedBroker()
+    raise ValueError(f"Unsupported change feed broker: {name}")
+
+
+async def start_change_feed_broker(feed: ClearRecordChangeFeed) -> None:
+    """設定されたブローカーを起動してフィードに接続"""
+    broker = create_change_feed_broker()
+    if broker is None:
+        return
+    await broker.start(feed)
+    feed.broker = broker
+
+
+async def stop_change_feed_broker(feed: ClearRecordChangeFeed) -> None:
+    """フィードに接続したブローカーを停止"""
+    broker, feed.broker = feed.broker, None
+    if broker is not None:
+        await broker.stop()
@@ -0,0 +1,264 @@
+"""
+クリア記録変更フィード
+
+リポジトリがコミットした変更を、同じユーザーの接続中のストリーム（SSE）へ配信します。
+ユーザーごとに直近の変更ログを保持し、再接続時はLast-Event-IDの続きから再送します。
+一定時間変更のないユーザーのログは破棄し、メモリ使用量がユーザー数に比例して増え続けないようにします。
+
+イベントIDはマイクロ秒単位のUNIX時刻を元にした単調増加値です。
+プロセス再起動やログの切り詰め・破棄で続きを再送できない場合は、再取得を促すreset通知を返します。
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from infrastructure.realtime.constants import ChangeFeedConstants
+from infrastructure.logging.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ClearRecordChangeEvent:
+    """クリア記録の変更（記録のキーと変更後のクリア条件ビットマスク）"""
+
+    event_id: int
+    event_type: str
+    user_id: int
+    record_id: int
+    game_id: int
+    character_name: str
+    difficulty: str
+    mode: str
+    flags: Optional[int]
+
+    def to_payload(self) -> Dict[str, Any]:
+        """クライアントへ送るデータ（versionは同じ記録の変更順を表す）"""
+        return {
+            "id": self.record_id,
+            "game_id": self.game_id,
+            "character_name": self.character_name,
+            "difficulty": self.difficulty,
+            "mode": self.mode,
+            "flags": self.flags,
+            "version": self.event_id,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ブローカー中継用の辞書に変換"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClearRecordChangeEvent":
+        """ブローカー中継用の辞書から復元"""
+        return cls(**data)
+
+
+class ChangeSubscription:
+    """1接続分の購読（イベントループ上のキューへ配信）"""
+
+    def __init__(self, user_id: int, queue_size: int):
+        """
+        Args:
+            user_id: 購読するユーザーID
+            queue_size: 未送信イベントの上限
+        """
+        self.user_id = user_id
+        self.overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event: ClearRecordChangeEvent) -> None:
+        """イベントを配信（任意のスレッドから呼び出し可能）"""
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: ClearRecordChangeEvent) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 送信が追いつかない接続は、取りこぼしを通知して再取得させる
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> Optional[ClearRecordChangeEvent]:
+        """
+        次のイベントを待機
+
+        Returns:
+            イベント（取りこぼしが発生した場合はNone）
+
+        Raises:
+            asyncio.TimeoutError: timeout秒以内にイベントがない場合
+        """
+        if self.overflowed:
+            return None
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+
+class ClearRecordChangeFeed:
+    """ユーザー単位のクリア記録変更フィード（プロセス内Pub/Sub）"""
+
+    def __init__(
+        self,
+        log_size: int = ChangeFeedConstants.LOG_SIZE_PER_USER,
+        queue_size: int = ChangeFeedConstants.SUBSCRIBER_QUEUE_SIZE,
+        log_idle_seconds: float = ChangeFeedConstants.LOG_IDLE_SECONDS,
+    ):
+        """
+        Args:
+            log_size: ユーザーごとに保持する変更ログの件数
+            queue_size: 接続ごとの未送信イベントの上限
+            log_idle_seconds: 変更がないまま経過したらユーザーの変更ログを破棄するまでの秒数
+        """
+        self.log_size = log_size
+        self.queue_size = queue_size
+        self.log_idle_seconds = log_idle_seconds
+        self.broker = None
+        self._lock = threading.Lock()
+        self._logs: Dict[int, Deque[ClearRecordChangeEvent]] = {}
+        # ユーザーごとの最終変更時刻（古い順に並ぶよう、変更のたびに末尾へ移動する）
+        self._last_delivered_at: Dict[int, float] = {}
+        # ログから押し出された最新のイベントID（これ以前からの再開は不可）
+        self._evicted_ids: Dict[int, int] = {}
+        # 破棄したログの最新のイベントID（ユーザーを問わず、これより前からの再開は不可）
+        self._expired_event_id = 0
+        self._subscriptions: Dict[int, Set[ChangeSubscription]] = {}
+        self._last_event_id = 0
+        # このプロセスで記録を始めた時点のイベントID（これより前からの再開は不可）
+        self._started_event_id = self._next_event_id()
+
+    @property
+    def last_event_id(self) -> int:
+        """最後に発行したイベントID"""
+        return self._last_event_id
+
+    def _next_event_id(self) -> int:
+        with self._lock:
+            self._last_event_id = max(self._last_event_id + 1, time.time_ns() // 1000)
+            return self._last_event_id
+
+    def publish(
+        self,
+        event_type: str,
+        user_id: int,
+        record_id: int,
+        game_id: int,
+        character_name: str,
+        difficulty: str,
+        mode: str,
+        flags: Optional[int],
+    ) -> ClearRecordChangeEvent:
+        """
+        変更を発行（ローカルの購読者へ配信し、ブローカーがあれば他ワーカーへ中継）
+
+        Returns:
+            ClearRecordChangeEvent: 発行したイベント
+        """
+        event = ClearRecordChangeEvent(
+            event_id=self._next_event_id(),
+            event_type=event_type,
+            user_id=user_id,
+            record_id=record_id,
+            game_id=game_id,
+            character_name=character_name,
+            difficulty=difficulty,
+            mode=mode,
+            flags=flags,
+        )
+        self.deliver(event)
+        if self.broker is not None:
+            try:
+                self.broker.publish(event)
+            except Exception as e:
+                # 中継の失敗で記録の更新自体を失敗させない
+                logger.warning(f"Failed to relay clear record change: {e}")
+        return event
+
+    def deliver(self, event: ClearRecordChangeEvent) -> None:
+        """イベントを変更ログに追加し、ローカルの購読者へ配信（ブローカーからの受信にも使用）"""
+        now = time.monotonic()
+        with self._lock:
+            self._expire_idle_logs(now)
+            self._last_delivered_at.pop(event.user_id, None)
+            self._last_delivered_at[event.user_id] = now
+            log = self._logs.get(event.user_id)
+            if log is None:
+                log = self._logs[event.user_id] = deque(maxlen=self.log_size)
+            if len(log) == self.log_size:
+                self._evicted_ids[event.user_id] = log[0].event_id
+            log.append(event)
+            subscriptions = list(self._subscriptions.get(event.user_id, ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    def _expire_idle_logs(self, now: float) -> None:
+        """変更のないまま保持期間を過ぎたユーザーの変更ログを破棄（ロック取得済みで呼び出す）"""
+        while self._last_delivered_at:
+            user_id, delivered_at = next(iter(self._last_delivered_at.items()))
+            if now - delivered_at < self.log_idle_seconds:
+                break
+            del self._last_delivered_at[user_id]
+            self._evicted_ids.pop(user_id, None)
+            log = self._logs.pop(user_id, None)
+            if log:
+                self._expired_event_id = max(self._expired_event_id, log[-1].event_id)
+
+    def events_since(self, user_id: int, last_event_id: int) -> Optional[List[ClearRecordChangeEvent]]:
+        """
+        指定したイベントIDより後の変更を取得
+
+        Args:
+            user_id: ユーザーID
+            last_event_id: クライアントが最後に受信したイベントID
+
+        Returns:
+            変更のリスト（続きを再送できない場合はNone）
+        """
+        with self._lock:
+            if (
+                last_event_id < self._started_event_id
+                or last_event_id < self._expired_event_id
+                or last_event_id < self._evicted_ids.get(user_id, 0)
+            ):
+                return None
+            return [event for event in self._logs.get(user_id, ()) if event.event_id > last_event_id]
+
+    def subscribe(self, user_id: int) -> ChangeSubscription:
+        """ユーザーの変更を購読（イベントループ上で呼び出す）"""
+        subscription = ChangeSubscription(user_id, self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        """購読を解除"""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def subscriber_count(self, user_id: Optional[int] = None) -> int:
+        """購読中の接続数"""
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscriptions.get(user_id, ()))
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def clear(self) -> None:
+        """変更ログを破棄（テスト用）"""
+        with self._lock:
+            self._logs.clear()
+            self._last_delivered_at.clear()
+            self._evicted_ids.clear()
+            self._expired_event_id = 0
+
+
+# グローバルなクリア記録変更フィード
+clear_record_change_feed = ClearRecordChangeFeed()
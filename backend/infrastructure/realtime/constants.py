@@ -0,0 +1,50 @@
+"""
+リアルタイム同期関連の定数定義
+
+マジックナンバー禁止原則に従い、変更フィードの設定値を定数として管理します。
+"""
+import os
+from typing import Final
+
+
+class ChangeFeedConstants:
+    """クリア記録変更フィード設定定数"""
+
+    # ユーザーごとに保持する変更ログの件数（Last-Event-IDからの再開に使用）
+    LOG_SIZE_PER_USER: Final[int] = int(os.getenv("CHANGE_FEED_LOG_SIZE", "500"))
+
+    # 変更がないまま経過したら破棄するユーザーごとの変更ログの保持期間（秒）
+    LOG_IDLE_SECONDS: Final[float] = float(os.getenv("CHANGE_FEED_LOG_IDLE_SECONDS", "3600"))
+
+    # 接続ごとの未送信イベントの上限（超えた場合は再取得を促して切断）
+    SUBSCRIBER_QUEUE_SIZE: Final[int] = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "256"))
+
+    # 無通信時にコメント行を送る間隔（秒、プロキシによる切断を防ぐ）
+    HEARTBEAT_SECONDS: Final[float] = float(os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", "15"))
+
+    # 切断時にクライアントが再接続するまでの待機時間（ミリ秒）
+    RETRY_MILLISECONDS: Final[int] = 3000
+
+    # ブローカー（memory: プロセス内のみ / redis: 複数ワーカー間で中継）
+    BROKER: Final[str] = os.getenv("CHANGE_FEED_BROKER", "memory").lower()
+    BROKER_URL: Final[str] = os.getenv("CHANGE_FEED_BROKER_URL", "redis://localhost:6379/0")
+    BROKER_CHANNEL: Final[str] = os.getenv("CHANGE_FEED_BROKER_CHANNEL", "touhou_clear_checker:clear_record_changes")
+
+    # イベント種別
+    EVENT_UPSERT: Final[str] = "upsert"
+    EVENT_DELETE: Final[str] = "delete"
+    EVENT_RESET: Final[str] = "reset"
+
+
+class ChangeLogConstants:
+    """クリア記録変更ログ（差分同期）設定定数"""
+
+    # 変更ログの保持期間（日、これより古い変更は圧縮ジョブで削除）
+    RETENTION_DAYS: Final[int] = int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "30"))
+
+    # 差分取得1回あたりの件数
+    DEFAULT_PAGE_SIZE: Final[int] = 500
+    MAX_PAGE_SIZE: Final[int] = 2000
+
+    # 圧縮ジョブで1トランザクションあたりに削除する件数
+    COMPACTION_BATCH_SIZE: Final[int] = int(os.getenv("CHANGE_LOG_COMPACTION_BATCH_SIZE", "1000"))
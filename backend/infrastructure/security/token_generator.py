@@ -26,4 +26,7 @@ class TokenGenerator:
     @staticmethod
     def is_token_expired(expires_at: datetime) -> bool:
         """トークンが期限切れかチェック"""
+        # SQLite / MySQL のDATETIMEはタイムゾーン情報なしで返るため、UTCとして扱う
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
         return datetime.now(UTC) > expires_at
\ No newline at end of file
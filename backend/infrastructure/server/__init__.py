@@ -0,0 +1,7 @@
+"""
+本番サーバーモジュール
+
+このモジュールは、本番用の起動スクリプト（server.py）が使用する
+ワーカー数・Keep-Alive・グレースフルシャットダウンなどの設定と、
+ワーカーごとの起動時の準備処理（接続プール・キャッシュのウォームアップ）を提供します。
+"""
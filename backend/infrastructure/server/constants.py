@@ -0,0 +1,63 @@
+"""
+本番サーバー関連の定数定義
+
+マジックナンバー禁止原則に従い、ワーカー数・タイムアウトなどを定数として管理します。
+"""
+import os
+from typing import Final
+
+from infrastructure.config.network_constants import NetworkConstants
+
+
+class ServerConstants:
+    """本番サーバー設定定数"""
+
+    # バインドするホスト・ポート
+    HOST: Final[str] = os.getenv("SERVER_HOST", NetworkConstants.DEFAULT_HOST)
+    PORT: Final[int] = int(os.getenv("SERVER_PORT", str(NetworkConstants.DEFAULT_PORT)))
+
+    # ワーカープロセス数（0の場合は利用可能なCPUコア数）
+    WORKERS: Final[int] = int(os.getenv("WEB_CONCURRENCY", "0"))
+
+    # 起動方式（gunicorn / uvicorn / auto: gunicornがインストールされていればgunicorn）
+    RUNNER: Final[str] = os.getenv("SERVER_RUNNER", "auto")
+
+    # イベントループ（auto / asyncio / uvloop）とHTTPパーサー（auto / h11 / httptools）
+    # autoはuvloop・httptoolsがインストールされていれば使用する
+    LOOP: Final[str] = os.getenv("SERVER_LOOP", "auto")
+    HTTP: Final[str] = os.getenv("SERVER_HTTP", "auto")
+
+    # Keep-Alive接続を保持する秒数（ロードバランサーのアイドルタイムアウトより長くする）
+    KEEPALIVE_SECONDS: Final[int] = int(os.getenv("SERVER_KEEPALIVE_SECONDS", "5"))
+
+    # 接続待ちキューの長さ
+    BACKLOG: Final[int] = int(os.getenv("SERVER_BACKLOG", "2048"))
+
+    # ワーカーを再起動するまでのリクエスト数（0の場合は再起動しない）と、ワーカーごとに加える揺らぎ
+    # 揺らぎにより全ワーカーが同時に再起動するのを避ける
+    MAX_REQUESTS: Final[int] = int(os.getenv("SERVER_MAX_REQUESTS", "10000"))
+    MAX_REQUESTS_JITTER: Final[int] = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "1000"))
+
+    # 停止時に処理中のリクエストを待つ秒数
+    GRACEFUL_TIMEOUT_SECONDS: Final[int] = int(os.getenv("SERVER_GRACEFUL_TIMEOUT_SECONDS", "30"))
+
+    # 応答のないワーカーを再起動するまでの秒数（gunicornのみ）
+    WORKER_TIMEOUT_SECONDS: Final[int] = int(os.getenv("SERVER_WORKER_TIMEOUT_SECONDS", "60"))
+
+    # アクセスログを出力するか（リクエストトレーシングミドルウェアが記録するため通常は不要）
+    ACCESS_LOG: Final[bool] = os.getenv("SERVER_ACCESS_LOG", "false").lower() == "true"
+
+    # ワーカーの起動時に接続プールとキャッシュを準備するか
+    WARM_UP_ENABLED: Final[bool] = os.getenv("SERVER_WARM_UP_ENABLED", "true").lower() == "true"
+
+    # ウォームアップで確立するDB接続数
+    WARM_UP_CONNECTIONS: Final[int] = int(os.getenv("SERVER_WARM_UP_CONNECTIONS", "2"))
+
+    # ウォームアップに失敗した場合に再試行するまでの秒数
+    WARM_UP_RETRY_SECONDS: Final[float] = float(os.getenv("SERVER_WARM_UP_RETRY_SECONDS", "5.0"))
+
+    # 準備完了判定（/readyz）でDB接続を確認する際のタイムアウト（秒）
+    READINESS_DB_TIMEOUT_SECONDS: Final[float] = float(os.getenv("SERVER_READINESS_DB_TIMEOUT_SECONDS", "2.0"))
+
+    # 準備完了とみなす接続プールの空き接続数の下限（空きがこれより少ない場合は準備未完了）
+    READINESS_MIN_POOL_HEADROOM: Final[int] = int(os.getenv("SERVER_READINESS_MIN_POOL_HEADROOM", "1"))
@@ -0,0 +1,21 @@
+"""
+gunicorn用のuvicornワーカー
+
+イベントループ・HTTPパーサーを設定（SERVER_LOOP / SERVER_HTTP）で選択できるuvicornワーカーです。
+gunicornから `infrastructure.server.gunicorn_worker.TunedUvicornWorker` として読み込まれます。
+"""
+from infrastructure.server.constants import ServerConstants
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:  # pragma: no cover - 任意依存（uvicorn同梱の旧ワーカーを使用）
+    from uvicorn.workers import UvicornWorker
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """設定に応じたイベントループ・HTTPパーサーを使用するuvicornワーカー"""
+
+    CONFIG_KWARGS = {
+        "loop": ServerConstants.LOOP,
+        "http": ServerConstants.HTTP,
+    }
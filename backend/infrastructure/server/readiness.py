@@ -0,0 +1,120 @@
+"""
+ワーカーの準備完了判定
+
+ロードバランサー・オーケストレーターからの確認用に、ワーカーの状態を2段階で判定します。
+- liveness（/healthz）: プロセスがリクエストに応答できるか（依存サービスは確認しない）
+- readiness（/readyz）: ウォームアップが完了し、DBに接続でき、接続プールに空きがあるか
+
+準備未完了のワーカーにはトラフィックを流さず、停止処理の開始時にも準備未完了に戻して新しいリクエストを止めます。
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from infrastructure.database.connection import engine
+from infrastructure.server.constants import ServerConstants
+
+
+def _ping(bind: Engine) -> None:
+    with bind.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def pool_headroom(bind: Engine) -> Optional[int]:
+    """
+    接続プールの空き接続数（使用中でない接続と、追加で作成できる接続の合計）
+
+    Returns:
+        空き接続数（接続数に上限のないプールの場合はNone）
+    """
+    pool = bind.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    if max_overflow < 0:
+        return None
+    return pool.size() + max_overflow - pool.checkedout()
+
+
+class WorkerReadiness:
+    """ワーカーの準備完了状態"""
+
+    def __init__(
+        self,
+        bind: Engine = engine,
+        db_timeout_seconds: float = ServerConstants.READINESS_DB_TIMEOUT_SECONDS,
+        min_pool_headroom: int = ServerConstants.READINESS_MIN_POOL_HEADROOM,
+    ):
+        """
+        Args:
+            bind: 接続を確認するEngine
+            db_timeout_seconds: DB接続確認のタイムアウト（秒）
+            min_pool_headroom: 準備完了とみなす接続プールの空き接続数の下限
+        """
+        self.bind = bind
+        self.db_timeout_seconds = db_timeout_seconds
+        self.min_pool_headroom = min_pool_headroom
+        self._ready = False
+        self._warm_up: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def mark_ready(self, warm_up: Optional[Dict[str, Any]] = None) -> None:
+        """ウォームアップの完了を記録し、準備完了にする"""
+        with self._lock:
+            self._warm_up = warm_up
+            self._ready = True
+
+    def mark_not_ready(self) -> None:
+        """準備未完了に戻す（停止処理の開始時）"""
+        with self._lock:
+            self._ready = False
+
+    async def check_database(self) -> Dict[str, Any]:
+        """DBに接続できるか（タイムアウト付き）"""
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(_ping, self.bind), timeout=self.db_timeout_seconds)
+        except asyncio.TimeoutError:
+            return {"ok": False, "error": f"timed out after {self.db_timeout_seconds:g}s"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+    def check_pool(self) -> Dict[str, Any]:
+        """接続プールに空きがあるか"""
+        headroom = pool_headroom(self.bind)
+        if headroom is None:
+            return {"ok": True, "headroom": None}
+        return {"ok": headroom >= self.min_pool_headroom, "headroom": headroom}
+
+    def check_warm_up(self) -> Dict[str, Any]:
+        """ウォームアップが完了しているか（完了時は準備の結果を含む）"""
+        with self._lock:
+            return {"ok": self._ready, **(self._warm_up or {})}
+
+    async def check(self) -> Dict[str, Any]:
+        """
+        全項目を確認
+
+        Returns:
+            準備完了か（ready）と、項目ごとの結果（checks）
+        """
+        checks = {
+            "warm_up": self.check_warm_up(),
+            "database": await self.check_database(),
+            "pool": self.check_pool(),
+        }
+        return {"ready": all(check["ok"] for check in checks.values()), "checks": checks}
+
+
+# このワーカーの準備完了状態
+worker_readiness = WorkerReadiness()
@@ -0,0 +1,129 @@
+"""
+ワーカーのウォームアップ
+
+各ワーカープロセスの起動処理（lifespan）で、最初のリクエストより前に
+DB接続の確立・カタログ（作品・機体一覧）のキャッシュ・メールテンプレートのコンパイル・パスワードハッシュのバックエンド読み込みを済ませます。
+gunicorn・uvicornのどちらで起動してもワーカーごとにlifespanが実行されるため、起動方式によらず適用されます。
+ウォームアップが完了するまでワーカーは準備未完了（/readyz が503）となり、失敗した場合は一定間隔で再試行します。
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from infrastructure.database.connection import engine
+from infrastructure.email.template_renderer import email_template_renderer
+from infrastructure.logging.logger import LoggerFactory
+from infrastructure.security.password_hasher import PasswordHasher
+from infrastructure.server.constants import ServerConstants
+from infrastructure.server.readiness import WorkerReadiness, worker_readiness
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def open_pool_connections(bind: Engine, count: int) -> int:
+    """
+    DB接続を同時にcount本（接続プールのサイズまで）確立してプールに戻す
+
+    Returns:
+        確立した接続数
+    """
+    if isinstance(bind.pool, QueuePool):
+        # プールのサイズを超えた接続はプールに戻らず閉じられるため確立しない
+        count = min(count, bind.pool.size())
+    connections = []
+    try:
+        for _ in range(count):
+            connection = bind.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def warm_up_worker(
+    bind: Engine = engine,
+    connections: int = ServerConstants.WARM_UP_CONNECTIONS,
+    catalog_loader: Optional[Callable[[], int]] = None,
+) -> Dict[str, Any]:
+    """
+    ワーカーの初回リクエスト前の準備
+
+    Args:
+        bind: 接続を確立するEngine
+        connections: 確立するDB接続数
+        catalog_loader: カタログのレスポンスをキャッシュする関数（キャッシュした件数を返す）
+
+    Returns:
+        準備の結果（確立した接続数・キャッシュしたカタログ数・コンパイルしたテンプレート数・所要時間）
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {
+        "connections": open_pool_connections(bind, connections),
+        "catalog_entries": catalog_loader() if catalog_loader is not None else 0,
+        "email_templates": email_template_renderer.preload(),
+    }
+    # passlibはハッシュ方式のバックエンドを初回使用時に読み込むため、ログイン前に読み込んでおく
+    PasswordHasher().pwd_context.handler("argon2").get_backend()
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info(f"Worker warmed up: {result}")
+    return result
+
+
+async def _retry_warm_up(warm_up: Callable[[], Dict[str, Any]], readiness: WorkerReadiness, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            result = await asyncio.to_thread(warm_up)
+        except Exception as e:
+            logger.warning(f"Worker warm-up failed, retrying in {interval:g}s: {e}")
+            continue
+        readiness.mark_ready(result)
+        return
+
+
+async def start_worker_warm_up(
+    catalog_loader: Optional[Callable[[], int]] = None,
+    readiness: WorkerReadiness = worker_readiness,
+) -> Optional[asyncio.Task]:
+    """
+    ウォームアップを実行し、完了したらワーカーを準備完了にする（lifespanの起動時に呼び出す）
+
+    失敗しても起動は止めず、準備未完了のままバックグラウンドで再試行します。
+
+    Returns:
+        再試行中のタスク（完了した場合・ウォームアップが無効な場合はNone）
+    """
+    if not ServerConstants.WARM_UP_ENABLED:
+        readiness.mark_ready()
+        return None
+
+    def warm_up() -> Dict[str, Any]:
+        return warm_up_worker(catalog_loader=catalog_loader)
+
+    try:
+        result = await asyncio.to_thread(warm_up)
+    except Exception as e:
+        logger.warning(f"Worker warm-up failed, retrying in {ServerConstants.WARM_UP_RETRY_SECONDS:g}s: {e}")
+        return asyncio.create_task(
+            _retry_warm_up(warm_up, readiness, ServerConstants.WARM_UP_RETRY_SECONDS), name="worker-warm-up"
+        )
+    readiness.mark_ready(result)
+    return None
+
+
+async def stop_worker_warm_up(task: Optional[asyncio.Task], readiness: WorkerReadiness = worker_readiness) -> None:
+    """ワーカーを準備未完了に戻し、再試行中のウォームアップを停止（lifespanの終了時に呼び出す）"""
+    readiness.mark_not_ready()
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
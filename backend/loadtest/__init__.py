@@ -0,0 +1,6 @@
+"""
+負荷試験モジュール
+
+uvicornで起動したバックエンドに対して、実際のプレイヤーに近いセッションを
+並列に実行し、同時接続数ごとのスループット・エラー率・レイテンシを計測します。
+"""
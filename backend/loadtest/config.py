@@ -0,0 +1,92 @@
+"""
+負荷試験の設定
+
+ユーザー構成（セッション種別の重み）・思考時間・同時接続数のステージを管理します。
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# セッション種別
+SESSION_NEW_PLAYER = "new_player"          # 登録 → メール認証 → ログイン → 初回利用
+SESSION_RETURNING_PLAYER = "returning"     # ログイン → 起動時読み込み → 記録更新 → メモ保存
+SESSION_BROWSER = "browser"                # ログイン → 作品・機体の閲覧のみ
+
+DEFAULT_USER_MIX: Dict[str, float] = {
+    SESSION_NEW_PLAYER: 1.0,
+    SESSION_RETURNING_PLAYER: 6.0,
+    SESSION_BROWSER: 3.0,
+}
+
+
+@dataclass
+class LoadTestConfig:
+    """負荷試験設定"""
+    base_url: str = "http://127.0.0.1:8001"
+    stages: List[int] = field(default_factory=lambda: [1, 5, 10, 25, 50])
+    stage_duration_sec: float = 30.0
+    think_time_sec: Tuple[float, float] = (0.5, 2.0)
+    user_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_USER_MIX))
+    toggles_per_session: int = 5
+    request_timeout_sec: float = 30.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        unknown = set(self.user_mix) - set(DEFAULT_USER_MIX)
+        if unknown:
+            raise ValueError(f"Unknown session types: {sorted(unknown)}. Available: {list(DEFAULT_USER_MIX)}")
+        if not any(weight > 0 for weight in self.user_mix.values()):
+            raise ValueError("At least one session type must have a positive weight")
+        if self.think_time_sec[0] > self.think_time_sec[1]:
+            raise ValueError("think_time min must not exceed max")
+
+    @classmethod
+    def from_file(cls, path: Path, **overrides) -> "LoadTestConfig":
+        """
+        JSONファイルから設定を読み込み
+
+        Args:
+            path: 設定ファイルのパス
+            **overrides: ファイルの値を上書きする設定（Noneは無視）
+
+        Returns:
+            負荷試験設定
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if "think_time_sec" in data:
+            data["think_time_sec"] = tuple(data["think_time_sec"])
+        data.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**data)
+
+
+def parse_user_mix(value: str) -> Dict[str, float]:
+    """
+    "new_player=1,returning=6" 形式のユーザー構成を解析
+
+    Args:
+        value: ユーザー構成の文字列
+
+    Returns:
+        セッション種別ごとの重み
+    """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def parse_think_time(value: str) -> Tuple[float, float]:
+    """
+    "0.5:2.0" 形式の思考時間（秒）を解析（単一値の場合は固定）
+
+    Args:
+        value: 思考時間の文字列
+
+    Returns:
+        (最小, 最大)
+    """
+    low, _, high = value.partition(":")
+    return float(low), float(high or low)
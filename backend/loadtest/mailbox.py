@@ -0,0 +1,118 @@
+"""
+メール認証トークンの取得
+
+負荷試験で登録したユーザーのメール認証トークンを取得します。
+ハーネスがサーバーを起動した場合は開発用モックメール送信（MockEmailSender）の
+標準出力から、外部サーバーの場合は同じデータベースから読み取ります。
+"""
+import asyncio
+import re
+import threading
+from typing import IO, Dict, Optional
+
+from sqlalchemy import create_engine, text
+
+
+# MockEmailSenderの出力から宛先と認証URLを抽出するパターン
+RECIPIENT_PATTERN = re.compile(r"^宛先:\s*(\S+)")
+TOKEN_PATTERN = re.compile(r"verify-email\?token=(\S+)")
+
+# トークン到着待ちのポーリング間隔・タイムアウト（秒）
+POLL_INTERVAL_SEC = 0.05
+DEFAULT_TIMEOUT_SEC = 10.0
+
+
+class MockEmailMailbox:
+    """MockEmailSenderの出力を読み取るメールボックス"""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._current_recipient: Optional[str] = None
+
+    def feed_line(self, line: str) -> None:
+        """
+        サーバーの出力を1行取り込む
+
+        Args:
+            line: 標準出力の1行
+        """
+        recipient_match = RECIPIENT_PATTERN.match(line.strip())
+        if recipient_match:
+            self._current_recipient = recipient_match.group(1)
+            return
+        token_match = TOKEN_PATTERN.search(line)
+        if token_match and self._current_recipient:
+            with self._lock:
+                self._tokens[self._current_recipient] = token_match.group(1)
+            self._current_recipient = None
+
+    def consume(self, stream: IO[str]) -> threading.Thread:
+        """
+        バックグラウンドでストリームを読み続ける
+
+        Args:
+            stream: サーバープロセスの標準出力
+
+        Returns:
+            読み取りスレッド
+        """
+        def _reader():
+            for line in stream:
+                self.feed_line(line)
+
+        thread = threading.Thread(target=_reader, name="mock-mailbox", daemon=True)
+        thread.start()
+        return thread
+
+    async def get_token(self, email: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> Optional[str]:
+        """
+        宛先の認証トークンを取得（届くまで待機）
+
+        Args:
+            email: 宛先メールアドレス
+            timeout_sec: 待機タイムアウト（秒）
+
+        Returns:
+            認証トークン（タイムアウト時はNone）
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_sec
+        while loop.time() < deadline:
+            with self._lock:
+                token = self._tokens.pop(email, None)
+            if token is not None:
+                return token
+            await asyncio.sleep(POLL_INTERVAL_SEC)
+        return None
+
+
+class DatabaseTokenLookup:
+    """データベースから認証トークンを読み取る（外部サーバー向け）"""
+
+    def __init__(self, database_url: str) -> None:
+        """
+        Args:
+            database_url: サーバーと同じデータベースの接続URL
+        """
+        self.engine = create_engine(database_url, future=True)
+
+    async def get_token(self, email: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> Optional[str]:
+        """
+        宛先ユーザーの認証トークンを取得
+
+        Args:
+            email: メールアドレス
+            timeout_sec: 未使用（インターフェース互換のため）
+
+        Returns:
+            認証トークン（存在しない場合はNone）
+        """
+        return await asyncio.to_thread(self._select_token, email)
+
+    def _select_token(self, email: str) -> Optional[str]:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT verification_token FROM users WHERE email = :email"),
+                {"email": email}
+            ).scalar()
@@ -0,0 +1,80 @@
+"""
+負荷試験のメトリクス集計
+
+エンドポイント単位でリクエスト数・エラー数・レイテンシを記録し、
+ステージ終了時にスループット・エラー率・パーセンタイルを算出します。
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.run import PERCENTILES, percentile
+
+
+# 全エンドポイント合計のキー
+TOTAL_KEY = "TOTAL"
+
+
+class EndpointStats:
+    """エンドポイント単位の計測値"""
+
+    __slots__ = ("durations_ms", "errors")
+
+    def __init__(self) -> None:
+        self.durations_ms: List[float] = []
+        self.errors = 0
+
+
+class MetricsCollector:
+    """ステージ単位のメトリクス収集クラス"""
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    def record(self, endpoint: str, duration_ms: float, ok: bool) -> None:
+        """
+        1リクエスト分の結果を記録
+
+        Args:
+            endpoint: エンドポイント名（例: "POST /api/v1/clear-records/upsert"）
+            duration_ms: 所要時間（ミリ秒）
+            ok: 成功したかどうか
+        """
+        stats = self._stats[endpoint]
+        stats.durations_ms.append(duration_ms)
+        if not ok:
+            stats.errors += 1
+
+    def summary(self, elapsed_sec: float) -> Dict[str, dict]:
+        """
+        エンドポイントごとの集計結果を取得
+
+        Args:
+            elapsed_sec: ステージの実行時間（秒）
+
+        Returns:
+            エンドポイント名をキーとする集計結果（TOTALを含む）
+        """
+        result = {}
+        total = EndpointStats()
+        for endpoint in sorted(self._stats):
+            stats = self._stats[endpoint]
+            total.durations_ms.extend(stats.durations_ms)
+            total.errors += stats.errors
+            result[endpoint] = self._summarize(stats, elapsed_sec)
+        result[TOTAL_KEY] = self._summarize(total, elapsed_sec)
+        return result
+
+    @staticmethod
+    def _summarize(stats: EndpointStats, elapsed_sec: float) -> dict:
+        """計測値を集計"""
+        requests = len(stats.durations_ms)
+        sorted_values = sorted(stats.durations_ms)
+        summary = {
+            "requests": requests,
+            "errors": stats.errors,
+            "error_rate": round(stats.errors / requests, 4) if requests else 0.0,
+            "throughput_rps": round(requests / elapsed_sec, 2) if elapsed_sec > 0 else 0.0,
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}_ms"] = round(percentile(sorted_values, pct), 2)
+        return summary
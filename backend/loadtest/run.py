@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+負荷試験実行スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+同時接続数（仮想ユーザー数）を段階的に増やしながら現実的なセッションを実行し、
+ステージごと・エンドポイントごとのスループット・エラー率・レイテンシと
+飽和曲線（同時接続数 → スループット/レイテンシ）をJSONで出力します。
+
+Usage:
+    python -m loadtest.run [options]
+
+Options:
+    --base-url URL            : 起動済みサーバーを対象にする（省略時はuvicornを起動）
+    --database-url URL        : 起動済みサーバーのDB（認証トークン取得用）
+    --users N                 : 起動時に投入する既存ユーザー数（デフォルト: 200）
+    --workers N               : 起動するuvicornワーカー数（デフォルト: 1）
+    --stages 1,5,10           : 同時接続数のステージ
+    --stage-duration SEC      : ステージごとの実行時間
+    --think-time MIN:MAX      : 操作間の思考時間（秒）
+    --mix new_player=1,...    : セッション種別の重み（new_player / returning / browser）
+    --config PATH             : 設定JSONファイル（コマンドライン引数が優先）
+    --output PATH             : 結果JSONの出力先（デフォルト: loadtest/results/）
+
+起動済みサーバーを対象にする場合、既存ユーザーは benchmarks.data_generator で
+投入されたもの（bench_user_XXXXXX）を使用します。
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+# パスを設定してモジュールをインポート
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+
+from benchmarks.data_generator import BENCHMARK_PASSWORD
+from benchmarks.run import git_commit
+from loadtest.config import LoadTestConfig, parse_think_time, parse_user_mix
+from loadtest.mailbox import DatabaseTokenLookup
+from loadtest.metrics import TOTAL_KEY, MetricsCollector
+from loadtest.server import ServerProcess
+from loadtest.sessions import VirtualUser
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_PORT = 8001
+DEFAULT_EXTERNAL_USER_COUNT = 100
+
+
+async def run_stage(
+    config: LoadTestConfig,
+    concurrency: int,
+    mailbox,
+    account_pool: List[str],
+    rng: random.Random
+) -> dict:
+    """
+    1ステージ分の負荷をかける
+
+    Args:
+        config: 負荷試験設定
+        concurrency: 同時実行する仮想ユーザー数
+        mailbox: 認証トークンの取得元
+        account_pool: 既存ユーザー名の一覧
+        rng: 乱数生成器
+
+    Returns:
+        ステージの集計結果
+    """
+    metrics = MetricsCollector()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=config.base_url, timeout=config.request_timeout_sec, limits=limits
+    ) as client:
+        users = [
+            VirtualUser(client, config, metrics, mailbox, account_pool, BENCHMARK_PASSWORD,
+                        random.Random(rng.random()))
+            for _ in range(concurrency)
+        ]
+        started = time.monotonic()
+        deadline = started + config.stage_duration_sec
+        await asyncio.gather(*(user.run_until(deadline) for user in users))
+        elapsed_sec = time.monotonic() - started
+
+    return {
+        "concurrency": concurrency,
+        "elapsed_sec": round(elapsed_sec, 2),
+        "endpoints": metrics.summary(elapsed_sec),
+    }
+
+
+def print_stage(stage: dict) -> None:
+    """ステージ結果を表形式で出力"""
+    print(f"\n▶ concurrency={stage['concurrency']} ({stage['elapsed_sec']}s)")
+    print(f"  {'endpoint':<52} {'req':>6} {'rps':>8} {'err%':>6} {'p50':>8} {'p90':>8} {'p99':>8}")
+    for endpoint, stats in stage["endpoints"].items():
+        print(f"  {endpoint:<52} {stats['requests']:>6} {stats['throughput_rps']:>8.2f} "
+              f"{stats['error_rate'] * 100:>5.1f}% {stats['p50_ms']:>8.1f} {stats['p90_ms']:>8.1f} "
+              f"{stats['p99_ms']:>8.1f}")
+
+
+def saturation_curve(stages: List[dict]) -> List[dict]:
+    """
+    ステージ結果から飽和曲線を作成
+
+    Args:
+        stages: ステージごとの集計結果
+
+    Returns:
+        同時接続数ごとの全体スループット・エラー率・レイテンシ
+    """
+    return [
+        {
+            "concurrency": stage["concurrency"],
+            "throughput_rps": stage["endpoints"][TOTAL_KEY]["throughput_rps"],
+            "error_rate": stage["endpoints"][TOTAL_KEY]["error_rate"],
+            "p50_ms": stage["endpoints"][TOTAL_KEY]["p50_ms"],
+            "p99_ms": stage["endpoints"][TOTAL_KEY]["p99_ms"],
+        }
+        for stage in stages
+    ]
+
+
+async def run_load_test(config: LoadTestConfig, mailbox, account_pool: List[str]) -> List[dict]:
+    """全ステージを順に実行"""
+    rng = random.Random(config.seed)
+    stages = []
+    for concurrency in config.stages:
+        stage = await run_stage(config, concurrency, mailbox, account_pool, rng)
+        print_stage(stage)
+        stages.append(stage)
+    return stages
+
+
+def build_config(args: argparse.Namespace, base_url: str) -> LoadTestConfig:
+    """コマンドライン引数と設定ファイルから設定を作成"""
+    overrides = {
+        "base_url": base_url,
+        "stages": [int(value) for value in args.stages.split(",")] if args.stages else None,
+        "stage_duration_sec": args.stage_duration,
+        "think_time_sec": parse_think_time(args.think_time) if args.think_time else None,
+        "user_mix": parse_user_mix(args.mix) if args.mix else None,
+        "seed": args.seed,
+    }
+    if args.config:
+        return LoadTestConfig.from_file(Path(args.config), **overrides)
+    return LoadTestConfig(**{key: value for key, value in overrides.items() if value is not None})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='負荷試験')
+    parser.add_argument('--base-url', help='起動済みサーバーのURL（省略時はuvicornを起動）')
+    parser.add_argument('--database-url', help='起動済みサーバーのDB接続URL（認証トークン取得用）')
+    parser.add_argument('--users', type=int, default=200, help='起動時に投入する既存ユーザー数')
+    parser.add_argument('--workers', type=int, default=1, help='起動するuvicornワーカー数')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='起動するサーバーのポート')
+    parser.add_argument('--stages', help='同時接続数のステージ（カンマ区切り）')
+    parser.add_argument('--stage-duration', type=float, help='ステージごとの実行時間（秒）')
+    parser.add_argument('--think-time', help='思考時間（MIN:MAX 秒）')
+    parser.add_argument('--mix', help='セッション種別の重み（例: new_player=1,returning=6,browser=3）')
+    parser.add_argument('--seed', type=int, help='乱数シード')
+    parser.add_argument('--config', help='設定JSONファイル')
+    parser.add_argument('--output', help='結果JSONの出力先')
+    args = parser.parse_args()
+
+    # リクエストごとのhttpxログを抑制
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    server: Optional[ServerProcess] = None
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.base_url:
+            if not args.database_url:
+                parser.error("--database-url is required with --base-url (verification token lookup)")
+            mailbox = DatabaseTokenLookup(args.database_url)
+            account_pool = [f"bench_user_{user_id:06d}" for user_id in range(2, DEFAULT_EXTERNAL_USER_COUNT + 2)]
+            config = build_config(args, args.base_url)
+        else:
+            server = ServerProcess(
+                f"sqlite:///{Path(work_dir) / 'loadtest.db'}", "127.0.0.1", args.port, args.workers
+            )
+            print(f"🧪 合成データを投入中... (users={args.users})")
+            dataset = server.seed(args.users)
+            account_pool = dataset.usernames
+            print("🚀 uvicornを起動中...")
+            server.start()
+            mailbox = server.mailbox
+            config = build_config(args, server.base_url)
+
+        try:
+            stages = asyncio.run(run_load_test(config, mailbox, account_pool))
+        finally:
+            if server is not None:
+                server.stop()
+
+    curve = saturation_curve(stages)
+    print("\n📈 saturation curve")
+    for point in curve:
+        print(f"  c={point['concurrency']:>4} rps={point['throughput_rps']:>8.2f} "
+              f"err={point['error_rate'] * 100:>5.1f}% p50={point['p50_ms']:>8.1f}ms p99={point['p99_ms']:>8.1f}ms")
+
+    result = {
+        "metadata": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "workers": args.workers if server is not None else None,
+        },
+        "config": {
+            "stages": config.stages,
+            "stage_duration_sec": config.stage_duration_sec,
+            "think_time_sec": list(config.think_time_sec),
+            "user_mix": config.user_mix,
+            "toggles_per_session": config.toggles_per_session,
+        },
+        "stages": stages,
+        "saturation_curve": curve,
+    }
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        output_path = RESULTS_DIR / f"{timestamp}_{result['metadata']['commit'] or 'unknown'}.json"
+    output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"📄 結果を出力しました: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
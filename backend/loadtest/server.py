@@ -0,0 +1,120 @@
+"""
+負荷試験対象サーバーの起動
+
+合成データを投入した一時SQLiteデータベースを用意し、
+uvicorn（または本番用の起動スクリプト）を別プロセスで起動します。標準出力はモックメールボックスが読み取ります。
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+from sqlalchemy import create_engine
+
+from loadtest.mailbox import MockEmailMailbox
+
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# 起動待ちのタイムアウト・ポーリング間隔（秒）
+STARTUP_TIMEOUT_SEC = 30.0
+STARTUP_POLL_INTERVAL_SEC = 0.2
+
+
+class ServerProcess:
+    """uvicornプロセスの管理クラス"""
+
+    def __init__(self, database_url: str, host: str, port: int, workers: int = 1, production: bool = False):
+        """
+        Args:
+            database_url: サーバーが使用するデータベースの接続URL
+            host: バインドするホスト
+            port: バインドするポート
+            workers: uvicornワーカー数
+            production: 本番用の起動スクリプト（server.py）で起動するか
+        """
+        self.database_url = database_url
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.production = production
+        self.mailbox = MockEmailMailbox()
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def seed(self, user_count: int):
+        """
+        合成データを投入
+
+        Args:
+            user_count: 既存ユーザー数
+
+        Returns:
+            投入したデータセットの概要
+        """
+        from benchmarks.data_generator import SyntheticDataGenerator
+
+        engine = create_engine(self.database_url, future=True)
+        try:
+            return SyntheticDataGenerator().populate(engine, user_count)
+        finally:
+            engine.dispose()
+
+    def start(self) -> None:
+        """サーバーを起動して準備完了（/readyz）になるまで待機"""
+        env = dict(
+            os.environ,
+            DATABASE_URL=self.database_url,
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "WARNING"),
+            # 全仮想ユーザーが同じIPからログインするため、レート制限は明示した場合のみ有効化
+            RATE_LIMIT_ENABLED=os.getenv("RATE_LIMIT_ENABLED", "false"),
+            PYTHONUNBUFFERED="1",
+        )
+        env.pop("ENVIRONMENT", None)  # モックメール送信を使用するため開発モードで起動
+        if self.production:
+            command = [sys.executable, "server.py",
+                       "--host", self.host, "--port", str(self.port), "--workers", str(self.workers)]
+        else:
+            command = [sys.executable, "-m", "uvicorn", "main:app",
+                       "--host", self.host, "--port", str(self.port),
+                       "--workers", str(self.workers), "--no-access-log"]
+        self._process = subprocess.Popen(
+            command,
+            cwd=BACKEND_DIR,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+        )
+        self.mailbox.consume(self._process.stdout)
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT_SEC
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Server exited during startup: returncode={self._process.returncode}")
+            try:
+                if httpx.get(f"{self.base_url}/readyz").status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(STARTUP_POLL_INTERVAL_SEC)
+        self.stop()
+        raise RuntimeError("Server did not become ready in time")
+
+    def stop(self) -> None:
+        """サーバーを停止"""
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
@@ -0,0 +1,233 @@
+"""
+負荷試験の仮想ユーザーとセッション定義
+
+各仮想ユーザーはステージ終了まで、重みに従って選んだセッションを
+思考時間を挟みながら繰り返し実行します。
+"""
+import asyncio
+import random
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+import httpx
+
+from domain.constants.game_constants import get_available_difficulties_for_game_and_mode
+from loadtest.config import SESSION_NEW_PLAYER, SESSION_RETURNING_PLAYER, LoadTestConfig
+from loadtest.metrics import MetricsCollector
+
+
+API_PREFIX = "/api/v1"
+
+
+class VirtualUser:
+    """仮想ユーザー"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        config: LoadTestConfig,
+        metrics: MetricsCollector,
+        mailbox,
+        account_pool: List[str],
+        password: str,
+        rng: random.Random
+    ):
+        """
+        Args:
+            client: HTTPクライアント
+            config: 負荷試験設定
+            metrics: メトリクス収集先
+            mailbox: 認証トークンの取得元（get_token(email)を持つオブジェクト）
+            account_pool: 既存ユーザー名の一覧（ログイン用）
+            password: 既存ユーザー共通のパスワード
+            rng: 乱数生成器
+        """
+        self.client = client
+        self.config = config
+        self.metrics = metrics
+        self.mailbox = mailbox
+        self.account_pool = account_pool
+        self.password = password
+        self.rng = rng
+        self.headers: dict = {}
+        self.game_ids: List[int] = []
+        self._session_types = list(config.user_mix)
+        self._session_weights = [config.user_mix[name] for name in self._session_types]
+
+    async def run_until(self, deadline: float) -> None:
+        """
+        期限までセッションを繰り返し実行
+
+        Args:
+            deadline: 終了時刻（time.monotonic基準）
+        """
+        while time.monotonic() < deadline:
+            session_type = self.rng.choices(self._session_types, weights=self._session_weights)[0]
+            if session_type == SESSION_NEW_PLAYER:
+                await self.new_player_session(deadline)
+            elif session_type == SESSION_RETURNING_PLAYER:
+                await self.returning_player_session(deadline)
+            else:
+                await self.browser_session(deadline)
+
+    async def think(self) -> None:
+        """思考時間（画面操作の間隔）を待機"""
+        low, high = self.config.think_time_sec
+        if high > 0:
+            await asyncio.sleep(self.rng.uniform(low, high))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        endpoint: Optional[str] = None,
+        expected_statuses: Tuple[int, ...] = (),
+        **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        リクエストを送信して結果を記録
+
+        Args:
+            method: HTTPメソッド
+            path: API_PREFIX以降のパス
+            endpoint: 集計用のエンドポイント名（パスパラメータを含む場合に指定）
+            expected_statuses: 4xxでも成功として扱うステータスコード
+            **kwargs: httpxに渡す引数
+
+        Returns:
+            レスポンス（通信エラー時はNone）
+        """
+        name = f"{method} {API_PREFIX}{endpoint or path}"
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, f"{API_PREFIX}{path}", headers=self.headers, **kwargs
+            )
+        except httpx.HTTPError:
+            self.metrics.record(name, (time.perf_counter() - started) * 1000, ok=False)
+            return None
+        ok = response.status_code < 400 or response.status_code in expected_statuses
+        self.metrics.record(name, (time.perf_counter() - started) * 1000, ok=ok)
+        return response
+
+    async def login(self, username: str, password: str) -> bool:
+        """ログインして認証ヘッダーを設定"""
+        self.headers = {}
+        response = await self.request(
+            "POST", "/users/login", data={"username": username, "password": password}
+        )
+        if response is None or response.status_code != 200:
+            return False
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return True
+
+    async def bootstrap(self) -> None:
+        """フロントエンド起動時の読み込み"""
+        await self.request("GET", "/users/me")
+        response = await self.request("GET", "/games")
+        if response is not None and response.status_code == 200:
+            self.game_ids = [game["id"] for game in response.json()]
+        await self.request("GET", "/clear-records")
+        await self.request("GET", "/game-memos")
+
+    async def open_game(self, game_id: int) -> List[str]:
+        """
+        作品画面を開く
+
+        Returns:
+            機体名の一覧
+        """
+        response = await self.request(
+            "GET", f"/game-characters/{game_id}/characters", endpoint="/game-characters/{game_id}/characters"
+        )
+        await self.request("GET", "/clear-records", params={"game_id": game_id})
+        # メモ未作成の作品は404が正常応答
+        await self.request(
+            "GET", f"/game-memos/{game_id}", endpoint="/game-memos/{game_id}", expected_statuses=(404,)
+        )
+        if response is None or response.status_code != 200:
+            return []
+        return [character["character_name"] for character in response.json().get("game_characters", [])]
+
+    async def toggle_records(self, game_id: int, characters: List[str], deadline: float) -> None:
+        """クリア記録のチェックを切り替える"""
+        difficulties = get_available_difficulties_for_game_and_mode(game_id, "normal")
+        for _ in range(self.config.toggles_per_session):
+            if not characters or time.monotonic() >= deadline:
+                return
+            await self.request("POST", "/clear-records/upsert", json={
+                "game_id": game_id,
+                "character_name": self.rng.choice(characters),
+                "difficulty": self.rng.choice(difficulties),
+                "is_cleared": self.rng.random() < 0.7,
+                "is_no_continue_clear": self.rng.random() < 0.3,
+            })
+            await self.think()
+
+    async def save_memo(self, game_id: int) -> None:
+        """ゲームメモを保存"""
+        await self.request(
+            "POST", f"/game-memos/{game_id}/upsert", endpoint="/game-memos/{game_id}/upsert",
+            json={"memo": f"負荷試験メモ {uuid.uuid4().hex[:8]}"}
+        )
+
+    async def play(self, deadline: float) -> None:
+        """作品を選んで記録更新・メモ保存を行う"""
+        if not self.game_ids:
+            return
+        game_id = self.rng.choice(self.game_ids)
+        characters = await self.open_game(game_id)
+        await self.think()
+        await self.toggle_records(game_id, characters, deadline)
+        await self.save_memo(game_id)
+
+    async def new_player_session(self, deadline: float) -> None:
+        """登録 → メール認証 → ログイン → 初回利用"""
+        self.headers = {}
+        suffix = uuid.uuid4().hex[:12]
+        username = f"lt_{suffix}"
+        email = f"{username}@loadtest.example.com"
+        password = f"pw-{suffix}"
+
+        response = await self.request("POST", "/users/register", json={
+            "username": username, "email": email, "password": password
+        })
+        if response is None or response.status_code != 201:
+            return
+        await self.think()
+
+        token = await self.mailbox.get_token(email)
+        if token is None:
+            self.metrics.record("MAIL verification token", 0.0, ok=False)
+            return
+        await self.request("POST", "/users/verify-email", json={"token": token})
+
+        if not await self.login(username, password):
+            return
+        await self.bootstrap()
+        await self.think()
+        await self.play(deadline)
+
+    async def returning_player_session(self, deadline: float) -> None:
+        """ログイン → 起動時読み込み → 記録更新 → メモ保存"""
+        if not self.account_pool:
+            return
+        if not await self.login(self.rng.choice(self.account_pool), self.password):
+            return
+        await self.bootstrap()
+        await self.think()
+        await self.play(deadline)
+
+    async def browser_session(self, deadline: float) -> None:
+        """ログイン → 作品・機体の閲覧"""
+        if not self.account_pool:
+            return
+        if not await self.login(self.rng.choice(self.account_pool), self.password):
+            return
+        await self.bootstrap()
+        for _ in range(3):
+            if not self.game_ids or time.monotonic() >= deadline:
+                return
+            await self.think()
+            await self.open_game(self.rng.choice(self.game_ids))
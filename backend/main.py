@@ -1,22 +1,62 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from presentation.api.v1.games import router as games_router
 from presentation.api.v1.clear_records import router as clear_records_router
 from presentation.api.v1.users import router as users_router
 from presentation.api.v1.admin import router as admin_router
 from presentation.api.v1.game_characters import router as game_characters_router
 from presentation.api.v1.game_memos import router as game_memos_router
-from infrastructure.database.connection import engine, Base
+from presentation.api.v1.stats import router as stats_router
+from presentation.api.v1.rankings import router as rankings_router
+from presentation.api.v1.health import router as health_router, preload_catalog
+from infrastructure.database.constants import DatabaseConstants
+from infrastructure.database.schema import create_schema
+from infrastructure.server.warm_up import start_worker_warm_up, stop_worker_warm_up
 from infrastructure.config.network_constants import NetworkConstants
 from infrastructure.logging.logger import LoggerFactory
 from infrastructure.logging.middleware import RequestTracingMiddleware
 from infrastructure.logging.exception_handler import ExceptionHandlerMiddleware
+from infrastructure.http.compression import CompressionMiddleware
+from infrastructure.http.constants import CompressionConstants
+from infrastructure.ratelimit.constants import ConcurrencyLimitConstants, RateLimitConstants
+from infrastructure.ratelimit.middleware import ConcurrencyLimitMiddleware, RateLimitMiddleware
+from infrastructure.realtime.brokers import start_change_feed_broker, stop_change_feed_broker
+from infrastructure.realtime.change_feed import clear_record_change_feed
+from infrastructure.jobs.email_outbox_job import start_email_outbox_worker, stop_email_outbox_worker
+from infrastructure.jobs.registry import start_job_scheduler, stop_job_scheduler
 
 # ロギングシステムの初期化
 LoggerFactory.setup_logging()
 logger = LoggerFactory.get_logger(__name__)
 
-app = FastAPI(title="Touhou Clear Checker API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動・終了時の処理（スキーマ作成・ワーカーのウォームアップと準備完了判定・複数ワーカー向けの変更フィード中継・定期ジョブ・メール送信）"""
+    if DatabaseConstants.AUTO_CREATE_SCHEMA:
+        await asyncio.to_thread(create_schema)
+    # ウォームアップが完了するまで /readyz は503（失敗時は起動を止めずにバックグラウンドで再試行）
+    warm_up_task = await start_worker_warm_up(catalog_loader=preload_catalog)
+    await start_change_feed_broker(clear_record_change_feed)
+    scheduler = start_job_scheduler()
+    email_outbox_worker = start_email_outbox_worker()
+    yield
+    # 停止処理の開始時に準備未完了に戻し、ロードバランサーに新しいリクエストを止めさせる
+    await stop_worker_warm_up(warm_up_task)
+    await stop_email_outbox_worker(email_outbox_worker)
+    await stop_job_scheduler(scheduler)
+    await stop_change_feed_broker(clear_record_change_feed)
+
+
+app = FastAPI(
+    title="Touhou Clear Checker API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 logger.info("FastAPI application starting up")
 
@@ -26,7 +66,15 @@ app.add_middleware(ExceptionHandlerMiddleware)
 # リクエストトレーシングミドルウェアを追加
 app.add_middleware(RequestTracingMiddleware)
 
-# CORS設定
+# ルート別のレート制限（ログイン・一括更新など、ユーザーまたはクライアントIPごと）
+if RateLimitConstants.ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
+# 処理中リクエスト数の上限を超えたリクエストを503で拒否（レート制限より先に判定）
+if ConcurrencyLimitConstants.MAX_IN_FLIGHT > 0:
+    app.add_middleware(ConcurrencyLimitMiddleware)
+
+# CORS設定（429・503のレスポンスにもCORSヘッダーを付けるため、制限より外側に追加）
 app.add_middleware(
     CORSMiddleware,
     allow_origins=NetworkConstants.ALLOWED_ORIGINS,
@@ -35,7 +83,9 @@ app.add_middleware(
     allow_headers=NetworkConstants.ALLOWED_HEADERS,
 )
 
-Base.metadata.create_all(bind=engine)
+# レスポンス圧縮（最後に追加して最外層で圧縮する）
+if CompressionConstants.ENABLED:
+    app.add_middleware(CompressionMiddleware)
 
 app.include_router(games_router, prefix="/api/v1/games", tags=["games"])
 app.include_router(clear_records_router, prefix="/api/v1/clear-records", tags=["clear-records"])
@@ -43,12 +93,16 @@ app.include_router(users_router, prefix="/api/v1/users", tags=["users"])
 app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
 app.include_router(game_characters_router, prefix="/api/v1/game-characters", tags=["game-characters"])
 app.include_router(game_memos_router, prefix="/api/v1/game-memos", tags=["game-memos"])
+app.include_router(stats_router, prefix="/api/v1/stats", tags=["stats"])
+app.include_router(rankings_router, prefix="/api/v1/rankings", tags=["rankings"])
+app.include_router(health_router, tags=["health"])
 
 @app.get("/")
 async def root():
     logger.debug("Root endpoint accessed")
     return {"message": "Touhou Clear Checker API"}
 
+# 開発用の1プロセス起動（本番は server.py でワーカーを複数起動する）
 if __name__ == "__main__":
     import uvicorn
     logger.info(
@@ -0,0 +1,126 @@
+"""
+クリア記録グリッドのコンパクト列指向フォーマット
+
+1件ごとに17個のキーを繰り返すJSONの代わりに、作品ID・機体名・難易度・モードの辞書と、
+辞書へのインデックス配列・記録ごとのクリア条件ビットマスクで一覧を表現します。
+`?format=compact` またはAcceptヘッダーで選択でき、MessagePackエンコーディング
+（msgpackインストール時のみ）にも対応します。
+
+日時は通信量削減のため秒精度のUNIX時刻（タイムゾーンなしの値はUTCとして扱う）、
+クリア日は1970-01-01からの日数で表現します。
+"""
+import calendar
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS, clear_flags_to_mask
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 任意依存
+    msgpack = None
+
+# フォーマットのバージョン（構造を変更した場合に更新）
+COMPACT_FORMAT_VERSION = 1
+
+# フォーマット名（?format= の値）
+FORMAT_JSON = "json"
+FORMAT_COMPACT = "compact"
+FORMAT_MSGPACK = "msgpack"
+
+# メディアタイプ
+COMPACT_MEDIA_TYPE = "application/vnd.touhou-clear-checker.compact+json"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+# 辞書化する列
+DICTIONARY_COLUMNS = ("game_id", "character_name", "difficulty", "mode")
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def msgpack_available() -> bool:
+    """MessagePackエンコーディングが利用可能か"""
+    return msgpack is not None
+
+
+def resolve_format(format_param: Optional[str], accept: Optional[str]) -> Optional[str]:
+    """
+    レスポンスフォーマットを決定（クエリパラメータ優先）
+
+    Args:
+        format_param: ?format= の値
+        accept: Acceptヘッダーの値
+
+    Returns:
+        フォーマット名（未対応のフォーマット名が指定された場合はNone）
+    """
+    if format_param:
+        format_name = format_param.lower()
+        return format_name if format_name in (FORMAT_JSON, FORMAT_COMPACT, FORMAT_MSGPACK) else None
+    if accept:
+        accept = accept.lower()
+        if COMPACT_MEDIA_TYPE in accept:
+            return FORMAT_COMPACT
+        if MSGPACK_MEDIA_TYPE in accept:
+            return FORMAT_MSGPACK
+    return FORMAT_JSON
+
+
+def _epoch_seconds(value: Optional[datetime]) -> Optional[int]:
+    """日時をUNIX時刻（秒）に変換"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return calendar.timegm(value.timetuple())
+    return int(value.timestamp())
+
+
+def _epoch_days(value: Optional[date]) -> Optional[int]:
+    """日付を1970-01-01からの日数に変換"""
+    return value.toordinal() - EPOCH_ORDINAL if value is not None else None
+
+
+def encode_compact_clear_records(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    クリア記録一覧（一覧表示用の列の辞書）をコンパクト列指向フォーマットに変換
+
+    Args:
+        rows: ClearRecordResponseと同じキーを持つ辞書のリスト
+
+    Returns:
+        コンパクトフォーマットの辞書
+    """
+    dictionaries: Dict[str, List[Any]] = {column: [] for column in DICTIONARY_COLUMNS}
+    indexes: Dict[str, Dict[Any, int]] = {column: {} for column in DICTIONARY_COLUMNS}
+    columns: Dict[str, List[Any]] = {
+        name: [] for name in ("id", *DICTIONARY_COLUMNS, "flags", "cleared_at", "created_at", "last_updated_at")
+    }
+
+    for row in rows:
+        columns["id"].append(row["id"])
+        for column in DICTIONARY_COLUMNS:
+            value = row[column]
+            index = indexes[column].get(value)
+            if index is None:
+                index = len(dictionaries[column])
+                indexes[column][value] = index
+                dictionaries[column].append(value)
+            columns[column].append(index)
+        columns["flags"].append(clear_flags_to_mask(row))
+        columns["cleared_at"].append(_epoch_days(row["cleared_at"]))
+        columns["created_at"].append(_epoch_seconds(row["created_at"]))
+        columns["last_updated_at"].append(_epoch_seconds(row["last_updated_at"]))
+
+    return {
+        "format": FORMAT_COMPACT,
+        "version": COMPACT_FORMAT_VERSION,
+        "count": len(rows),
+        "flag_fields": list(CLEAR_FLAG_FIELDS),
+        "dictionaries": dictionaries,
+        "columns": columns,
+    }
+
+
+def encode_msgpack(content: Dict[str, Any]) -> bytes:
+    """コンパクトフォーマットをMessagePackでエンコード"""
+    return msgpack.packb(content, use_bin_type=True)
@@ -3,9 +3,15 @@ from infrastructure.database.connection import get_db
 from infrastructure.database.repositories.game_repository_impl import GameRepositoryImpl
 from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
 from infrastructure.database.repositories.game_memo_repository_impl import GameMemoRepositoryImpl
+from infrastructure.database.repositories.game_character_repository_impl import GameCharacterRepositoryImpl
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.database.repositories.ranking_repository_impl import RankingRepositoryImpl
 from application.services.game_service import GameService
 from application.services.clear_record_service import ClearRecordService
+from application.services.clear_record_rule_registry import ClearRecordRuleRegistry
 from application.services.game_memo_service import GameMemoService
+from application.services.clear_stats_service import ClearStatsService
+from application.services.ranking_service import RankingService
 from infrastructure.security.auth_middleware import get_current_user, get_current_admin_user
 from fastapi import Depends
 
@@ -15,8 +21,17 @@ def get_game_service(db: Session = Depends(get_db)) -> GameService:
 
 def get_clear_record_service(db: Session = Depends(get_db)) -> ClearRecordService:
     clear_record_repository = ClearRecordRepositoryImpl(db)
-    return ClearRecordService(clear_record_repository)
+    rule_table = ClearRecordRuleRegistry.get(GameCharacterRepositoryImpl(db))
+    return ClearRecordService(clear_record_repository, rule_table)
 
 def get_game_memo_service(db: Session = Depends(get_db)) -> GameMemoService:
     game_memo_repository = GameMemoRepositoryImpl(db)
-    return GameMemoService(game_memo_repository)
\ No newline at end of file
+    return GameMemoService(game_memo_repository)
+
+def get_clear_stats_service(db: Session = Depends(get_db)) -> ClearStatsService:
+    clear_stats_repository = ClearStatsRepositoryImpl(db)
+    return ClearStatsService(clear_stats_repository)
+
+def get_ranking_service(db: Session = Depends(get_db)) -> RankingService:
+    ranking_repository = RankingRepositoryImpl(db)
+    return RankingService(ranking_repository)
@@ -0,0 +1,28 @@
+"""
+APIレスポンスクラス
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _orjson_default(value: Any) -> Any:
+    """orjsonが直接扱えない値をPydanticと同じ表現に変換"""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class TrustedJSONResponse(ORJSONResponse):
+    """
+    信頼済みのデータ（DBの列の値やサーバー側で組み立てた辞書）をそのままJSONに変換するレスポンス
+
+    エンドポイントがResponseを直接返すとFastAPIはresponse_modelによる再検証を行わないため、
+    一覧APIでのPydanticモデル生成と二重検証を省略できます（OpenAPIスキーマはresponse_modelのまま）。
+    日付・日時・Enum・DecimalはPydanticと同じ形式で出力します。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
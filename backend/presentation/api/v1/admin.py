@@ -1,6 +1,8 @@
 from typing import List, Optional
 from decimal import Decimal
+from datetime import datetime, UTC
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from application.services.game_service import GameService
 from application.services.user_service import UserService
@@ -10,14 +12,40 @@ from domain.entities.user import User
 from domain.value_objects.game_type import GameType
 from infrastructure.security.auth_middleware import get_current_admin_user
 from infrastructure.database.connection import get_db
+from infrastructure.database.repositories.job_lease_repository_impl import JobLeaseRepositoryImpl
 from ..dependencies import get_game_service
+from ..responses import TrustedJSONResponse
+from .games import GAMES_CACHE_KEY
 from ...schemas.game_schema import GameCreate, GameUpdate, GameResponse
 from ...schemas.user_schema import UserUpdate, UserResponse
+from ...schemas.profiling_schema import (
+    ProfileReportSummary, ProfileReportResponse, SamplingProfilerStart, SamplingProfilerStatus
+)
+from ...schemas.job_schema import JobSchedulerStatus, ScheduledJobStatus
+from infrastructure.http.precompressed import catalog_response_cache
+from infrastructure.jobs.scheduler import job_scheduler
 from infrastructure.logging.logger import LoggerFactory
+from infrastructure.profiling.report_store import profile_report_store
+from infrastructure.profiling.sampling_profiler import SamplingProfiler, sampling_profiler
 
 router = APIRouter()
 logger = LoggerFactory.get_logger(__name__)
 
+
+def _user_payload(dto) -> dict:
+    """ユーザーDTOをレスポンス用の辞書に変換（UserResponseと同じフィールド）"""
+    return {
+        "id": dto.id,
+        "username": dto.username,
+        "email": dto.email,
+        "is_active": dto.is_active,
+        "is_admin": dto.is_admin,
+        "email_verified": dto.email_verified,
+        "created_at": dto.created_at,
+        "updated_at": dto.updated_at,
+    }
+
+
 # ゲーム管理API
 
 @router.get("/games", response_model=List[GameResponse])
@@ -76,6 +104,7 @@ async def create_game(
             game_type=game_data.game_type
         )
         game = game_service.create_game(create_dto)
+        catalog_response_cache.invalidate(GAMES_CACHE_KEY)
         logger.info(f"Admin created game: game_id={game.id}, title={game.title}")
         return GameResponse(
             id=game.id,
@@ -112,6 +141,7 @@ async def update_game_by_series(
             game_type=game_data.game_type
         )
         game = game_service.update_game(existing_game.id, update_dto)
+        catalog_response_cache.invalidate(GAMES_CACHE_KEY)
         if not game:
             logger.warning(f"Failed to update game: series_number={series_number}")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
@@ -144,6 +174,7 @@ async def delete_game_by_series(
 
     existing_game = existing_games[0]  # series_numberはユニークなので最初の要素
     success = game_service.delete_game(existing_game.id)
+    catalog_response_cache.invalidate(GAMES_CACHE_KEY)
     if not success:
         logger.error(f"Failed to delete game: series_number={series_number}, game_id={existing_game.id}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete game")
@@ -163,7 +194,7 @@ async def admin_get_all_users(
     user_service = UserService(user_repository)
     users = user_service.get_all_users()
     logger.info(f"Admin retrieved {len(users)} users")
-    return users
+    return TrustedJSONResponse(content=[_user_payload(user) for user in users])
 
 @router.put("/users/{user_id}", response_model=UserResponse)
 async def admin_update_user(
@@ -209,4 +240,89 @@ async def admin_delete_user(
     if not success:
         logger.warning(f"User not found for delete: user_id={user_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    logger.info(f"Admin deleted user: user_id={user_id}")
\ No newline at end of file
+    logger.info(f"Admin deleted user: user_id={user_id}")
+
+# プロファイリングAPI
+
+def _sampling_profiler_status(profiler: SamplingProfiler) -> SamplingProfilerStatus:
+    """サンプリングプロファイラーの状態をレスポンスに変換"""
+    return SamplingProfilerStatus(
+        running=profiler.is_running,
+        interval_ms=profiler.interval_ms,
+        sample_count=profiler.sample_count,
+        started_at=datetime.fromtimestamp(profiler.started_at, UTC) if profiler.started_at else None
+    )
+
+@router.get("/profiles", response_model=List[ProfileReportSummary])
+async def admin_get_profiles(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: 保存済みプロファイルレポート一覧（新しい順）"""
+    reports = profile_report_store.list()
+    logger.info(f"Admin retrieved {len(reports)} profile reports")
+    return [ProfileReportSummary.model_validate(report) for report in reports]
+
+@router.get("/profiles/{request_id}", response_model=ProfileReportResponse)
+async def admin_get_profile(
+    request_id: str,
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: リクエストIDを指定してプロファイルレポートを取得"""
+    report = profile_report_store.get(request_id)
+    if report is None:
+        logger.warning(f"Profile report not found: request_id={request_id}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile report not found")
+    return ProfileReportResponse.model_validate(report)
+
+@router.get("/profiling/sampler", response_model=SamplingProfilerStatus)
+async def admin_get_sampler_status(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: サンプリングプロファイラーの状態を取得"""
+    return _sampling_profiler_status(sampling_profiler)
+
+@router.post("/profiling/sampler/start", response_model=SamplingProfilerStatus)
+async def admin_start_sampler(
+    options: SamplingProfilerStart,
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: サンプリングプロファイラーを開始（前回の集計結果は破棄）"""
+    if not sampling_profiler.start(options.interval_ms):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Sampling profiler is already running")
+    logger.info(f"Admin started sampling profiler: admin_id={current_admin.id}")
+    return _sampling_profiler_status(sampling_profiler)
+
+@router.post("/profiling/sampler/stop", response_model=SamplingProfilerStatus)
+async def admin_stop_sampler(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: サンプリングプロファイラーを停止"""
+    sampling_profiler.stop()
+    logger.info(f"Admin stopped sampling profiler: admin_id={current_admin.id}")
+    return _sampling_profiler_status(sampling_profiler)
+
+@router.get("/profiling/sampler/collapsed", response_class=PlainTextResponse)
+async def admin_get_sampler_collapsed(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """管理者専用: サンプリング結果をフレームグラフ互換のcollapsed形式で取得"""
+    return PlainTextResponse(sampling_profiler.collapsed())
+
+# 定期ジョブAPI
+
+@router.get("/jobs", response_model=JobSchedulerStatus)
+async def admin_get_jobs(
+    current_admin: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """管理者専用: 定期ジョブの状態・実行履歴・所要時間を取得（履歴は応答したワーカーのもの）"""
+    leases = {lease["job_name"]: lease for lease in JobLeaseRepositoryImpl(db).find_all()}
+    jobs = []
+    for job in job_scheduler.status():
+        lease = leases.get(job["name"], {})
+        jobs.append(ScheduledJobStatus(
+            **job,
+            lease_owner=lease.get("owner"),
+            lease_expires_at=lease.get("expires_at")
+        ))
+    return JobSchedulerStatus(worker=job_scheduler.owner, running=job_scheduler.is_running, jobs=jobs)
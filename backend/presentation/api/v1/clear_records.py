@@ -1,13 +1,39 @@
 """
 クリア記録API（機体別個別条件対応）
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 from application.services.clear_record_service import ClearRecordService
 from domain.entities.user import User
+from infrastructure.database.connection import get_db
+from infrastructure.realtime.change_feed import ChangeSubscription, ClearRecordChangeFeed, clear_record_change_feed
+from infrastructure.realtime.constants import ChangeFeedConstants, ChangeLogConstants
 from infrastructure.security.auth_middleware import get_current_active_user
 from ..dependencies import get_clear_record_service
-from ...schemas.clear_record_schema import ClearRecordCreate, ClearRecordUpdate, ClearRecordResponse, ClearRecordBatch
+from ..responses import TrustedJSONResponse
+from ..compact_format import (
+    COMPACT_MEDIA_TYPE,
+    FORMAT_COMPACT,
+    FORMAT_MSGPACK,
+    MSGPACK_MEDIA_TYPE,
+    encode_compact_clear_records,
+    encode_msgpack,
+    msgpack_available,
+    resolve_format,
+)
+from ...schemas.clear_record_schema import (
+    ClearProgressGameResponse,
+    ClearRecordBatch,
+    ClearRecordChangesResponse,
+    ClearRecordCreate,
+    ClearRecordHistoryResponse,
+    ClearRecordResponse,
+    ClearRecordUpdate,
+)
 from infrastructure.logging.logger import LoggerFactory
 
 router = APIRouter()
@@ -40,19 +66,157 @@ def _to_response(record) -> ClearRecordResponse:
 async def get_my_clear_records(
     game_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
+    clear_record_service: ClearRecordService = Depends(get_clear_record_service),
+    format: Annotated[Optional[str], Query(description="レスポンス形式（json / compact / msgpack）")] = None,
+    accept: Annotated[Optional[str], Header(include_in_schema=False)] = None
+):
+    """
+    現在のユーザーのクリア記録一覧取得（エンティティ・スキーマを経由せず列の値を直接返す）
+
+    `?format=compact` またはAcceptヘッダーでコンパクト列指向フォーマット、
+    `?format=msgpack` でそのMessagePack表現を返します。
+    """
+    logger.debug(f"Get clear records: user_id={current_user.id}, game_id={game_id}, format={format}")
+
+    response_format = resolve_format(format, accept)
+    if response_format is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported format: {format}")
+    if response_format == FORMAT_MSGPACK and not msgpack_available():
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail="MessagePack is not available")
+
+    rows = await clear_record_service.get_user_clear_record_rows(current_user.id, game_id or None)
+    logger.info(f"Retrieved {len(rows)} clear records for user_id={current_user.id}, game_id={game_id}")
+
+    headers = {"Vary": "Accept"}
+    if response_format == FORMAT_COMPACT:
+        return TrustedJSONResponse(
+            content=encode_compact_clear_records(rows), media_type=COMPACT_MEDIA_TYPE, headers=headers
+        )
+    if response_format == FORMAT_MSGPACK:
+        return Response(
+            content=encode_msgpack(encode_compact_clear_records(rows)), media_type=MSGPACK_MEDIA_TYPE, headers=headers
+        )
+    return TrustedJSONResponse(content=rows, headers=headers)
+
+
+@router.get("/changes", response_model=ClearRecordChangesResponse)
+async def get_my_clear_record_changes(
+    since: Annotated[Optional[int], Query(ge=0, description="取得済みの最後の連番（latest_seq）")] = None,
+    limit: Annotated[int, Query(ge=1, le=ChangeLogConstants.MAX_PAGE_SIZE)] = ChangeLogConstants.DEFAULT_PAGE_SIZE,
+    current_user: User = Depends(get_current_active_user),
     clear_record_service: ClearRecordService = Depends(get_clear_record_service)
 ):
-    """現在のユーザーのクリア記録一覧取得"""
-    logger.debug(f"Get clear records: user_id={current_user.id}, game_id={game_id}")
+    """
+    現在のユーザーのクリア記録の変更をsince以降の差分で取得
+
+    sinceを指定しない場合、または変更ログが削除済みの場合はresync_requiredを返すため、
+    一覧を取得し直してからlatest_seqを次回のsinceに指定してください。
+    """
+    result = await clear_record_service.get_clear_record_changes(current_user.id, since, limit)
+    logger.debug(
+        f"Clear record changes: user_id={current_user.id}, since={since}, "
+        f"count={len(result['changes'])}, resync_required={result['resync_required']}"
+    )
+    return TrustedJSONResponse(content=result)
+
+
+@router.get("/progress", response_model=List[ClearProgressGameResponse])
+async def get_my_clear_progress(
+    game_id: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+    clear_record_service: ClearRecordService = Depends(get_clear_record_service)
+):
+    """
+    現在のユーザーの作品ごとの月別累計達成数を取得（進捗グラフ用）
+
+    条件ごとの初回達成を月別に集計済みのテーブルから作成するため、履歴の長さによらず高速です。
+    """
+    progress = await clear_record_service.get_clear_progress(current_user.id, game_id or None)
+    return TrustedJSONResponse(content=progress)
+
+
+def _sse_message(data: Dict[str, Any], event: Optional[str] = None, event_id: Optional[int] = None) -> str:
+    """Server-Sent Eventsの1メッセージを作成"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Last-Event-IDヘッダーを解釈（不正な値は指定なしとして扱う）"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
 
-    if game_id:
-        records = await clear_record_service.get_user_game_clear_records(current_user.id, game_id)
-        logger.info(f"Retrieved {len(records)} clear records for user_id={current_user.id}, game_id={game_id}")
-    else:
-        records = await clear_record_service.get_user_clear_records(current_user.id)
-        logger.info(f"Retrieved {len(records)} clear records for user_id={current_user.id}")
 
-    return [_to_response(record) for record in records]
+async def _change_stream(
+    request: Request,
+    feed: ClearRecordChangeFeed,
+    subscription: ChangeSubscription,
+    last_event_id: Optional[int],
+) -> AsyncIterator[str]:
+    """変更フィードをSSEとして送信（切断時に購読を解除）"""
+    try:
+        yield f"retry: {ChangeFeedConstants.RETRY_MILLISECONDS}\n\n"
+        sent_event_id = last_event_id or 0
+        if last_event_id is not None:
+            backlog = feed.events_since(subscription.user_id, last_event_id)
+            if backlog is None:
+                # 続きを再送できないため、一覧の再取得を促す
+                yield _sse_message({}, ChangeFeedConstants.EVENT_RESET, feed.last_event_id)
+                sent_event_id = feed.last_event_id
+            else:
+                for event in backlog:
+                    yield _sse_message(event.to_payload(), event.event_type, event.event_id)
+                    sent_event_id = event.event_id
+        while True:
+            try:
+                event = await subscription.get(timeout=ChangeFeedConstants.HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                yield _sse_message({}, ChangeFeedConstants.EVENT_RESET, feed.last_event_id)
+                break
+            if event.event_id <= sent_event_id:
+                # 再送済みの変更（購読開始と変更ログ取得の間に発生したもの）
+                continue
+            yield _sse_message(event.to_payload(), event.event_type, event.event_id)
+            sent_event_id = event.event_id
+    finally:
+        feed.unsubscribe(subscription)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_my_clear_record_changes(
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+    last_event_id: Annotated[Optional[str], Header(include_in_schema=False)] = None
+):
+    """
+    現在のユーザーのクリア記録の変更をServer-Sent Eventsで配信
+
+    他のタブ・端末での作成・更新（upsert）と削除（delete）を、記録のキー・クリア条件ビットマスク・
+    バージョンとして送信します。再接続時はLast-Event-IDの続きから再送し、
+    再送できない場合はreset（一覧の再取得）を送信します。
+    """
+    # 接続中にDBコネクションを占有しないよう、認証後にセッションを閉じる
+    db.close()
+    subscription = clear_record_change_feed.subscribe(current_user.id)
+    logger.info(f"Clear record change stream opened: user_id={current_user.id}")
+    return StreamingResponse(
+        _change_stream(request, clear_record_change_feed, subscription, _parse_last_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{record_id}", response_model=ClearRecordResponse)
@@ -73,6 +237,25 @@ async def get_clear_record_by_id(
     return _to_response(record)
 
 
+@router.get("/{record_id}/history", response_model=ClearRecordHistoryResponse)
+async def get_clear_record_history(
+    record_id: int,
+    current_user: User = Depends(get_current_active_user),
+    clear_record_service: ClearRecordService = Depends(get_clear_record_service)
+):
+    """クリア記録の条件ごとの初回達成日時を取得（条件をOFFに戻した後も保持）"""
+    record = await clear_record_service.get_clear_record_by_id(record_id)
+    if not record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Clear record not found")
+    
+    # ユーザー権限チェック
+    if record.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+    
+    achievements = await clear_record_service.get_clear_record_achievements(record)
+    return TrustedJSONResponse(content={"record_id": record_id, "achievements": achievements})
+
+
 @router.post("", response_model=ClearRecordResponse, status_code=status.HTTP_201_CREATED)
 async def create_clear_record(
     record_data: ClearRecordCreate,
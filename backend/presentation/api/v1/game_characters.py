@@ -1,6 +1,8 @@
 """
 ゲーム機体API（統合game_charactersテーブル対応）
 """
+from datetime import datetime
+from typing import Callable
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from infrastructure.database.repositories.game_character_repository_impl import GameCharacterRepositoryImpl
@@ -13,14 +15,55 @@ from presentation.schemas.game_character_schema import (
     GameCharacterResponse,
     GameCharacterListResponse
 )
-from infrastructure.database.connection import get_db
+from infrastructure.database.connection import get_db, get_session_factory
 from infrastructure.security.auth_middleware import get_current_user
 from domain.entities.user import User
+from infrastructure.http.precompressed import PrecompressedPayload, PrecompressedResponse, catalog_response_cache
 from infrastructure.logging.logger import LoggerFactory
+from ..responses import TrustedJSONResponse
 
 router = APIRouter()
 logger = LoggerFactory.get_logger(__name__)
 
+# ゲーム別機体一覧（事前圧縮済みでキャッシュ）のキー接頭辞
+CHARACTERS_CACHE_KEY_PREFIX = "game_characters:"
+
+
+def _to_payload(dto) -> dict:
+    """機体DTOをレスポンス用の辞書に変換（GameCharacterResponseと同じフィールド）"""
+    created_at = dto.created_at
+    if isinstance(created_at, str):
+        # 生SQLで取得した場合、SQLiteでは文字列のまま返るため日時に揃える
+        created_at = datetime.fromisoformat(created_at)
+    return {
+        "character_name": dto.character_name,
+        "description": dto.description,
+        "sort_order": dto.sort_order,
+        "id": dto.id,
+        "game_id": dto.game_id,
+        "created_at": created_at,
+    }
+
+
+def build_game_characters_payload(service: GameCharacterService, game_id: int) -> PrecompressedPayload:
+    """ゲーム別機体一覧を事前圧縮（ウォームアップでも使用）"""
+    result = service.get_characters_by_game_id(game_id)
+    logger.info(f"Retrieved {result.total_count} characters for game_id={game_id}")
+    body = TrustedJSONResponse(content={
+        "game_characters": [_to_payload(dto) for dto in result.game_characters],
+        "total_count": result.total_count
+    }).body
+    return PrecompressedPayload.build(body)
+
+
+def refresh_game_characters_payload(game_id: int, session_factory: Callable[[], Session]) -> PrecompressedPayload:
+    """キャッシュの読み込み・バックグラウンド更新用（リクエストのDBセッションを使わずに作成）"""
+    db = session_factory()
+    try:
+        return build_game_characters_payload(GameCharacterService(GameCharacterRepositoryImpl(db)), game_id)
+    finally:
+        db.close()
+
 
 def get_game_character_repository(session: Session = Depends(get_db)) -> GameCharacterRepository:
     """ゲーム機体リポジトリを取得"""
@@ -36,26 +79,16 @@ def get_game_character_service(session: Session = Depends(get_db)) -> GameCharac
 @router.get("/{game_id}/characters", response_model=GameCharacterListResponse)
 async def get_game_characters(
     game_id: int,
-    service: GameCharacterService = Depends(get_game_character_service)
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
 ):
     """ゲーム別機体一覧を取得（認証なし）"""
     logger.debug(f"Get game characters request: game_id={game_id}")
     try:
-        result = service.get_characters_by_game_id(game_id)
-        logger.info(f"Retrieved {result.total_count} characters for game_id={game_id}")
-        return GameCharacterListResponse(
-            game_characters=[
-                GameCharacterResponse(
-                    id=dto.id,
-                    game_id=dto.game_id,
-                    character_name=dto.character_name,
-                    description=dto.description,
-                    sort_order=dto.sort_order,
-                    created_at=dto.created_at
-                ) for dto in result.game_characters
-            ],
-            total_count=result.total_count
+        load = lambda: refresh_game_characters_payload(game_id, session_factory)
+        payload = await catalog_response_cache.get_or_load(
+            f"{CHARACTERS_CACHE_KEY_PREFIX}{game_id}", load, refresher=load
         )
+        return PrecompressedResponse(payload)
     except Exception as e:
         logger.error(f"Failed to get game characters: game_id={game_id}, error={str(e)}")
         raise HTTPException(status_code=500, detail=f"機体取得に失敗しました: {str(e)}")
@@ -107,6 +140,7 @@ async def create_game_character(
         )
 
         dto = service.create_character(create_dto)
+        catalog_response_cache.invalidate(CHARACTERS_CACHE_KEY_PREFIX)
         logger.info(f"Game character created: character_id={dto.id}, name={dto.character_name}")
         return GameCharacterResponse(
             id=dto.id,
@@ -143,6 +177,7 @@ async def update_game_character(
         )
 
         dto = service.update_character(character_id, update_dto)
+        catalog_response_cache.invalidate(CHARACTERS_CACHE_KEY_PREFIX)
         if not dto:
             logger.warning(f"Game character not found for update: character_id={character_id}")
             raise HTTPException(status_code=404, detail="機体が見つかりません")
@@ -178,6 +213,7 @@ async def delete_game_character(
     logger.info(f"Delete game character attempt: character_id={character_id}")
     try:
         success = service.delete_character(character_id)
+        catalog_response_cache.invalidate(CHARACTERS_CACHE_KEY_PREFIX)
         if not success:
             logger.warning(f"Game character not found for delete: character_id={character_id}")
             raise HTTPException(status_code=404, detail="機体が見つかりません")
@@ -8,6 +8,7 @@ from application.services.game_memo_service import GameMemoService
 from domain.entities.user import User
 from ..dependencies import get_game_memo_service, get_current_user
 from infrastructure.logging.logger import LoggerFactory
+from ..responses import TrustedJSONResponse
 
 router = APIRouter()
 logger = LoggerFactory.get_logger(__name__)
@@ -38,16 +39,7 @@ async def get_my_game_memos(
     try:
         memos = await game_memo_service.get_user_memos(current_user.id)
         logger.info(f"Retrieved {len(memos)} game memos for user_id={current_user.id}")
-        return [
-            GameMemoResponse(
-                id=memo.id,
-                user_id=memo.user_id,
-                game_id=memo.game_id,
-                memo=memo.memo,
-                created_at=memo.created_at.isoformat() if memo.created_at else None,
-                updated_at=memo.updated_at.isoformat() if memo.updated_at else None
-            ) for memo in memos
-        ]
+        return TrustedJSONResponse(content=[memo.to_dict() for memo in memos])
     except Exception as e:
         logger.error(f"Failed to get game memos: user_id={current_user.id}, error={str(e)}")
         raise HTTPException(status_code=500, detail=f"ゲームメモ取得に失敗しました: {str(e)}")
@@ -1,21 +1,65 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from application.services.game_service import GameService
 from domain.value_objects.game_type import GameType
 from ..dependencies import get_game_service, get_current_user
+from ..responses import TrustedJSONResponse
 from ...schemas.game_schema import GameResponse
 from domain.entities.user import User
+from sqlalchemy.orm import Session
+from infrastructure.database.connection import get_session_factory
+from infrastructure.database.repositories.game_repository_impl import GameRepositoryImpl
+from infrastructure.http.precompressed import PrecompressedPayload, PrecompressedResponse, catalog_response_cache
 from infrastructure.logging.logger import LoggerFactory
 
 router = APIRouter()
 logger = LoggerFactory.get_logger(__name__)
 
+# 検索条件なしのゲーム一覧（事前圧縮済みでキャッシュ）のキー
+GAMES_CACHE_KEY = "games"
+
+
+def _to_payload(dto) -> dict:
+    """ゲームDTOをレスポンス用の辞書に変換（GameResponseと同じフィールド）"""
+    game_type = dto.game_type if hasattr(dto, 'game_type') else 'main_series'
+    return {
+        "title": dto.title,
+        "series_number": dto.series_number,
+        "release_year": dto.release_year,
+        "game_type": getattr(game_type, 'value', game_type),
+        "id": dto.id,
+    }
+
+
+def build_games_payload(game_service: GameService) -> PrecompressedPayload:
+    """全件のゲーム一覧を事前圧縮（ウォームアップでも使用）"""
+    game_dtos = game_service.get_all_games()
+    logger.info(f"Retrieved all games: {len(game_dtos)} games")
+    body = TrustedJSONResponse(content=[_to_payload(dto) for dto in game_dtos]).body
+    return PrecompressedPayload.build(body)
+
+
+def refresh_games_payload(session_factory: Callable[[], Session]) -> PrecompressedPayload:
+    """
+    キャッシュの読み込み・バックグラウンド更新用（リクエストのDBセッションを使わずに作成）
+
+    同時リクエストで共有する読み込みは、最初のリクエストがキャンセルされても継続するため、
+    そのリクエストのDBセッションを使用しない
+    """
+    db = session_factory()
+    try:
+        return build_games_payload(GameService(GameRepositoryImpl(db)))
+    finally:
+        db.close()
+
+
 @router.get("", response_model=List[GameResponse])
 async def get_games(
     series_number: Optional[Decimal] = Query(None, description="シリーズ番号で検索"),
     game_type: Optional[str] = Query(None, description="ゲームタイプで検索"),
-    game_service: GameService = Depends(get_game_service)
+    game_service: GameService = Depends(get_game_service),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
 ):
     """ゲーム一覧取得（検索パラメータ対応）"""
     logger.debug(f"Get games request: series_number={series_number}, game_type={game_type}")
@@ -39,17 +83,13 @@ async def get_games(
             game_type=parsed_game_type
         )
         logger.info(f"Retrieved {len(game_dtos)} games with filters")
-    else:
-        game_dtos = game_service.get_all_games()
-        logger.info(f"Retrieved all games: {len(game_dtos)} games")
-
-    return [GameResponse(
-        id=dto.id,
-        title=dto.title,
-        series_number=dto.series_number,
-        release_year=dto.release_year,
-        game_type=dto.game_type if hasattr(dto, 'game_type') else 'main_series'
-    ) for dto in game_dtos]
+        return TrustedJSONResponse(content=[_to_payload(dto) for dto in game_dtos])
+
+    # 全件一覧はほとんど変更されないため、事前圧縮済みのレスポンスを再利用
+    # 期限切れ直後の同時リクエストは読み込みを1回にまとめ、期限切れ後しばらくは古い一覧を返しながら更新する
+    load = lambda: refresh_games_payload(session_factory)
+    payload = await catalog_response_cache.get_or_load(GAMES_CACHE_KEY, load, refresher=load)
+    return PrecompressedResponse(payload)
 
 
 
@@ -0,0 +1,57 @@
+"""
+ヘルスチェックAPI
+
+- GET /healthz: liveness（プロセスが応答できるか。依存サービスは確認しない）
+- GET /readyz: readiness（ウォームアップ完了・DB接続・接続プールの空き。準備未完了の場合は503）
+"""
+from fastapi import APIRouter, status
+from application.services.game_character_service import GameCharacterService
+from application.services.game_service import GameService
+from infrastructure.database.connection import SessionLocal
+from infrastructure.database.repositories.game_character_repository_impl import GameCharacterRepositoryImpl
+from infrastructure.database.repositories.game_repository_impl import GameRepositoryImpl
+from infrastructure.http.precompressed import catalog_response_cache
+from infrastructure.server.readiness import worker_readiness
+from .game_characters import CHARACTERS_CACHE_KEY_PREFIX, build_game_characters_payload
+from .games import GAMES_CACHE_KEY, build_games_payload
+from ..responses import TrustedJSONResponse
+
+router = APIRouter()
+
+
+def preload_catalog() -> int:
+    """
+    カタログ（ゲーム一覧・ゲーム別機体一覧）のレスポンスを事前圧縮してキャッシュ（ワーカーのウォームアップ用）
+
+    Returns:
+        キャッシュしたレスポンス数
+    """
+    db = SessionLocal()
+    try:
+        game_service = GameService(GameRepositoryImpl(db))
+        character_service = GameCharacterService(GameCharacterRepositoryImpl(db))
+        catalog_response_cache.set(GAMES_CACHE_KEY, build_games_payload(game_service))
+        game_ids = [game.id for game in game_service.get_all_games()]
+        for game_id in game_ids:
+            catalog_response_cache.set(
+                f"{CHARACTERS_CACHE_KEY_PREFIX}{game_id}", build_game_characters_payload(character_service, game_id)
+            )
+        return 1 + len(game_ids)
+    finally:
+        db.close()
+
+
+@router.get("/healthz")
+async def healthz():
+    """liveness（プロセスが応答できれば200）"""
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz():
+    """readiness（全項目を満たす場合は200、満たさない場合は503と項目ごとの結果）"""
+    result = await worker_readiness.check()
+    return TrustedJSONResponse(
+        content={"status": "ready" if result["ready"] else "not_ready", "checks": result["checks"]},
+        status_code=status.HTTP_200_OK if result["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -0,0 +1,41 @@
+"""
+ランキングAPI
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from application.services.ranking_service import RankingService
+from domain.entities.user import User
+from ..dependencies import get_ranking_service, get_current_user
+from ..responses import TrustedJSONResponse
+from ...schemas.ranking_schema import LeaderboardResponse, UserRankResponse
+from infrastructure.ranking.constants import RankingConstants
+from infrastructure.logging.logger import LoggerFactory
+
+router = APIRouter()
+logger = LoggerFactory.get_logger(__name__)
+
+
+@router.get("", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    game_id: Optional[int] = Query(None, description="作品ID（省略時は全作品合計）"),
+    page: int = Query(1, ge=1, description="ページ番号"),
+    per_page: int = Query(
+        RankingConstants.DEFAULT_PAGE_SIZE, ge=1, le=RankingConstants.MAX_PAGE_SIZE, description="1ページの件数"
+    ),
+    current_user: User = Depends(get_current_user),
+    ranking_service: RankingService = Depends(get_ranking_service)
+):
+    """達成スコアのリーダーボード取得（同点は同順位）"""
+    logger.debug(f"Get leaderboard: game_id={game_id}, page={page}, per_page={per_page}")
+    return TrustedJSONResponse(content=ranking_service.get_leaderboard(game_id, page, per_page))
+
+
+@router.get("/me", response_model=UserRankResponse)
+async def get_my_rank(
+    game_id: Optional[int] = Query(None, description="作品ID（省略時は全作品合計）"),
+    current_user: User = Depends(get_current_user),
+    ranking_service: RankingService = Depends(get_ranking_service)
+):
+    """自分の達成スコアと順位を取得"""
+    logger.debug(f"Get my rank: user_id={current_user.id}, game_id={game_id}")
+    return TrustedJSONResponse(content=ranking_service.get_user_rank(current_user.id, game_id))
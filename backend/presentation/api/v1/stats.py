@@ -0,0 +1,52 @@
+from typing import Callable, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from application.services.clear_stats_service import ClearStatsService
+from ..responses import TrustedJSONResponse
+from ...schemas.stats_schema import ClearRarityResponse
+from infrastructure.database.connection import get_session_factory
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.http.precompressed import PrecompressedPayload, PrecompressedResponse, catalog_response_cache
+from infrastructure.jobs.constants import ClearStatsConstants
+from infrastructure.logging.logger import LoggerFactory
+
+router = APIRouter()
+logger = LoggerFactory.get_logger(__name__)
+
+
+def build_clear_rarity_payload(clear_stats_service: ClearStatsService, game_id: Optional[int]) -> PrecompressedPayload:
+    """達成率の集計結果を事前圧縮"""
+    rarity = clear_stats_service.get_rarity(game_id)
+    logger.debug(f"Built clear rarity response: game_id={game_id}, rows={len(rarity['stats'])}")
+    return PrecompressedPayload.build(TrustedJSONResponse(content=rarity).body)
+
+
+def refresh_clear_rarity_payload(
+    game_id: Optional[int], session_factory: Callable[[], Session]
+) -> PrecompressedPayload:
+    """キャッシュの読み込み・バックグラウンド更新用（リクエストのDBセッションを使わずに作成）"""
+    db = session_factory()
+    try:
+        return build_clear_rarity_payload(ClearStatsService(ClearStatsRepositoryImpl(db)), game_id)
+    finally:
+        db.close()
+
+
+@router.get("/rarity", response_model=ClearRarityResponse)
+async def get_clear_rarity(
+    game_id: Optional[int] = Query(None, description="作品IDで絞り込み"),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
+):
+    """
+    クリア条件ごとの達成率取得（認証不要）
+
+    定期集計ジョブが作成した集計結果を返します。
+    集計結果は次の集計まで変わらないため、事前圧縮済みのレスポンスを再利用します。
+    集計後のキャッシュ破棄の直後に届いた同時リクエストは、集計結果の読み込みを1回にまとめます。
+    """
+    cache_key = f"{ClearStatsConstants.CACHE_KEY_PREFIX}{game_id if game_id is not None else 'all'}"
+    load = lambda: refresh_clear_rarity_payload(game_id, session_factory)
+    payload = await catalog_response_cache.get_or_load(cache_key, load, refresher=load)
+    response = PrecompressedResponse(payload)
+    response.headers["Cache-Control"] = f"public, max-age={ClearStatsConstants.CACHE_MAX_AGE_SECONDS}"
+    return response
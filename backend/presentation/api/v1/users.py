@@ -5,12 +5,13 @@ from typing import List
 
 from infrastructure.database.connection import get_db
 from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.repositories.email_outbox_repository_impl import EmailOutboxRepositoryImpl
 from infrastructure.security.auth_middleware import get_current_active_user
 from application.services.user_service import UserService
 from application.dtos.user_dto import CreateUserDto, UpdateUserDto, LoginRequestDto
 from presentation.schemas.user_schema import UserCreate, UserUpdate, UserResponse, LoginRequest, TokenResponse, EmailVerificationRequest, ResendVerificationRequest, MessageResponse
 from domain.entities.user import User
-from infrastructure.logging.logger import LoggerFactory, security_logger
+from infrastructure.logging.logger import LoggerFactory
 from infrastructure.logging.constants import LoggingConstants
 
 router = APIRouter()
@@ -19,7 +20,8 @@ logger = LoggerFactory.get_logger(__name__)
 
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     user_repository = UserRepositoryImpl(db)
-    return UserService(user_repository)
+    # 認証メールはユーザーの作成・更新と同じトランザクションで送信キューに登録する
+    return UserService(user_repository, email_outbox=EmailOutboxRepositoryImpl(db))
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
@@ -45,7 +47,7 @@ def register_user(
         access_token = jwt_handler.create_access_token(data={"sub": user_response.username})
 
         # セキュリティログ記録
-        security_logger.log_security_event(
+        LoggerFactory.get_security_logger().log_security_event(
             event_type=LoggingConstants.EVENT_TYPE_REGISTRATION,
             user_id=user_response.id,
             username=user_response.username,
@@ -98,7 +100,7 @@ def login(
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
         # セキュリティログ記録（成功）
-        security_logger.log_security_event(
+        LoggerFactory.get_security_logger().log_security_event(
             event_type=LoggingConstants.EVENT_TYPE_LOGIN_SUCCESS,
             user_id=user_response.id,
             username=user_response.username,
@@ -125,7 +127,7 @@ def login(
         )
     except ValueError as e:
         # セキュリティログ記録（失敗）
-        security_logger.log_security_event(
+        LoggerFactory.get_security_logger().log_security_event(
             event_type=LoggingConstants.EVENT_TYPE_LOGIN_FAILURE,
             username=form_data.username,
             ip_address=request.client.host if request and request.client else None,
@@ -200,7 +202,7 @@ def verify_email(
         user_service.verify_email(verification_data.token)
 
         # セキュリティログ記録
-        security_logger.log_security_event(
+        LoggerFactory.get_security_logger().log_security_event(
             event_type=LoggingConstants.EVENT_TYPE_EMAIL_VERIFICATION,
             ip_address=request.client.host if request.client else None,
             status_code=status.HTTP_200_OK,
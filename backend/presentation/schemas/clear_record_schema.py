@@ -2,7 +2,7 @@
 クリア記録のPydanticスキーマ
 """
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date, datetime
 
 class ClearRecordBase(BaseModel):
@@ -43,4 +43,43 @@ class ClearRecordResponse(ClearRecordBase):
     last_updated_at: Optional[datetime]
 
 class ClearRecordBatch(BaseModel):
-    records: List[ClearRecordCreate]
\ No newline at end of file
+    records: List[ClearRecordCreate]
+
+class ClearRecordChangeResponse(BaseModel):
+    """クリア記録の変更（old_flagsがNoneは作成、new_flagsがNoneは削除）"""
+    seq: int
+    record_id: int
+    game_id: int
+    character_name: str
+    difficulty: str
+    mode: str
+    old_flags: Optional[int]
+    new_flags: Optional[int]
+    changed_at: datetime
+
+class ClearRecordChangesResponse(BaseModel):
+    """差分同期のレスポンス"""
+    changes: List[ClearRecordChangeResponse]
+    latest_seq: int
+    has_more: bool
+    resync_required: bool
+
+class ClearAchievementResponse(BaseModel):
+    """クリア条件の初回達成日時"""
+    condition: str
+    achieved_at: datetime
+
+class ClearRecordHistoryResponse(BaseModel):
+    """クリア記録の達成履歴"""
+    record_id: int
+    achievements: List[ClearAchievementResponse]
+
+class ClearProgressMonthResponse(BaseModel):
+    """月末時点の条件ごとの累計達成数"""
+    month: str
+    counts: Dict[str, int]
+
+class ClearProgressGameResponse(BaseModel):
+    """作品ごとの月別累計達成数"""
+    game_id: int
+    months: List[ClearProgressMonthResponse]
@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import datetime
+
+class JobRunResponse(BaseModel):
+    started_at: datetime
+    status: str
+    duration_ms: Optional[float] = None
+    rows: Dict[str, int] = {}
+    error: Optional[str] = None
+
+class JobMetricsResponse(BaseModel):
+    runs: int
+    failures: int
+    rows_total: Dict[str, int]
+    last_duration_ms: Optional[float] = None
+    max_duration_ms: Optional[float] = None
+    last_run_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+class ScheduledJobStatus(BaseModel):
+    name: str
+    schedule: str
+    leader_only: bool
+    max_concurrency: int
+    running: int
+    next_run_at: Optional[datetime] = None
+    is_leader: Optional[bool] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    metrics: Optional[JobMetricsResponse] = None
+    history: List[JobRunResponse]
+
+class JobSchedulerStatus(BaseModel):
+    worker: str
+    running: bool
+    jobs: List[ScheduledJobStatus]
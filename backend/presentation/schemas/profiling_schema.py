@@ -0,0 +1,25 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+from datetime import datetime
+
+class ProfileReportSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    request_id: str
+    method: str
+    path: str
+    profiler: str
+    duration_ms: float
+    created_at: datetime
+
+class ProfileReportResponse(ProfileReportSummary):
+    report: str
+
+class SamplingProfilerStart(BaseModel):
+    interval_ms: float = Field(10.0, ge=1.0, le=1000.0, description="サンプリング間隔（ミリ秒）")
+
+class SamplingProfilerStatus(BaseModel):
+    running: bool
+    interval_ms: float
+    sample_count: int
+    started_at: Optional[datetime] = None
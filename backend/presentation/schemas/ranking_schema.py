@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class LeaderboardEntryResponse(BaseModel):
+    rank: int
+    user_id: int
+    username: str
+    score: int
+
+class LeaderboardResponse(BaseModel):
+    game_id: Optional[int] = None
+    page: int
+    per_page: int
+    total: int
+    entries: List[LeaderboardEntryResponse]
+
+class UserRankResponse(BaseModel):
+    game_id: Optional[int] = None
+    user_id: int
+    score: int
+    rank: Optional[int] = None
+    total: int
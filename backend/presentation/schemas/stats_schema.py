@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+class ClearConditionRarityResponse(BaseModel):
+    game_id: int
+    character_name: str
+    difficulty: str
+    mode: str
+    condition: str
+    achieved_count: int
+    rate: float
+
+class ClearRarityResponse(BaseModel):
+    active_users: int
+    built_at: Optional[datetime] = None
+    stats: List[ClearConditionRarityResponse]
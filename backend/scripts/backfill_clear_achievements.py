@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+クリア条件達成履歴の初期データ作成スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+達成履歴の記録を始める前から存在するクリア記録について、ONになっている条件の
+初回達成日時を推定して clear_achievements に登録し、月別集計（clear_progress_monthly）を作り直します。
+通常クリアはクリア日、それ以外の条件は最終更新日時（なければ作成日時）を達成日時とします。
+既に記録済みの達成履歴は変更しません。
+
+Usage:
+    python scripts/backfill_clear_achievements.py [--user-id N]
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import datetime, time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
+from infrastructure.database.connection import Base, engine, get_db
+from infrastructure.database.models import ClearAchievementModel, ClearProgressMonthlyModel, ClearRecordModel
+
+
+def _estimated_achieved_at(record: ClearRecordModel, condition: str) -> datetime:
+    """既存記録の初回達成日時を推定"""
+    if condition == "is_cleared" and record.cleared_at:
+        return datetime.combine(record.cleared_at, time())
+    return record.last_updated_at or record.created_at or datetime.now()
+
+
+def backfill(db, user_id=None) -> int:
+    """
+    既存記録の達成履歴を登録し、月別集計を作り直す
+
+    Returns:
+        登録した達成履歴の件数
+    """
+    records = db.query(ClearRecordModel)
+    achievements = db.query(ClearAchievementModel)
+    if user_id is not None:
+        records = records.filter(ClearRecordModel.user_id == user_id)
+        achievements = achievements.filter(ClearAchievementModel.user_id == user_id)
+
+    recorded = {
+        (a.user_id, a.game_id, a.character_name, a.difficulty, a.mode, a.condition)
+        for a in achievements.all()
+    }
+    added = 0
+    for record in records.yield_per(1000):
+        for condition in CLEAR_FLAG_FIELDS:
+            key = (record.user_id, record.game_id, record.character_name, record.difficulty,
+                   record.mode or "normal", condition)
+            if not getattr(record, condition) or key in recorded:
+                continue
+            db.add(ClearAchievementModel(
+                user_id=record.user_id,
+                game_id=record.game_id,
+                character_name=record.character_name,
+                difficulty=record.difficulty,
+                mode=record.mode or "normal",
+                condition=condition,
+                achieved_at=_estimated_achieved_at(record, condition)
+            ))
+            recorded.add(key)
+            added += 1
+    db.flush()
+
+    # 月別集計を達成履歴から作り直す
+    buckets = Counter(
+        (a.user_id, a.game_id, a.achieved_at.strftime("%Y-%m"), a.condition)
+        for a in achievements.all()
+    )
+    monthly = db.query(ClearProgressMonthlyModel)
+    if user_id is not None:
+        monthly = monthly.filter(ClearProgressMonthlyModel.user_id == user_id)
+    monthly.delete(synchronize_session=False)
+    db.add_all(
+        ClearProgressMonthlyModel(user_id=u, game_id=g, month=m, condition=c, count=count)
+        for (u, g, m, c), count in buckets.items()
+    )
+    db.commit()
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description='クリア条件達成履歴の初期データ作成スクリプト')
+    parser.add_argument('--user-id', type=int, help='対象ユーザーID（省略時は全ユーザー）')
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = next(get_db())
+    try:
+        added = backfill(db, args.user_id)
+        print(f"✅ {added}件の達成履歴を登録し、月別集計を作り直しました")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ エラーが発生しました: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+クリア記録変更ログ圧縮スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+保持期間を過ぎた clear_record_changes の行を、小さなトランザクションに分けて削除します。
+アプリケーションの起動中はジョブスケジューラーが定期的に実行します（CHANGE_LOG_COMPACTION_SCHEDULE）。
+手動で実行する場合や、スケジューラーを無効にした構成で使用してください。
+
+Usage:
+    python scripts/compact_clear_record_changes.py [--retention-days N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from application.services.clear_record_service import ClearRecordService
+from infrastructure.database.connection import get_db
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from infrastructure.realtime.constants import ChangeLogConstants
+
+
+def main():
+    parser = argparse.ArgumentParser(description='クリア記録変更ログ圧縮スクリプト')
+    parser.add_argument('--retention-days', type=int, default=ChangeLogConstants.RETENTION_DAYS,
+                        help=f'保持期間（日、デフォルト: {ChangeLogConstants.RETENTION_DAYS}）')
+    parser.add_argument('--batch-size', type=int, default=ChangeLogConstants.COMPACTION_BATCH_SIZE,
+                        help=f'1トランザクションで削除する件数（デフォルト: {ChangeLogConstants.COMPACTION_BATCH_SIZE}）')
+    args = parser.parse_args()
+
+    db = next(get_db())
+    try:
+        service = ClearRecordService(ClearRecordRepositoryImpl(db))
+        deleted = asyncio.run(service.compact_changes(args.retention_days, args.batch_size))
+        print(f"✅ {deleted}件の変更ログを削除しました（保持期間: {args.retention_days}日）")
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
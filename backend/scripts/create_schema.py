@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+データベーススキーマ作成スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+DATABASE_URL のデータベースに未作成のテーブル・インデックスを作成します（既存のテーブルは変更しません）。
+本番環境ではAPIサーバーの起動前（デプロイ時）に1回実行し、DB_AUTO_CREATE_SCHEMA=false で起動してください。
+
+Usage:
+    python scripts/create_schema.py
+"""
+
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from infrastructure.database.schema import create_schema
+
+
+def main():
+    try:
+        create_schema()
+        print("✅ スキーマを作成しました")
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
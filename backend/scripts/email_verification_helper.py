@@ -25,6 +25,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from infrastructure.database.connection import get_db
 from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.repositories.user_cleanup_repository_impl import UserCleanupRepositoryImpl
+from application.services.verification_sweep_service import VerificationSweepService
+from infrastructure.jobs.constants import VerificationSweepConstants
 
 
 class EmailVerificationHelper:
@@ -170,31 +173,15 @@ class EmailVerificationHelper:
         print('=' * 80)
     
     def cleanup_expired_tokens(self):
-        """期限切れトークンをクリーンアップ"""
+        """期限切れトークンをクリーンアップ（APIサーバーの定期ジョブと同じ一括処理）"""
         print('🧹 期限切れトークンのクリーンアップを開始...')
         
-        users = self.repo.get_all()
-        now = datetime.utcnow()
-        expired_count = 0
-        
-        for user in users:
-            if (user.verification_token and 
-                user.verification_token_expires_at and 
-                user.verification_token_expires_at < now):
-                
-                print(f'期限切れトークンを削除: {user.username} (期限: {user.verification_token_expires_at})')
-                
-                # トークンをクリア
-                user.verification_token = None
-                user.verification_token_expires_at = None
-                user.updated_at = now
-                
-                # データベースに保存
-                self.db.commit()
-                expired_count += 1
+        service = VerificationSweepService(UserCleanupRepositoryImpl(self.db))
+        result = service.sweep(VerificationSweepConstants.BATCH_SIZE)
+        expired_count = result["expired_tokens_cleared"]
         
         if expired_count > 0:
-            print(f'✅ {expired_count}個の期限切れトークンを削除しました。')
+            print(f'✅ {expired_count}個の期限切れトークンを削除しました。（{result["duration_ms"]:.0f}ms）')
         else:
             print('✅ 期限切れトークンはありませんでした。')
 
@@ -29,6 +29,26 @@ from infrastructure.security.token_generator import TokenGenerator
 # データベースファイルのパス
 DB_PATH = Path(__file__).parent.parent / "touhou_clear_checker.db"
 
+# 東方シリーズゲーム（第6作〜第20作）
+GAMES_DATA = [
+    ('東方紅魔郷', 6.0, 2002, 'main_series'),
+    ('東方妖々夢', 7.0, 2003, 'main_series'),
+    ('東方永夜抄', 8.0, 2004, 'main_series'),
+    ('東方花映塚', 9.0, 2005, 'versus'),
+    ('東方風神録', 10.0, 2007, 'main_series'),
+    ('東方地霊殿', 11.0, 2008, 'main_series'),
+    ('東方星蓮船', 12.0, 2009, 'main_series'),
+    ('妖精大戦争', 12.8, 2010, 'spin_off_stg'),
+    ('東方神霊廟', 13.0, 2011, 'main_series'),
+    ('東方輝針城', 14.0, 2013, 'main_series'),
+    ('東方紺珠伝', 15.0, 2015, 'main_series'),
+    ('東方天空璋', 16.0, 2017, 'main_series'),
+    ('東方鬼形獣', 17.0, 2019, 'main_series'),
+    ('東方虹龍洞', 18.0, 2021, 'main_series'),
+    ('東方獣王園', 19.0, 2023, 'versus'),
+    ('東方錦上京', 20.0, 2025, 'main_series')
+]
+
 
 class DatabaseInitializer:
     """データベース初期化クラス"""
@@ -63,6 +83,8 @@ class DatabaseInitializer:
             
             # usersテーブルのインデックス
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_verification_token ON users(verification_token)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_users_verification_token_expires_at ON users(verification_token_expires_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_unverified_created ON users(email_verified, created_at)")
             print("✅ users テーブル作成完了")
             
             # 2. games テーブル
@@ -147,6 +169,124 @@ class DatabaseInitializer:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_game_memos_user_game ON game_memos(user_id, game_id)")
             print("✅ game_memos テーブル作成完了")
             
+            # 6. clear_record_changes テーブル（差分同期用の変更ログ）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clear_record_changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    record_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    character_name VARCHAR(100) NOT NULL,
+                    difficulty VARCHAR(20) NOT NULL,
+                    mode VARCHAR(20) NOT NULL DEFAULT 'normal',
+                    old_flags INTEGER,
+                    new_flags INTEGER,
+                    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_clear_record_changes_user_seq ON clear_record_changes(user_id, seq)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_clear_record_changes_changed_at ON clear_record_changes(changed_at)")
+            print("✅ clear_record_changes テーブル作成完了")
+            
+            # 7. clear_achievements / clear_progress_monthly テーブル（初回達成日時・進捗グラフ用）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clear_achievements (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    character_name VARCHAR(100) NOT NULL,
+                    difficulty VARCHAR(20) NOT NULL,
+                    mode VARCHAR(20) NOT NULL DEFAULT 'normal',
+                    condition VARCHAR(30) NOT NULL,
+                    achieved_at TIMESTAMP NOT NULL,
+                    UNIQUE(user_id, game_id, character_name, difficulty, mode, condition)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clear_progress_monthly (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    month VARCHAR(7) NOT NULL,
+                    condition VARCHAR(30) NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    UNIQUE(user_id, game_id, month, condition)
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_clear_progress_monthly_user_game ON clear_progress_monthly(user_id, game_id, month)")
+            print("✅ clear_achievements / clear_progress_monthly テーブル作成完了")
+            
+            # 8. clear_condition_stats / clear_stats_snapshots テーブル（全ユーザーの達成率統計）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clear_condition_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    game_id INTEGER NOT NULL,
+                    character_name VARCHAR(100) NOT NULL,
+                    difficulty VARCHAR(20) NOT NULL,
+                    mode VARCHAR(20) NOT NULL DEFAULT 'normal',
+                    condition VARCHAR(30) NOT NULL,
+                    achieved_count INTEGER NOT NULL DEFAULT 0,
+                    UNIQUE(game_id, character_name, difficulty, mode, condition)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clear_stats_snapshots (
+                    id INTEGER PRIMARY KEY,
+                    active_users INTEGER NOT NULL DEFAULT 0,
+                    last_change_seq BIGINT NOT NULL DEFAULT 0,
+                    full_rebuild BOOLEAN NOT NULL DEFAULT 1,
+                    duration_ms FLOAT NOT NULL DEFAULT 0,
+                    built_at TIMESTAMP NOT NULL
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_clear_condition_stats_game ON clear_condition_stats(game_id)")
+            print("✅ clear_condition_stats / clear_stats_snapshots テーブル作成完了")
+            
+            # 9. user_scores テーブル（ランキング用の達成スコア、game_id=0は全作品合計）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_scores (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    game_id INTEGER NOT NULL,
+                    score INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(user_id, game_id)
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_scores_game_score ON user_scores(game_id, score, user_id)")
+            print("✅ user_scores テーブル作成完了")
+            
+            # 10. email_outbox テーブル（送信待ちのメール、送信ワーカーが非同期に送信）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    to_email VARCHAR(255) NOT NULL,
+                    subject VARCHAR(255) NOT NULL,
+                    text_body TEXT NOT NULL,
+                    html_body TEXT NOT NULL,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    locked_until TIMESTAMP,
+                    last_error TEXT,
+                    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    sent_at TIMESTAMP
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_email_outbox_status_next_attempt ON email_outbox(status, next_attempt_at)")
+            print("✅ email_outbox テーブル作成完了")
+            
+            # 11. job_leases テーブル（定期ジョブの実行権、複数ワーカーのうち1つだけが実行する）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS job_leases (
+                    job_name VARCHAR(100) PRIMARY KEY,
+                    owner VARCHAR(100) NOT NULL,
+                    acquired_at TIMESTAMP NOT NULL,
+                    expires_at TIMESTAMP NOT NULL
+                )
+            """)
+            print("✅ job_leases テーブル作成完了")
+            
             conn.commit()
             
         except Exception as e:
@@ -168,32 +308,12 @@ class DatabaseInitializer:
             cursor.execute("DELETE FROM game_characters")
             cursor.execute("DELETE FROM games")
             
-            # 東方シリーズゲーム（第6作〜第20作）
-            games_data = [
-                ('東方紅魔郷', 6.0, 2002, 'main_series'),
-                ('東方妖々夢', 7.0, 2003, 'main_series'),
-                ('東方永夜抄', 8.0, 2004, 'main_series'),
-                ('東方花映塚', 9.0, 2005, 'versus'),
-                ('東方風神録', 10.0, 2007, 'main_series'),
-                ('東方地霊殿', 11.0, 2008, 'main_series'),
-                ('東方星蓮船', 12.0, 2009, 'main_series'),
-                ('妖精大戦争', 12.8, 2010, 'spin_off_stg'),
-                ('東方神霊廟', 13.0, 2011, 'main_series'),
-                ('東方輝針城', 14.0, 2013, 'main_series'),
-                ('東方紺珠伝', 15.0, 2015, 'main_series'),
-                ('東方天空璋', 16.0, 2017, 'main_series'),
-                ('東方鬼形獣', 17.0, 2019, 'main_series'),
-                ('東方虹龍洞', 18.0, 2021, 'main_series'),
-                ('東方獣王園', 19.0, 2023, 'versus'),
-                ('東方錦上京', 20.0, 2025, 'main_series')
-            ]
-            
             cursor.executemany("""
                 INSERT INTO games (title, series_number, release_year, game_type)
                 VALUES (?, ?, ?, ?)
-            """, games_data)
+            """, GAMES_DATA)
             
-            print(f"✅ {len(games_data)}作品のゲームデータ投入完了")
+            print(f"✅ {len(GAMES_DATA)}作品のゲームデータ投入完了")
             conn.commit()
             
         except Exception as e:
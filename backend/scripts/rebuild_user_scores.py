@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+達成スコア再計算スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+全クリア記録から user_scores（作品別・全作品合計の達成スコア）を計算し直します。
+ランキング導入時と、domain/constants/ranking_constants.py の重みを変更した後に実行してください。
+実行中のAPIサーバーの順位インデックスは RANKING_INDEX_TTL_SECONDS 経過後に反映されます。
+
+Usage:
+    python scripts/rebuild_user_scores.py
+"""
+
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from application.services.ranking_service import RankingService
+from infrastructure.database.connection import get_db
+from infrastructure.database.repositories.ranking_repository_impl import RankingRepositoryImpl
+
+
+def main():
+    db = next(get_db())
+    try:
+        user_count = RankingService(RankingRepositoryImpl(db)).rebuild_scores()
+        print(f"✅ {user_count}人の達成スコアを再計算しました")
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+クリア条件達成率統計集計スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+APIサーバーの定期集計（CLEAR_STATS_REFRESH_ENABLED）を無効にしている環境で、
+cron等から達成率統計を集計します。初回や集計結果の修復には --full を指定してください。
+
+Usage:
+    python scripts/refresh_clear_stats.py [--full] [--batch-size N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from application.services.clear_stats_service import ClearStatsService
+from infrastructure.database.connection import get_db
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.jobs.constants import ClearStatsConstants
+
+
+def main():
+    parser = argparse.ArgumentParser(description='クリア条件達成率統計集計スクリプト')
+    parser.add_argument('--full', action='store_true', help='全クリア記録から集計し直す')
+    parser.add_argument('--batch-size', type=int, default=ClearStatsConstants.CHANGE_BATCH_SIZE,
+                        help=f'増分集計で1回に読み込む変更ログの件数（デフォルト: {ClearStatsConstants.CHANGE_BATCH_SIZE}）')
+    args = parser.parse_args()
+
+    db = next(get_db())
+    try:
+        service = ClearStatsService(ClearStatsRepositoryImpl(db))
+        result = service.refresh(args.batch_size, force_full=args.full)
+        kind = "全件集計" if result["full_rebuild"] else f"増分集計（{result['applied_changes']}件の変更を反映）"
+        print(f"✅ {kind}が完了しました（分母: {result['active_users']}人, {result['duration_ms']:.0f}ms）")
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+本番サーバー起動スクリプト
+東方プロジェクトクリア状況チェッカー用
+
+APIサーバーを複数のワーカープロセスで起動します。パスワードハッシュ（Argon2）などのCPU処理が
+1つのコアで全リクエストと競合しないよう、既定では利用可能なCPUコア数だけワーカーを起動します。
+gunicornがインストールされている場合はgunicorn＋uvicornワーカー、未インストールの場合は uvicorn --workers で起動します。
+ワーカーごとの準備（DB接続・キャッシュのウォームアップ）は各ワーカーのlifespanで実行されます。
+
+Usage:
+    python server.py [--workers N] [--runner gunicorn|uvicorn] [--host HOST] [--port PORT]
+
+設定は環境変数（infrastructure/server/constants.py）で変更でき、コマンドライン引数が優先されます。
+"""
+import argparse
+import os
+from typing import Any, Dict
+
+from infrastructure.server.constants import ServerConstants
+
+try:
+    import gunicorn
+except ImportError:  # pragma: no cover - 任意依存
+    gunicorn = None
+
+APP = "main:app"
+GUNICORN_WORKER_CLASS = "infrastructure.server.gunicorn_worker.TunedUvicornWorker"
+
+
+def available_cpu_count() -> int:
+    """このプロセスが使用できるCPUコア数（コンテナのCPUアフィニティを考慮）"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - sched_getaffinityのないOS
+        return os.cpu_count() or 1
+
+
+def resolve_workers(workers: int) -> int:
+    """ワーカー数を決定（0以下の場合はCPUコア数）"""
+    return workers if workers > 0 else available_cpu_count()
+
+
+def resolve_runner(runner: str) -> str:
+    """
+    起動方式を決定
+
+    Raises:
+        RuntimeError: gunicornを指定したがインストールされていない場合
+        ValueError: 未対応の起動方式の場合
+    """
+    if runner == "auto":
+        return "gunicorn" if gunicorn is not None else "uvicorn"
+    if runner == "gunicorn" and gunicorn is None:
+        raise RuntimeError("gunicorn package is required for SERVER_RUNNER=gunicorn")
+    if runner not in ("gunicorn", "uvicorn"):
+        raise ValueError(f"Unsupported server runner: {runner}")
+    return runner
+
+
+def gunicorn_options(host: str, port: int, workers: int) -> Dict[str, Any]:
+    """gunicornの設定"""
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": GUNICORN_WORKER_CLASS,
+        "keepalive": ServerConstants.KEEPALIVE_SECONDS,
+        "backlog": ServerConstants.BACKLOG,
+        "max_requests": ServerConstants.MAX_REQUESTS,
+        "max_requests_jitter": ServerConstants.MAX_REQUESTS_JITTER,
+        "graceful_timeout": ServerConstants.GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": ServerConstants.WORKER_TIMEOUT_SECONDS,
+        "accesslog": "-" if ServerConstants.ACCESS_LOG else None,
+        # アプリはワーカーごとに読み込む（フォーク前にDB接続やスレッドを作らない）
+        "preload_app": False,
+    }
+
+
+def uvicorn_options(host: str, port: int, workers: int) -> Dict[str, Any]:
+    """
+    uvicornの設定
+
+    uvicornはワーカーごとの揺らぎに対応しないため、再起動までのリクエスト数は全ワーカー共通です。
+    """
+    return {
+        "host": host,
+        "port": port,
+        "workers": workers,
+        "loop": ServerConstants.LOOP,
+        "http": ServerConstants.HTTP,
+        "timeout_keep_alive": ServerConstants.KEEPALIVE_SECONDS,
+        "backlog": ServerConstants.BACKLOG,
+        "limit_max_requests": ServerConstants.MAX_REQUESTS or None,
+        "timeout_graceful_shutdown": ServerConstants.GRACEFUL_TIMEOUT_SECONDS,
+        "access_log": ServerConstants.ACCESS_LOG,
+    }
+
+
+def run_gunicorn(options: Dict[str, Any]) -> None:
+    """gunicorn＋uvicornワーカーで起動"""
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+            return app
+
+    Application().run()
+
+
+def run_uvicorn(options: Dict[str, Any]) -> None:
+    """uvicorn --workers で起動"""
+    import uvicorn
+
+    uvicorn.run(APP, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本番サーバー起動スクリプト')
+    parser.add_argument('--workers', type=int, default=ServerConstants.WORKERS,
+                        help='ワーカー数（0の場合はCPUコア数、デフォルト: WEB_CONCURRENCY）')
+    parser.add_argument('--runner', default=ServerConstants.RUNNER, choices=['auto', 'gunicorn', 'uvicorn'],
+                        help='起動方式（デフォルト: SERVER_RUNNER）')
+    parser.add_argument('--host', default=ServerConstants.HOST, help='バインドするホスト')
+    parser.add_argument('--port', type=int, default=ServerConstants.PORT, help='バインドするポート')
+    args = parser.parse_args()
+
+    runner = resolve_runner(args.runner)
+    workers = resolve_workers(args.workers)
+    print(f"🚀 {runner}で起動します: {args.host}:{args.port} workers={workers}")
+    if runner == "gunicorn":
+        run_gunicorn(gunicorn_options(args.host, args.port, workers))
+    else:
+        run_uvicorn(uvicorn_options(args.host, args.port, workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,24 @@
+import os
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
-from infrastructure.database.connection import Base, get_db
+
+# テスト中は開発用DBに対する定期ジョブ（達成率統計の集計・認証トークンの掃除など）とメール送信ワーカーを起動しない
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+# テーブルはテスト用DBにdb_sessionフィクスチャで作成するため、起動時に開発用DBへスキーマを作成しない
+os.environ.setdefault("DB_AUTO_CREATE_SCHEMA", "false")
+os.environ.setdefault("SERVER_WARM_UP_ENABLED", "false")
+os.environ.setdefault("CLEAR_STATS_REFRESH_ENABLED", "false")
+os.environ.setdefault("EMAIL_OUTBOX_WORKER_ENABLED", "false")
+os.environ.setdefault("VERIFICATION_SWEEP_ENABLED", "false")
+# 同じクライアント（testclient）から繰り返しログインするため、レート制限を無効化
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from infrastructure.database.connection import Base, get_db, get_session_factory
+from infrastructure.http.precompressed import catalog_response_cache
+from infrastructure.realtime.change_feed import clear_record_change_feed
+from infrastructure.ranking.score_index import ranking_index
 from main import app
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -20,6 +36,29 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+# 同時リクエストで共有するキャッシュの読み込みもテスト用DBから行う
+app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+
+@pytest.fixture(autouse=True)
+def clear_catalog_response_cache():
+    """カタログレスポンスのキャッシュをテスト間で持ち越さない"""
+    catalog_response_cache.invalidate()
+    yield
+    catalog_response_cache.invalidate()
+
+@pytest.fixture(autouse=True)
+def clear_change_feed():
+    """クリア記録の変更ログをテスト間で持ち越さない"""
+    clear_record_change_feed.clear()
+    yield
+    clear_record_change_feed.clear()
+
+@pytest.fixture(autouse=True)
+def clear_ranking_index():
+    """順位インデックスをテスト間で持ち越さない"""
+    ranking_index.invalidate()
+    yield
+    ranking_index.invalidate()
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -0,0 +1,32 @@
+"""
+クエリ予算チェック用テストユーティリティ
+
+RequestTracingMiddlewareが付与するX-DB-Queriesヘッダーを利用して、
+エンドポイントが宣言したクエリ数を超えていないかを検証します。
+"""
+from infrastructure.logging.constants import LoggingConstants
+
+
+def assert_query_budget(response, max_queries: int) -> int:
+    """
+    レスポンスのクエリ数が予算以内であることを検証
+
+    Args:
+        response: TestClientのレスポンス
+        max_queries: 許容する最大クエリ数
+
+    Returns:
+        実際に発行されたクエリ数
+    """
+    header_value = response.headers.get(LoggingConstants.DB_QUERY_HEADER_NAME)
+    assert header_value is not None, (
+        f"{LoggingConstants.DB_QUERY_HEADER_NAME} header is missing. "
+        "Set DB_QUERY_HEADER_ENABLED=true to enable query counting."
+    )
+
+    query_count = int(header_value)
+    assert query_count <= max_queries, (
+        f"{response.request.method} {response.request.url.path} issued {query_count} queries "
+        f"(budget: {max_queries})"
+    )
+    return query_count
@@ -2,6 +2,7 @@
 管理者APIの単体テスト
 """
 import pytest
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import Mock, AsyncMock, patch
 from fastapi import HTTPException, status
@@ -12,13 +13,17 @@ from presentation.api.v1.admin import (
     delete_game_by_series,
     admin_get_all_users,
     admin_update_user,
-    admin_delete_user
+    admin_delete_user,
+    admin_get_profile,
+    admin_start_sampler,
+    admin_get_jobs
 )
 from domain.entities.game import Game
 from domain.entities.user import User
 from domain.value_objects.game_type import GameType
 from presentation.schemas.game_schema import GameCreate, GameUpdate
 from presentation.schemas.user_schema import UserUpdate
+from presentation.schemas.profiling_schema import SamplingProfilerStart
 
 
 class TestAdminAPI:
@@ -478,4 +483,72 @@ class TestAdminAPI:
     # 理由：動的インポートのモック設定が複雑で、テスト実行時にAttributeErrorが発生
     # 対応策：admin.pyの実装方法を変更するか、より高度なモック技術を使用する必要がある
     # 影響：機能的には問題なし。管理者APIは動作するが、単体テストでの品質保証が不完全
-    # 優先度：中（実装は完了しているため、テストは後回し可能）
\ No newline at end of file
+    # 優先度：中（実装は完了しているため、テストは後回し可能）
+    # プロファイリングAPIテスト
+
+    @pytest.mark.asyncio
+    async def test_admin_get_profile_not_found(self):
+        """存在しないプロファイルレポート取得のテスト"""
+        with patch("presentation.api.v1.admin.profile_report_store") as mock_store:
+            mock_store.get.return_value = None
+
+            with pytest.raises(HTTPException) as exc_info:
+                await admin_get_profile(request_id="unknown", current_admin=self.sample_admin)
+
+            assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_admin_start_sampler_already_running(self):
+        """サンプリングプロファイラー二重起動のテスト"""
+        with patch("presentation.api.v1.admin.sampling_profiler") as mock_profiler:
+            mock_profiler.start.return_value = False
+
+            with pytest.raises(HTTPException) as exc_info:
+                await admin_start_sampler(
+                    options=SamplingProfilerStart(interval_ms=10),
+                    current_admin=self.sample_admin
+                )
+
+            assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+
+    # 定期ジョブAPIテスト
+
+    @pytest.mark.asyncio
+    async def test_admin_get_jobs(self):
+        """定期ジョブの状態・実行履歴とリースの保持者を返す"""
+        job_status = {
+            "name": "verification_sweep",
+            "schedule": "every 3600s",
+            "leader_only": True,
+            "max_concurrency": 1,
+            "running": 0,
+            "next_run_at": datetime(2024, 1, 1, 11, 0, 0),
+            "is_leader": True,
+            "history": [{
+                "started_at": datetime(2024, 1, 1, 10, 0, 0),
+                "status": "succeeded",
+                "duration_ms": 12.5,
+                "rows": {"expired_tokens_cleared": 3},
+                "error": None,
+            }],
+            "metrics": None,
+        }
+        lease = {
+            "job_name": "verification_sweep",
+            "owner": "host:1:abcd",
+            "acquired_at": datetime(2024, 1, 1, 10, 0, 0),
+            "expires_at": datetime(2024, 1, 1, 11, 0, 0),
+        }
+        with patch("presentation.api.v1.admin.job_scheduler") as mock_scheduler, \
+                patch("presentation.api.v1.admin.JobLeaseRepositoryImpl") as mock_repository_class:
+            mock_scheduler.owner = "host:1:abcd"
+            mock_scheduler.is_running = True
+            mock_scheduler.status.return_value = [job_status]
+            mock_repository_class.return_value.find_all.return_value = [lease]
+
+            result = await admin_get_jobs(current_admin=self.sample_admin, db=Mock())
+
+        assert result.worker == "host:1:abcd"
+        assert result.jobs[0].lease_owner == "host:1:abcd"
+        assert result.jobs[0].lease_expires_at == datetime(2024, 1, 1, 11, 0, 0)
+        assert result.jobs[0].history[0].rows == {"expired_tokens_cleared": 3}
@@ -1,12 +1,16 @@
 """
 クリア記録APIの単体テスト
 """
+import json
 import pytest
 from datetime import datetime, date
 from unittest.mock import Mock, AsyncMock
 from fastapi import HTTPException, status
 from presentation.api.v1.clear_records import (
     get_my_clear_records,
+    get_my_clear_record_changes,
+    get_my_clear_progress,
+    get_clear_record_history,
     get_clear_record_by_id,
     create_clear_record,
     update_clear_record,
@@ -15,6 +19,7 @@ from presentation.api.v1.clear_records import (
     batch_create_or_update_records,
     _to_response
 )
+from presentation.api.compact_format import COMPACT_MEDIA_TYPE
 from domain.entities.clear_record import ClearRecord
 from domain.entities.user import User
 from presentation.schemas.clear_record_schema import ClearRecordCreate, ClearRecordUpdate, ClearRecordBatch
@@ -56,6 +61,9 @@ class TestClearRecordsAPI:
             created_at=datetime(2024, 1, 1, 10, 0, 0)
         )
         
+        # サンプル一覧行（リポジトリの列のみの取得結果）
+        self.sample_row = _to_response(self.sample_record).model_dump()
+        
         # サンプル作成スキーマ
         self.sample_create_schema = ClearRecordCreate(
             game_id=1,
@@ -95,7 +103,7 @@ class TestClearRecordsAPI:
     @pytest.mark.asyncio
     async def test_get_my_clear_records_all(self):
         """全クリア記録取得のテスト"""
-        self.mock_service.get_user_clear_records = AsyncMock(return_value=[self.sample_record])
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[self.sample_row])
         
         result = await get_my_clear_records(
             game_id=None,
@@ -103,14 +111,15 @@ class TestClearRecordsAPI:
             clear_record_service=self.mock_service
         )
         
-        assert len(result) == 1
-        assert result[0].character_name == "霊夢"
-        self.mock_service.get_user_clear_records.assert_called_once_with(1)
+        body = json.loads(result.body)
+        assert len(body) == 1
+        assert body[0]["character_name"] == "霊夢"
+        self.mock_service.get_user_clear_record_rows.assert_called_once_with(1, None)
         
     @pytest.mark.asyncio
     async def test_get_my_clear_records_by_game(self):
         """ゲーム指定でクリア記録取得のテスト"""
-        self.mock_service.get_user_game_clear_records = AsyncMock(return_value=[self.sample_record])
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[self.sample_row])
         
         result = await get_my_clear_records(
             game_id=1,
@@ -118,9 +127,138 @@ class TestClearRecordsAPI:
             clear_record_service=self.mock_service
         )
         
-        assert len(result) == 1
-        assert result[0].game_id == 1
-        self.mock_service.get_user_game_clear_records.assert_called_once_with(1, 1)
+        body = json.loads(result.body)
+        assert len(body) == 1
+        assert body[0]["game_id"] == 1
+        self.mock_service.get_user_clear_record_rows.assert_called_once_with(1, 1)
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_records_matches_schema_output(self):
+        """高速パスのJSONがレスポンススキーマと同じ形式であること"""
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[self.sample_row])
+        
+        result = await get_my_clear_records(
+            game_id=None,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service
+        )
+        
+        assert json.loads(result.body) == [_to_response(self.sample_record).model_dump(mode="json")]
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_records_compact_format(self):
+        """?format=compact でコンパクト列指向フォーマットを返すテスト"""
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[self.sample_row])
+        
+        result = await get_my_clear_records(
+            game_id=None,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service,
+            format="compact"
+        )
+        
+        body = json.loads(result.body)
+        assert result.media_type == COMPACT_MEDIA_TYPE
+        assert result.headers["vary"] == "Accept"
+        assert body["count"] == 1
+        assert body["dictionaries"]["character_name"] == ["霊夢"]
+        assert body["columns"]["flags"] == [1]
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_records_compact_by_accept_header(self):
+        """Acceptヘッダーでコンパクトフォーマットを選択するテスト"""
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[self.sample_row])
+        
+        result = await get_my_clear_records(
+            game_id=None,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service,
+            accept=COMPACT_MEDIA_TYPE
+        )
+        
+        assert json.loads(result.body)["format"] == "compact"
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_records_unsupported_format(self):
+        """未対応のフォーマット指定で400エラーのテスト"""
+        self.mock_service.get_user_clear_record_rows = AsyncMock(return_value=[])
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await get_my_clear_records(
+                game_id=None,
+                current_user=self.sample_user,
+                clear_record_service=self.mock_service,
+                format="xml"
+            )
+        
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        self.mock_service.get_user_clear_record_rows.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_record_changes(self):
+        """差分同期のテスト"""
+        self.mock_service.get_clear_record_changes = AsyncMock(return_value={
+            "changes": [], "latest_seq": 5, "has_more": False, "resync_required": False
+        })
+        
+        result = await get_my_clear_record_changes(
+            since=5,
+            limit=100,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service
+        )
+        
+        assert json.loads(result.body)["latest_seq"] == 5
+        self.mock_service.get_clear_record_changes.assert_called_once_with(1, 5, 100)
+        
+    @pytest.mark.asyncio
+    async def test_get_my_clear_progress(self):
+        """進捗グラフ取得のテスト"""
+        self.mock_service.get_clear_progress = AsyncMock(return_value=[
+            {"game_id": 1, "months": [{"month": "2024-01", "counts": {"is_cleared": 1}}]}
+        ])
+        
+        result = await get_my_clear_progress(
+            game_id=None,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service
+        )
+        
+        assert json.loads(result.body)[0]["months"][0]["month"] == "2024-01"
+        self.mock_service.get_clear_progress.assert_called_once_with(1, None)
+        
+    @pytest.mark.asyncio
+    async def test_get_clear_record_history(self):
+        """達成履歴取得のテスト"""
+        self.mock_service.get_clear_record_by_id = AsyncMock(return_value=self.sample_record)
+        self.mock_service.get_clear_record_achievements = AsyncMock(return_value=[
+            {"condition": "is_cleared", "achieved_at": datetime(2024, 1, 1, 10, 0, 0)}
+        ])
+        
+        result = await get_clear_record_history(
+            record_id=1,
+            current_user=self.sample_user,
+            clear_record_service=self.mock_service
+        )
+        
+        body = json.loads(result.body)
+        assert body["record_id"] == 1
+        assert body["achievements"] == [{"condition": "is_cleared", "achieved_at": "2024-01-01T10:00:00"}]
+        
+    @pytest.mark.asyncio
+    async def test_get_clear_record_history_access_denied(self):
+        """他ユーザーの記録の達成履歴は取得できない"""
+        self.sample_record.user_id = 2
+        self.mock_service.get_clear_record_by_id = AsyncMock(return_value=self.sample_record)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await get_clear_record_history(
+                record_id=1,
+                current_user=self.sample_user,
+                clear_record_service=self.mock_service
+            )
+        
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
         
     @pytest.mark.asyncio
     async def test_get_clear_record_by_id_success(self):
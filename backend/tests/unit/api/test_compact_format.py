@@ -0,0 +1,139 @@
+"""
+クリア記録コンパクト列指向フォーマットの単体テスト
+"""
+import json
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from presentation.api import compact_format
+from presentation.api.compact_format import (
+    COMPACT_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    encode_compact_clear_records,
+    resolve_format,
+)
+from presentation.api.responses import TrustedJSONResponse
+from domain.constants.clear_condition_constants import CLEAR_FLAG_FIELDS
+
+
+def _row(record_id: int, game_id: int, character_name: str, difficulty: str, mode: str = "normal", **flags) -> dict:
+    """一覧行を作成"""
+    row = {
+        "id": record_id,
+        "game_id": game_id,
+        "character_name": character_name,
+        "difficulty": difficulty,
+        "mode": mode,
+        "cleared_at": None,
+        "created_at": datetime(2024, 1, 1, 10, 0, 0),
+        "last_updated_at": datetime(2024, 1, 1, 10, 0, 0),
+    }
+    row.update({field: flags.get(field, False) for field in CLEAR_FLAG_FIELDS})
+    return row
+
+
+def _decode(payload: dict) -> list:
+    """コンパクトフォーマットを一覧行に戻す（フロントエンドのデコーダと同じ手順）"""
+    dictionaries = payload["dictionaries"]
+    columns = payload["columns"]
+    rows = []
+    for index in range(payload["count"]):
+        row = {"id": columns["id"][index]}
+        for column, values in dictionaries.items():
+            row[column] = values[columns[column][index]]
+        for bit, field in enumerate(payload["flag_fields"]):
+            row[field] = bool(columns["flags"][index] & (1 << bit))
+        rows.append(row)
+    return rows
+
+
+class TestResolveFormat:
+
+    def test_default_json(self):
+        """指定がない場合はJSON"""
+        assert resolve_format(None, None) == "json"
+        assert resolve_format(None, "application/json") == "json"
+
+    def test_query_param_has_priority(self):
+        """クエリパラメータがAcceptヘッダーより優先される"""
+        assert resolve_format("json", COMPACT_MEDIA_TYPE) == "json"
+        assert resolve_format("COMPACT", None) == "compact"
+
+    def test_accept_header(self):
+        """Acceptヘッダーによる選択"""
+        assert resolve_format(None, f"{COMPACT_MEDIA_TYPE}, application/json;q=0.5") == "compact"
+        assert resolve_format(None, MSGPACK_MEDIA_TYPE) == "msgpack"
+
+    def test_unsupported_format(self):
+        """未対応のフォーマット名はNone"""
+        assert resolve_format("xml", None) is None
+
+
+class TestEncodeCompactClearRecords:
+
+    def test_round_trip(self):
+        """辞書・インデックス・ビットマスクから元の値を復元できる"""
+        rows = [
+            _row(1, 1, "博麗霊夢A", "Easy", is_cleared=True),
+            _row(2, 1, "博麗霊夢A", "Lunatic", is_cleared=True, is_no_bomb_clear=True),
+            _row(3, 2, "霧雨魔理沙", "Easy", mode="legacy", is_special_clear_3=True),
+        ]
+
+        payload = encode_compact_clear_records(rows)
+
+        expected = [{key: row[key] for key in _decode(payload)[0]} for row in rows]
+        assert _decode(payload) == expected
+        assert payload["dictionaries"]["character_name"] == ["博麗霊夢A", "霧雨魔理沙"]
+        assert payload["columns"]["difficulty"] == [0, 1, 0]
+
+    def test_dates(self):
+        """クリア日は日数、日時は秒精度のUNIX時刻（タイムゾーンなしはUTC扱い）"""
+        row = _row(1, 1, "博麗霊夢", "Easy")
+        row["cleared_at"] = date(1970, 1, 11)
+        row["created_at"] = datetime(2024, 1, 1, 10, 0, 0, 123456)
+        row["last_updated_at"] = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+        columns = encode_compact_clear_records([row])["columns"]
+
+        epoch = int(datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc).timestamp())
+        assert columns["cleared_at"] == [10]
+        assert columns["created_at"] == [epoch]
+        assert columns["last_updated_at"] == [epoch]
+
+    def test_empty(self):
+        """0件の場合"""
+        payload = encode_compact_clear_records([])
+
+        assert payload["count"] == 0
+        assert payload["columns"]["id"] == []
+
+    def test_payload_is_at_least_five_times_smaller(self):
+        """グリッド規模の一覧で通常のJSONの1/5以下になる"""
+        difficulties = ["Easy", "Normal", "Hard", "Lunatic", "Extra", "Phantasm"]
+        rows = [
+            _row(index, index % 20 + 1, f"機体{index % 12}", difficulties[index % 6],
+                 is_cleared=True, is_no_continue_clear=index % 2 == 0)
+            for index in range(1, 1001)
+        ]
+
+        json_size = len(TrustedJSONResponse(content=rows).body)
+        compact_size = len(TrustedJSONResponse(content=encode_compact_clear_records(rows)).body)
+
+        assert json_size / compact_size >= 5
+
+
+class TestMsgpack:
+
+    def test_unavailable(self):
+        """msgpack未インストールの場合は利用不可"""
+        with patch.object(compact_format, "msgpack", None):
+            assert not compact_format.msgpack_available()
+
+    def test_encode(self):
+        """msgpackのpackbに委譲する"""
+        class FakeMsgpack:
+            @staticmethod
+            def packb(content, use_bin_type):
+                return json.dumps(content).encode()
+
+        with patch.object(compact_format, "msgpack", FakeMsgpack):
+            assert json.loads(compact_format.encode_msgpack({"count": 0})) == {"count": 0}
@@ -1,9 +1,10 @@
 """
 ゲーム機体APIの単体テスト
 """
+import json
 import pytest
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from fastapi import HTTPException, status
 from presentation.api.v1.game_characters import (
     get_game_characters,
@@ -70,18 +71,17 @@ class TestGameCharactersAPI:
         self.mock_service.get_characters_by_game_id.return_value = list_dto
         
         # Act
-        result = await get_game_characters(
-            game_id=1,
-            service=self.mock_service
-        )
+        with patch("presentation.api.v1.game_characters.GameCharacterService", return_value=self.mock_service):
+            result = await get_game_characters(game_id=1, session_factory=Mock())
         
         # Assert
-        assert result.total_count == 2
-        assert len(result.game_characters) == 2
-        assert result.game_characters[0].id == 1
-        assert result.game_characters[0].character_name == "霊夢"
-        assert result.game_characters[1].id == 2
-        assert result.game_characters[1].character_name == "魔理沙"
+        body = json.loads(result.body)
+        assert body["total_count"] == 2
+        assert len(body["game_characters"]) == 2
+        assert body["game_characters"][0]["id"] == 1
+        assert body["game_characters"][0]["character_name"] == "霊夢"
+        assert body["game_characters"][1]["id"] == 2
+        assert body["game_characters"][1]["character_name"] == "魔理沙"
         self.mock_service.get_characters_by_game_id.assert_called_once_with(1)
     
     @pytest.mark.asyncio
@@ -91,11 +91,9 @@ class TestGameCharactersAPI:
         self.mock_service.get_characters_by_game_id.side_effect = Exception("Database error")
         
         # Act & Assert
-        with pytest.raises(HTTPException) as exc_info:
-            await get_game_characters(
-                game_id=1,
-                service=self.mock_service
-            )
+        with pytest.raises(HTTPException) as exc_info, \
+                patch("presentation.api.v1.game_characters.GameCharacterService", return_value=self.mock_service):
+            await get_game_characters(game_id=1, session_factory=Mock())
         
         assert exc_info.value.status_code == 500
         assert "機体取得に失敗しました" in str(exc_info.value.detail)
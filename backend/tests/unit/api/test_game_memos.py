@@ -1,6 +1,7 @@
 """
 ゲームメモAPIの単体テスト
 """
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock
@@ -77,13 +78,14 @@ class TestGameMemosAPI:
         )
         
         # Assert
-        assert len(result) == 2
-        assert result[0].id == 1
-        assert result[0].memo == "テストメモ"
-        assert result[0].game_id == 1
-        assert result[1].id == 2
-        assert result[1].memo == "テストメモ2"
-        assert result[1].game_id == 2
+        body = json.loads(result.body)
+        assert len(body) == 2
+        assert body[0]["id"] == 1
+        assert body[0]["memo"] == "テストメモ"
+        assert body[0]["game_id"] == 1
+        assert body[1]["id"] == 2
+        assert body[1]["memo"] == "テストメモ2"
+        assert body[1]["game_id"] == 2
         self.mock_service.get_user_memos.assert_called_once_with(1)
     
     @pytest.mark.asyncio
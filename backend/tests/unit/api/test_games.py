@@ -1,9 +1,10 @@
 """
 ゲームAPIの単体テスト
 """
+import json
 import pytest
 from decimal import Decimal
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 from fastapi import HTTPException, status
 from presentation.api.v1.games import get_games
 from domain.entities.game import Game
@@ -16,6 +17,9 @@ class TestGamesAPI:
     def setup_method(self):
         """各テストメソッドの前に実行される共通セットアップ"""
         self.mock_game_service = Mock()
+        # 全件一覧はリクエストのDBセッションを使わずにサービスを作成して読み込む
+        self.service_patcher = patch("presentation.api.v1.games.GameService", return_value=self.mock_game_service)
+        self.service_patcher.start()
         
         # サンプルゲームDTO
         self.sample_game_dto = GameDto(
@@ -34,6 +38,9 @@ class TestGamesAPI:
             game_type=GameType.MAIN_SERIES
         )
 
+    def teardown_method(self):
+        self.service_patcher.stop()
+
     @pytest.mark.asyncio
     async def test_get_games_all(self):
         """全ゲーム一覧取得のテスト"""
@@ -47,18 +54,20 @@ class TestGamesAPI:
         result = await get_games(
             series_number=None,
             game_type=None,
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 2
-        assert result[0].id == 1
-        assert result[0].title == "東方紅魔郷"
-        assert result[0].series_number == Decimal("6")
-        assert result[0].release_year == 2002
-        assert result[0].game_type == GameType.MAIN_SERIES.value
-        assert result[1].id == 2
-        assert result[1].title == "東方妖々夢"
+        body = json.loads(result.body)
+        assert len(body) == 2
+        assert body[0]["id"] == 1
+        assert body[0]["title"] == "東方紅魔郷"
+        assert body[0]["series_number"] == "6"
+        assert body[0]["release_year"] == 2002
+        assert body[0]["game_type"] == GameType.MAIN_SERIES.value
+        assert body[1]["id"] == 2
+        assert body[1]["title"] == "東方妖々夢"
         self.mock_game_service.get_all_games.assert_called_once()
     
     @pytest.mark.asyncio
@@ -71,13 +80,15 @@ class TestGamesAPI:
         result = await get_games(
             series_number=Decimal("6"),
             game_type=None,
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 1
-        assert result[0].title == "東方紅魔郷"
-        assert result[0].series_number == Decimal("6")
+        body = json.loads(result.body)
+        assert len(body) == 1
+        assert body[0]["title"] == "東方紅魔郷"
+        assert body[0]["series_number"] == "6"
         self.mock_game_service.get_games_filtered.assert_called_once_with(
             series_number=Decimal("6"),
             game_type=None
@@ -93,12 +104,14 @@ class TestGamesAPI:
         result = await get_games(
             series_number=None,
             game_type="main_series",
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 1
-        assert result[0].game_type == GameType.MAIN_SERIES.value
+        body = json.loads(result.body)
+        assert len(body) == 1
+        assert body[0]["game_type"] == GameType.MAIN_SERIES.value
         self.mock_game_service.get_games_filtered.assert_called_once_with(
             series_number=None,
             game_type=GameType.MAIN_SERIES
@@ -114,11 +127,13 @@ class TestGamesAPI:
         result = await get_games(
             series_number=Decimal("6"),
             game_type="main_series",
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 1
+        body = json.loads(result.body)
+        assert len(body) == 1
         self.mock_game_service.get_games_filtered.assert_called_once_with(
             series_number=Decimal("6"),
             game_type=GameType.MAIN_SERIES
@@ -132,7 +147,8 @@ class TestGamesAPI:
             await get_games(
                 series_number=None,
                 game_type="invalid_type",
-                game_service=self.mock_game_service
+                game_service=self.mock_game_service,
+                session_factory=Mock()
             )
         
         assert exc_info.value.status_code == 400
@@ -149,12 +165,14 @@ class TestGamesAPI:
         result = await get_games(
             series_number=None,
             game_type=None,
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 0
-        assert result == []
+        body = json.loads(result.body)
+        assert len(body) == 0
+        assert body == []
         self.mock_game_service.get_all_games.assert_called_once()
     
     @pytest.mark.asyncio
@@ -175,9 +193,11 @@ class TestGamesAPI:
         result = await get_games(
             series_number=None,
             game_type=None,
-            game_service=self.mock_game_service
+            game_service=self.mock_game_service,
+            session_factory=Mock()
         )
         
         # Assert
-        assert len(result) == 1
-        assert result[0].game_type == 'main_series'  # デフォルト値
\ No newline at end of file
+        body = json.loads(result.body)
+        assert len(body) == 1
+        assert body[0]["game_type"] == 'main_series'  # デフォルト値
\ No newline at end of file
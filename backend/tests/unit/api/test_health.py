@@ -0,0 +1,84 @@
+"""
+ヘルスチェックAPI・カタログのウォームアップの単体テスト
+"""
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+from presentation.api.v1.games import GAMES_CACHE_KEY
+from presentation.api.v1.game_characters import CHARACTERS_CACHE_KEY_PREFIX
+from presentation.api.v1.health import healthz, preload_catalog, readyz
+from application.dtos.game_dto import GameDto
+from application.dtos.game_character_dto import GameCharacterDto, GameCharacterListDto
+from domain.value_objects.game_type import GameType
+from infrastructure.http.precompressed import catalog_response_cache
+
+
+class TestHealthAPI:
+    """liveness・readinessのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_healthz(self):
+        """依存サービスを確認せずに200を返す"""
+        assert await healthz() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_readyz_ready(self):
+        """全項目を満たす場合は200"""
+        checks = {"warm_up": {"ok": True}, "database": {"ok": True, "latency_ms": 1.0}, "pool": {"ok": True, "headroom": 4}}
+        with patch("presentation.api.v1.health.worker_readiness") as readiness:
+            readiness.check = AsyncMock(return_value={"ready": True, "checks": checks})
+            response = await readyz()
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"status": "ready", "checks": checks}
+
+    @pytest.mark.asyncio
+    async def test_readyz_not_ready(self):
+        """満たさない項目がある場合は503と項目ごとの結果"""
+        checks = {"warm_up": {"ok": True}, "database": {"ok": False, "error": "timed out after 2s"}, "pool": {"ok": True}}
+        with patch("presentation.api.v1.health.worker_readiness") as readiness:
+            readiness.check = AsyncMock(return_value={"ready": False, "checks": checks})
+            response = await readyz()
+
+        assert response.status_code == 503
+        assert json.loads(response.body)["status"] == "not_ready"
+        assert json.loads(response.body)["checks"]["database"]["ok"] is False
+
+
+class TestPreloadCatalog:
+    """カタログのウォームアップのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        catalog_response_cache.invalidate()
+        self.game_service = Mock()
+        self.game_service.get_all_games.return_value = [
+            GameDto(id=1, title="東方紅魔郷", series_number=Decimal("6"), release_year=2002, game_type=GameType.MAIN_SERIES),
+            GameDto(id=2, title="東方妖々夢", series_number=Decimal("7"), release_year=2003, game_type=GameType.MAIN_SERIES),
+        ]
+        self.character_service = Mock()
+        self.character_service.get_characters_by_game_id.return_value = GameCharacterListDto(
+            game_characters=[GameCharacterDto(
+                id=1, game_id=1, character_name="霊夢A", description=None, sort_order=1,
+                created_at=datetime(2024, 1, 1, 0, 0, 0)
+            )],
+            total_count=1
+        )
+
+    def teardown_method(self):
+        catalog_response_cache.invalidate()
+
+    def test_preload_catalog(self):
+        """ゲーム一覧と全ゲームの機体一覧をキャッシュする"""
+        with patch("presentation.api.v1.health.SessionLocal") as session_local, \
+                patch("presentation.api.v1.health.GameService", return_value=self.game_service), \
+                patch("presentation.api.v1.health.GameCharacterService", return_value=self.character_service):
+            assert preload_catalog() == 3
+            session_local.return_value.close.assert_called_once()
+
+        games = json.loads(catalog_response_cache.get(GAMES_CACHE_KEY).body)
+        assert [game["id"] for game in games] == [1, 2]
+        characters = json.loads(catalog_response_cache.get(f"{CHARACTERS_CACHE_KEY_PREFIX}2").body)
+        assert characters["total_count"] == 1
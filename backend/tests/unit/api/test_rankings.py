@@ -0,0 +1,47 @@
+"""
+ランキングAPIの単体テスト
+"""
+import json
+import pytest
+from unittest.mock import Mock
+from presentation.api.v1.rankings import get_leaderboard, get_my_rank
+from domain.entities.user import User
+
+
+class TestRankingsAPI:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_ranking_service = Mock()
+        self.current_user = User(id=1, username="testuser", email="test@example.com", hashed_password="hashed")
+
+    @pytest.mark.asyncio
+    async def test_get_leaderboard(self):
+        """リーダーボードの1ページを返す"""
+        self.mock_ranking_service.get_leaderboard.return_value = {
+            "game_id": 1, "page": 2, "per_page": 10, "total": 11,
+            "entries": [{"rank": 11, "user_id": 3, "username": "user3", "score": 10}],
+        }
+
+        result = await get_leaderboard(
+            game_id=1, page=2, per_page=10,
+            current_user=self.current_user, ranking_service=self.mock_ranking_service
+        )
+
+        body = json.loads(result.body)
+        assert body["entries"][0]["rank"] == 11
+        self.mock_ranking_service.get_leaderboard.assert_called_once_with(1, 2, 10)
+
+    @pytest.mark.asyncio
+    async def test_get_my_rank(self):
+        """ログインユーザーの順位を返す"""
+        self.mock_ranking_service.get_user_rank.return_value = {
+            "game_id": None, "user_id": 1, "score": 120, "rank": 3, "total": 40,
+        }
+
+        result = await get_my_rank(
+            game_id=None, current_user=self.current_user, ranking_service=self.mock_ranking_service
+        )
+
+        assert json.loads(result.body)["rank"] == 3
+        self.mock_ranking_service.get_user_rank.assert_called_once_with(1, None)
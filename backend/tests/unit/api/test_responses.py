@@ -0,0 +1,100 @@
+"""
+信頼済みJSONレスポンスの単体テスト
+
+一覧APIはresponse_modelによる再検証を省略するため、出力がレスポンススキーマを
+経由した場合と一致することを確認します。
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+from pydantic import TypeAdapter
+from application.dtos.game_character_dto import GameCharacterDto
+from application.dtos.game_dto import GameDto
+from application.dtos.user_dto import UserResponseDto
+from domain.entities.game_memo import GameMemo
+from domain.value_objects.game_type import GameType
+from presentation.api.responses import TrustedJSONResponse
+from presentation.api.v1 import admin, game_characters, games
+from presentation.api.v1.game_memos import GameMemoResponse
+from presentation.schemas.game_character_schema import GameCharacterResponse
+from presentation.schemas.game_schema import GameResponse
+from presentation.schemas.user_schema import UserResponse
+
+
+def _schema_json(schema, items) -> list:
+    """response_modelを経由した場合のJSON表現"""
+    return json.loads(TypeAdapter(List[schema]).dump_json(items))
+
+
+def _trusted_json(payloads) -> list:
+    """信頼済みレスポンスのJSON表現"""
+    return json.loads(TrustedJSONResponse(content=payloads).body)
+
+
+class TestTrustedJSONResponse:
+
+    def test_renders_dates_and_decimals_like_pydantic(self):
+        """日付・日時・Decimalの表現がPydanticと一致すること"""
+        body = _trusted_json({
+            "date": date(2024, 1, 1),
+            "datetime": datetime(2024, 1, 1, 10, 0, 0, 123456),
+            "decimal": Decimal("12.8"),
+        })
+
+        assert body == {
+            "date": "2024-01-01",
+            "datetime": "2024-01-01T10:00:00.123456",
+            "decimal": "12.8",
+        }
+
+    def test_game_payload_matches_schema(self):
+        """ゲーム一覧の出力がGameResponseと一致すること"""
+        dto = GameDto(
+            id=8, title="東方妖精大戦争", series_number=Decimal("12.8"),
+            release_year=2010, game_type=GameType.SPIN_OFF_STG
+        )
+        schema = GameResponse(
+            id=dto.id, title=dto.title, series_number=dto.series_number,
+            release_year=dto.release_year, game_type=dto.game_type
+        )
+
+        assert _trusted_json([games._to_payload(dto)]) == _schema_json(GameResponse, [schema])
+
+    def test_character_payload_matches_schema(self):
+        """機体一覧の出力がGameCharacterResponseと一致すること（SQLiteの文字列日時を含む）"""
+        dto = GameCharacterDto(
+            id=1, game_id=1, character_name="霊夢A", description=None,
+            sort_order=1, created_at="2024-01-01 10:00:00.123456"
+        )
+        schema = GameCharacterResponse(
+            id=dto.id, game_id=dto.game_id, character_name=dto.character_name,
+            description=dto.description, sort_order=dto.sort_order, created_at=dto.created_at
+        )
+
+        assert _trusted_json([game_characters._to_payload(dto)]) == _schema_json(GameCharacterResponse, [schema])
+
+    def test_memo_payload_matches_schema(self):
+        """メモ一覧の出力がGameMemoResponseと一致すること"""
+        memo = GameMemo(
+            id=1, user_id=1, game_id=1, memo="テストメモ",
+            created_at=datetime(2024, 1, 1), updated_at=None
+        )
+        schema = GameMemoResponse(
+            id=memo.id, user_id=memo.user_id, game_id=memo.game_id, memo=memo.memo,
+            created_at=memo.created_at.isoformat(), updated_at=None
+        )
+
+        assert _trusted_json([memo.to_dict()]) == _schema_json(GameMemoResponse, [schema])
+
+    def test_user_payload_matches_schema(self):
+        """ユーザー一覧の出力がUserResponseと一致すること"""
+        dto = UserResponseDto(
+            id=1, username="test_user", email="test@example.com", is_active=True,
+            is_admin=False, email_verified=True,
+            created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2)
+        )
+
+        assert _trusted_json([admin._user_payload(dto)]) == _schema_json(
+            UserResponse, [UserResponse.model_validate(dto, from_attributes=True)]
+        )
@@ -0,0 +1,54 @@
+"""
+統計APIの単体テスト
+"""
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from presentation.api.v1.stats import get_clear_rarity
+from infrastructure.http.precompressed import catalog_response_cache
+from infrastructure.jobs.constants import ClearStatsConstants
+
+
+class TestStatsAPI:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_clear_stats_service = Mock()
+        self.mock_clear_stats_service.get_rarity.return_value = {
+            "active_users": 4,
+            "built_at": datetime(2024, 1, 1, 10, 0, 0),
+            "stats": [
+                {"game_id": 1, "character_name": "霊夢", "difficulty": "Lunatic", "mode": "normal",
+                 "condition": "is_no_miss_clear", "achieved_count": 1, "rate": 0.25},
+            ],
+        }
+        self.service_patcher = patch(
+            "presentation.api.v1.stats.ClearStatsService", return_value=self.mock_clear_stats_service
+        )
+        self.service_patcher.start()
+
+    def teardown_method(self):
+        self.service_patcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_clear_rarity(self):
+        """達成率を公開キャッシュ可能なレスポンスで返す"""
+        result = await get_clear_rarity(game_id=1, session_factory=Mock())
+
+        body = json.loads(result.body)
+        assert body["active_users"] == 4
+        assert body["stats"][0]["rate"] == 0.25
+        assert result.headers["cache-control"] == f"public, max-age={ClearStatsConstants.CACHE_MAX_AGE_SECONDS}"
+        self.mock_clear_stats_service.get_rarity.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_get_clear_rarity_cached_until_refresh(self):
+        """次の集計でキャッシュが破棄されるまで集計結果を再利用する"""
+        await get_clear_rarity(game_id=None, session_factory=Mock())
+        await get_clear_rarity(game_id=None, session_factory=Mock())
+        assert self.mock_clear_stats_service.get_rarity.call_count == 1
+
+        catalog_response_cache.invalidate(ClearStatsConstants.CACHE_KEY_PREFIX)
+        await get_clear_rarity(game_id=None, session_factory=Mock())
+        assert self.mock_clear_stats_service.get_rarity.call_count == 2
@@ -0,0 +1,74 @@
+"""
+ベンチマーク用合成データ生成のテスト
+"""
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from benchmarks.data_generator import SyntheticDataGenerator
+from benchmarks.run import percentile
+from domain.constants.clear_condition_constants import is_special_condition_available
+from domain.constants.game_constants import (
+    get_available_difficulties_for_game_and_mode,
+    get_available_modes_for_game,
+)
+
+
+class TestSyntheticDataGenerator:
+    """SyntheticDataGeneratorのテストクラス"""
+
+    def test_records_follow_game_rules(self):
+        """生成された記録がゲーム・モード・難易度・機体・特殊条件のルールに従うこと"""
+        generator = SyntheticDataGenerator(seed=1)
+
+        records = generator.generate_clear_records(user_id=2, skill=1.0)
+
+        assert len(records) > 0
+        for record in records:
+            game_id = record["game_id"]
+            assert record["mode"] in get_available_modes_for_game(game_id)
+            assert record["difficulty"] in get_available_difficulties_for_game_and_mode(game_id, record["mode"])
+            assert record["character_name"] in generator.characters_by_game[game_id]
+            for index in (1, 2, 3):
+                if record[f"is_special_clear_{index}"]:
+                    assert is_special_condition_available(game_id, f"special_{index}")
+
+    def test_cells_are_unique(self):
+        """同一ユーザー内で同じセルの記録が重複しないこと"""
+        records = SyntheticDataGenerator(seed=2).generate_clear_records(user_id=2, skill=1.0)
+
+        cells = {(r["game_id"], r["character_name"], r["difficulty"], r["mode"]) for r in records}
+        assert len(cells) == len(records)
+
+    def test_same_seed_is_reproducible(self):
+        """同じシードで同じデータが生成されること"""
+        first = SyntheticDataGenerator(seed=3).generate_clear_records(user_id=2, skill=0.5)
+        second = SyntheticDataGenerator(seed=3).generate_clear_records(user_id=2, skill=0.5)
+
+        strip = lambda rows: [{k: v for k, v in r.items() if k not in ("last_updated_at", "created_at")} for r in rows]
+        assert strip(first) == strip(second)
+
+    def test_populate(self):
+        """テーブルにユーザー・ゲーム・機体・記録が投入されること"""
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+
+        dataset = SyntheticDataGenerator(seed=4).populate(engine, user_count=3)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM users")).scalar() == 4
+            assert conn.execute(text("SELECT COUNT(*) FROM games")).scalar() == 16
+            assert conn.execute(text("SELECT COUNT(*) FROM clear_records")).scalar() == dataset.clear_record_count
+        assert len(dataset.usernames) == 3
+        engine.dispose()
+
+
+class TestPercentile:
+    """パーセンタイル算出のテストクラス"""
+
+    def test_percentile(self):
+        """最近傍順位法で算出されること"""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
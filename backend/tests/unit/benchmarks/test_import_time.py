@@ -0,0 +1,38 @@
+"""
+インポート時間計測とアプリケーションのインポート時の副作用のテスト
+"""
+from benchmarks.import_time import DEFAULT_BUDGET_MS, measure_import_time, parse_importtime, total_ms
+from infrastructure.logging.constants import LoggingConstants
+
+SAMPLE_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       335 |      53901 |     jose.jwk
+import time:      1169 |      55806 |   infrastructure.security.jwt_handler
+import time:     73788 |    1003517 | main
+"""
+
+
+class TestImportTime:
+    """インポート時間計測のテストクラス"""
+
+    def test_parse_importtime(self):
+        """モジュール名・自己時間・累積時間・ネストの深さを取り出す"""
+        timings = parse_importtime(SAMPLE_OUTPUT)
+
+        assert timings[1] == ("jose.jwk", 335, 53901, 2)
+        assert timings[-1] == ("main", 73788, 1003517, 0)
+        assert total_ms(timings, "main") == 1003.517
+
+    def test_import_main_has_no_side_effects(self, tmp_path):
+        """mainのインポートでスキーマ作成・セキュリティログの作成を行わず、予算内でインポートできること"""
+        db_path = tmp_path / "import_time.db"
+        log_dir = tmp_path / "logs"
+
+        timings = measure_import_time("main", env={
+            "DATABASE_URL": f"sqlite:///{db_path}",
+            "LOG_DIR": str(log_dir),
+        })
+
+        assert not db_path.exists()
+        assert not (log_dir / LoggingConstants.LOG_FILE_SECURITY).exists()
+        assert total_ms(timings, "main") < DEFAULT_BUDGET_MS
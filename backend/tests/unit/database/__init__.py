@@ -0,0 +1 @@
+"""データベース関連の単体テスト"""
@@ -0,0 +1,82 @@
+"""
+SQLクエリ計測のテスト
+"""
+from sqlalchemy import create_engine, text
+from infrastructure.database.query_instrumentation import QueryInstrumentation
+from infrastructure.logging.context import RequestContext
+from infrastructure.database.models.game_model import GameModel
+from tests.helpers.query_budget import assert_query_budget
+
+
+class TestQueryInstrumentation:
+    """QueryInstrumentationのテストクラス"""
+
+    def setup_method(self):
+        RequestContext.clear()
+        QueryInstrumentation.install()
+        self.engine = create_engine("sqlite:///:memory:")
+
+    def teardown_method(self):
+        RequestContext.clear()
+        self.engine.dispose()
+
+    def test_counts_queries_while_collecting(self):
+        """集計中はクエリ数とDB時間が記録されること"""
+        stats = RequestContext.start_db_query_stats()
+
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        assert stats.query_count == 2
+        assert stats.total_time_ms >= 0
+
+    def test_does_not_count_without_collecting(self):
+        """集計していない場合は記録されないこと"""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert RequestContext.get_db_query_stats() is None
+
+    def test_failed_query_is_counted(self):
+        """失敗したクエリも記録されること"""
+        stats = RequestContext.start_db_query_stats()
+
+        with self.engine.connect() as conn:
+            try:
+                conn.execute(text("SELECT * FROM missing_table"))
+            except Exception:
+                pass
+
+        assert stats.query_count == 1
+
+    def test_install_is_idempotent(self):
+        """複数回installしても二重計測されないこと"""
+        QueryInstrumentation.install()
+        stats = RequestContext.start_db_query_stats()
+
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert stats.query_count == 1
+
+
+class TestEndpointQueryBudget:
+    """主要エンドポイントのクエリ予算テスト"""
+
+    def test_get_games_query_budget(self, client, db_session):
+        """ゲーム一覧取得は1クエリで完了すること"""
+        db_session.add(GameModel(title="東方紅魔郷", series_number=6.0, release_year=2002))
+        db_session.commit()
+
+        response = client.get("/api/v1/games")
+
+        assert response.status_code == 200
+        assert_query_budget(response, max_queries=1)
+
+    def test_get_game_characters_query_budget(self, client, db_session):
+        """ゲーム別機体一覧取得は1クエリで完了すること"""
+        response = client.get("/api/v1/game-characters/1/characters")
+
+        assert response.status_code == 200
+        assert_query_budget(response, max_queries=1)
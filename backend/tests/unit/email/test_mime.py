@@ -0,0 +1,69 @@
+"""
+送信用メール（MIME）の組み立ての単体テスト
+"""
+from email import message_from_bytes, policy
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from application.services.email_service import EmailMessage
+from infrastructure.email.mime import encode_email_message
+
+
+def _parse(data: bytes):
+    return message_from_bytes(data, policy=policy.default)
+
+
+class TestEncodeEmailMessage:
+    """キャッシュした固定部分からのメールの組み立てのテスト"""
+
+    def test_round_trip(self):
+        """標準ライブラリで解析すると件名・宛先・本文が復元できる"""
+        message = EmailMessage(
+            "user@example.com",
+            "東方プロジェクト クリアチェッカー - メールアドレス認証",
+            "霊夢 さん、\n" * 100,
+            "<p>霊夢 さん、</p>" * 100,
+        )
+
+        encoded = encode_email_message("noreply@example.com", message)
+        parsed = _parse(encoded.data)
+
+        assert encoded.from_email == "noreply@example.com"
+        assert encoded.to_email == "user@example.com"
+        assert parsed.defects == []
+        assert parsed["Subject"] == message.subject
+        assert parsed["From"] == "noreply@example.com"
+        assert parsed["To"] == "user@example.com"
+        text_part, html_part = parsed.iter_parts()
+        assert text_part.get_content_type() == "text/plain"
+        assert text_part.get_content() == message.text_body
+        assert html_part.get_content_type() == "text/html"
+        assert html_part.get_content() == message.html_body
+
+    def test_matches_email_mime(self):
+        """email.mimeで組み立てたメールと同じ構造・内容になる"""
+        message = EmailMessage("user@example.com", "件名", "本文", "<p>本文</p>")
+        expected = MIMEMultipart("alternative")
+        expected["Subject"] = message.subject
+        expected["From"] = "noreply@example.com"
+        expected["To"] = message.to_email
+        expected.attach(MIMEText(message.text_body, "plain", "utf-8"))
+        expected.attach(MIMEText(message.html_body, "html", "utf-8"))
+
+        parsed = _parse(encode_email_message("noreply@example.com", message).data)
+        reference = _parse(expected.as_bytes())
+
+        assert [
+            (part.get_content_type(), part.get_content()) for part in parsed.iter_parts()
+        ] == [
+            (part.get_content_type(), part.get_content()) for part in reference.iter_parts()
+        ]
+        assert parsed["Subject"] == reference["Subject"]
+
+    def test_lines_end_with_crlf(self):
+        """全ての行がCRLFで終わり、998文字を超える行がない"""
+        message = EmailMessage("user@example.com", "件名", "本文" * 1000, "<p>本文</p>")
+
+        lines = encode_email_message("noreply@example.com", message).data.split(b"\r\n")
+
+        assert all(b"\n" not in line for line in lines)
+        assert max(len(line) for line in lines) <= 998
@@ -0,0 +1,157 @@
+"""
+メール送信キューの送信ワーカーの単体テスト
+"""
+import socket
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import Mock
+from application.services.email_service import MockEmailSender
+from infrastructure.database.connection import Base
+from infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from infrastructure.database.repositories.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from infrastructure.email.outbox_worker import EmailOutboxWorker
+from infrastructure.email.smtp_email_sender import SMTPEmailSender
+
+
+class TestEmailOutboxWorker:
+    """送信・再試行・デッドレターのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        # ワーカーのスレッドからも同じインメモリDBを参照する
+        self.engine = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.session = self.session_factory()
+        # send_batchは基底クラスの実装（send_emailを1通ずつ呼び出す）を使用
+        self.email_sender = MockEmailSender()
+        self.email_sender.send_email = Mock()
+        self.worker = EmailOutboxWorker(
+            email_sender=self.email_sender,
+            session_factory=self.session_factory,
+            worker_count=2,
+            batch_size=10,
+            max_attempts=3,
+            retry_base_seconds=30,
+            retry_max_seconds=100,
+        )
+
+    def teardown_method(self):
+        self.worker.shutdown()
+        self.session.close()
+        self.engine.dispose()
+
+    def _enqueue(self, to_email: str = "user@example.com") -> None:
+        EmailOutboxRepositoryImpl(self.session).enqueue(to_email, "件名", "本文", "<p>本文</p>")
+        self.session.commit()
+
+    def _model(self, message_id: int = 1) -> EmailOutboxModel:
+        self.session.expire_all()
+        return self.session.get(EmailOutboxModel, message_id)
+
+    def _make_due(self, message_id: int = 1) -> None:
+        model = self._model(message_id)
+        model.next_attempt_at = model.created_at
+        self.session.commit()
+
+    def test_retry_delay(self):
+        """再試行間隔は試行ごとに倍増し、上限で頭打ちになる"""
+        assert [self.worker.retry_delay(attempts) for attempts in (1, 2, 3, 4)] == [30, 60, 100, 100]
+
+    def test_drain_once_sends(self):
+        """送信待ちを送信して送信済みにする"""
+        self._enqueue("a@example.com")
+        self._enqueue("b@example.com")
+        self.email_sender.send_email.return_value = True
+
+        result = self.worker.drain_once()
+
+        assert result == {"sent": 2, "retried": 0, "dead": 0}
+        assert self.email_sender.send_email.call_count == 2
+        assert self._model(1).status == "sent"
+        assert self.worker.drain_once() == {"sent": 0, "retried": 0, "dead": 0}
+
+    def test_drain_once_retries_with_backoff(self):
+        """送信失敗・例外は再試行時刻を設定して送信待ちに戻す"""
+        self._enqueue()
+        self.email_sender.send_email.side_effect = ConnectionRefusedError("refused")
+
+        result = self.worker.drain_once()
+
+        model = self._model()
+        assert result == {"sent": 0, "retried": 1, "dead": 0}
+        assert model.status == "pending"
+        assert "ConnectionRefusedError" in model.last_error
+        assert 29 <= (model.next_attempt_at - model.created_at).total_seconds() <= 31
+        # 再試行時刻までは送信しない
+        assert self.worker.drain_once() == {"sent": 0, "retried": 0, "dead": 0}
+
+    def test_drain_once_dead_letter(self):
+        """試行回数の上限に達したメールはデッドレターにする"""
+        self._enqueue()
+        self.email_sender.send_email.return_value = False
+
+        for _ in range(3):
+            self._make_due()
+            self.worker.drain_once()
+
+        model = self._model()
+        assert model.status == "dead"
+        assert model.attempts == 3
+        assert self.email_sender.send_email.call_count == 3
+
+
+class TestEmailOutboxWorkerWithSMTPServer:
+    """ローカルのSMTPサーバー（aiosmtpd）への送信のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        controller_module = pytest.importorskip("aiosmtpd.controller")
+        handlers_module = pytest.importorskip("aiosmtpd.handlers")
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.handler = handlers_module.Sink()
+        self.messages = []
+        self.handler.handle_DATA = self._handle_data
+        self.controller = controller_module.Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        self.controller.start()
+
+        self.engine = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+    def teardown_method(self):
+        self.controller.stop()
+        self.engine.dispose()
+
+    async def _handle_data(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+    def test_delivers_to_smtp_server(self, monkeypatch):
+        """送信キューのメールがSMTPサーバーに届く"""
+        monkeypatch.setenv("SMTP_SERVER", "127.0.0.1")
+        monkeypatch.setenv("SMTP_PORT", str(self.port))
+        monkeypatch.setenv("SMTP_USE_TLS", "false")
+        monkeypatch.setenv("FROM_EMAIL", "noreply@example.com")
+        session = self.session_factory()
+        EmailOutboxRepositoryImpl(session).enqueue("user@example.com", "件名", "本文", "<p>本文</p>")
+        session.commit()
+        worker = EmailOutboxWorker(email_sender=SMTPEmailSender(), session_factory=self.session_factory)
+
+        try:
+            result = worker.drain_once()
+        finally:
+            worker.shutdown()
+
+        assert result["sent"] == 1
+        assert [envelope.rcpt_tos for envelope in self.messages] == [["user@example.com"]]
+        assert EmailOutboxRepositoryImpl(session).count_by_status() == {"sent": 1}
+        session.close()
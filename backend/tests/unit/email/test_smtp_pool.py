@@ -0,0 +1,222 @@
+"""
+SMTP接続プールの単体テスト（ローカルのSMTPサーバー（aiosmtpd）に送信）
+"""
+import socket
+import threading
+import pytest
+from application.services.email_service import EmailMessage
+from infrastructure.email.mime import EncodedEmail, encode_email_message
+from infrastructure.email.smtp_pool import AsyncSMTPConnectionPool, SMTPConnectionPool
+from infrastructure.email.smtp_email_sender import AsyncSMTPEmailSender, SMTPEmailSender
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _message(to_email: str) -> EncodedEmail:
+    return encode_email_message("noreply@example.com", EmailMessage(to_email, "件名", "本文", "<p>本文</p>"))
+
+
+class RecordingHandler:
+    """受信したメールと接続数を記録するSMTPハンドラー"""
+
+    def __init__(self):
+        self.recipients = []
+        self.rejected = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.rejected:
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+class SMTPServerTestBase:
+    """テストごとにローカルのSMTPサーバーを起動"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        controller_module = pytest.importorskip("aiosmtpd.controller")
+        self.port = _free_port()
+        self.handler = RecordingHandler()
+        self.controller = controller_module.Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        self.controller.start()
+
+    def teardown_method(self):
+        self.controller.stop()
+
+    def _pool(self, **kwargs) -> SMTPConnectionPool:
+        return SMTPConnectionPool("127.0.0.1", self.port, use_tls=False, **kwargs)
+
+
+class TestSMTPConnectionPool(SMTPServerTestBase):
+    """接続の再利用・生存確認・同時接続数の上限のテスト"""
+
+    def test_reuses_connection(self):
+        """複数回の送信で同じ接続を再利用する"""
+        pool = self._pool()
+
+        for index in range(3):
+            assert pool.send_messages([_message(f"user{index}@example.com")]) == [None]
+        pool.close()
+
+        assert pool.created_count == 1
+        assert self.handler.recipients == ["user0@example.com", "user1@example.com", "user2@example.com"]
+
+    def test_batch_over_one_connection(self):
+        """1回の呼び出しのメールを1つの接続で送信する"""
+        pool = self._pool()
+
+        errors = pool.send_messages([_message(f"user{index}@example.com") for index in range(5)])
+        pool.close()
+
+        assert errors == [None] * 5
+        assert pool.created_count == 1
+
+    def test_replaces_stale_connection(self):
+        """NOOPに応答しない接続は閉じて接続し直す"""
+        pool = self._pool(noop_after_idle_seconds=0)
+        pool.send_messages([_message("user0@example.com")])
+        # サーバー側から切断された状態にする
+        pool._idle[0].client.sock.shutdown(socket.SHUT_RDWR)
+
+        assert pool.send_messages([_message("user1@example.com")]) == [None]
+        pool.close()
+
+        assert pool.created_count == 2
+        assert self.handler.recipients == ["user0@example.com", "user1@example.com"]
+
+    def test_reconnects_after_max_messages(self):
+        """1接続の送信数の上限に達したら接続し直す"""
+        pool = self._pool(max_messages_per_connection=2)
+
+        errors = pool.send_messages([_message(f"user{index}@example.com") for index in range(5)])
+        pool.close()
+
+        assert errors == [None] * 5
+        assert pool.created_count == 3
+
+    def test_rejected_recipient_keeps_connection(self):
+        """宛先の拒否はそのメールのみ失敗とし、接続を使い続ける"""
+        self.handler.rejected.add("rejected@example.com")
+        pool = self._pool()
+
+        errors = pool.send_messages([_message("rejected@example.com"), _message("user@example.com")])
+        pool.close()
+
+        assert "SMTPRecipientsRefused" in errors[0]
+        assert errors[1] is None
+        assert pool.created_count == 1
+
+    def test_caps_concurrent_connections(self):
+        """同時に使用する接続数は上限を超えない"""
+        pool = self._pool(max_connections=2)
+        threads = [
+            threading.Thread(target=pool.send_messages, args=([_message(f"user{index}@example.com")] * 3,))
+            for index in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.close()
+
+        assert pool.created_count <= 2
+        assert len(self.handler.recipients) == 18
+
+    def test_connection_failure(self):
+        """接続できない場合は全てのメールを失敗とする"""
+        pool = SMTPConnectionPool("127.0.0.1", _free_port(), use_tls=False)
+
+        errors = pool.send_messages([_message("user0@example.com"), _message("user1@example.com")])
+
+        assert len(errors) == 2
+        assert all("ConnectionRefusedError" in error for error in errors)
+
+
+class TestSMTPEmailSender(SMTPServerTestBase):
+    """接続プールを使用したメール送信のテスト"""
+
+    def test_send_batch(self, monkeypatch):
+        """send_batchで送信し、メールごとの結果を返す"""
+        monkeypatch.setenv("SMTP_USE_TLS", "false")
+        monkeypatch.setenv("FROM_EMAIL", "noreply@example.com")
+        self.handler.rejected.add("rejected@example.com")
+        sender = SMTPEmailSender(self._pool())
+
+        results = sender.send_batch([
+            EmailMessage("user@example.com", "件名", "本文", "<p>本文</p>"),
+            EmailMessage("rejected@example.com", "件名", "本文", "<p>本文</p>"),
+        ])
+        sender.close()
+
+        assert results == [True, False]
+        assert self.handler.recipients == ["user@example.com"]
+
+    def test_credentials_missing(self, monkeypatch):
+        """STARTTLSを使用する設定で認証情報がない場合は送信しない"""
+        monkeypatch.setenv("SMTP_USE_TLS", "true")
+        monkeypatch.delenv("SMTP_USERNAME", raising=False)
+        monkeypatch.delenv("SMTP_PASSWORD", raising=False)
+        sender = SMTPEmailSender(self._pool())
+
+        assert sender.send_email("user@example.com", "件名", "本文", "<p>本文</p>") is False
+        assert sender.pool.created_count == 0
+
+
+class TestAsyncSMTPConnectionPool(SMTPServerTestBase):
+    """非同期版の接続プールのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        pytest.importorskip("aiosmtplib")
+        super().setup_method()
+
+    def _async_pool(self, **kwargs) -> AsyncSMTPConnectionPool:
+        return AsyncSMTPConnectionPool("127.0.0.1", self.port, use_tls=False, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection(self):
+        """複数回の送信で同じ接続を再利用する"""
+        pool = self._async_pool()
+
+        for index in range(3):
+            assert await pool.send_messages([_message(f"user{index}@example.com")]) == [None]
+        await pool.close()
+
+        assert pool.created_count == 1
+        assert len(self.handler.recipients) == 3
+
+    @pytest.mark.asyncio
+    async def test_replaces_stale_connection(self):
+        """NOOPに応答しない接続は閉じて接続し直す"""
+        pool = self._async_pool(noop_after_idle_seconds=0)
+        await pool.send_messages([_message("user0@example.com")])
+        pool._idle[0].client.close()
+
+        assert await pool.send_messages([_message("user1@example.com")]) == [None]
+        await pool.close()
+
+        assert pool.created_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sender_send_batch(self, monkeypatch):
+        """非同期版のsend_batchで送信する"""
+        monkeypatch.setenv("SMTP_USE_TLS", "false")
+        monkeypatch.setenv("FROM_EMAIL", "noreply@example.com")
+        sender = AsyncSMTPEmailSender(self._async_pool())
+
+        results = await sender.send_batch([
+            EmailMessage(f"user{index}@example.com", "件名", "本文", "<p>本文</p>") for index in range(3)
+        ])
+        await sender.close()
+
+        assert results == [True, True, True]
+        assert sender.pool.created_count == 1
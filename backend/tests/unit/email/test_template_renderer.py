@@ -0,0 +1,97 @@
+"""
+メールテンプレートの単体テスト
+"""
+import pytest
+from infrastructure.email.template_renderer import CompiledTemplate, EmailTemplateRenderer
+
+
+class TestCompiledTemplate:
+    """テンプレートのコンパイル・置換のテスト"""
+
+    def test_render(self):
+        """固定部分と変数に分解し、値を置換する"""
+        template = CompiledTemplate("$name さん、${count}件 $$100")
+
+        assert template.fields == ("name", "count")
+        assert template.render({"name": "霊夢", "count": "3"}) == "霊夢 さん、3件 $100"
+
+    def test_missing_variable(self):
+        """変数の値がない場合はエラー"""
+        with pytest.raises(ValueError, match="name"):
+            CompiledTemplate("$name さん").render({})
+
+    def test_invalid_placeholder(self):
+        """不正なプレースホルダーはコンパイル時にエラー"""
+        with pytest.raises(ValueError):
+            CompiledTemplate("価格: $100")
+
+
+class TestEmailTemplateRenderer:
+    """ロケールごとのテンプレートの読み込み・キャッシュのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.renderer = EmailTemplateRenderer(default_locale="ja")
+
+    def test_render_verification(self):
+        """認証メールのテンプレートから件名・本文を作成する"""
+        subject, text_body, html_body = self.renderer.render(
+            "verification", username="霊夢", verification_url="https://example.com/verify-email?token=abc"
+        )
+
+        assert subject == "東方プロジェクト クリアチェッカー - メールアドレス認証"
+        assert "霊夢 さん、" in text_body
+        assert "https://example.com/verify-email?token=abc" in text_body
+        assert '<a href="https://example.com/verify-email?token=abc"' in html_body
+
+    def test_html_values_are_escaped(self):
+        """HTML本文に埋め込む値のみエスケープする"""
+        _, text_body, html_body = self.renderer.render(
+            "verification", username="<b>霊夢</b>", verification_url="https://example.com/?a=1&b=2"
+        )
+
+        assert "<b>霊夢</b> さん" in text_body
+        assert "&lt;b&gt;霊夢&lt;/b&gt; さん" in html_body
+        assert "https://example.com/?a=1&amp;b=2" in html_body
+
+    def test_templates_are_cached_per_locale(self):
+        """同じテンプレート・ロケールはコンパイル済みのものを再利用する"""
+        assert self.renderer.get("verification", "ja") is self.renderer.get("verification")
+
+    def test_falls_back_to_default_locale(self):
+        """指定したロケールのテンプレートがない場合は既定のロケールを使用する"""
+        template = self.renderer.get("verification", "xx")
+
+        assert template.subject.render({}) == "東方プロジェクト クリアチェッカー - メールアドレス認証"
+
+    def test_template_not_found(self):
+        """テンプレートが存在しない場合はエラー"""
+        with pytest.raises(ValueError, match="not_found"):
+            self.renderer.get("not_found")
+
+    def test_new_template_type(self, tmp_path):
+        """3ファイルを追加するだけで新しい種類のメールを作成できる"""
+        directory = tmp_path / "en"
+        directory.mkdir()
+        (directory / "digest.subject.txt").write_text("Weekly digest for $username\n", encoding="utf-8")
+        (directory / "digest.txt").write_text("$count new clears", encoding="utf-8")
+        (directory / "digest.html").write_text("<p>$count new clears</p>", encoding="utf-8")
+        renderer = EmailTemplateRenderer(template_dir=tmp_path, default_locale="en")
+
+        assert renderer.render("digest", username="marisa", count=5) == (
+            "Weekly digest for marisa", "5 new clears", "<p>5 new clears</p>"
+        )
+
+    def test_preload(self, tmp_path):
+        """既定のロケールの全テンプレートを事前にコンパイルする"""
+        directory = tmp_path / "en"
+        directory.mkdir()
+        for name in ("digest", "welcome"):
+            (directory / f"{name}.subject.txt").write_text(f"{name} $username", encoding="utf-8")
+            (directory / f"{name}.txt").write_text("text", encoding="utf-8")
+            (directory / f"{name}.html").write_text("<p>html</p>", encoding="utf-8")
+        renderer = EmailTemplateRenderer(template_dir=tmp_path, default_locale="en")
+
+        assert renderer.preload() == 2
+        (directory / "digest.subject.txt").unlink()
+        assert renderer.get("digest").subject.render({"username": "marisa"}) == "digest marisa"
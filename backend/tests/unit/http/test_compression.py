@@ -0,0 +1,237 @@
+"""
+レスポンス圧縮・事前圧縮済みレスポンスの単体テスト
+"""
+import gzip
+import json
+import pytest
+from unittest.mock import Mock, patch
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from infrastructure.http import compression
+from infrastructure.http.compression import CompressionMiddleware, negotiate_encoding
+from infrastructure.http.precompressed import (
+    PrecompressedPayload,
+    PrecompressedResponse,
+    PrecompressedResponseCache,
+    catalog_response_cache,
+)
+from infrastructure.database.models.game_model import GameModel
+from presentation.api.v1.games import get_games
+
+
+LARGE_PAYLOAD = [{"character_name": "博麗霊夢", "difficulty": "Lunatic", "is_cleared": True}] * 200
+
+
+def _create_app() -> FastAPI:
+    """テスト用アプリを作成"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE_PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b"data: 1\n\n" * 100
+            yield b"data: 2\n\n" * 100
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/chunked")
+    async def chunked():
+        async def chunks():
+            for line in LARGE_PAYLOAD:
+                yield json.dumps(line).encode() + b"\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/chunked-small")
+    async def chunked_small():
+        async def chunks():
+            yield b'{"ok":'
+            yield b" true}"
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    @app.get("/precompressed")
+    async def precompressed():
+        return PrecompressedResponse(PrecompressedPayload.build(json.dumps(LARGE_PAYLOAD).encode()))
+
+    return app
+
+
+class TestNegotiateEncoding:
+
+    def test_no_header(self):
+        """Accept-Encodingがない場合は圧縮しない"""
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("") is None
+
+    def test_gzip(self):
+        """gzipを受け入れる場合はgzip"""
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+
+    def test_rejected_by_q_zero(self):
+        """q=0で拒否された方式は使用しない"""
+        assert negotiate_encoding("gzip;q=0, identity") is None
+
+    def test_wildcard(self):
+        """ワイルドカードで受け入れる"""
+        assert negotiate_encoding("*") in compression.available_encodings()
+
+    def test_brotli_preferred_when_available(self):
+        """brotliが利用可能な場合は同じq値ならbrotliを優先"""
+        with patch.object(compression, "brotli", Mock()):
+            assert negotiate_encoding("gzip, br") == "br"
+            assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+
+    def test_brotli_unavailable(self):
+        """brotli未インストールの場合はgzipにフォールバック"""
+        with patch.object(compression, "brotli", None):
+            assert negotiate_encoding("br") is None
+            assert negotiate_encoding("br, gzip") == "gzip"
+
+
+class TestCompressionMiddleware:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.client = TestClient(_create_app())
+
+    def test_large_response_is_compressed(self):
+        """最小サイズ以上のJSONは圧縮される"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(json.dumps(LARGE_PAYLOAD))
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_small_response_is_not_compressed(self):
+        """最小サイズ未満は圧縮しない"""
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_without_accept_encoding(self):
+        """Accept-Encodingがない場合は圧縮しない"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_not_compressed(self):
+        """ストリーミングレスポンスは圧縮しない"""
+        response = self.client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text.startswith("data: 1")
+
+    def test_chunked_response_is_compressed(self):
+        """複数チャンクに分かれたボディも最小サイズ以上なら圧縮される"""
+        response = self.client.get("/chunked", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert [json.loads(line) for line in response.text.splitlines()] == LARGE_PAYLOAD
+
+    def test_small_chunked_response_is_not_compressed(self):
+        """複数チャンクでも合計が最小サイズ未満なら圧縮しない"""
+        response = self.client.get("/chunked-small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_precompressed_response_is_not_recompressed(self):
+        """事前圧縮済みレスポンスは再圧縮されず、そのまま返される"""
+        with patch.object(compression, "compress", wraps=compression.compress) as mock_compress:
+            response = self.client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == LARGE_PAYLOAD
+        mock_compress.assert_not_called()
+
+    def test_precompressed_response_identity(self):
+        """圧縮を受け入れない場合は圧縮前のボディを返す"""
+        response = self.client.get("/precompressed", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE_PAYLOAD
+
+
+class TestCompressionThroughApp:
+
+    def test_dynamic_endpoint_is_compressed(self, client, db_session):
+        """アプリ全体のミドルウェア構成を通しても大きなレスポンスは圧縮される"""
+        for number in range(6, 26):
+            db_session.add(GameModel(title=f"東方作品{number}", series_number=number, release_year=2000 + number))
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/games", params={"game_type": "main_series"}, headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()) == 20
+
+
+class TestPrecompressedPayload:
+
+    def test_build_compresses_once(self):
+        """対応する全方式で圧縮済みボディを保持する"""
+        body = json.dumps(LARGE_PAYLOAD).encode()
+
+        payload = PrecompressedPayload.build(body)
+
+        assert gzip.decompress(payload.variants["gzip"]) == body
+
+    def test_small_body_is_not_compressed(self):
+        """最小サイズ未満は圧縮しない"""
+        assert PrecompressedPayload.build(b"[]").variants == {}
+
+
+class TestPrecompressedResponseCache:
+
+    def test_get_and_invalidate(self):
+        """保存・接頭辞指定での破棄"""
+        cache = PrecompressedResponseCache(ttl_seconds=60)
+        cache.set("games", PrecompressedPayload.build(b"[]"))
+        cache.set("game_characters:1", PrecompressedPayload.build(b"[]"))
+
+        cache.invalidate("game_characters:")
+
+        assert cache.get("games") is not None
+        assert cache.get("game_characters:1") is None
+
+    def test_expired_entry(self):
+        """有効期間を過ぎたエントリは返さない"""
+        cache = PrecompressedResponseCache(ttl_seconds=-1)
+        cache.set("games", PrecompressedPayload.build(b"[]"))
+
+        assert cache.get("games") is None
+
+
+class TestCatalogCache:
+
+    @pytest.mark.asyncio
+    async def test_games_list_is_served_from_cache(self):
+        """検索条件なしのゲーム一覧は2回目以降キャッシュから返す"""
+        mock_service = Mock()
+        mock_service.get_all_games.return_value = []
+
+        with patch("presentation.api.v1.games.GameService", return_value=mock_service):
+            first = await get_games(series_number=None, game_type=None, game_service=Mock(), session_factory=Mock())
+            second = await get_games(series_number=None, game_type=None, game_service=Mock(), session_factory=Mock())
+
+            assert first.body == second.body == b"[]"
+            mock_service.get_all_games.assert_called_once()
+
+            catalog_response_cache.invalidate()
+            await get_games(series_number=None, game_type=None, game_service=Mock(), session_factory=Mock())
+            assert mock_service.get_all_games.call_count == 2
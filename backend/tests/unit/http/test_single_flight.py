@@ -0,0 +1,232 @@
+"""
+同一キーの読み込みの集約（single-flight）・stale-while-revalidateの単体テスト
+"""
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from infrastructure.http.precompressed import PrecompressedPayload, PrecompressedResponseCache, catalog_response_cache
+from infrastructure.http.single_flight import SingleFlight
+from presentation.api.v1.games import get_games
+
+
+class BlockingLoader:
+    """releaseが呼ばれるまで完了しない読み込み関数（呼び出し回数を記録）"""
+
+    def __init__(self, result=None, error: Exception = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self._released = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self._released.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def release(self):
+        self._released.set()
+
+
+class TestSingleFlight:
+    """同一キーの読み込みの集約のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.single_flight = SingleFlight()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        """同じキーの同時呼び出しは読み込みを1回だけ実行して結果を共有する"""
+        loader = BlockingLoader(result="games")
+
+        calls = [asyncio.create_task(self.single_flight.do("games", loader)) for _ in range(20)]
+        await asyncio.sleep(0.05)
+        assert self.single_flight.in_flight("games")
+        loader.release()
+
+        assert await asyncio.gather(*calls) == ["games"] * 20
+        assert loader.calls == 1
+        assert not self.single_flight.in_flight("games")
+
+    @pytest.mark.asyncio
+    async def test_different_keys_load_separately(self):
+        """キーが異なる場合はそれぞれ読み込む"""
+        first = await self.single_flight.do("game_characters:1", lambda: 1)
+        second = await self.single_flight.do("game_characters:2", lambda: 2)
+
+        assert (first, second) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_and_not_cached(self):
+        """失敗は待っている全員に伝わり、次の呼び出しでは再度読み込む"""
+        loader = BlockingLoader(error=RuntimeError("database is locked"))
+
+        calls = [asyncio.create_task(self.single_flight.do("games", loader)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        loader.release()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert loader.calls == 1
+        assert await self.single_flight.do("games", lambda: "games") == "games"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        """待っているリクエストの1つがキャンセルされても読み込みは継続する"""
+        loader = BlockingLoader(result="games")
+
+        cancelled = asyncio.create_task(self.single_flight.do("games", loader))
+        waiting = asyncio.create_task(self.single_flight.do("games", loader))
+        await asyncio.sleep(0.05)
+        cancelled.cancel()
+        loader.release()
+
+        assert await waiting == "games"
+        assert loader.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_forget(self):
+        """forget後の呼び出しは実行中の読み込みを待たずに新たに読み込む"""
+        loader = BlockingLoader(result="old")
+        old = asyncio.create_task(self.single_flight.do("games", loader))
+        await asyncio.sleep(0.05)
+
+        self.single_flight.forget("games")
+
+        assert await self.single_flight.do("games", lambda: "new") == "new"
+        loader.release()
+        assert await old == "old"
+
+
+class TestStaleWhileRevalidate:
+    """キャッシュの読み込みの集約・期限切れ後の古い値の返却のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        """未保存のキーへの同時リクエストは読み込みを1回だけ実行して保存する"""
+        cache = PrecompressedResponseCache(ttl_seconds=60, stale_seconds=60)
+        loader = BlockingLoader(result=PrecompressedPayload.build(b"[]"))
+
+        calls = [asyncio.create_task(cache.get_or_load("games", loader)) for _ in range(20)]
+        await asyncio.sleep(0.05)
+        loader.release()
+        payloads = await asyncio.gather(*calls)
+
+        assert loader.calls == 1
+        assert all(payload is loader.result for payload in payloads)
+        assert cache.get("games") is loader.result
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_refreshing(self):
+        """期限切れ後の一定期間は古い値を返し、バックグラウンドで1回だけ更新する"""
+        cache = PrecompressedResponseCache(ttl_seconds=0.01, stale_seconds=60)
+        stale = PrecompressedPayload.build(b"[1]")
+        cache.set("games", stale)
+        time.sleep(0.02)
+        loader = Mock()
+        refresher = BlockingLoader(result=PrecompressedPayload.build(b"[2]"))
+
+        payloads = [await cache.get_or_load("games", loader, refresher=refresher) for _ in range(5)]
+        assert all(payload is stale for payload in payloads)
+        refresher.release()
+        await asyncio.sleep(0.05)
+
+        assert refresher.calls == 1
+        loader.assert_not_called()
+        assert (await cache.get_or_load("games", loader, refresher=refresher)).body == b"[2]"
+
+    @pytest.mark.asyncio
+    async def test_too_old_entry_waits_for_load(self):
+        """古い値を返す期間も過ぎた場合は読み込みを待つ"""
+        cache = PrecompressedResponseCache(ttl_seconds=0.01, stale_seconds=0.01)
+        cache.set("games", PrecompressedPayload.build(b"[1]"))
+        time.sleep(0.03)
+        refresher = Mock()
+
+        payload = await cache.get_or_load("games", lambda: PrecompressedPayload.build(b"[2]"), refresher=refresher)
+
+        assert payload.body == b"[2]"
+        refresher.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_without_refresher_waits_for_load(self):
+        """refresherを指定しない場合は期限切れを未保存と同じに扱う"""
+        cache = PrecompressedResponseCache(ttl_seconds=0.01, stale_seconds=60)
+        cache.set("games", PrecompressedPayload.build(b"[1]"))
+        time.sleep(0.02)
+
+        payload = await cache.get_or_load("games", lambda: PrecompressedPayload.build(b"[2]"))
+
+        assert payload.body == b"[2]"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load(self):
+        """読み込み中に破棄した場合、破棄前に開始した読み込みの結果は保存しない"""
+        cache = PrecompressedResponseCache(ttl_seconds=60, stale_seconds=60)
+        loader = BlockingLoader(result=PrecompressedPayload.build(b"[1]"))
+        before = asyncio.create_task(cache.get_or_load("games", loader))
+        await asyncio.sleep(0.05)
+
+        cache.invalidate()
+        after = await cache.get_or_load("games", lambda: PrecompressedPayload.build(b"[2]"))
+        loader.release()
+        await before
+
+        assert after.body == b"[2]"
+        assert cache.get("games").body == b"[2]"
+
+
+class TestGamesStampede:
+    """ゲーム一覧APIのキャッシュ期限切れ時の同時リクエストのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        catalog_response_cache.invalidate()
+        self.released = threading.Event()
+        self.mock_service = Mock()
+        self.mock_service.get_all_games.side_effect = lambda: self.released.wait(timeout=5) and []
+        # 共有する読み込みはリクエストのDBセッションを使わずにサービスを作成する
+        self.service_patcher = patch("presentation.api.v1.games.GameService", return_value=self.mock_service)
+        self.service_patcher.start()
+
+    def teardown_method(self):
+        self.service_patcher.stop()
+        catalog_response_cache.invalidate()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_query_once(self):
+        """キャッシュがない状態の同時リクエストでもDBから読み込むのは1回"""
+        request_service = Mock()
+
+        requests = [
+            asyncio.create_task(get_games(series_number=None, game_type=None, game_service=request_service, session_factory=Mock()))
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0.05)
+        self.released.set()
+        responses = await asyncio.gather(*requests)
+
+        assert all(response.body == b"[]" for response in responses)
+        self.mock_service.get_all_games.assert_called_once()
+        request_service.get_all_games.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_request_cancelled(self):
+        """読み込みを開始したリクエストがキャンセルされても、待っている他のリクエストは応答できる"""
+        first = asyncio.create_task(get_games(series_number=None, game_type=None, game_service=Mock(), session_factory=Mock()))
+        await asyncio.sleep(0.05)
+        others = [
+            asyncio.create_task(get_games(series_number=None, game_type=None, game_service=Mock(), session_factory=Mock()))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        first.cancel()
+        self.released.set()
+        responses = await asyncio.gather(*others)
+
+        assert all(response.body == b"[]" for response in responses)
+        self.mock_service.get_all_games.assert_called_once()
@@ -0,0 +1,45 @@
+"""
+バックグラウンドジョブの実行メトリクスの単体テスト
+"""
+from infrastructure.jobs.metrics import JobMetrics
+
+
+class TestJobMetrics:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.metrics = JobMetrics()
+
+    def test_record(self):
+        """処理行数の累計・直近の結果・最大所要時間を記録する"""
+        self.metrics.record("sweep", 12.0, {"cleared": 3})
+        self.metrics.record("sweep", 5.0, {"cleared": 2, "purged": 1})
+
+        snapshot = self.metrics.snapshot("sweep")
+
+        assert snapshot["runs"] == 2
+        assert snapshot["rows_total"] == {"cleared": 5, "purged": 1}
+        assert snapshot["last_rows"] == {"cleared": 2, "purged": 1}
+        assert snapshot["last_duration_ms"] == 5.0
+        assert snapshot["max_duration_ms"] == 12.0
+        assert snapshot["last_run_at"] is not None
+
+    def test_record_failure(self):
+        """失敗回数と直近のエラーを記録し、成功すると直近のエラーを消す"""
+        self.metrics.record_failure("sweep", "database is locked")
+
+        assert self.metrics.snapshot("sweep")["failures"] == 1
+        assert self.metrics.snapshot("sweep")["last_error"] == "database is locked"
+
+        self.metrics.record("sweep", 1.0, {})
+
+        assert self.metrics.snapshot("sweep")["last_error"] is None
+
+    def test_snapshot_is_a_copy(self):
+        """取得したメトリクスを変更しても記録に影響しない"""
+        self.metrics.record("sweep", 1.0, {"cleared": 1})
+
+        self.metrics.snapshot()["sweep"]["rows_total"]["cleared"] = 100
+
+        assert self.metrics.snapshot("sweep")["rows_total"] == {"cleared": 1}
+        assert self.metrics.snapshot("unknown") == {}
@@ -0,0 +1,180 @@
+"""
+定期ジョブスケジューラーの単体テスト
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import Mock
+from infrastructure.database.connection import Base
+from infrastructure.database.repositories.job_lease_repository_impl import JobLeaseRepositoryImpl
+from infrastructure.jobs.metrics import job_metrics
+from infrastructure.jobs.scheduler import (
+    RUN_FAILED, RUN_SKIPPED, RUN_SUCCEEDED, JobScheduler, ScheduledJob
+)
+from infrastructure.jobs.schedules import IntervalSchedule
+
+
+class TestJobScheduler:
+    """ジョブの実行・同時実行数・リースのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        job_metrics.clear()
+
+    def teardown_method(self):
+        job_metrics.clear()
+        self.engine.dispose()
+
+    def _scheduler(self, owner: str = "worker-a", **kwargs) -> JobScheduler:
+        return JobScheduler(session_factory=self.session_factory, owner=owner, **kwargs)
+
+    def _job(self, func, **kwargs) -> ScheduledJob:
+        kwargs.setdefault("jitter_seconds", 0)
+        return ScheduledJob(name="sweep", func=func, schedule=IntervalSchedule(60), **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_run_job_records_history_and_metrics(self):
+        """処理行数・所要時間を実行履歴とメトリクスに記録する"""
+        scheduler = self._scheduler()
+        scheduler.register(self._job(Mock(return_value={"cleared": 3})))
+
+        run = await scheduler.run_job("sweep")
+
+        assert run.status == RUN_SUCCEEDED
+        assert run.rows == {"cleared": 3}
+        assert run.duration_ms is not None
+        assert job_metrics.snapshot("sweep")["rows_total"] == {"cleared": 3}
+        status = scheduler.status()[0]
+        assert status["is_leader"] is True
+        assert status["history"][0]["status"] == RUN_SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_run_job_failure(self):
+        """例外は失敗として記録し、スケジューラーには伝播しない"""
+        scheduler = self._scheduler()
+        scheduler.register(self._job(Mock(side_effect=RuntimeError("database is locked"))))
+
+        run = await scheduler.run_job("sweep")
+
+        assert run.status == RUN_FAILED
+        assert run.error == "database is locked"
+        assert job_metrics.snapshot("sweep")["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coroutine_job(self):
+        """コルーチン関数のジョブはイベントループ上で実行する"""
+        async def compact():
+            return {"deleted": 2}
+
+        scheduler = self._scheduler()
+        scheduler.register(self._job(compact, leader_only=False))
+
+        run = await scheduler.run_job("sweep")
+
+        assert run.rows == {"deleted": 2}
+        assert scheduler.status()[0]["is_leader"] is None
+
+    @pytest.mark.asyncio
+    async def test_only_leader_runs(self):
+        """リースを保持するワーカーだけが実行する"""
+        func_a, func_b = Mock(return_value=None), Mock(return_value=None)
+        scheduler_a, scheduler_b = self._scheduler("worker-a"), self._scheduler("worker-b")
+        scheduler_a.register(self._job(func_a))
+        scheduler_b.register(self._job(func_b))
+
+        assert (await scheduler_a.run_job("sweep")).status == RUN_SUCCEEDED
+        run_b = await scheduler_b.run_job("sweep")
+
+        assert run_b.status == RUN_SKIPPED
+        assert run_b.error == "lease held by another worker"
+        func_a.assert_called_once()
+        func_b.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """同時実行数の上限に達している場合は実行しない"""
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        scheduler = self._scheduler()
+        scheduler.register(self._job(slow, leader_only=False))
+
+        first = asyncio.create_task(scheduler.run_job("sweep"))
+        await asyncio.sleep(0)
+        second = await scheduler.run_job("sweep")
+        release.set()
+
+        assert second.status == RUN_SKIPPED
+        assert (await first).status == RUN_SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency(self):
+        """全ジョブ合計の同時実行数を超えた分は空くまで待つ"""
+        running, peak = 0, 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = self._scheduler(max_concurrency=1)
+        for name in ("a", "b", "c"):
+            scheduler.register(ScheduledJob(name=name, func=job, schedule=IntervalSchedule(60), leader_only=False))
+
+        runs = await asyncio.gather(*(scheduler.run_job(name) for name in ("a", "b", "c")))
+
+        assert [run.status for run in runs] == [RUN_SUCCEEDED] * 3
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """起動直後に実行し、停止時にリースを手放す"""
+        func = Mock(return_value=None)
+        scheduler = self._scheduler()
+        scheduler.register(self._job(func))
+
+        scheduler.start()
+        for _ in range(100):
+            if func.called and not scheduler.status()[0]["running"]:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        func.assert_called_once()
+        assert not scheduler.is_running
+        other = self._scheduler("worker-b")
+        other.register(self._job(Mock(return_value=None)))
+        assert (await other.run_job("sweep")).status == RUN_SUCCEEDED
+
+    def test_register_while_running(self):
+        """起動中は登録できない"""
+        scheduler = self._scheduler()
+        scheduler._loops.append(Mock())
+
+        with pytest.raises(RuntimeError):
+            scheduler.register(self._job(Mock()))
+
+    def test_lease_expires_at_next_run(self):
+        """リースは次回の実行時刻（最短lease_min_seconds秒後）まで保持する"""
+        now = datetime(2024, 1, 1, 10, 0, 0)
+        scheduler = self._scheduler(clock=lambda: now, lease_min_seconds=60)
+
+        scheduler._acquire_lease("sweep", now + timedelta(hours=1))
+        scheduler._acquire_lease("compact", now + timedelta(seconds=10))
+
+        db = self.session_factory()
+        leases = {lease["job_name"]: lease["expires_at"] for lease in JobLeaseRepositoryImpl(db).find_all()}
+        db.close()
+        assert leases == {"sweep": now + timedelta(hours=1), "compact": now + timedelta(seconds=60)}
@@ -0,0 +1,78 @@
+"""
+定期ジョブの実行スケジュールの単体テスト
+"""
+import pytest
+from datetime import datetime
+from infrastructure.jobs.schedules import CronSchedule, IntervalSchedule
+
+
+class TestIntervalSchedule:
+
+    def test_first_and_next_run(self):
+        """起動直後に1回実行し、その後は一定間隔"""
+        schedule = IntervalSchedule(600)
+        now = datetime(2024, 1, 1, 10, 0, 0)
+
+        assert schedule.first_run(now) == now
+        assert schedule.next_run(now) == datetime(2024, 1, 1, 10, 10, 0)
+
+    def test_without_run_at_start(self):
+        """run_at_start=Falseの場合は1間隔後から実行"""
+        schedule = IntervalSchedule(60, run_at_start=False)
+
+        assert schedule.first_run(datetime(2024, 1, 1, 10, 0, 0)) == datetime(2024, 1, 1, 10, 1, 0)
+
+    def test_invalid_interval(self):
+        """0以下の間隔はエラー"""
+        with pytest.raises(ValueError):
+            IntervalSchedule(0)
+
+
+class TestCronSchedule:
+
+    def test_daily(self):
+        """毎日決まった時刻（当日分を過ぎていれば翌日）"""
+        schedule = CronSchedule("30 4 * * *")
+
+        assert schedule.next_run(datetime(2024, 1, 1, 3, 0, 0)) == datetime(2024, 1, 1, 4, 30)
+        assert schedule.next_run(datetime(2024, 1, 1, 4, 30, 0)) == datetime(2024, 1, 2, 4, 30)
+
+    def test_step_and_range(self):
+        """*/n・範囲・カンマ区切り"""
+        schedule = CronSchedule("*/15 9-17 * * *")
+
+        assert schedule.next_run(datetime(2024, 1, 1, 9, 7, 30)) == datetime(2024, 1, 1, 9, 15)
+        assert schedule.next_run(datetime(2024, 1, 1, 17, 45, 0)) == datetime(2024, 1, 2, 9, 0)
+        assert CronSchedule("0 6,18 * * *").next_run(datetime(2024, 1, 1, 7, 0)) == datetime(2024, 1, 1, 18, 0)
+
+    def test_weekday(self):
+        """曜日指定（0と7は日曜日）"""
+        # 2024-01-01は月曜日
+        assert CronSchedule("0 0 * * 0").next_run(datetime(2024, 1, 1)) == datetime(2024, 1, 7)
+        assert CronSchedule("0 0 * * 7").next_run(datetime(2024, 1, 1)) == datetime(2024, 1, 7)
+        assert CronSchedule("0 0 * * 1-5").next_run(datetime(2024, 1, 5, 12, 0)) == datetime(2024, 1, 8)
+
+    def test_day_or_weekday(self):
+        """日と曜日の両方を指定した場合はどちらかに一致すれば実行（cronと同じ）"""
+        schedule = CronSchedule("0 0 15 * 0")
+
+        assert schedule.next_run(datetime(2024, 1, 1)) == datetime(2024, 1, 7)
+        assert schedule.next_run(datetime(2024, 1, 14, 1, 0)) == datetime(2024, 1, 15)
+
+    def test_month_and_year_rollover(self):
+        """月・年をまたぐ"""
+        schedule = CronSchedule("0 0 1 3 *")
+
+        assert schedule.next_run(datetime(2024, 3, 1, 0, 0)) == datetime(2025, 3, 1)
+        assert CronSchedule("0 0 29 2 *").next_run(datetime(2024, 3, 1)) == datetime(2028, 2, 29)
+
+    @pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* * 0 * *", "*/0 * * * *", "a * * * *"])
+    def test_invalid_expression(self, expression):
+        """不正なcron式はエラー"""
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+    def test_never_matches(self):
+        """存在しない日付はエラー"""
+        with pytest.raises(ValueError):
+            CronSchedule("0 0 31 2 *").next_run(datetime(2024, 1, 1))
@@ -0,0 +1,68 @@
+"""
+負荷試験ハーネスのテスト
+"""
+import pytest
+from loadtest.config import LoadTestConfig, parse_think_time, parse_user_mix
+from loadtest.mailbox import MockEmailMailbox
+from loadtest.metrics import TOTAL_KEY, MetricsCollector
+
+
+class TestLoadTestConfig:
+    """負荷試験設定のテストクラス"""
+
+    def test_parse_user_mix(self):
+        """ユーザー構成の文字列が解析されること"""
+        assert parse_user_mix("new_player=1,returning=6") == {"new_player": 1.0, "returning": 6.0}
+
+    def test_parse_think_time(self):
+        """思考時間の範囲・固定値が解析されること"""
+        assert parse_think_time("0.5:2") == (0.5, 2.0)
+        assert parse_think_time("1") == (1.0, 1.0)
+
+    def test_unknown_session_type(self):
+        """未知のセッション種別はエラーになること"""
+        with pytest.raises(ValueError):
+            LoadTestConfig(user_mix={"unknown": 1.0})
+
+    def test_all_weights_zero(self):
+        """全ての重みが0の場合はエラーになること"""
+        with pytest.raises(ValueError):
+            LoadTestConfig(user_mix={"returning": 0.0})
+
+
+class TestMetricsCollector:
+    """MetricsCollectorのテストクラス"""
+
+    def test_summary(self):
+        """エンドポイント別・合計のスループットとエラー率が集計されること"""
+        metrics = MetricsCollector()
+        for duration in (10.0, 20.0, 30.0):
+            metrics.record("GET /api/v1/games", duration, ok=True)
+        metrics.record("POST /api/v1/users/login", 100.0, ok=False)
+
+        summary = metrics.summary(elapsed_sec=2.0)
+
+        assert summary["GET /api/v1/games"]["throughput_rps"] == 1.5
+        assert summary["GET /api/v1/games"]["p50_ms"] == 20.0
+        assert summary["POST /api/v1/users/login"]["error_rate"] == 1.0
+        assert summary[TOTAL_KEY]["requests"] == 4
+        assert summary[TOTAL_KEY]["error_rate"] == 0.25
+
+
+class TestMockEmailMailbox:
+    """MockEmailMailboxのテストクラス"""
+
+    @pytest.mark.asyncio
+    async def test_token_is_extracted_from_mock_email_output(self):
+        """モックメール送信の出力から宛先ごとの認証トークンが取得できること"""
+        mailbox = MockEmailMailbox()
+        for line in [
+            "📧 メール送信（開発モード）",
+            "宛先: player@example.com",
+            "件名: 東方プロジェクト クリアチェッカー - メールアドレス認証",
+            "http://localhost:3000/verify-email?token=abc123",
+        ]:
+            mailbox.feed_line(line)
+
+        assert await mailbox.get_token("player@example.com") == "abc123"
+        assert await mailbox.get_token("other@example.com", timeout_sec=0.1) is None
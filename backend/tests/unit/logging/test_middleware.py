@@ -6,6 +6,7 @@ from unittest.mock import Mock, AsyncMock, patch
 from fastapi import Request, Response
 from infrastructure.logging.middleware import RequestTracingMiddleware
 from infrastructure.logging.context import RequestContext
+from infrastructure.profiling.constants import ProfilingConstants
 
 
 class TestRequestTracingMiddleware:
@@ -179,3 +180,106 @@ class TestRequestTracingMiddleware:
         assert RequestContext.get_request_id() is None
         assert RequestContext.get_user_id() is None
         assert RequestContext.get_username() is None
+
+    @pytest.mark.asyncio
+    async def test_middleware_reports_db_query_stats(self):
+        """ミドルウェアがDBクエリ数・DB時間を完了ログとヘッダーに含めること"""
+        # Arrange
+        middleware = RequestTracingMiddleware(app=Mock())
+        mock_request = Mock(spec=Request)
+        mock_request.method = "GET"
+        mock_request.url.path = "/api/v1/clear-records"
+        mock_request.client = Mock()
+        mock_request.client.host = "127.0.0.1"
+
+        async def call_next(request):
+            RequestContext.record_db_query(1.5)
+            RequestContext.record_db_query(2.5)
+            return Response(status_code=200)
+
+        # Act
+        with patch("infrastructure.logging.middleware.logger") as mock_logger:
+            response = await middleware.dispatch(mock_request, call_next)
+
+            # Assert
+            extra_data = mock_logger.info.call_args_list[1][1]["extra"]["extra"]
+            assert extra_data["db_query_count"] == 2
+            assert extra_data["db_time_ms"] == 4.0
+            assert response.headers["X-DB-Queries"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_middleware_profiles_request_with_valid_token(self):
+        """プロファイリング用シークレットが一致する場合にレポートが保存されること"""
+        # Arrange
+        middleware = RequestTracingMiddleware(app=Mock())
+        mock_request = Mock(spec=Request)
+        mock_request.method = "GET"
+        mock_request.url.path = "/api/v1/games"
+        mock_request.headers = {"X-Profile-Token": "profile-secret"}
+        mock_request.client = Mock()
+        mock_request.client.host = "127.0.0.1"
+        call_next = AsyncMock(return_value=Response(status_code=200))
+
+        # Act
+        with patch.object(ProfilingConstants, "PROFILING_SECRET", "profile-secret"), \
+                patch("infrastructure.logging.middleware.RequestProfiler.start"), \
+                patch("infrastructure.logging.middleware.RequestProfiler.stop", return_value="report"), \
+                patch("infrastructure.logging.middleware.profile_report_store") as mock_store:
+            response = await middleware.dispatch(mock_request, call_next)
+
+            # Assert
+            assert response.headers["X-Profile-ID"] == response.headers["X-Request-ID"]
+            saved_report = mock_store.save.call_args[0][0]
+            assert saved_report.request_id == response.headers["X-Request-ID"]
+            assert saved_report.path == "/api/v1/games"
+            assert saved_report.report == "report"
+
+    @pytest.mark.asyncio
+    async def test_middleware_does_not_profile_with_invalid_token(self):
+        """シークレットが一致しない場合はプロファイリングしないこと"""
+        # Arrange
+        middleware = RequestTracingMiddleware(app=Mock())
+        mock_request = Mock(spec=Request)
+        mock_request.method = "GET"
+        mock_request.url.path = "/api/v1/games"
+        mock_request.headers = {"X-Profile-Token": "wrong"}
+        mock_request.client = Mock()
+        mock_request.client.host = "127.0.0.1"
+        call_next = AsyncMock(return_value=Response(status_code=200))
+
+        # Act
+        with patch.object(ProfilingConstants, "PROFILING_SECRET", "profile-secret"), \
+                patch("infrastructure.logging.middleware.profile_report_store") as mock_store:
+            response = await middleware.dispatch(mock_request, call_next)
+
+            # Assert
+            assert "X-Profile-ID" not in response.headers
+            mock_store.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_middleware_skips_profile_when_start_fails(self):
+        """プロファイリングを開始できない場合もリクエストは通常どおり処理されること"""
+        # Arrange
+        middleware = RequestTracingMiddleware(app=Mock())
+        mock_request = Mock(spec=Request)
+        mock_request.method = "GET"
+        mock_request.url.path = "/api/v1/games"
+        mock_request.headers = {"X-Profile-Token": "profile-secret"}
+        mock_request.client = Mock()
+        mock_request.client.host = "127.0.0.1"
+        call_next = AsyncMock(return_value=Response(status_code=200))
+
+        for start_result in (
+            {"return_value": False},
+            {"side_effect": ValueError("Another profiling tool is already active")},
+        ):
+            # Act
+            with patch.object(ProfilingConstants, "PROFILING_SECRET", "profile-secret"), \
+                    patch("infrastructure.logging.middleware.RequestProfiler.start", **start_result), \
+                    patch("infrastructure.logging.middleware.profile_report_store") as mock_store:
+                response = await middleware.dispatch(mock_request, call_next)
+
+                # Assert
+                assert response.status_code == 200
+                assert "X-Profile-ID" not in response.headers
+                mock_store.save.assert_not_called()
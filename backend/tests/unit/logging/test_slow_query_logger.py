@@ -0,0 +1,130 @@
+"""
+スロークエリロガーのテスト
+"""
+import pytest
+from unittest.mock import Mock, patch
+from sqlalchemy import create_engine, text
+from infrastructure.logging.slow_query_logger import SlowQueryLogger
+
+
+class TestSlowQueryLogger:
+    """SlowQueryLoggerのテストクラス"""
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def _create_logger(self, threshold_ms: float, explain_enabled: bool = False) -> SlowQueryLogger:
+        slow_logger = SlowQueryLogger(threshold_ms=threshold_ms, explain_enabled=explain_enabled)
+        slow_logger._logger = Mock()
+        return slow_logger
+
+    def test_fast_query_is_not_logged(self):
+        """閾値未満のクエリは記録されないこと"""
+        slow_logger = self._create_logger(threshold_ms=100)
+
+        with self.engine.connect() as conn:
+            logged = slow_logger.log_if_slow(conn, "SELECT 1", (), 5.0)
+
+        assert logged is False
+        slow_logger._logger.warning.assert_not_called()
+
+    def test_slow_query_is_logged_with_details(self):
+        """閾値以上のクエリが文・時間・方言と共に記録されること"""
+        slow_logger = self._create_logger(threshold_ms=100)
+
+        with self.engine.connect() as conn:
+            logged = slow_logger.log_if_slow(conn, "SELECT * FROM items WHERE id = ?", (1,), 150.123)
+
+        assert logged is True
+        event_data = slow_logger._logger.warning.call_args[1]["extra"]["extra"]
+        assert event_data["statement"] == "SELECT * FROM items WHERE id = ?"
+        assert event_data["parameters"] == [1]
+        assert event_data["duration_ms"] == 150.12
+        assert event_data["dialect"] == "sqlite"
+        assert "explain_plan" not in event_data
+
+    def test_sensitive_parameters_are_masked(self):
+        """パラメータ内の機密情報がマスキングされること"""
+        parameters = ("user@example.com", "$argon2id$v=19$m=65536,t=3,p=1$abc$def", "霊夢")
+
+        sanitized = SlowQueryLogger.sanitize_parameters(parameters)
+
+        assert sanitized[0] == "***REDACTED***"
+        assert sanitized[1] == "***REDACTED***"
+        assert sanitized[2] == "霊夢"
+
+    def test_positional_parameters_are_masked_by_column(self):
+        """位置指定パラメータは値のパターンに一致しなくても列名でマスキングされること"""
+        token = "Ab-cD_" + "x" * 58
+        statement = (
+            "SELECT users.id FROM users WHERE users.verification_token = ? "
+            "AND users.id IN (?, ?) LIMIT ? OFFSET ?"
+        )
+
+        sanitized = SlowQueryLogger.sanitize_parameters((token, 1, 2, 10, 0), statement)
+
+        assert sanitized == ["***REDACTED***", 1, 2, 10, 0]
+
+    def test_insert_parameters_are_masked_by_column(self):
+        """INSERT文・executemanyでも列リストの順にマスキングされること"""
+        statement = "INSERT INTO users (username, verification_token) VALUES (%s, %s)"
+
+        sanitized = SlowQueryLogger.sanitize_parameters([("reimu", "a-b_c"), ("marisa", "d-e_f")], statement)
+
+        assert sanitized == [["reimu", "***REDACTED***"], ["marisa", "***REDACTED***"]]
+
+    def test_long_parameters_are_truncated(self):
+        """長いパラメータが切り詰められること"""
+        sanitized = SlowQueryLogger.sanitize_parameters({"memo": "あ" * 500})
+
+        assert len(sanitized["memo"]) < 500
+        assert sanitized["memo"].endswith("...")
+
+    def test_explain_plan_is_captured_on_sqlite(self):
+        """SQLiteで実行計画が取得されること"""
+        slow_logger = self._create_logger(threshold_ms=0, explain_enabled=True)
+
+        with self.engine.connect() as conn:
+            slow_logger.log_if_slow(conn, "SELECT * FROM items WHERE id = ?", (1,), 1.0)
+
+        event_data = slow_logger._logger.warning.call_args[1]["extra"]["extra"]
+        assert len(event_data["explain_plan"]) >= 1
+
+    def test_explain_is_skipped_for_non_select(self):
+        """SELECT以外では実行計画を取得しないこと"""
+        with self.engine.connect() as conn:
+            plan = SlowQueryLogger.explain(conn, "DELETE FROM items", ())
+
+        assert plan is None
+
+    def test_find_caller_detects_repository_method(self):
+        """呼び出し元のリポジトリメソッドが特定されること"""
+        from infrastructure.database.repositories.game_repository_impl import GameRepositoryImpl
+
+        session = Mock()
+        session.query.side_effect = lambda *_: (_ for _ in ()).throw(LookupError(SlowQueryLogger.find_caller()))
+        repository = GameRepositoryImpl(session)
+
+        with pytest.raises(LookupError) as exc_info:
+            repository.find_all()
+
+        assert exc_info.value.args[0] == "GameRepositoryImpl.find_all"
+
+    def test_find_caller_returns_none_outside_repository(self):
+        """リポジトリ外からの呼び出しではNoneになること"""
+        assert SlowQueryLogger.find_caller() is None
+
+    def test_instrumented_engine_logs_slow_queries(self):
+        """計測イベント経由でスロークエリが記録されること"""
+        slow_logger = self._create_logger(threshold_ms=0)
+
+        with patch("infrastructure.database.query_instrumentation.slow_query_logger", slow_logger):
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT name FROM items"))
+
+        slow_logger._logger.warning.assert_called_once()
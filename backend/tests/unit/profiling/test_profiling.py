@@ -0,0 +1,153 @@
+"""
+プロファイリング基盤のテスト
+"""
+import threading
+import pytest
+from unittest.mock import patch
+from datetime import datetime, UTC
+from infrastructure.profiling.report_store import ProfileReport, ProfileReportStore
+from infrastructure.profiling.request_profiler import RequestProfiler
+from infrastructure.profiling.sampling_profiler import SamplingProfiler, TRUNCATED_STACK_KEY
+
+
+def _create_report(request_id: str) -> ProfileReport:
+    return ProfileReport(
+        request_id=request_id,
+        method="GET",
+        path="/api/v1/games",
+        profiler="cprofile",
+        duration_ms=1.0,
+        created_at=datetime.now(UTC),
+        report="report"
+    )
+
+
+class TestRequestProfiler:
+    """RequestProfilerのテストクラス"""
+
+    def test_is_authorized(self):
+        """シークレットとの一致判定"""
+        assert RequestProfiler.is_authorized("secret", secret="secret") is True
+        assert RequestProfiler.is_authorized("wrong", secret="secret") is False
+        assert RequestProfiler.is_authorized(None, secret="secret") is False
+
+    def test_is_authorized_disabled_without_secret(self):
+        """シークレット未設定の場合は常に無効であること"""
+        assert RequestProfiler.is_authorized("", secret="") is False
+        assert RequestProfiler.is_authorized("anything", secret="") is False
+
+    def test_cprofile_report(self):
+        """cProfileでレポートが生成されること"""
+        profiler = RequestProfiler(use_pyinstrument=False)
+
+        profiler.start()
+        sum(range(1000))
+        report = profiler.stop()
+
+        assert profiler.profiler_name == "cprofile"
+        assert "function calls" in report
+
+    def test_only_one_request_profiled_at_a_time(self):
+        """プロファイリング中は他のリクエストのプロファイリングを開始しないこと"""
+        first = RequestProfiler(use_pyinstrument=False)
+        second = RequestProfiler(use_pyinstrument=False)
+
+        assert first.start() is True
+        try:
+            assert second.start() is False
+            assert second.stop() == ""
+        finally:
+            first.stop()
+
+        assert second.start() is True
+        second.stop()
+
+    def test_start_failure_releases_slot(self):
+        """開始に失敗した場合も次のリクエストはプロファイリングできること"""
+        profiler = RequestProfiler(use_pyinstrument=False)
+
+        with patch("infrastructure.profiling.request_profiler.cProfile.Profile", side_effect=ValueError("busy")):
+            with pytest.raises(ValueError):
+                profiler.start()
+
+        assert profiler.start() is True
+        profiler.stop()
+
+    def test_stop_without_start(self):
+        """開始前に停止しても空のレポートになること"""
+        assert RequestProfiler(use_pyinstrument=False).stop() == ""
+
+
+class TestProfileReportStore:
+    """ProfileReportStoreのテストクラス"""
+
+    def test_save_and_get(self):
+        """リクエストIDでレポートを取得できること"""
+        store = ProfileReportStore(max_size=5)
+
+        store.save(_create_report("req-1"))
+
+        assert store.get("req-1").request_id == "req-1"
+        assert store.get("unknown") is None
+
+    def test_evicts_oldest_report(self):
+        """上限を超えると古いレポートから破棄されること"""
+        store = ProfileReportStore(max_size=2)
+
+        for request_id in ("req-1", "req-2", "req-3"):
+            store.save(_create_report(request_id))
+
+        assert store.get("req-1") is None
+        assert [report.request_id for report in store.list()] == ["req-3", "req-2"]
+
+
+class TestSamplingProfiler:
+    """SamplingProfilerのテストクラス"""
+
+    def test_sample_collects_other_threads(self):
+        """他スレッドのスタックがcollapsed形式で集計されること"""
+        profiler = SamplingProfiler()
+        ready = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            ready.set()
+            release.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        ready.wait()
+        try:
+            profiler.sample()
+        finally:
+            release.set()
+            thread.join()
+
+        collapsed = profiler.collapsed()
+        assert profiler.sample_count == 1
+        assert "test_profiling:worker" in collapsed
+        for line in collapsed.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) >= 1
+
+    def test_unique_stack_limit(self):
+        """ユニークなスタック数が上限を超えた分はまとめて集計されること"""
+        profiler = SamplingProfiler(max_unique_stacks=0)
+
+        # 呼び出しスレッド自身は除外されるため別スレッドから採取する
+        thread = threading.Thread(target=profiler.sample)
+        thread.start()
+        thread.join()
+
+        assert profiler.collapsed().startswith(TRUNCATED_STACK_KEY)
+
+    def test_start_and_stop(self):
+        """開始・停止でサンプリングスレッドが制御されること"""
+        profiler = SamplingProfiler()
+
+        assert profiler.start(interval_ms=1) is True
+        assert profiler.start(interval_ms=1) is False
+        assert profiler.is_running is True
+        assert profiler.stop() is True
+        assert profiler.is_running is False
+        assert profiler.stop() is False
@@ -0,0 +1,98 @@
+"""
+達成スコア順位インデックスの単体テスト
+"""
+import random
+from unittest.mock import Mock
+from infrastructure.ranking.score_index import FenwickTree, RankingIndex
+from domain.constants.ranking_constants import calculate_record_score, get_condition_scores_for_game
+from domain.constants.game_constants import GameIds
+
+
+class TestFenwickTree:
+
+    def test_matches_sorted_scores(self):
+        """順位・N番目のスコアが全件ソートの結果と一致する"""
+        rng = random.Random(1)
+        scores = [rng.randint(1, 300) for _ in range(500)]
+        tree = FenwickTree(capacity=8)
+        for score in scores:
+            tree.add(score, 1)
+
+        ordered = sorted(scores, reverse=True)
+        assert tree.total == 500
+        assert tree.capacity >= 301
+        assert [tree.score_at(position) for position in range(1, 501)] == ordered
+        for score in (1, 50, 150, 300, 400):
+            assert tree.count_above(score) == sum(1 for value in scores if value > score)
+
+    def test_remove(self):
+        """人数を減らすと順位が繰り上がる"""
+        tree = FenwickTree()
+        for score in (10, 20, 30):
+            tree.add(score, 1)
+        tree.add(30, -1)
+
+        assert tree.count_above(10) == 1
+        assert tree.score_at(1) == 20
+
+    def test_score_at_out_of_range(self):
+        """人数を超える位置はNone"""
+        tree = FenwickTree()
+        tree.add(5, 1)
+
+        assert tree.score_at(2) is None
+        assert tree.score_at(0) is None
+
+
+class TestRankingIndex:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.index = RankingIndex(ttl_seconds=60)
+        self.loader = Mock(return_value={100: 1, 50: 2, 10: 1})
+
+    def test_rank_with_ties(self):
+        """同点は同順位（自分より高いスコアの人数 + 1）"""
+        assert self.index.rank(1, 50, self.loader) == (2, 4)
+        assert self.index.rank(1, 10, self.loader) == (4, 4)
+        self.loader.assert_called_once()
+
+    def test_locate(self):
+        """N番目のユーザーのスコアと、それより高い人数"""
+        assert self.index.locate(1, 3, self.loader) == (50, 1, 4)
+        assert self.index.locate(1, 5, self.loader) == (None, 4, 4)
+
+    def test_apply(self):
+        """このプロセスでのスコア変更を反映（0は対象外）"""
+        self.index.rank(1, 0, self.loader)
+        self.index.apply(1, 10, 200)
+        self.index.apply(1, 0, 5)
+
+        assert self.index.rank(1, 200, self.loader) == (1, 5)
+        assert self.index.rank(1, 5, self.loader) == (5, 5)
+
+    def test_rebuild_after_ttl(self):
+        """TTL経過後・破棄後はスコア分布から作り直す"""
+        index = RankingIndex(ttl_seconds=0)
+        index.rank(1, 50, self.loader)
+        index.rank(1, 50, self.loader)
+        assert self.loader.call_count == 2
+
+        self.index.rank(1, 50, self.loader)
+        self.index.invalidate(1)
+        self.index.rank(1, 50, self.loader)
+        assert self.loader.call_count == 4
+
+
+class TestRecordScore:
+
+    def test_difficulty_weight(self):
+        """達成条件のスコアの合計 × 難易度倍率"""
+        assert calculate_record_score(GameIds.TOUHOU_06_EOSD, "Easy", 0b1) == 10
+        assert calculate_record_score(GameIds.TOUHOU_06_EOSD, "Lunatic", 0b1001) == 125
+
+    def test_unavailable_special_condition(self):
+        """作品で利用できない特殊条件はスコアに含めない"""
+        assert get_condition_scores_for_game(GameIds.TOUHOU_06_EOSD)[5:] == (0, 0, 0)
+        assert get_condition_scores_for_game(GameIds.TOUHOU_12_UFO)[5] > 0
+        assert calculate_record_score(GameIds.TOUHOU_06_EOSD, "Easy", 0b100000) == 0
@@ -0,0 +1,177 @@
+"""
+レート制限・負荷制限ミドルウェアの単体テスト
+"""
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from infrastructure.ratelimit.middleware import (
+    KEY_BY_IP,
+    KEY_BY_USER,
+    ConcurrencyLimitMiddleware,
+    RateLimitMiddleware,
+    RateLimitRule,
+    client_ip,
+    rate_limit_key,
+)
+from infrastructure.ratelimit.stores import ShardedMemoryTokenBucketStore
+from infrastructure.security.jwt_handler import JWTHandler
+
+
+RULES = (
+    RateLimitRule("login", "POST", "/login", capacity=2, refill_per_second=0.5, key_by=KEY_BY_IP),
+    RateLimitRule("batch", "POST", "/batch", capacity=1, refill_per_second=0.1, key_by=KEY_BY_USER),
+)
+
+
+def _create_app(store) -> FastAPI:
+    """テスト用アプリを作成"""
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, rules=RULES, store=store)
+
+    @app.post("/login")
+    async def login():
+        return JSONResponse({"ok": True})
+
+    @app.post("/batch")
+    async def batch():
+        return JSONResponse({"ok": True})
+
+    @app.get("/games")
+    async def games():
+        return JSONResponse([])
+
+    return app
+
+
+def _bearer(username: str) -> dict:
+    return {"Authorization": f"Bearer {JWTHandler().create_access_token({'sub': username})}"}
+
+
+class TestRateLimitKey:
+    """バケットのキーの作成のテスト"""
+
+    def _scope(self, headers=(), client=("10.0.0.1", 50000)):
+        return {
+            "type": "http",
+            "headers": [(name.encode(), value.encode()) for name, value in headers],
+            "client": client,
+        }
+
+    def test_ip_rule(self):
+        """IPごとのルールはトークンがあってもクライアントIPをキーにする"""
+        token = _bearer("reimu")["Authorization"]
+        scope = self._scope([("authorization", token)])
+
+        assert rate_limit_key(RULES[0], scope) == "login:ip:10.0.0.1"
+
+    def test_user_rule(self):
+        """ユーザーごとのルールはJWTのsubjectをキーにする"""
+        scope = self._scope([("authorization", _bearer("reimu")["Authorization"])])
+
+        assert rate_limit_key(RULES[1], scope) == "batch:user:reimu"
+
+    def test_user_rule_with_invalid_token(self):
+        """トークンが無効な場合はクライアントIPをキーにする"""
+        scope = self._scope([("authorization", "Bearer invalid")])
+
+        assert rate_limit_key(RULES[1], scope) == "batch:ip:10.0.0.1"
+
+    def test_forwarded_for(self):
+        """プロキシを信頼する場合のみX-Forwarded-Forの末尾を使用する"""
+        scope = self._scope([("x-forwarded-for", "203.0.113.9, 198.51.100.7")])
+
+        assert client_ip(scope, trust_forwarded_for=False) == "10.0.0.1"
+        assert client_ip(scope, trust_forwarded_for=True) == "198.51.100.7"
+
+
+class TestRateLimitMiddleware:
+    """ルート別のレート制限のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.store = ShardedMemoryTokenBucketStore()
+        self.client = TestClient(_create_app(self.store))
+
+    def test_rejects_after_capacity(self):
+        """容量を超えたリクエストは429とRetry-Afterを返す"""
+        first = self.client.post("/login")
+        second = self.client.post("/login")
+        third = self.client.post("/login")
+
+        assert [first.status_code, second.status_code, third.status_code] == [200, 200, 429]
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert third.headers["Retry-After"] == "2"
+        assert third.json()["error_code"] == "RATE_LIMITED"
+
+    def test_users_have_separate_budgets(self):
+        """ユーザーごとのルールはユーザーごとに別の上限"""
+        assert self.client.post("/batch", headers=_bearer("reimu")).status_code == 200
+        assert self.client.post("/batch", headers=_bearer("reimu")).status_code == 429
+        assert self.client.post("/batch", headers=_bearer("marisa")).status_code == 200
+
+    def test_unmatched_route_is_not_limited(self):
+        """ルールのないルートは制限せず、ヘッダーも付けない"""
+        responses = [self.client.get("/games") for _ in range(5)]
+
+        assert all(response.status_code == 200 for response in responses)
+        assert "X-RateLimit-Limit" not in responses[0].headers
+
+    def test_store_failure_allows_request(self):
+        """保存先の障害時は制限せずに処理する"""
+        store = AsyncMock()
+        store.consume.side_effect = ConnectionError("redis unavailable")
+        client = TestClient(_create_app(store))
+
+        assert client.post("/login").status_code == 200
+
+
+class TestConcurrencyLimitMiddleware:
+    """処理中リクエスト数の上限のテスト"""
+
+    def _create_app(self, max_in_flight: int):
+        app = FastAPI()
+        self.release = asyncio.Event()
+        self.started = 0
+
+        @app.get("/slow")
+        async def slow():
+            self.started += 1
+            await self.release.wait()
+            return JSONResponse({"ok": True})
+
+        @app.get("/healthz")
+        async def healthz():
+            return JSONResponse({"status": "ok"})
+
+        self.middleware = ConcurrencyLimitMiddleware(
+            app, max_in_flight=max_in_flight, retry_after_seconds=3, exempt_paths=("/healthz",)
+        )
+        return self.middleware
+
+    @pytest.mark.asyncio
+    async def test_sheds_requests_over_limit(self):
+        """上限に達している間の新しいリクエストは503とRetry-Afterで拒否する"""
+        app = self._create_app(max_in_flight=2)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            in_flight = [asyncio.create_task(client.get("/slow")) for _ in range(2)]
+            while self.started < 2:
+                await asyncio.sleep(0.01)
+
+            shed = await client.get("/slow")
+            health = await client.get("/healthz")
+            self.release.set()
+            completed = await asyncio.gather(*in_flight)
+
+            assert shed.status_code == 503
+            assert shed.headers["Retry-After"] == "3"
+            assert shed.json()["error_code"] == "OVERLOADED"
+            assert health.status_code == 200
+            assert [response.status_code for response in completed] == [200, 200]
+            assert self.middleware.in_flight == 0
+            assert self.middleware.shed_count == 1
+            assert (await client.get("/slow")).status_code == 200
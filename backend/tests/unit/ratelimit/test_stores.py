@@ -0,0 +1,120 @@
+"""
+トークンバケットの保存先の単体テスト
+"""
+import math
+import pytest
+from infrastructure.ratelimit.stores import (
+    ShardedMemoryTokenBucketStore,
+    create_token_bucket_store,
+    redis_asyncio,
+    refill_and_consume,
+)
+
+
+class FakeClock:
+    """テスト用の時刻"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRefillAndConsume:
+    """トークンの補充・消費の計算のテスト"""
+
+    def test_consume(self):
+        """トークンがあれば1つ消費して許可する"""
+        tokens, decision = refill_and_consume(3.0, 0.0, 0.0, capacity=3, refill_per_second=1.0)
+
+        assert tokens == 2.0
+        assert decision.allowed is True
+        assert decision.remaining == 2
+
+    def test_refill_up_to_capacity(self):
+        """経過時間分を補充し、容量を超えない"""
+        tokens, decision = refill_and_consume(0.0, 0.0, 100.0, capacity=3, refill_per_second=1.0)
+
+        assert tokens == 2.0
+        assert decision.allowed is True
+
+    def test_rejected_with_retry_after(self):
+        """トークンがなければ拒否し、1つ補充されるまでの秒数を返す"""
+        tokens, decision = refill_and_consume(0.25, 0.0, 0.0, capacity=3, refill_per_second=0.5)
+
+        assert tokens == 0.25
+        assert decision.allowed is False
+        assert decision.retry_after_seconds == pytest.approx(1.5)
+
+    def test_no_refill(self):
+        """補充しない設定では再試行までの秒数は無限"""
+        _, decision = refill_and_consume(0.0, 0.0, 0.0, capacity=1, refill_per_second=0.0)
+
+        assert decision.allowed is False
+        assert math.isinf(decision.retry_after_seconds)
+
+
+class TestShardedMemoryTokenBucketStore:
+    """プロセス内のトークンバケットのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.clock = FakeClock()
+        self.store = ShardedMemoryTokenBucketStore(shards=4, max_keys_per_shard=100, clock=self.clock)
+
+    def test_burst_then_refill(self):
+        """容量分は連続して許可し、以降は補充された分だけ許可する"""
+        results = [self.store.consume_sync("login:ip:10.0.0.1", 3, 1.0).allowed for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        self.clock.now += 1.0
+        assert self.store.consume_sync("login:ip:10.0.0.1", 3, 1.0).allowed is True
+        assert self.store.consume_sync("login:ip:10.0.0.1", 3, 1.0).allowed is False
+
+    def test_keys_are_independent(self):
+        """キーごとに別のバケットを使用する"""
+        assert self.store.consume_sync("login:ip:10.0.0.1", 1, 1.0).allowed is True
+        assert self.store.consume_sync("login:ip:10.0.0.1", 1, 1.0).allowed is False
+        assert self.store.consume_sync("login:ip:10.0.0.2", 1, 1.0).allowed is True
+
+    def test_keys_are_spread_over_shards(self):
+        """キーはシャードに分散して保存される"""
+        for index in range(100):
+            self.store.consume_sync(f"login:ip:10.0.0.{index}", 3, 1.0)
+
+        assert len(self.store) == 100
+        assert all(len(shard.buckets) < 100 for shard in self.store._shards)
+
+    def test_least_recently_used_keys_are_evicted(self):
+        """シャードの上限を超えた場合は最も長く使用していないバケットを削除する"""
+        store = ShardedMemoryTokenBucketStore(shards=1, max_keys_per_shard=2, clock=self.clock)
+        store.consume_sync("a", 1, 1.0)
+        store.consume_sync("b", 1, 1.0)
+        store.consume_sync("a", 1, 1.0)
+        store.consume_sync("c", 1, 1.0)
+
+        assert list(store._shards[0].buckets) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_consume_async(self):
+        """非同期版も同じバケットを使用する"""
+        assert (await self.store.consume("batch:user:reimu", 1, 1.0)).allowed is True
+        assert (await self.store.consume("batch:user:reimu", 1, 1.0)).allowed is False
+
+
+class TestCreateTokenBucketStore:
+    """保存先の作成のテスト"""
+
+    def test_memory(self):
+        assert isinstance(create_token_bucket_store("memory"), ShardedMemoryTokenBucketStore)
+
+    @pytest.mark.skipif(redis_asyncio is not None, reason="redisがインストールされている環境では作成できる")
+    def test_redis_not_installed(self):
+        """redisがインストールされていない場合はエラー"""
+        with pytest.raises(RuntimeError, match="redis"):
+            create_token_bucket_store("redis")
+
+    def test_unsupported(self):
+        with pytest.raises(ValueError, match="memcached"):
+            create_token_bucket_store("memcached")
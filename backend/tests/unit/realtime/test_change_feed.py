@@ -0,0 +1,252 @@
+"""
+クリア記録変更フィード（SSEによるタブ間同期）の単体テスト
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from domain.entities.clear_record import ClearRecord
+from infrastructure.database.connection import Base
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from infrastructure.realtime import brokers
+from infrastructure.realtime.brokers import RedisChangeFeedBroker, create_change_feed_broker
+from infrastructure.realtime.change_feed import ClearRecordChangeEvent, ClearRecordChangeFeed
+from presentation.api.v1 import clear_records
+from presentation.api.v1.clear_records import stream_my_clear_record_changes
+
+
+def _publish(feed: ClearRecordChangeFeed, user_id: int = 1, record_id: int = 1, flags: int = 1) -> ClearRecordChangeEvent:
+    """テスト用の変更を発行"""
+    return feed.publish(
+        event_type="upsert",
+        user_id=user_id,
+        record_id=record_id,
+        game_id=1,
+        character_name="霊夢",
+        difficulty="Easy",
+        mode="normal",
+        flags=flags,
+    )
+
+
+class TestClearRecordChangeFeed:
+
+    @pytest.mark.asyncio
+    async def test_publish_to_same_user_only(self):
+        """同じユーザーの購読者にのみ配信される"""
+        feed = ClearRecordChangeFeed()
+        subscription = feed.subscribe(1)
+        other = feed.subscribe(2)
+
+        event = _publish(feed, user_id=1)
+        await asyncio.sleep(0)
+
+        assert await subscription.get(timeout=1) == event
+        with pytest.raises(asyncio.TimeoutError):
+            await other.get(timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        """購読解除後は配信されない"""
+        feed = ClearRecordChangeFeed()
+        subscription = feed.subscribe(1)
+
+        feed.unsubscribe(subscription)
+
+        assert feed.subscriber_count() == 0
+
+    def test_event_ids_are_monotonic(self):
+        """イベントIDは単調増加する"""
+        feed = ClearRecordChangeFeed()
+
+        first = _publish(feed)
+        second = _publish(feed)
+
+        assert second.event_id > first.event_id
+        assert second.to_payload()["version"] == second.event_id
+
+    def test_events_since(self):
+        """指定したイベントIDより後の変更のみ返す"""
+        feed = ClearRecordChangeFeed()
+        first = _publish(feed, record_id=1)
+        second = _publish(feed, record_id=2)
+        _publish(feed, user_id=2, record_id=3)
+
+        assert feed.events_since(1, first.event_id) == [second]
+        assert feed.events_since(1, second.event_id) == []
+
+    def test_events_since_evicted(self):
+        """変更ログから押し出された範囲からは再開できない"""
+        feed = ClearRecordChangeFeed(log_size=2)
+        first = _publish(feed, record_id=1)
+        _publish(feed, record_id=2)
+        _publish(feed, record_id=3)
+
+        assert feed.events_since(1, first.event_id - 1) is None
+        assert len(feed.events_since(1, first.event_id)) == 2
+
+    def test_idle_user_logs_are_dropped(self):
+        """変更のないまま保持期間を過ぎたユーザーの変更ログは破棄され、その範囲からは再開できない"""
+        feed = ClearRecordChangeFeed(log_idle_seconds=60)
+        with patch("infrastructure.realtime.change_feed.time.monotonic", return_value=1000.0):
+            idle = _publish(feed, user_id=1)
+            recent = _publish(feed, user_id=2)
+        with patch("infrastructure.realtime.change_feed.time.monotonic", return_value=1050.0):
+            latest = _publish(feed, user_id=2)
+        with patch("infrastructure.realtime.change_feed.time.monotonic", return_value=1070.0):
+            _publish(feed, user_id=3)
+
+        assert set(feed._logs) == {2, 3}
+        assert feed.events_since(1, idle.event_id - 1) is None
+        assert feed.events_since(2, recent.event_id) == [latest]
+
+    def test_events_since_before_start(self):
+        """このプロセスの起動前のイベントIDからは再開できない"""
+        feed = ClearRecordChangeFeed()
+
+        assert feed.events_since(1, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_overflow(self):
+        """送信が追いつかない場合は取りこぼしを通知する"""
+        feed = ClearRecordChangeFeed(queue_size=1)
+        subscription = feed.subscribe(1)
+
+        _publish(feed, record_id=1)
+        _publish(feed, record_id=2)
+        await asyncio.sleep(0)
+
+        assert await subscription.get(timeout=1) is None
+
+    def test_broker_relay(self):
+        """ブローカーがある場合は他ワーカーへ中継する"""
+        feed = ClearRecordChangeFeed()
+        feed.broker = Mock()
+
+        event = _publish(feed)
+
+        feed.broker.publish.assert_called_once_with(event)
+
+    def test_broker_failure_does_not_raise(self):
+        """中継に失敗しても発行は成功する"""
+        feed = ClearRecordChangeFeed()
+        feed.broker = Mock()
+        feed.broker.publish.side_effect = ConnectionError("down")
+
+        event = _publish(feed)
+
+        assert feed.events_since(1, event.event_id - 1) == [event]
+
+    def test_event_round_trip(self):
+        """ブローカー中継用の辞書から復元できる"""
+        event = _publish(ClearRecordChangeFeed())
+
+        assert ClearRecordChangeEvent.from_dict(event.to_dict()) == event
+
+
+class TestChangeFeedBroker:
+
+    def test_memory(self):
+        """memoryの場合はブローカーなし"""
+        assert create_change_feed_broker("memory") is None
+
+    def test_unsupported(self):
+        """未対応のブローカー名はエラー"""
+        with pytest.raises(ValueError):
+            create_change_feed_broker("kafka")
+
+    def test_redis_unavailable(self):
+        """redis未インストールの場合はエラー"""
+        with patch.object(brokers, "redis_asyncio", None):
+            with pytest.raises(RuntimeError):
+                RedisChangeFeedBroker()
+
+
+class TestRepositoryPublishesChanges:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.feed = ClearRecordChangeFeed()
+        self.repository = ClearRecordRepositoryImpl(self.session, change_feed=self.feed)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_create_update_delete(self):
+        """作成・更新・削除のコミット後に変更を発行する"""
+        started_event_id = self.feed.last_event_id
+        created = await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="霊夢", difficulty="Easy", is_cleared=True
+        ))
+        created.is_no_bomb_clear = True
+        await self.repository.update(created)
+        await self.repository.delete(created.id)
+
+        events = self.feed.events_since(1, started_event_id)
+        assert [event.event_type for event in events] == ["upsert", "upsert", "delete"]
+        assert [event.flags for event in events] == [1, 5, None]
+        assert {event.record_id for event in events} == {created.id}
+
+
+class TestStreamEndpoint:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.feed = ClearRecordChangeFeed()
+        self.user = Mock(id=1)
+        self.request = Mock()
+        self.request.is_disconnected = AsyncMock(return_value=True)
+        self.db = Mock()
+
+    async def _open(self, last_event_id=None):
+        with patch.object(clear_records, "clear_record_change_feed", self.feed):
+            response = await stream_my_clear_record_changes(
+                request=self.request, current_user=self.user, db=self.db, last_event_id=last_event_id
+            )
+        return response.body_iterator
+
+    @pytest.mark.asyncio
+    async def test_stream_pushes_changes(self):
+        """接続後の変更をSSEとして送信する"""
+        stream = await self._open()
+
+        assert (await stream.__anext__()).startswith("retry:")
+        event = _publish(self.feed)
+        message = await stream.__anext__()
+        await stream.aclose()
+
+        assert f"id: {event.event_id}" in message
+        assert "event: upsert" in message
+        assert json.loads(message.split("data: ")[1])["flags"] == 1
+        self.db.close.assert_called_once()
+        assert self.feed.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_event_id(self):
+        """Last-Event-IDの続きから再送する"""
+        first = _publish(self.feed, record_id=1)
+        second = _publish(self.feed, record_id=2)
+
+        stream = await self._open(last_event_id=str(first.event_id))
+        await stream.__anext__()
+        message = await stream.__anext__()
+        await stream.aclose()
+
+        assert f"id: {second.event_id}" in message
+
+    @pytest.mark.asyncio
+    async def test_reset_when_cannot_resume(self):
+        """続きを再送できない場合はresetを送信する"""
+        stream = await self._open(last_event_id="1")
+        await stream.__anext__()
+        message = await stream.__anext__()
+        await stream.aclose()
+
+        assert "event: reset" in message
@@ -2,10 +2,14 @@
 クリア記録リポジトリの単体テスト
 """
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from unittest.mock import Mock, MagicMock, AsyncMock
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
 from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
 from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.clear_record_change_model import ClearRecordChangeModel
+from infrastructure.database.connection import Base
 from domain.entities.clear_record import ClearRecord
 
 
@@ -199,20 +203,36 @@ class TestClearRecordRepository:
             self.mock_session.add = Mock()
             self.mock_session.commit = Mock()
             self.mock_session.refresh = Mock()
+            self._mock_history_queries(Mock())
             
             result = await self.repository.create(new_record)
             
             assert result.id == 2
             assert result.character_name == "魔理沙"
-            self.mock_session.add.assert_called_once()
+            # 記録と変更ログを同じコミットで書き込む
+            assert self.mock_session.add.call_args_list[0].args == (mock_model,)
+            assert isinstance(self.mock_session.add.call_args_list[1].args[0], ClearRecordChangeModel)
             self.mock_session.commit.assert_called_once()
             
+    def _mock_history_queries(self, record_query):
+        """記録の検索以外（達成履歴・月別集計）は該当なしとしてモック化"""
+        history_query = Mock()
+        history_query.filter.return_value.first.return_value = None
+        history_query.filter.return_value.all.return_value = []
+        self.mock_session.query.side_effect = (
+            lambda model: record_query if model is ClearRecordModel else history_query
+        )
+        self.mock_session.execute.return_value.scalars.return_value.all.return_value = []
+        # 達成スコア・月別集計の加算（DB側で加算した行数と加算後の値）
+        self.mock_session.execute.return_value.rowcount = 1
+        self.mock_session.execute.return_value.scalar_one.return_value = 0
+        
     @pytest.mark.asyncio
     async def test_update_existing_record(self):
         """既存クリア記録更新のテスト"""
         mock_query = Mock()
-        self.mock_session.query.return_value = mock_query
         mock_query.filter.return_value.first.return_value = self.sample_model
+        self._mock_history_queries(mock_query)
         
         updated_record = ClearRecord(
             id=1,
@@ -246,8 +266,8 @@ class TestClearRecordRepository:
     async def test_delete_existing_record(self):
         """存在するクリア記録削除のテスト"""
         mock_query = Mock()
-        self.mock_session.query.return_value = mock_query
         mock_query.filter.return_value.first.return_value = self.sample_model
+        self._mock_history_queries(mock_query)
         
         result = await self.repository.delete(1)
         
@@ -329,4 +349,221 @@ class TestClearRecordRepository:
         result = await self.repository.create_or_update(record)
         
         assert result.character_name == "霊夢"
-        self.repository.create.assert_called_once()
\ No newline at end of file
+        self.repository.create.assert_called_once()
+
+class TestClearRecordRepositoryRows:
+    """一覧表示用の列のみ取得（Core select）のテスト"""
+    
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        ClearRecordModel.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = ClearRecordRepositoryImpl(self.session)
+        for user_id, game_id, character_name in [(1, 2, "魔理沙"), (1, 1, "霊夢"), (2, 1, "霊夢")]:
+            self.session.add(ClearRecordModel(
+                user_id=user_id,
+                game_id=game_id,
+                character_name=character_name,
+                difficulty="Normal",
+                mode="normal",
+                is_cleared=True,
+                cleared_at=date(2024, 1, 1)
+            ))
+        self.session.commit()
+        
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+        
+    @pytest.mark.asyncio
+    async def test_find_rows_by_user(self):
+        """ユーザーの記録のみを一覧表示用の列で取得する"""
+        rows = await self.repository.find_rows_by_user(1)
+        
+        assert [row["game_id"] for row in rows] == [1, 2]
+        assert "user_id" not in rows[0]
+        assert rows[0]["is_cleared"] is True
+        assert rows[0]["is_no_bomb_clear"] is False
+        assert rows[0]["cleared_at"] == date(2024, 1, 1)
+        assert isinstance(rows[0]["created_at"], datetime)
+        
+    @pytest.mark.asyncio
+    async def test_find_rows_by_user_and_game(self):
+        """ゲーム指定で絞り込める"""
+        rows = await self.repository.find_rows_by_user(1, game_id=2)
+        
+        assert len(rows) == 1
+        assert rows[0]["character_name"] == "魔理沙"
+        
+    @pytest.mark.asyncio
+    async def test_find_rows_does_not_populate_identity_map(self):
+        """ORMオブジェクトをセッションに読み込まない"""
+        self.session.expunge_all()
+        
+        await self.repository.find_rows_by_user(1)
+        
+        assert len(self.session.identity_map) == 0
+
+
+class TestClearRecordChangeLog:
+    """クリア記録変更ログ（差分同期）のテスト"""
+    
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = ClearRecordRepositoryImpl(self.session)
+        
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+        
+    async def _create(self, user_id: int = 1, character_name: str = "霊夢") -> ClearRecord:
+        return await self.repository.create(ClearRecord(
+            user_id=user_id, game_id=1, character_name=character_name, difficulty="Easy", is_cleared=True
+        ))
+        
+    @pytest.mark.asyncio
+    async def test_changes_written_with_each_mutation(self):
+        """作成・更新・削除ごとに変更前後のビットマスクを記録する"""
+        record = await self._create()
+        record.is_no_bomb_clear = True
+        await self.repository.update(record)
+        await self.repository.delete(record.id)
+        
+        changes = await self.repository.find_changes_since(1, 0, 10)
+        
+        assert [(c["old_flags"], c["new_flags"]) for c in changes] == [(None, 1), (1, 5), (5, None)]
+        assert [c["seq"] for c in changes] == [1, 2, 3]
+        assert {c["record_id"] for c in changes} == {record.id}
+        
+    @pytest.mark.asyncio
+    async def test_unchanged_flags_are_not_logged(self):
+        """クリア条件が変わらない更新は記録しない"""
+        record = await self._create()
+        await self.repository.update(record)
+        
+        assert len(await self.repository.find_changes_since(1, 0, 10)) == 1
+        
+    @pytest.mark.asyncio
+    async def test_find_changes_since(self):
+        """指定ユーザーの連番より後の変更のみ返す"""
+        await self._create(user_id=1, character_name="霊夢")
+        await self._create(user_id=2, character_name="霊夢")
+        await self._create(user_id=1, character_name="魔理沙")
+        
+        changes = await self.repository.find_changes_since(1, 1, 10)
+        
+        assert [c["seq"] for c in changes] == [3]
+        assert await self.repository.get_change_seq_bounds() == (1, 3)
+        
+    @pytest.mark.asyncio
+    async def test_delete_changes_before(self):
+        """古い変更を分割して削除し、最新の1件は残す"""
+        for name in ["霊夢", "魔理沙", "咲夜", "妖夢"]:
+            await self._create(character_name=name)
+        
+        deleted = await self.repository.delete_changes_before(datetime.now() + timedelta(days=1), batch_size=2)
+        
+        assert deleted == 3
+        assert await self.repository.get_change_seq_bounds() == (4, 4)
+        
+    @pytest.mark.asyncio
+    async def test_delete_changes_before_keeps_recent(self):
+        """保持期間内の変更は削除しない"""
+        await self._create()
+        
+        assert await self.repository.delete_changes_before(datetime.now() - timedelta(days=1), batch_size=10) == 0
+
+
+class TestClearRecordAchievements:
+    """クリア条件の初回達成日時・月別集計のテスト"""
+    
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = ClearRecordRepositoryImpl(self.session)
+        
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+        
+    async def _progress(self):
+        return {(row["month"], row["condition"]): row["count"] for row in await self.repository.find_monthly_progress(1)}
+        
+    @pytest.mark.asyncio
+    async def test_first_achievement_is_kept(self):
+        """条件をOFFに戻して再度ONにしても初回達成日時は変わらない"""
+        record = await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="霊夢", difficulty="Lunatic", is_cleared=True
+        ))
+        record.is_no_miss_clear = True
+        await self.repository.update(record)
+        first = await self.repository.find_achievements(record)
+        
+        record.is_no_miss_clear = False
+        await self.repository.update(record)
+        record.is_no_miss_clear = True
+        await self.repository.update(record)
+        
+        assert [a["condition"] for a in first] == ["is_cleared", "is_no_miss_clear"]
+        assert await self.repository.find_achievements(record) == first
+        month = datetime.now().strftime("%Y-%m")
+        assert await self._progress() == {(month, "is_cleared"): 1, (month, "is_no_miss_clear"): 1}
+        
+    @pytest.mark.asyncio
+    async def test_past_cleared_at_is_used(self):
+        """過去のクリア日が指定された場合は通常クリアの達成日とする"""
+        record = await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="霊夢", difficulty="Easy",
+            is_cleared=True, cleared_at=date(2023, 5, 3)
+        ))
+        
+        achievements = await self.repository.find_achievements(record)
+        
+        assert achievements == [{"condition": "is_cleared", "achieved_at": datetime(2023, 5, 3)}]
+        assert await self._progress() == {("2023-05", "is_cleared"): 1}
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_progress_is_not_lost(self):
+        """月別集計の読み込みから書き込みまでの間に他のワーカーが加算しても、その加算を上書きしない"""
+        await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="霊夢", difficulty="Easy", is_cleared=True, cleared_at=date(2023, 5, 3)
+        ))
+        other = await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="魔理沙", difficulty="Easy", cleared_at=date(2023, 5, 3)
+        ))
+        interrupted = []
+
+        def add_concurrently(conn, cursor, statement, parameters, context, executemany):
+            # 他のワーカーのコミット済みの加算（集計を書き込む直前に1回だけ割り込む）
+            if statement.startswith("UPDATE clear_progress_monthly") and not interrupted:
+                interrupted.append(statement)
+                cursor.execute("UPDATE clear_progress_monthly SET count = count + 5 WHERE condition = 'is_cleared'")
+
+        event.listen(self.engine, "before_cursor_execute", add_concurrently)
+        try:
+            other.is_cleared = True
+            other.cleared_at = date(2023, 5, 3)
+            await self.repository.update(other)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", add_concurrently)
+
+        assert interrupted
+        assert await self._progress() == {("2023-05", "is_cleared"): 7}
+        
+    @pytest.mark.asyncio
+    async def test_delete_removes_achievements(self):
+        """記録の削除で達成履歴と月別集計を取り消す"""
+        record = await self.repository.create(ClearRecord(
+            user_id=1, game_id=1, character_name="霊夢", difficulty="Easy", is_cleared=True
+        ))
+        
+        await self.repository.delete(record.id)
+        
+        assert await self.repository.find_achievements(record) == []
+        assert await self._progress() == {}
@@ -0,0 +1,122 @@
+"""
+クリア条件達成率統計リポジトリの単体テスト
+"""
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from application.services.clear_stats_service import ClearStatsService
+from infrastructure.database.repositories.clear_stats_repository_impl import ClearStatsRepositoryImpl
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.connection import Base
+from domain.entities.clear_record import ClearRecord
+
+
+class TestClearStatsRepository:
+    """達成率統計の集計（全件集計・増分集計）のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = ClearStatsRepositoryImpl(self.session)
+        self.clear_record_repository = ClearRecordRepositoryImpl(self.session)
+        self.service = ClearStatsService(self.repository)
+        for user_id, is_active in [(1, True), (2, True), (3, False)]:
+            self.session.add(UserModel(
+                id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com",
+                hashed_password="hashed", is_active=is_active
+            ))
+        self.session.commit()
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    async def _create(self, user_id: int, difficulty: str = "Lunatic", **flags) -> ClearRecord:
+        return await self.clear_record_repository.create(ClearRecord(
+            user_id=user_id, game_id=1, character_name="霊夢", difficulty=difficulty, **flags
+        ))
+
+    def _counts(self) -> dict:
+        return {
+            (stat["difficulty"], stat["condition"]): stat["achieved_count"]
+            for stat in self.repository.find_stats()
+        }
+
+    @pytest.mark.asyncio
+    async def test_rebuild_counts(self):
+        """全件集計は条件ごとの達成記録数を集計し、変更ログの最大連番を返す"""
+        await self._create(1, is_cleared=True, is_no_miss_clear=True)
+        await self._create(2, is_cleared=True)
+        await self._create(2, difficulty="Easy", is_cleared=False)
+
+        last_change_seq = self.repository.rebuild_counts()
+
+        assert last_change_seq == 3
+        assert self._counts() == {("Lunatic", "is_cleared"): 2, ("Lunatic", "is_no_miss_clear"): 1}
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_counted_in_both_numerator_and_denominator(self):
+        """無効なユーザーの記録も分子・分母の両方に含め、達成率が100%を超えない"""
+        await self._create(1, is_cleared=True)
+        await self._create(3, is_cleared=True)
+
+        result = self.service.refresh(batch_size=2, force_full=True)
+        stats = self.service.get_rarity()["stats"]
+
+        assert result["active_users"] == 2
+        assert self.repository.count_active_players() == 2
+        assert [(stat["achieved_count"], stat["rate"]) for stat in stats] == [(2, 1.0)]
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_matches_rebuild(self):
+        """変更ログからの増分集計が全件集計と一致する"""
+        record = await self._create(1, is_cleared=True)
+        first = self.service.refresh(batch_size=2)
+
+        record.is_no_miss_clear = True
+        await self.clear_record_repository.update(record)
+        other = await self._create(2, is_cleared=True, is_no_bomb_clear=True)
+        await self.clear_record_repository.delete(other.id)
+        await self._create(2, difficulty="Easy", is_cleared=True)
+        second = self.service.refresh(batch_size=2)
+        incremental = self._counts()
+
+        self.service.refresh(batch_size=2, force_full=True)
+
+        assert first["full_rebuild"] is True
+        assert second["full_rebuild"] is False
+        assert second["applied_changes"] == 4
+        assert second["active_users"] == 2
+        assert incremental == self._counts()
+        assert incremental == {
+            ("Easy", "is_cleared"): 1, ("Lunatic", "is_cleared"): 1, ("Lunatic", "is_no_miss_clear"): 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_find_stats_filtered_by_game(self):
+        """作品IDで絞り込み、達成ユーザー数0の行は返さない"""
+        await self.clear_record_repository.create(ClearRecord(
+            user_id=1, game_id=2, character_name="魔理沙", difficulty="Hard", is_cleared=True
+        ))
+        await self._create(1, is_cleared=True)
+        self.repository.rebuild_counts()
+        self.repository.apply_count_deltas({(2, "魔理沙", "Hard", "normal", "is_cleared"): -1})
+
+        assert self.repository.find_stats(game_id=2) == []
+        assert [stat["game_id"] for stat in self.repository.find_stats()] == [1]
+
+    def test_save_snapshot(self):
+        """集計状態を1行で保持する"""
+        built_at = datetime(2024, 1, 1, 10, 0, 0)
+        self.repository.save_snapshot(10, 5, True, 12.5, built_at)
+        self.repository.save_snapshot(11, 6, False, 3.0, built_at)
+
+        snapshot = self.repository.get_snapshot()
+
+        assert snapshot["active_users"] == 11
+        assert snapshot["last_change_seq"] == 6
+        assert snapshot["full_rebuild"] is False
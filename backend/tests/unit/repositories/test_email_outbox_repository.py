@@ -0,0 +1,113 @@
+"""
+メール送信キューリポジトリの単体テスト
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from infrastructure.database.repositories.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from infrastructure.database.connection import Base
+
+
+class TestEmailOutboxRepository:
+    """送信待ちの確保・送信結果の記録のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.session = self.session_factory()
+        self.repository = EmailOutboxRepositoryImpl(self.session)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _enqueue(self, count: int = 1) -> None:
+        for index in range(count):
+            self.repository.enqueue(f"user{index}@example.com", "件名", "本文", "<p>本文</p>")
+        self.session.commit()
+
+    def _model(self, message_id: int) -> EmailOutboxModel:
+        self.session.expire_all()
+        return self.session.get(EmailOutboxModel, message_id)
+
+    def test_enqueue_is_written_on_commit(self):
+        """呼び出し元のコミットで送信待ちとして書き込まれる"""
+        self.repository.enqueue("user@example.com", "件名", "本文", "<p>本文</p>")
+        self.session.rollback()
+        assert self.repository.count_by_status() == {}
+
+        self._enqueue()
+
+        assert self.repository.count_by_status() == {"pending": 1}
+
+    def test_claim_due(self):
+        """送信時刻を過ぎたメールを送信中として確保し、試行回数を加算する"""
+        self._enqueue(3)
+
+        messages = self.repository.claim_due(limit=2, lease_seconds=60)
+
+        assert [message["id"] for message in messages] == [1, 2]
+        assert messages[0]["to_email"] == "user0@example.com"
+        assert messages[0]["attempts"] == 1
+        assert self.repository.count_by_status() == {"pending": 1, "sending": 2}
+
+    def test_claim_due_does_not_claim_twice(self):
+        """別のセッションが確保済みのメールは確保しない"""
+        self._enqueue(2)
+        other = EmailOutboxRepositoryImpl(self.session_factory())
+
+        first = self.repository.claim_due(limit=10, lease_seconds=60)
+        second = other.claim_due(limit=10, lease_seconds=60)
+
+        assert len(first) == 2
+        assert second == []
+        other.session.close()
+
+    def test_claim_due_reclaims_expired_lease(self):
+        """確保期限が切れた送信中のメールは再度確保する"""
+        self._enqueue()
+        self.repository.claim_due(limit=10, lease_seconds=60)
+        model = self._model(1)
+        model.locked_until = datetime.now() - timedelta(seconds=1)
+        self.session.commit()
+
+        messages = self.repository.claim_due(limit=10, lease_seconds=60)
+
+        assert [message["attempts"] for message in messages] == [2]
+
+    def test_mark_sent(self):
+        """送信済みにする"""
+        self._enqueue()
+        self.repository.claim_due(limit=10, lease_seconds=60)
+
+        self.repository.mark_sent(1)
+
+        model = self._model(1)
+        assert model.status == "sent"
+        assert model.sent_at is not None
+        assert model.locked_until is None
+
+    def test_mark_failed_schedules_retry(self):
+        """再試行時刻まで確保されない"""
+        self._enqueue()
+        self.repository.claim_due(limit=10, lease_seconds=60)
+
+        self.repository.mark_failed(1, "timeout", datetime.now() + timedelta(minutes=5))
+
+        model = self._model(1)
+        assert model.status == "pending"
+        assert model.last_error == "timeout"
+        assert self.repository.claim_due(limit=10, lease_seconds=60) == []
+
+    def test_mark_failed_dead_letter(self):
+        """再試行時刻がない場合はデッドレターにする"""
+        self._enqueue()
+        self.repository.claim_due(limit=10, lease_seconds=60)
+
+        self.repository.mark_failed(1, "rejected", None)
+
+        assert self.repository.count_by_status() == {"dead": 1}
+        assert self.repository.claim_due(limit=10, lease_seconds=60) == []
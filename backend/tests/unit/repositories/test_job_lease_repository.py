@@ -0,0 +1,67 @@
+"""
+ジョブリースリポジトリの単体テスト
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from infrastructure.database.repositories.job_lease_repository_impl import JobLeaseRepositoryImpl
+from infrastructure.database.connection import Base
+
+
+class TestJobLeaseRepository:
+    """リースの取得・延長・解放のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = JobLeaseRepositoryImpl(self.session)
+        self.now = datetime(2024, 1, 1, 10, 0, 0)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _acquire(self, owner: str, now: datetime, seconds: int = 60) -> bool:
+        return self.repository.try_acquire("sweep", owner, now, now + timedelta(seconds=seconds))
+
+    def test_acquire_new_lease(self):
+        """リースがなければ作成して取得する"""
+        assert self._acquire("worker-a", self.now)
+
+        leases = self.repository.find_all()
+        assert len(leases) == 1
+        assert leases[0]["owner"] == "worker-a"
+        assert leases[0]["expires_at"] == self.now + timedelta(seconds=60)
+
+    def test_held_by_another_worker(self):
+        """他のワーカーが保持中の場合は取得できない"""
+        self._acquire("worker-a", self.now)
+
+        assert not self._acquire("worker-b", self.now + timedelta(seconds=30))
+        assert self.repository.find_all()[0]["owner"] == "worker-a"
+
+    def test_renew_by_owner(self):
+        """保持者は期限内でも延長できる"""
+        self._acquire("worker-a", self.now)
+
+        assert self._acquire("worker-a", self.now + timedelta(seconds=30))
+        assert self.repository.find_all()[0]["expires_at"] == self.now + timedelta(seconds=90)
+
+    def test_take_over_expired_lease(self):
+        """期限切れのリースは他のワーカーが引き継げる"""
+        self._acquire("worker-a", self.now)
+
+        assert self._acquire("worker-b", self.now + timedelta(seconds=61))
+        assert self.repository.find_all()[0]["owner"] == "worker-b"
+
+    def test_release(self):
+        """手放したリースはすぐに他のワーカーが取得できる（保持者以外は手放せない）"""
+        self._acquire("worker-a", self.now)
+
+        self.repository.release("sweep", "worker-b", self.now)
+        assert not self._acquire("worker-b", self.now + timedelta(seconds=1))
+
+        self.repository.release("sweep", "worker-a", self.now)
+        assert self._acquire("worker-b", self.now + timedelta(seconds=1))
@@ -0,0 +1,121 @@
+"""
+ランキングリポジトリの単体テスト
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from application.services.ranking_service import RankingService
+from infrastructure.database.repositories.ranking_repository_impl import RankingRepositoryImpl
+from infrastructure.database.repositories.clear_record_repository_impl import ClearRecordRepositoryImpl
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.connection import Base
+from infrastructure.ranking.score_index import RankingIndex
+from domain.entities.clear_record import ClearRecord
+
+
+class TestRankingRepository:
+    """記録の変更に追従する達成スコアとリーダーボードのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.index = RankingIndex(ttl_seconds=60)
+        self.repository = RankingRepositoryImpl(self.session)
+        self.clear_record_repository = ClearRecordRepositoryImpl(self.session, ranking_index=self.index)
+        self.service = RankingService(self.repository, self.index)
+        for user_id in range(1, 5):
+            self.session.add(UserModel(
+                id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com", hashed_password="hashed"
+            ))
+        self.session.commit()
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    async def _create(self, user_id: int, game_id: int = 1, difficulty: str = "Easy", **flags) -> ClearRecord:
+        return await self.clear_record_repository.create(ClearRecord(
+            user_id=user_id, game_id=game_id, character_name="霊夢", difficulty=difficulty, **flags
+        ))
+
+    @pytest.mark.asyncio
+    async def test_scores_follow_record_changes(self):
+        """記録の作成・更新・削除で作品別・全作品合計のスコアを増減する"""
+        record = await self._create(1, is_cleared=True)
+        await self._create(1, game_id=2, is_cleared=True)
+        record.is_no_miss_clear = True
+        await self.clear_record_repository.update(record)
+
+        assert self.repository.find_score(1, 1) == 25
+        assert self.repository.find_score(1, 0) == 35
+
+        await self.clear_record_repository.delete(record.id)
+
+        assert self.repository.find_score(1, 1) == 0
+        assert self.repository.find_score(1, 0) == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_increment_is_not_lost(self):
+        """スコアの読み込みから書き込みまでの間に他のワーカーが加算しても、その加算を上書きしない"""
+        record = await self._create(1, is_cleared=True)
+        applied = []
+        self.index.apply = lambda game_id, old, new: applied.append((game_id, old, new))
+        interrupted = []
+
+        def add_concurrently(conn, cursor, statement, parameters, context, executemany):
+            # 他のワーカーのコミット済みの加算（スコアを書き込む直前に1回だけ割り込む）
+            if statement.startswith("UPDATE user_scores") and not interrupted:
+                interrupted.append(statement)
+                cursor.execute("UPDATE user_scores SET score = score + 100 WHERE user_id = 1 AND game_id = 1")
+
+        event.listen(self.engine, "before_cursor_execute", add_concurrently)
+        try:
+            record.is_no_miss_clear = True
+            await self.clear_record_repository.update(record)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", add_concurrently)
+
+        assert self.repository.find_score(1, 1) == 125
+        assert applied[0] == (1, 110, 125)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self):
+        """全件再計算の結果が記録ごとの増減と一致する"""
+        await self._create(1, is_cleared=True, is_no_bomb_clear=True)
+        await self._create(2, difficulty="Lunatic", is_cleared=True)
+        incremental = {game_id: self.repository.get_score_histogram(game_id) for game_id in (0, 1)}
+
+        assert self.repository.rebuild_scores() == 2
+        assert {game_id: self.repository.get_score_histogram(game_id) for game_id in (0, 1)} == incremental
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_pages_and_ties(self):
+        """ページをまたいで高い順に並び、同点は同順位"""
+        await self._create(1, is_cleared=True)
+        await self._create(2, difficulty="Lunatic", is_cleared=True)
+        await self._create(3, is_cleared=True)
+        await self._create(4, difficulty="Hard", is_cleared=True)
+
+        first = self.service.get_leaderboard(None, page=1, per_page=3)
+        second = self.service.get_leaderboard(None, page=2, per_page=3)
+
+        assert first["total"] == 4
+        assert [(e["rank"], e["username"], e["score"]) for e in first["entries"]] == [
+            (1, "user2", 50), (2, "user4", 30), (3, "user1", 10)
+        ]
+        assert [(e["rank"], e["username"]) for e in second["entries"]] == [(3, "user3")]
+        assert self.service.get_leaderboard(None, page=3, per_page=3)["entries"] == []
+
+    @pytest.mark.asyncio
+    async def test_user_rank_follows_changes(self):
+        """順位インデックス作成後の変更も即座に順位へ反映する"""
+        await self._create(1, is_cleared=True)
+        await self._create(2, difficulty="Hard", is_cleared=True)
+        assert self.service.get_user_rank(1)["rank"] == 2
+
+        await self._create(1, difficulty="Lunatic", is_cleared=True)
+
+        assert self.service.get_user_rank(1) == {"game_id": None, "user_id": 1, "score": 60, "rank": 1, "total": 2}
+        assert self.service.get_user_rank(3)["rank"] is None
@@ -0,0 +1,97 @@
+"""
+ユーザーの定期クリーンアップリポジトリの単体テスト
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from infrastructure.database.repositories.user_cleanup_repository_impl import UserCleanupRepositoryImpl
+from infrastructure.database.models.clear_record_model import ClearRecordModel
+from infrastructure.database.models.game_model import GameModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.models.user_score_model import UserScoreModel
+from infrastructure.database.connection import Base
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class TestUserCleanupRepository:
+    """期限切れトークン・未認証ユーザーの一括削除のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = UserCleanupRepositoryImpl(self.session)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _add_user(self, user_id: int, email_verified: bool = False, is_admin: bool = False,
+                  expires_at: datetime = None, created_at: datetime = NOW) -> None:
+        self.session.add(UserModel(
+            id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com",
+            hashed_password="hashed", email_verified=email_verified, is_admin=is_admin,
+            verification_token=f"token{user_id}" if expires_at else None,
+            verification_token_expires_at=expires_at, created_at=created_at
+        ))
+        self.session.commit()
+
+    def _tokens(self) -> dict:
+        self.session.expire_all()
+        return {user.id: user.verification_token for user in self.session.query(UserModel).order_by(UserModel.id)}
+
+    def test_clear_expired_tokens(self):
+        """有効期限切れのトークンのみ削除する"""
+        self._add_user(1, expires_at=NOW - timedelta(hours=1))
+        self._add_user(2, expires_at=NOW + timedelta(hours=1))
+        self._add_user(3, email_verified=True)
+
+        cleared = self.repository.clear_expired_tokens(NOW, limit=100)
+
+        assert cleared == 1
+        assert self._tokens() == {1: None, 2: "token2", 3: None}
+
+    def test_clear_expired_tokens_limit(self):
+        """1回の処理はlimit件まで（期限の古い順）"""
+        for user_id in range(1, 6):
+            self._add_user(user_id, expires_at=NOW - timedelta(hours=user_id))
+
+        assert self.repository.clear_expired_tokens(NOW, limit=2) == 2
+        assert self._tokens() == {1: "token1", 2: "token2", 3: "token3", 4: None, 5: None}
+        assert self.repository.clear_expired_tokens(NOW, limit=2) == 2
+        assert self.repository.clear_expired_tokens(NOW, limit=2) == 1
+        assert self.repository.clear_expired_tokens(NOW, limit=2) == 0
+
+    def test_purge_unverified_users(self):
+        """期限より前に登録した未認証の一般ユーザーのみ削除する"""
+        old = NOW - timedelta(days=40)
+        self._add_user(1, created_at=old)
+        self._add_user(2, created_at=NOW)
+        self._add_user(3, email_verified=True, created_at=old)
+        self._add_user(4, is_admin=True, created_at=old)
+
+        purged = self.repository.purge_unverified_users(NOW - timedelta(days=30), limit=100)
+
+        assert purged == 1
+        assert sorted(self._tokens()) == [2, 3, 4]
+
+    def test_purge_unverified_users_keeps_users_with_data(self):
+        """クリア記録などのデータを持つ未認証ユーザーは削除しない"""
+        old = NOW - timedelta(days=40)
+        for user_id in range(1, 4):
+            self._add_user(user_id, created_at=old)
+        self.session.add(GameModel(id=1, title="東方紅魔郷", series_number=6.0, release_year=2002, game_type="main_series"))
+        self.session.add(ClearRecordModel(
+            user_id=1, game_id=1, character_name="博麗霊夢", difficulty="NORMAL", mode="normal", is_cleared=True
+        ))
+        self.session.add(UserScoreModel(user_id=2, game_id=1, score=10))
+        self.session.commit()
+
+        purged = self.repository.purge_unverified_users(NOW - timedelta(days=30), limit=1)
+
+        assert purged == 1
+        assert sorted(self._tokens()) == [1, 2]
+        assert self.session.query(ClearRecordModel).count() == 1
+        assert self.session.query(UserScoreModel).count() == 1
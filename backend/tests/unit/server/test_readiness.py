@@ -0,0 +1,147 @@
+"""
+ワーカーの準備完了判定・ウォームアップの再試行の単体テスト
+"""
+import asyncio
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool
+from unittest.mock import Mock, patch
+from infrastructure.server.constants import ServerConstants
+from infrastructure.server.readiness import WorkerReadiness, pool_headroom
+from infrastructure.server.warm_up import start_worker_warm_up, stop_worker_warm_up
+
+
+class TestWorkerReadiness:
+    """準備完了判定の項目ごとのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite://", future=True)
+        self.readiness = WorkerReadiness(bind=self.engine, db_timeout_seconds=1.0, min_pool_headroom=1)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_pool_headroom(self, tmp_path):
+        """QueuePoolはサイズ＋最大超過数から使用中の接続数を引いた値、上限のないプールはNone"""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}", future=True, poolclass=QueuePool, pool_size=2, max_overflow=1
+        )
+        try:
+            connection = engine.connect()
+            assert pool_headroom(engine) == 2
+            connection.close()
+            assert pool_headroom(engine) == 3
+        finally:
+            engine.dispose()
+        assert pool_headroom(create_engine("sqlite://", poolclass=NullPool)) is None
+
+    @pytest.mark.asyncio
+    async def test_not_ready_before_warm_up(self):
+        """ウォームアップが完了するまでは準備未完了"""
+        result = await self.readiness.check()
+
+        assert result["ready"] is False
+        assert result["checks"]["warm_up"] == {"ok": False}
+        assert result["checks"]["database"]["ok"] is True
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warm_up(self):
+        """ウォームアップの完了後は準備完了になり、準備の結果を含む"""
+        self.readiness.mark_ready({"connections": 2, "catalog_entries": 3})
+
+        result = await self.readiness.check()
+
+        assert result["ready"] is True
+        assert result["checks"]["warm_up"] == {"ok": True, "connections": 2, "catalog_entries": 3}
+
+    @pytest.mark.asyncio
+    async def test_not_ready_after_shutdown_starts(self):
+        """停止処理の開始後は準備未完了に戻る"""
+        self.readiness.mark_ready()
+        self.readiness.mark_not_ready()
+
+        assert self.readiness.is_ready is False
+        assert (await self.readiness.check())["ready"] is False
+
+    @pytest.mark.asyncio
+    async def test_database_timeout(self):
+        """DB接続の確認がタイムアウトした場合は準備未完了"""
+        self.readiness.mark_ready()
+        self.readiness.db_timeout_seconds = 0.05
+        with patch("infrastructure.server.readiness._ping", side_effect=lambda bind: time.sleep(0.5)):
+            result = await self.readiness.check()
+
+        assert result["ready"] is False
+        assert "timed out" in result["checks"]["database"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_database_error(self):
+        """DBに接続できない場合は準備未完了"""
+        self.readiness.mark_ready()
+        with patch("infrastructure.server.readiness._ping", side_effect=RuntimeError("connection refused")):
+            result = await self.readiness.check()
+
+        assert result["ready"] is False
+        assert result["checks"]["database"] == {"ok": False, "error": "connection refused"}
+
+    def test_pool_exhausted(self):
+        """接続プールの空きが下限未満の場合は準備未完了"""
+        with patch("infrastructure.server.readiness.pool_headroom", return_value=0):
+            assert self.readiness.check_pool() == {"ok": False, "headroom": 0}
+
+
+class TestStartWorkerWarmUp:
+    """lifespanでのウォームアップの開始・再試行のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.readiness = WorkerReadiness(bind=Mock())
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """ウォームアップが無効な場合はすぐに準備完了"""
+        with patch.object(ServerConstants, "WARM_UP_ENABLED", False):
+            task = await start_worker_warm_up(readiness=self.readiness)
+
+        assert task is None
+        assert self.readiness.is_ready is True
+
+    @pytest.mark.asyncio
+    async def test_succeeded(self):
+        """ウォームアップが成功した場合は準備完了"""
+        catalog_loader = Mock(return_value=5)
+        with patch.object(ServerConstants, "WARM_UP_ENABLED", True), \
+                patch("infrastructure.server.warm_up.warm_up_worker", return_value={"catalog_entries": 5}) as warm_up:
+            task = await start_worker_warm_up(catalog_loader=catalog_loader, readiness=self.readiness)
+
+        assert task is None
+        assert self.readiness.is_ready is True
+        warm_up.assert_called_once_with(catalog_loader=catalog_loader)
+
+    @pytest.mark.asyncio
+    async def test_retries_until_succeeded(self):
+        """失敗した場合は準備未完了のまま再試行し、成功したら準備完了"""
+        with patch.object(ServerConstants, "WARM_UP_ENABLED", True), \
+                patch.object(ServerConstants, "WARM_UP_RETRY_SECONDS", 0.01), \
+                patch("infrastructure.server.warm_up.warm_up_worker",
+                      side_effect=[RuntimeError("database is locked"), RuntimeError("database is locked"), {}]):
+            task = await start_worker_warm_up(readiness=self.readiness)
+            assert task is not None
+            assert self.readiness.is_ready is False
+            await asyncio.wait_for(task, timeout=1.0)
+
+        assert self.readiness.is_ready is True
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_retry(self):
+        """停止時は準備未完了に戻し、再試行を止める"""
+        with patch.object(ServerConstants, "WARM_UP_ENABLED", True), \
+                patch.object(ServerConstants, "WARM_UP_RETRY_SECONDS", 10.0), \
+                patch("infrastructure.server.warm_up.warm_up_worker", side_effect=RuntimeError("down")):
+            task = await start_worker_warm_up(readiness=self.readiness)
+            await stop_worker_warm_up(task, readiness=self.readiness)
+
+        assert task.cancelled()
+        assert self.readiness.is_ready is False
@@ -0,0 +1,99 @@
+"""
+本番サーバー起動スクリプト・ワーカーのウォームアップの単体テスト
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+from unittest.mock import Mock, patch
+import server
+from infrastructure.server.constants import ServerConstants
+from infrastructure.server.warm_up import open_pool_connections, warm_up_worker
+
+
+class TestServerOptions:
+    """ワーカー数・起動方式・サーバー設定のテスト"""
+
+    def test_resolve_workers(self):
+        """0以下の場合はCPUコア数、それ以外は指定値"""
+        with patch("server.available_cpu_count", return_value=8):
+            assert server.resolve_workers(0) == 8
+            assert server.resolve_workers(-1) == 8
+            assert server.resolve_workers(3) == 3
+
+    def test_resolve_runner_auto(self):
+        """autoはgunicornがあればgunicorn、なければuvicorn"""
+        with patch("server.gunicorn", None):
+            assert server.resolve_runner("auto") == "uvicorn"
+        with patch("server.gunicorn", Mock()):
+            assert server.resolve_runner("auto") == "gunicorn"
+
+    def test_resolve_runner_gunicorn_not_installed(self):
+        """gunicornを指定したがインストールされていない場合はエラー"""
+        with patch("server.gunicorn", None):
+            with pytest.raises(RuntimeError, match="gunicorn"):
+                server.resolve_runner("gunicorn")
+
+    def test_resolve_runner_unsupported(self):
+        """未対応の起動方式はエラー"""
+        with pytest.raises(ValueError, match="hypercorn"):
+            server.resolve_runner("hypercorn")
+
+    def test_gunicorn_options(self):
+        """uvicornワーカーを使用し、アプリはワーカーごとに読み込む"""
+        options = server.gunicorn_options("0.0.0.0", 8000, 4)
+
+        assert options["bind"] == "0.0.0.0:8000"
+        assert options["workers"] == 4
+        assert options["worker_class"] == server.GUNICORN_WORKER_CLASS
+        assert options["keepalive"] == ServerConstants.KEEPALIVE_SECONDS
+        assert options["preload_app"] is False
+
+    def test_uvicorn_options(self):
+        """uvicornの設定に変換する"""
+        options = server.uvicorn_options("127.0.0.1", 8001, 2)
+
+        assert options["host"] == "127.0.0.1"
+        assert options["port"] == 8001
+        assert options["workers"] == 2
+        assert options["timeout_keep_alive"] == ServerConstants.KEEPALIVE_SECONDS
+        assert options["backlog"] == ServerConstants.BACKLOG
+
+    def test_uvicorn_options_without_max_requests(self):
+        """再起動までのリクエスト数が0の場合は無制限"""
+        with patch.object(ServerConstants, "MAX_REQUESTS", 0):
+            assert server.uvicorn_options("127.0.0.1", 8001, 2)["limit_max_requests"] is None
+
+
+class TestWarmUpWorker:
+    """ワーカーのウォームアップのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.engine = create_engine("sqlite://", future=True)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_open_pool_connections(self, tmp_path):
+        """指定した本数の接続を確立してプールに戻す"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'warm_up.db'}", future=True, poolclass=QueuePool)
+        try:
+            assert open_pool_connections(engine, 3) == 3
+            assert engine.pool.checkedout() == 0
+            assert engine.pool.checkedin() == 3
+            # プールのサイズを超える接続は確立しない
+            assert open_pool_connections(engine, engine.pool.size() + 3) == engine.pool.size()
+        finally:
+            engine.dispose()
+
+    def test_warm_up_worker(self):
+        """DB接続・カタログ・テンプレート・パスワードハッシュのバックエンドを準備する"""
+        catalog_loader = Mock(return_value=3)
+
+        result = warm_up_worker(self.engine, connections=2, catalog_loader=catalog_loader)
+
+        assert result["connections"] == 2
+        assert result["catalog_entries"] == 3
+        catalog_loader.assert_called_once_with()
+        assert result["email_templates"] >= 1
+        assert result["duration_ms"] >= 0
@@ -0,0 +1,204 @@
+"""
+クリア記録バリデーションルール表の単体テスト
+"""
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from application.services.clear_record_service import ClearRecordService
+from application.services.clear_record_rule_registry import ClearRecordRuleRegistry
+from domain.constants.game_constants import GameIds
+from domain.entities.clear_record import ClearRecord
+from domain.value_objects.clear_record_rule_table import ClearRecordRuleTable
+from infrastructure.logging.exceptions import ValidationException
+
+
+def _record(**overrides):
+    """検証用のクリア記録データを作成"""
+    record = {
+        "game_id": GameIds.TOUHOU_06_EOSD,
+        "character_name": "霊夢A",
+        "difficulty": "Normal",
+        "mode": "normal",
+        "is_cleared": True,
+    }
+    record.update(overrides)
+    return record
+
+
+class TestClearRecordRuleTable:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.table = ClearRecordRuleTable.build({
+            GameIds.TOUHOU_06_EOSD: ["霊夢A", "霊夢B", "魔理沙A", "魔理沙B"],
+        })
+
+    def test_valid_record(self):
+        """正しい記録は違反なし"""
+        assert self.table.validate(_record()) is None
+
+    def test_unknown_game_id(self):
+        """未定義のゲームIDは拒否される"""
+        message, field_name, invalid_value = self.table.validate(_record(game_id=999))
+
+        assert field_name == "game_id"
+        assert invalid_value == 999
+
+    def test_invalid_difficulty(self):
+        """ゲームに存在しない難易度は拒否される"""
+        violation = self.table.validate(_record(difficulty="Phantasm"))
+
+        assert violation[1] == "difficulty"
+        assert violation[2] == "Phantasm"
+
+    def test_invalid_mode(self):
+        """モード非対応ゲームでのモード指定は拒否される"""
+        violation = self.table.validate(_record(mode="legacy"))
+
+        assert violation[1] == "mode"
+
+    def test_mode_defaults_to_normal(self):
+        """モード未指定の場合はnormalとして検証される"""
+        assert self.table.validate(_record(mode=None)) is None
+
+    def test_lolk_pointdevice_without_extra(self):
+        """紺珠伝の完全無欠モードにExtraは存在しない"""
+        legacy = _record(game_id=GameIds.TOUHOU_15_LoLK, mode="legacy", difficulty="Extra")
+        pointdevice = _record(game_id=GameIds.TOUHOU_15_LoLK, mode="pointdevice", difficulty="Extra")
+
+        assert self.table.validate(legacy) is None
+        assert self.table.validate(pointdevice)[1] == "difficulty"
+
+    def test_unknown_character_with_catalog(self):
+        """カタログ登録済みのゲームでは未登録の機体を拒否する"""
+        violation = self.table.validate(_record(character_name="咲夜A"))
+
+        assert violation[1] == "character_name"
+        assert violation[2] == "咲夜A"
+
+    def test_character_skipped_without_catalog(self):
+        """カタログ未登録のゲームでは機体名を検証しない"""
+        record = _record(game_id=GameIds.TOUHOU_07_PCB, character_name="任意の機体")
+
+        assert self.table.validate(record) is None
+
+    def test_special_condition_not_available(self):
+        """ゲームに存在しない特殊条件は拒否される"""
+        violation = self.table.validate(_record(is_special_clear_1=True))
+
+        assert violation[1] == "special_conditions"
+
+    def test_special_condition_available(self):
+        """ゲームで定義された特殊条件は記録できる"""
+        record = _record(game_id=GameIds.TOUHOU_12_UFO, character_name="霊夢A", is_special_clear_1=True)
+
+        assert self.table.validate(record) is None
+
+
+class TestClearRecordServiceValidation:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.mock_repository.create_or_update = AsyncMock(side_effect=lambda record: record)
+        self.mock_repository.create = AsyncMock(side_effect=lambda record: record)
+        self.mock_repository.update = AsyncMock(side_effect=lambda record: record)
+        self.mock_repository.find_by_id = AsyncMock(return_value=ClearRecord(id=1, user_id=1, **_record()))
+        table = ClearRecordRuleTable.build({GameIds.TOUHOU_06_EOSD: ["霊夢A"]})
+        self.service = ClearRecordService(self.mock_repository, table)
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_invalid_record(self):
+        """不正な記録の作成はValidationExceptionとなり保存されない"""
+        with pytest.raises(ValidationException) as exc_info:
+            await self.service.create_clear_record(1, _record(difficulty="Ultra"))
+
+        assert exc_info.value.details["field_name"] == "difficulty"
+        self.mock_repository.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_invalid_combination(self):
+        """更新でも既存の記録に反映した結果を検証し、不正な組み合わせは保存しない"""
+        with pytest.raises(ValidationException) as exc_info:
+            await self.service.update_clear_record(1, 1, {"is_special_clear_1": True})
+
+        assert exc_info.value.details["field_name"] == "special_conditions"
+        self.mock_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_invalid_mode(self):
+        """モード非対応ゲームの記録はモードを変更できない"""
+        with pytest.raises(ValidationException) as exc_info:
+            await self.service.update_clear_record(1, 1, {"mode": "legacy"})
+
+        assert exc_info.value.details["field_name"] == "mode"
+        self.mock_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_saves_valid_record(self):
+        """正しい更新は保存される"""
+        result = await self.service.update_clear_record(1, 1, {"is_no_bomb_clear": True})
+
+        assert result.is_no_bomb_clear is True
+        self.mock_repository.update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_before_any_write(self):
+        """一括保存では1件でも不正なら1件も書き込まない"""
+        records = [_record(), _record(character_name="咲夜A")]
+
+        with pytest.raises(ValidationException) as exc_info:
+            await self.service.batch_upsert_clear_records(1, records)
+
+        assert "records[1]" in exc_info.value.message
+        self.mock_repository.create_or_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_saves_valid_records(self):
+        """全件正しい場合は保存される"""
+        result = await self.service.batch_upsert_clear_records(1, [_record(), _record(difficulty="Hard")])
+
+        assert len(result) == 2
+        assert self.mock_repository.create_or_update.call_count == 2
+
+
+class TestClearRecordRuleRegistry:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        ClearRecordRuleRegistry.invalidate()
+        self.mock_repository = Mock()
+        self.mock_repository.find_all_character_names_by_game.return_value = {
+            GameIds.TOUHOU_06_EOSD: ["霊夢A"],
+        }
+
+    def teardown_method(self):
+        """キャッシュを他のテストへ持ち越さない"""
+        ClearRecordRuleRegistry.invalidate()
+
+    def test_table_is_cached(self):
+        """参照表は一度だけ構築される"""
+        first = ClearRecordRuleRegistry.get(self.mock_repository)
+        second = ClearRecordRuleRegistry.get(self.mock_repository)
+
+        assert first is second
+        self.mock_repository.find_all_character_names_by_game.assert_called_once()
+
+    def test_invalidate_rebuilds_table(self):
+        """破棄後は再構築される"""
+        first = ClearRecordRuleRegistry.get(self.mock_repository)
+        ClearRecordRuleRegistry.invalidate()
+        second = ClearRecordRuleRegistry.get(self.mock_repository)
+
+        assert first is not second
+        assert self.mock_repository.find_all_character_names_by_game.call_count == 2
+
+    def test_table_is_rebuilt_after_ttl(self):
+        """有効期間を過ぎると再構築される（他のワーカーでの機体カタログ変更を反映）"""
+        with patch.object(ClearRecordRuleRegistry, "ttl_seconds", 0):
+            first = ClearRecordRuleRegistry.get(self.mock_repository)
+            with patch("application.services.clear_record_rule_registry.time.monotonic",
+                       return_value=ClearRecordRuleRegistry._built_at + 1):
+                second = ClearRecordRuleRegistry.get(self.mock_repository)
+
+        assert first is not second
+        assert self.mock_repository.find_all_character_names_by_game.call_count == 2
@@ -358,4 +358,107 @@ class TestClearRecordService:
         assert len(result) == 2
         assert result[0].character_name == "霊夢"
         assert result[1].character_name == "魔理沙"
-        assert self.mock_repository.create_or_update.call_count == 2
\ No newline at end of file
+        assert self.mock_repository.create_or_update.call_count == 2
+
+class TestClearRecordChanges:
+    """差分同期・変更ログ圧縮のテスト"""
+    
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.service = ClearRecordService(self.mock_repository)
+        
+    @pytest.mark.asyncio
+    async def test_without_since_requires_resync(self):
+        """sinceを指定しない場合は基準の連番と再取得の要求を返す"""
+        self.mock_repository.get_change_seq_bounds = AsyncMock(return_value=(1, 10))
+        self.mock_repository.find_changes_since = AsyncMock()
+        
+        result = await self.service.get_clear_record_changes(1, None, 100)
+        
+        assert result == {"changes": [], "latest_seq": 10, "has_more": False, "resync_required": True}
+        self.mock_repository.find_changes_since.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_compacted_range_requires_resync(self):
+        """sinceより後の変更が削除済みの場合は再取得を要求する"""
+        self.mock_repository.get_change_seq_bounds = AsyncMock(return_value=(50, 60))
+        
+        result = await self.service.get_clear_record_changes(1, 10, 100)
+        
+        assert result["resync_required"] is True
+        
+    @pytest.mark.asyncio
+    async def test_changes_since(self):
+        """sinceより後の変更を返し、latest_seqを進める"""
+        self.mock_repository.get_change_seq_bounds = AsyncMock(return_value=(1, 12))
+        self.mock_repository.find_changes_since = AsyncMock(return_value=[{"seq": 11}, {"seq": 12}])
+        
+        result = await self.service.get_clear_record_changes(1, 10, 100)
+        
+        assert result["changes"] == [{"seq": 11}, {"seq": 12}]
+        assert result["latest_seq"] == 12
+        assert result["has_more"] is False
+        self.mock_repository.find_changes_since.assert_called_once_with(1, 10, 101)
+        
+    @pytest.mark.asyncio
+    async def test_changes_since_paginated(self):
+        """件数上限を超える場合は続きの基準となる連番を返す"""
+        self.mock_repository.get_change_seq_bounds = AsyncMock(return_value=(1, 100))
+        self.mock_repository.find_changes_since = AsyncMock(return_value=[{"seq": 11}, {"seq": 12}, {"seq": 13}])
+        
+        result = await self.service.get_clear_record_changes(1, 10, 2)
+        
+        assert [c["seq"] for c in result["changes"]] == [11, 12]
+        assert result["latest_seq"] == 12
+        assert result["has_more"] is True
+        
+    @pytest.mark.asyncio
+    async def test_compact_changes(self):
+        """保持期間より古い変更ログを削除する"""
+        self.mock_repository.delete_changes_before = AsyncMock(return_value=3)
+        
+        deleted = await self.service.compact_changes(retention_days=30, batch_size=100)
+        
+        assert deleted == 3
+        cutoff, batch_size = self.mock_repository.delete_changes_before.call_args.args
+        assert (datetime.now() - cutoff).days == 30
+        assert batch_size == 100
+
+
+class TestClearProgress:
+    """進捗グラフ（月別累計）のテスト"""
+    
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.service = ClearRecordService(self.mock_repository)
+        
+    @pytest.mark.asyncio
+    async def test_cumulative_per_game(self):
+        """作品ごとに月別の初回達成数を累計に変換する"""
+        self.mock_repository.find_monthly_progress = AsyncMock(return_value=[
+            {"game_id": 1, "month": "2024-01", "condition": "is_cleared", "count": 2},
+            {"game_id": 1, "month": "2024-03", "condition": "is_cleared", "count": 1},
+            {"game_id": 1, "month": "2024-03", "condition": "is_no_miss_clear", "count": 1},
+            {"game_id": 2, "month": "2024-02", "condition": "is_cleared", "count": 5},
+        ])
+        
+        progress = await self.service.get_clear_progress(1)
+        
+        assert [game["game_id"] for game in progress] == [1, 2]
+        months = progress[0]["months"]
+        assert [m["month"] for m in months] == ["2024-01", "2024-03"]
+        assert months[0]["counts"]["is_cleared"] == 2
+        assert months[0]["counts"]["is_no_miss_clear"] == 0
+        assert months[1]["counts"]["is_cleared"] == 3
+        assert months[1]["counts"]["is_no_miss_clear"] == 1
+        assert progress[1]["months"][0]["counts"]["is_cleared"] == 5
+        
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        """達成がない場合は空"""
+        self.mock_repository.find_monthly_progress = AsyncMock(return_value=[])
+        
+        assert await self.service.get_clear_progress(1, game_id=3) == []
+        self.mock_repository.find_monthly_progress.assert_called_once_with(1, 3)
@@ -0,0 +1,92 @@
+"""
+クリア条件達成率統計サービスの単体テスト
+"""
+from datetime import datetime
+from unittest.mock import Mock
+from application.services.clear_stats_service import ClearStatsService
+
+
+def _change(seq: int, old_flags, new_flags, character_name: str = "霊夢") -> dict:
+    return {
+        "seq": seq, "game_id": 1, "character_name": character_name, "difficulty": "Lunatic",
+        "mode": "normal", "old_flags": old_flags, "new_flags": new_flags,
+    }
+
+
+class TestClearStatsService:
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.mock_repository.count_active_players.return_value = 4
+        self.mock_repository.get_change_seq_bounds.return_value = (1, 10)
+        self.service = ClearStatsService(self.mock_repository)
+
+    def test_refresh_rebuilds_without_snapshot(self):
+        """未集計の場合は全件集計する"""
+        self.mock_repository.get_snapshot.return_value = None
+        self.mock_repository.rebuild_counts.return_value = 10
+
+        result = self.service.refresh(batch_size=100)
+
+        assert result["full_rebuild"] is True
+        assert result["last_change_seq"] == 10
+        self.mock_repository.find_changes_after.assert_not_called()
+        kwargs = self.mock_repository.save_snapshot.call_args.kwargs
+        assert kwargs["active_users"] == 4
+        assert kwargs["last_change_seq"] == 10
+
+    def test_refresh_rebuilds_when_changes_compacted(self):
+        """反映済みの連番の続きが圧縮で削除されている場合は全件集計する"""
+        self.mock_repository.get_snapshot.return_value = {"last_change_seq": 3}
+        self.mock_repository.get_change_seq_bounds.return_value = (8, 10)
+        self.mock_repository.rebuild_counts.return_value = 10
+
+        assert self.service.refresh(batch_size=100)["full_rebuild"] is True
+
+    def test_refresh_applies_changes_in_batches(self):
+        """前回以降の変更ログをバッチごとに反映する"""
+        self.mock_repository.get_snapshot.return_value = {"last_change_seq": 5}
+        self.mock_repository.find_changes_after.side_effect = [
+            [_change(6, None, 0b1), _change(7, 0b1, 0b1001)],
+            [_change(8, 0b1001, None)],
+        ]
+
+        result = self.service.refresh(batch_size=2)
+
+        assert result["full_rebuild"] is False
+        assert result["applied_changes"] == 3
+        assert result["last_change_seq"] == 8
+        assert [call.args[0] for call in self.mock_repository.find_changes_after.call_args_list] == [5, 7]
+        self.mock_repository.rebuild_counts.assert_not_called()
+        first, second = [call.args[0] for call in self.mock_repository.apply_count_deltas.call_args_list]
+        assert first == {
+            (1, "霊夢", "Lunatic", "normal", "is_cleared"): 1,
+            (1, "霊夢", "Lunatic", "normal", "is_no_miss_clear"): 1,
+        }
+        assert second == {
+            (1, "霊夢", "Lunatic", "normal", "is_cleared"): -1,
+            (1, "霊夢", "Lunatic", "normal", "is_no_miss_clear"): -1,
+        }
+
+    def test_get_rarity(self):
+        """達成率は達成ユーザー数 / 分母"""
+        built_at = datetime(2024, 1, 1, 10, 0, 0)
+        self.mock_repository.get_snapshot.return_value = {"active_users": 4, "built_at": built_at}
+        self.mock_repository.find_stats.return_value = [
+            {"game_id": 1, "character_name": "霊夢", "difficulty": "Lunatic", "mode": "normal",
+             "condition": "is_no_miss_clear", "achieved_count": 1},
+        ]
+
+        rarity = self.service.get_rarity(game_id=1)
+
+        assert rarity["active_users"] == 4
+        assert rarity["built_at"] == built_at
+        assert rarity["stats"][0]["rate"] == 0.25
+        self.mock_repository.find_stats.assert_called_once_with(1)
+
+    def test_get_rarity_without_snapshot(self):
+        """未集計の場合は空の結果"""
+        self.mock_repository.get_snapshot.return_value = None
+
+        assert self.service.get_rarity() == {"active_users": 0, "built_at": None, "stats": []}
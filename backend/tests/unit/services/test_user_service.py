@@ -1,7 +1,8 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 from application.services.user_service import UserService
+from application.services.email_service import EmailMessage
 from application.dtos.user_dto import CreateUserDto, UpdateUserDto, LoginRequestDto
 from domain.entities.user import User
 
@@ -13,7 +14,7 @@ class TestUserService:
         
         with patch('application.services.user_service.PasswordHasher') as mock_hasher_class, \
              patch('application.services.user_service.JWTHandler') as mock_jwt_class, \
-             patch('application.services.user_service.MockEmailSender') as mock_email_sender_class, \
+             patch('application.services.user_service.create_email_sender') as mock_create_email_sender, \
              patch('application.services.user_service.TokenGenerator') as mock_token_gen_class:
             
             self.mock_password_hasher = Mock()
@@ -23,7 +24,7 @@ class TestUserService:
             self.mock_token_generator = Mock()
             mock_hasher_class.return_value = self.mock_password_hasher
             mock_jwt_class.return_value = self.mock_jwt_handler
-            mock_email_sender_class.return_value = self.mock_email_sender
+            mock_create_email_sender.return_value = self.mock_email_sender
             mock_token_gen_class.return_value = self.mock_token_generator
             # TokenGeneratorは静的メソッドなのでクラス自体をモック
             mock_token_gen_class.generate_token_with_expiry.return_value = ("test_token", datetime.now())
@@ -279,4 +280,76 @@ class TestUserService:
         
         result = self.service.delete_user(999)
         
-        assert result is False
\ No newline at end of file
+        assert result is False
+        
+    def test_verify_email_with_naive_expiry(self):
+        """DBから読み込んだタイムゾーンなしの有効期限でもメール認証できること"""
+        unverified_user = User(
+            id=3,
+            username="unverified_user",
+            email="unverified@example.com",
+            hashed_password="hashed_password",
+            email_verified=False,
+            verification_token="valid_token",
+            verification_token_expires_at=datetime.utcnow() + timedelta(hours=1)
+        )
+        self.mock_repository.get_by_verification_token.return_value = unverified_user
+        
+        result = self.service.verify_email("valid_token")
+        
+        assert result is True
+        assert unverified_user.email_verified is True
+        self.mock_repository.update.assert_called_once_with(unverified_user)
+
+
+class TestUserServiceEmailOutbox:
+    """送信キューを使用する場合の認証メールのテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.mock_email_service = Mock()
+        self.mock_email_outbox = Mock()
+        self.mock_email_service.build_verification_email.return_value = EmailMessage(
+            to_email="new@example.com", subject="件名", text_body="本文", html_body="<p>本文</p>"
+        )
+        with patch('application.services.user_service.PasswordHasher') as mock_hasher_class, \
+             patch('application.services.user_service.JWTHandler'):
+            mock_hasher_class.return_value.hash_password.return_value = "hashed_password"
+            self.service = UserService(self.mock_repository, self.mock_email_service, self.mock_email_outbox)
+
+    def test_create_user_queues_verification_email(self):
+        """ユーザー作成前に送信キューへ登録し、その場では送信しない"""
+        self.mock_repository.get_by_username.return_value = None
+        self.mock_repository.get_by_email.return_value = None
+        self.mock_repository.create.side_effect = lambda user: User(
+            id=1, username=user.username, email=user.email, hashed_password=user.hashed_password,
+            created_at=datetime.now(), updated_at=datetime.now()
+        )
+        calls = Mock()
+        calls.attach_mock(self.mock_email_outbox.enqueue, "enqueue")
+        calls.attach_mock(self.mock_repository.create, "create")
+
+        result = self.service.create_user(CreateUserDto(
+            username="new_user", email="new@example.com", password="password123"
+        ))
+
+        assert result.username == "new_user"
+        # ユーザー作成のコミットで送信キューも書き込まれる
+        assert [call[0] for call in calls.mock_calls] == ["enqueue", "create"]
+        self.mock_email_outbox.enqueue.assert_called_once_with("new@example.com", "件名", "本文", "<p>本文</p>")
+        self.mock_email_service.send_verification_email.assert_not_called()
+
+    def test_resend_verification_email_queues(self):
+        """再送信も送信キューに登録する"""
+        self.mock_repository.get_by_email.return_value = User(
+            id=1, username="new_user", email="new@example.com", hashed_password="hashed_password",
+            email_verified=False
+        )
+
+        result = self.service.resend_verification_email("new@example.com")
+
+        assert result is True
+        self.mock_email_outbox.enqueue.assert_called_once()
+        self.mock_repository.update.assert_called_once()
+        self.mock_email_service.send_verification_email.assert_not_called()
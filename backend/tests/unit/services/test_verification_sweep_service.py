@@ -0,0 +1,51 @@
+"""
+メール認証の定期クリーンアップサービスの単体テスト
+"""
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from application.services.verification_sweep_service import VerificationSweepService
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class TestVerificationSweepService:
+    """一括処理の繰り返しと集計結果のテスト"""
+
+    def setup_method(self):
+        """各テストメソッドの前に実行される共通セットアップ"""
+        self.mock_repository = Mock()
+        self.service = VerificationSweepService(self.mock_repository)
+
+    def test_sweep_in_batches(self):
+        """対象がなくなるまでbatch_size件ずつ処理する"""
+        self.mock_repository.clear_expired_tokens.side_effect = [100, 100, 30]
+
+        result = self.service.sweep(batch_size=100, now=NOW)
+
+        assert result["expired_tokens_cleared"] == 230
+        assert result["unverified_users_purged"] == 0
+        assert result["batches"] == 3
+        assert result["duration_ms"] >= 0
+        assert self.mock_repository.clear_expired_tokens.call_count == 3
+        self.mock_repository.clear_expired_tokens.assert_called_with(NOW, 100)
+        self.mock_repository.purge_unverified_users.assert_not_called()
+
+    def test_sweep_stops_when_nothing_left(self):
+        """ちょうどbatch_size件で終わる場合は0件になるまで確認する"""
+        self.mock_repository.clear_expired_tokens.side_effect = [100, 0]
+
+        result = self.service.sweep(batch_size=100, now=NOW)
+
+        assert result["expired_tokens_cleared"] == 100
+        assert result["batches"] == 1
+
+    def test_sweep_purges_unverified_users(self):
+        """期間を指定した場合は未認証ユーザーも削除する"""
+        self.mock_repository.purge_unverified_users.side_effect = [50, 10]
+        self.mock_repository.clear_expired_tokens.return_value = 0
+
+        result = self.service.sweep(batch_size=50, purge_unverified_after=timedelta(days=30), now=NOW)
+
+        assert result["unverified_users_purged"] == 60
+        assert result["batches"] == 2
+        self.mock_repository.purge_unverified_users.assert_called_with(NOW - timedelta(days=30), 50)
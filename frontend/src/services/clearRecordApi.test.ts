@@ -1,4 +1,4 @@
-import { clearRecordApi } from './clearRecordApi';
+import { clearRecordApi, decodeCompactClearRecords } from './clearRecordApi';
 import apiClient from './api';
 
 // apiClientのモック
@@ -43,7 +43,7 @@ describe('clearRecordApi', () => {
 
       const result = await clearRecordApi.getMyClearRecords();
 
-      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records');
+      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records?format=compact');
       expect(result).toEqual(mockRecords);
     });
 
@@ -63,7 +63,7 @@ describe('clearRecordApi', () => {
 
       const result = await clearRecordApi.getMyClearRecordsByGame(gameId);
 
-      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records?game_id=1');
+      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records?format=compact&game_id=1');
       expect(result).toEqual(mockRecords);
     });
 
@@ -73,7 +73,65 @@ describe('clearRecordApi', () => {
 
       await clearRecordApi.getMyClearRecordsByGame(gameId);
 
-      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records?game_id=999');
+      expect(mockedApiClient.get).toHaveBeenCalledWith('/clear-records?format=compact&game_id=999');
+    });
+  });
+
+  describe('decodeCompactClearRecords', () => {
+    const compactPayload = {
+      format: 'compact',
+      version: 1,
+      count: 2,
+      flag_fields: [
+        'is_cleared', 'is_no_continue_clear', 'is_no_bomb_clear', 'is_no_miss_clear',
+        'is_full_spell_card', 'is_special_clear_1', 'is_special_clear_2', 'is_special_clear_3',
+      ],
+      dictionaries: {
+        game_id: [1],
+        character_name: ['霊夢', '魔理沙'],
+        difficulty: ['Easy', 'Lunatic'],
+        mode: ['normal'],
+      },
+      columns: {
+        id: [1, 2],
+        game_id: [0, 0],
+        character_name: [0, 1],
+        difficulty: [0, 1],
+        mode: [0, 0],
+        flags: [1, 5],
+        cleared_at: [19723, null],
+        created_at: [1704103200, 1704103200],
+        last_updated_at: [1704103200, 1704103200],
+      },
+    };
+
+    it('コンパクトフォーマットを記録配列に変換する', () => {
+      const records = decodeCompactClearRecords(compactPayload);
+
+      expect(records).toHaveLength(2);
+      expect(records[0]).toMatchObject({
+        id: 1,
+        game_id: 1,
+        character_name: '霊夢',
+        difficulty: 'Easy',
+        mode: 'normal',
+        is_cleared: true,
+        is_no_bomb_clear: false,
+        cleared_at: '2024-01-01',
+        created_at: '2024-01-01T10:00:00',
+      });
+      expect(records[1]).toMatchObject({
+        character_name: '魔理沙',
+        difficulty: 'Lunatic',
+        is_cleared: true,
+        is_no_bomb_clear: true,
+        is_no_miss_clear: false,
+        cleared_at: null,
+      });
+    });
+
+    it('通常のJSON配列はそのまま返す', () => {
+      expect(decodeCompactClearRecords([mockClearRecord])).toEqual([mockClearRecord]);
     });
   });
 
@@ -3,6 +3,51 @@
  */
 import apiClient from './api';
 
+const SECONDS_PER_DAY = 86400;
+
+/**
+ * エポック秒をISO形式（タイムゾーンなし・UTC）の日時文字列に変換
+ * @param {number|null} seconds - UNIX時刻（秒）
+ * @returns {string|null} 日時文字列
+ */
+const epochSecondsToIso = (seconds: number | null) =>
+  seconds === null ? null : new Date(seconds * 1000).toISOString().slice(0, 19);
+
+/**
+ * コンパクト列指向フォーマットのクリア記録一覧を通常の記録配列に変換
+ * 通常のJSON配列が渡された場合はそのまま返す
+ * @param {Object|Array} payload - APIレスポンス
+ * @returns {Array} クリア記録配列
+ */
+export const decodeCompactClearRecords = (payload: any) => {
+  if (!payload || payload.format !== 'compact') {
+    return payload;
+  }
+
+  const { count, flag_fields: flagFields, dictionaries, columns } = payload;
+  const records: any[] = [];
+  for (let i = 0; i < count; i++) {
+    const record: any = {
+      id: columns.id[i],
+      game_id: dictionaries.game_id[columns.game_id[i]],
+      character_name: dictionaries.character_name[columns.character_name[i]],
+      difficulty: dictionaries.difficulty[columns.difficulty[i]],
+      mode: dictionaries.mode[columns.mode[i]],
+    };
+    flagFields.forEach((field: string, bit: number) => {
+      record[field] = (columns.flags[i] & (1 << bit)) !== 0;
+    });
+    const clearedDays = columns.cleared_at[i];
+    record.cleared_at = clearedDays === null
+      ? null
+      : new Date(clearedDays * SECONDS_PER_DAY * 1000).toISOString().slice(0, 10);
+    record.created_at = epochSecondsToIso(columns.created_at[i]);
+    record.last_updated_at = epochSecondsToIso(columns.last_updated_at[i]);
+    records.push(record);
+  }
+  return records;
+};
+
 /**
  * クリア記録関連のAPI呼び出し
  */
@@ -12,8 +57,8 @@ export const clearRecordApi = {
    * @returns {Promise<Array>} クリア記録配列
    */
   async getMyClearRecords() {
-    const response = await apiClient.get('/clear-records');
-    return response.data;
+    const response = await apiClient.get('/clear-records?format=compact');
+    return decodeCompactClearRecords(response.data);
   },
 
   /**
@@ -22,8 +67,8 @@ export const clearRecordApi = {
    * @returns {Promise<Array>} クリア記録配列
    */
   async getMyClearRecordsByGame(gameId) {
-    const response = await apiClient.get(`/clear-records?game_id=${gameId}`);
-    return response.data;
+    const response = await apiClient.get(`/clear-records?format=compact&game_id=${gameId}`);
+    return decodeCompactClearRecords(response.data);
   },
 
   /**